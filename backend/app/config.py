@@ -12,10 +12,37 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./Kantama.db"
     
+    # SQLite: WAL, busy_timeout and cache pragmas on every connection
+    SQLITE_TUNING: bool = True
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    SQLITE_CACHE_SIZE_KB: int = 64 * 1024
+    
+    # Log every SQL statement (very verbose)
+    SQL_ECHO: bool = False
+    # In DEBUG, warn when a request runs one statement more than this many times
+    SQL_N_PLUS_ONE_THRESHOLD: int = 10
+    
     # JWT
     SECRET_KEY: str = "your-super-secret-key-change-in-production-Kantama-2025"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24  # 24 hours
+    # Tickets for the notification stream URL (EventSource cannot send headers)
+    STREAM_TICKET_EXPIRE_SECONDS: int = 60
+    
+    # Authenticated user cache (per worker process)
+    AUTH_CACHE_MAX_SIZE: int = 2048
+    AUTH_CACHE_TTL_SECONDS: float = 30.0
+    # How often each worker reloads the token revocation list
+    TOKEN_REVOCATION_REFRESH_SECONDS: float = 5.0
+    
+    # bcrypt runs on a dedicated thread pool so it never blocks the event loop
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+    
+    # List endpoints: default and maximum page size
+    PAGE_SIZE_DEFAULT: int = 50
+    PAGE_SIZE_MAX: int = 200
     
     # Email
     SMTP_HOST: str = "smtp.gmail.com"
@@ -24,6 +51,108 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: Optional[str] = None
     SMTP_FROM_EMAIL: str = "noreply@Kantama.fi"
     SMTP_FROM_NAME: str = "Kantama"
+    SMTP_START_TLS: bool = True
+    SMTP_TIMEOUT_SECONDS: float = 30.0
+    # Authenticated SMTP sessions are pooled and reused between emails
+    SMTP_POOL_SIZE: int = 4
+    SMTP_POOL_IDLE_SECONDS: float = 60.0
+    # Rendered emails kept for reuse (emails with tokens/passwords excluded)
+    EMAIL_TEMPLATE_CACHE_SIZE: int = 256
+    
+    # Email outbox: background workers deliver queued emails with retries
+    EMAIL_WORKERS: int = 2
+    EMAIL_WORKER_BATCH_SIZE: int = 10
+    EMAIL_OUTBOX_POLL_SECONDS: float = 5.0
+    EMAIL_MAX_ATTEMPTS: int = 8
+    EMAIL_RETRY_BASE_SECONDS: float = 30.0
+    EMAIL_RETRY_MAX_SECONDS: float = 6 * 60 * 60
+    # A claimed email not finished within this time is handed to another worker
+    EMAIL_LOCK_TIMEOUT_SECONDS: float = 5 * 60
+    
+    # Unread notification counts: per-process cache in front of notification_counters
+    NOTIFICATION_COUNT_CACHE_SIZE: int = 4096
+    NOTIFICATION_COUNT_CACHE_TTL_SECONDS: float = 10.0
+    # How often the counters are recounted from the notifications table
+    NOTIFICATION_COUNTER_REPAIR_SECONDS: float = 60 * 60
+    # Notification push (GET /notifications/stream): "postgres" LISTEN/NOTIFY
+    # wakes streams on every worker, "local" only in the publishing process;
+    # "auto" picks postgres on a Postgres database
+    NOTIFICATION_PUBSUB_BACKEND: str = "auto"
+    NOTIFICATION_STREAM_HEARTBEAT_SECONDS: float = 25.0
+    NOTIFICATION_STREAM_RETRY_MS: int = 3000
+    # Read notifications older than this many days are moved to
+    # notifications_archive in batches (0 = keep everything)
+    NOTIFICATION_RETENTION_DAYS: int = 90
+    NOTIFICATION_ARCHIVE_BATCH_SIZE: int = 1000
+    NOTIFICATION_ARCHIVE_INTERVAL_SECONDS: float = 6 * 60 * 60
+    # Email digests: a user's unsent notifications are emailed together
+    # once the oldest has waited NOTIFICATION_DIGEST_WINDOW_SECONDS.
+    # Roles are comma-separated; other users' notifications are not emailed.
+    NOTIFICATION_DIGEST_ROLES: str = "FINANCIER"
+    NOTIFICATION_DIGEST_WINDOW_SECONDS: float = 60 * 60
+    NOTIFICATION_DIGEST_POLL_SECONDS: float = 60.0
+    NOTIFICATION_DIGEST_BATCH_USERS: int = 200
+    # Notifications listed in one digest; the rest are only counted
+    NOTIFICATION_DIGEST_MAX_ITEMS: int = 50
+    
+    # Newsletters: recipients are streamed in batches and sent through the
+    # SMTP pool at a bounded concurrency and rate (emails per second)
+    NEWSLETTER_BATCH_SIZE: int = 500
+    NEWSLETTER_CONCURRENCY: int = 4
+    NEWSLETTER_RATE_PER_SECOND: float = 20.0
+    # A sending campaign without progress for this long is resumed by another worker
+    NEWSLETTER_LOCK_TIMEOUT_SECONDS: float = 2 * 60
+    
+    # PRH/YTJ company data (avoindata.prh.fi)
+    YTJ_API_URL: str = "https://avoindata.prh.fi/opendata-ytj-api/v3/companies"
+    YTJ_TIMEOUT_SECONDS: float = 10.0
+    YTJ_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    # One shared client per worker: pooled keep-alive connections, HTTP/2
+    # if the h2 package is installed
+    YTJ_HTTP2: bool = True
+    YTJ_MAX_CONNECTIONS: int = 20
+    YTJ_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    YTJ_KEEPALIVE_SECONDS: float = 60.0
+    # Lookups are cached in memory (LRU) and in the ytj_cache table. Entries
+    # past their TTL are served while being refreshed in the background,
+    # until YTJ_STALE_TTL_SECONDS; unknown business ids are cached briefly
+    YTJ_CACHE_SIZE: int = 2048
+    YTJ_COMPANY_TTL_SECONDS: float = 24 * 60 * 60
+    YTJ_SEARCH_TTL_SECONDS: float = 60 * 60
+    YTJ_NOT_FOUND_TTL_SECONDS: float = 10 * 60
+    YTJ_STALE_TTL_SECONDS: float = 7 * 24 * 60 * 60
+    # Circuit breaker around PRH: opens when, over the last
+    # YTJ_BREAKER_WINDOW_CALLS calls within YTJ_BREAKER_WINDOW_SECONDS (at
+    # least YTJ_BREAKER_MIN_CALLS), the share of failed calls or of calls
+    # slower than YTJ_BREAKER_SLOW_CALL_SECONDS reaches its rate.
+    # While open, lookups return cached company records (kept up to
+    # YTJ_FALLBACK_TTL_SECONDS) flagged stale without calling PRH; after
+    # YTJ_BREAKER_OPEN_SECONDS one probe call may close it again
+    YTJ_BREAKER_WINDOW_SECONDS: float = 60.0
+    YTJ_BREAKER_WINDOW_CALLS: int = 10
+    YTJ_BREAKER_MIN_CALLS: int = 5
+    YTJ_BREAKER_ERROR_RATE: float = 0.5
+    YTJ_BREAKER_SLOW_CALL_SECONDS: float = 3.0
+    YTJ_BREAKER_SLOW_CALL_RATE: float = 0.5
+    YTJ_BREAKER_OPEN_SECONDS: float = 30.0
+    YTJ_FALLBACK_TTL_SECONDS: float = 90 * 24 * 60 * 60
+    # POST /ytj/batch: companies missing from the cache are fetched from PRH
+    # this many at a time
+    YTJ_BATCH_CONCURRENCY: int = 8
+    # Company status refresh: the companies of open applications and signed
+    # contracts are re-checked from PRH once their status is older than
+    # YTJ_STATUS_MAX_AGE_SECONDS, YTJ_STATUS_BATCH_SIZE per transaction and
+    # at most YTJ_STATUS_RATE_PER_SECOND lookups per second. One process
+    # runs it at a time, holding a lease renewed after every batch; a lease
+    # not renewed within YTJ_STATUS_LOCK_TIMEOUT_SECONDS (e.g. the process
+    # died) is free again
+    YTJ_STATUS_INTERVAL_SECONDS: float = 60 * 60
+    YTJ_STATUS_MAX_AGE_SECONDS: float = 24 * 60 * 60
+    YTJ_STATUS_BATCH_SIZE: int = 50
+    YTJ_STATUS_RATE_PER_SECOND: float = 2.0
+    YTJ_STATUS_LOCK_TIMEOUT_SECONDS: float = 10 * 60
+    # Companies written per transaction by import_ytj.py (local name index)
+    YTJ_IMPORT_BATCH_SIZE: int = 1000
     
     # Admin email for notifications
     ADMIN_EMAIL: str = "myynti@Kantama.fi"
@@ -1,20 +1,55 @@
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
 from app.config import settings
+from app.services.sql_metrics import sql_metrics
 
 
 class Base(DeclarativeBase):
     pass
 
 
+def _is_sqlite_file(url: str) -> bool:
+    return url.startswith("sqlite") and ":memory:" not in url
+
+
+SQLITE_TUNED = settings.SQLITE_TUNING and _is_sqlite_file(settings.DATABASE_URL)
+
+
+def _set_sqlite_pragmas(dbapi_connection):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    # Negative cache_size is in KiB rather than pages
+    cursor.execute(f"PRAGMA cache_size=-{int(settings.SQLITE_CACHE_SIZE_KB)}")
+    cursor.close()
+
+
 engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG,
+    echo=settings.SQL_ECHO,
 )
 
+if SQLITE_TUNED:
+    # WAL lets readers run alongside a writer; concurrent writers wait up
+    # to busy_timeout for the lock instead of failing with "database is locked"
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        _set_sqlite_pragmas(dbapi_connection)
+
+sql_metrics.instrument(engine)
+
+
+class AppSession(Session):
+    """Sync session behind async_session_maker; session events are registered on it"""
+
+
 async_session_maker = async_sessionmaker(
     engine,
     class_=AsyncSession,
+    sync_session_class=AppSession,
     expire_on_commit=False,
 )
 
@@ -30,4 +65,3 @@ async def get_db():
 async def init_db():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-
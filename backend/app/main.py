@@ -3,24 +3,57 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 from app.config import settings
-from app.database import init_db
+from app.database import init_db, engine
 from app.routes import api_router
+from app.services.sql_metrics import sql_metrics, SqlTimingMiddleware
+from app.services.search_service import search_service
+from app.services.email_worker import email_worker
+from app.services.email_service import email_service
+from app.services.email_templates import email_templates
+from app.services.newsletter_service import newsletter_service
+from app.services.notification_counters import notification_counters
+from app.services.notification_bus import notification_bus
+from app.services.notification_archiver import notification_archiver
+from app.services.notification_digest import notification_digest
+from app.services.ytj_service import ytj_service
+from app.services.ytj_index import ytj_index
+from app.services.company_status_refresher import company_status_refresher
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     await init_db()
+    await search_service.ensure_index(engine)
+    await ytj_index.ensure_index(engine)
     await create_admin_user()
+    email_templates.load()
+    email_worker.start()
+    newsletter_service.start()
+    notification_counters.start()
+    await notification_bus.start()
+    notification_archiver.start()
+    notification_digest.start()
+    ytj_service.start()
+    company_status_refresher.start()
     yield
     # Shutdown
+    await company_status_refresher.stop()
+    await ytj_service.stop()
+    await notification_digest.stop()
+    await notification_archiver.stop()
+    await notification_bus.stop()
+    await notification_counters.stop()
+    await newsletter_service.stop()
+    await email_worker.stop()
+    await email_service.smtp_pool.close()
 
 
 async def create_admin_user():
     """Create default admin user if not exists"""
     from app.database import async_session_maker
     from app.models.user import User, UserRole
-    from app.utils.auth import get_password_hash
+    from app.utils.auth import get_password_hash_async
     from sqlalchemy import select
     
     async with async_session_maker() as db:
@@ -32,7 +65,7 @@ async def create_admin_user():
         if not admin:
             admin = User(
                 email="admin@Kantama.fi",
-                password_hash=get_password_hash("admin123"),
+                password_hash=await get_password_hash_async("admin123"),
                 role=UserRole.ADMIN,
                 first_name="Admin",
                 last_name="Kantama",
@@ -68,8 +101,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Total-Count", "Server-Timing"],
 )
 
+# SQL statement count and DB time per request (Server-Timing header)
+app.add_middleware(SqlTimingMiddleware, metrics=sql_metrics)
+
 # Include routes
 app.include_router(api_router, prefix="/api")
 
@@ -5,8 +5,19 @@ from app.models.assignment import ApplicationAssignment, AssignmentStatus
 from app.models.info_request import InfoRequest, InfoRequestStatus, InfoRequestResponse
 from app.models.offer import Offer, OfferStatus
 from app.models.contract import Contract, ContractStatus
-from app.models.notification import Notification
+from app.models.notification import Notification, NotificationCounter, NotificationArchive
 from app.models.file import File
+from app.models.token_revocation import TokenRevocation
+from app.models.email_outbox import EmailOutbox, EmailOutboxStatus
+from app.models.job_lease import JobLease
+from app.models.ytj import YtjCacheEntry, YtjCompany, YtjCompanyStatus
+from app.models.newsletter import (
+    NewsletterCampaign,
+    NewsletterCampaignStatus,
+    NewsletterRecipient,
+    NewsletterRecipientStatus,
+    NewsletterSegment,
+)
 
 __all__ = [
     "User",
@@ -24,6 +35,20 @@ __all__ = [
     "Contract",
     "ContractStatus",
     "Notification",
+    "NotificationCounter",
+    "NotificationArchive",
     "File",
+    "TokenRevocation",
+    "EmailOutbox",
+    "EmailOutboxStatus",
+    "JobLease",
+    "YtjCacheEntry",
+    "YtjCompany",
+    "YtjCompanyStatus",
+    "NewsletterCampaign",
+    "NewsletterCampaignStatus",
+    "NewsletterRecipient",
+    "NewsletterRecipientStatus",
+    "NewsletterSegment",
 ]
 
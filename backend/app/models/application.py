@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Enum, Text, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Enum, Text, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -27,6 +27,13 @@ class ApplicationStatus(str, enum.Enum):
 
 class Application(Base):
     __tablename__ = "applications"
+    __table_args__ = (
+        Index("ix_applications_customer_id_created_at", "customer_id", "created_at"),
+        Index("ix_applications_status_created_at", "status", "created_at"),
+        Index("ix_applications_created_at_id", "created_at", "id"),
+        Index("ix_applications_equipment_price_id", "equipment_price", "id"),
+        Index("ix_applications_status_id", "status", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     reference_number = Column(String(50), unique=True, index=True)
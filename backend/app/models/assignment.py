@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -16,6 +16,10 @@ class AssignmentStatus(str, enum.Enum):
 
 class ApplicationAssignment(Base):
     __tablename__ = "application_assignments"
+    __table_args__ = (
+        Index("ix_application_assignments_application_id_financier_id", "application_id", "financier_id"),
+        Index("ix_application_assignments_financier_id_application_id", "financier_id", "application_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     
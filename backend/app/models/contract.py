@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum, Text, ForeignKey, Float, Boolean, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Text, ForeignKey, Float, Boolean, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -17,6 +17,13 @@ class ContractStatus(str, enum.Enum):
 
 class Contract(Base):
     __tablename__ = "contracts"
+    __table_args__ = (
+        Index("ix_contracts_application_id_status", "application_id", "status"),
+        Index("ix_contracts_application_id_created_at", "application_id", "created_at"),
+        Index("ix_contracts_created_at_id", "created_at", "id"),
+        Index("ix_contracts_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_contracts_financier_id_created_at_id", "financier_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     contract_number = Column(String(50), unique=True, nullable=True)  # e.g., A000379000
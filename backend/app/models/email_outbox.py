@@ -0,0 +1,37 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text, JSON, Enum, Index
+from datetime import datetime
+import enum
+
+from app.database import Base
+
+
+class EmailOutboxStatus(str, enum.Enum):
+    PENDING = "PENDING"    # Waiting for delivery (or for the next retry)
+    SENDING = "SENDING"    # Claimed by a worker
+    SENT = "SENT"
+    DEAD = "DEAD"          # Gave up after EMAIL_MAX_ATTEMPTS
+
+
+class EmailOutbox(Base):
+    """Email queued in the same transaction as the change that triggered it"""
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    
+    to_email = Column(String(255), nullable=False)
+    cc = Column(JSON, nullable=True)
+    subject = Column(String(500), nullable=False)
+    html_content = Column(Text, nullable=False)
+    text_content = Column(Text, nullable=True)
+    
+    status = Column(Enum(EmailOutboxStatus), default=EmailOutboxStatus.PENDING, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    next_attempt_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    locked_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    
+    created_at = Column(DateTime, default=datetime.utcnow)
+    sent_at = Column(DateTime, nullable=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -7,6 +7,9 @@ from app.database import Base
 
 class File(Base):
     __tablename__ = "files"
+    __table_args__ = (
+        Index("ix_files_application_id_created_at", "application_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     
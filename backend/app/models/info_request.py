@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum, Text, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Text, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -14,6 +14,9 @@ class InfoRequestStatus(str, enum.Enum):
 
 class InfoRequest(Base):
     __tablename__ = "info_requests"
+    __table_args__ = (
+        Index("ix_info_requests_application_id_created_at", "application_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     
@@ -36,6 +39,9 @@ class InfoRequest(Base):
 
 class InfoRequestResponse(Base):
     __tablename__ = "info_request_responses"
+    __table_args__ = (
+        Index("ix_info_request_responses_info_request_id", "info_request_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, String, DateTime
+
+from app.database import Base
+
+
+class JobLease(Base):
+    """
+    Lease on a periodic background job, so that only one app process (e.g.
+    one gunicorn worker) runs it at a time. holder identifies the process;
+    the lease is free once locked_until has passed.
+    """
+    __tablename__ = "job_leases"
+
+    name = Column(String(100), primary_key=True)
+    holder = Column(String(64), nullable=False)
+    locked_until = Column(DateTime, nullable=False)
@@ -0,0 +1,73 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text, JSON, Enum, ForeignKey, Index, UniqueConstraint
+from datetime import datetime
+import enum
+
+from app.database import Base
+
+
+class NewsletterSegment(str, enum.Enum):
+    ALL = "ALL"                # Active customers and financier users
+    CUSTOMER = "CUSTOMER"
+    FINANCIER = "FINANCIER"
+
+
+class NewsletterCampaignStatus(str, enum.Enum):
+    DRAFT = "DRAFT"
+    SENDING = "SENDING"
+    PAUSED = "PAUSED"
+    COMPLETED = "COMPLETED"
+
+
+class NewsletterRecipientStatus(str, enum.Enum):
+    PENDING = "PENDING"
+    SENT = "SENT"
+    FAILED = "FAILED"
+
+
+class NewsletterCampaign(Base):
+    """Newsletter rendered from templates/newsletter.html and sent to a segment"""
+    __tablename__ = "newsletter_campaigns"
+
+    id = Column(Integer, primary_key=True, index=True)
+    
+    # Template fields
+    subject = Column(String(500), nullable=False)
+    headline = Column(String(500), nullable=False)
+    subheadline = Column(String(500), nullable=True)
+    content = Column(Text, nullable=False)
+    cta_text = Column(String(255), nullable=True)
+    cta_url = Column(String(1000), nullable=True)
+    features = Column(JSON, nullable=True)  # List of strings
+    
+    segment = Column(Enum(NewsletterSegment), default=NewsletterSegment.ALL, nullable=False)
+    status = Column(Enum(NewsletterCampaignStatus), default=NewsletterCampaignStatus.DRAFT, nullable=False)
+    
+    # Progress
+    total_recipients = Column(Integer, default=0, nullable=False)
+    sent_count = Column(Integer, default=0, nullable=False)
+    failed_count = Column(Integer, default=0, nullable=False)
+    # Heartbeat of the process sending the campaign
+    locked_at = Column(DateTime, nullable=True)
+    
+    created_by_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+
+
+class NewsletterRecipient(Base):
+    """Delivery status of a campaign to one user; makes sending resumable"""
+    __tablename__ = "newsletter_recipients"
+    __table_args__ = (
+        UniqueConstraint("campaign_id", "user_id", name="uq_newsletter_recipients_campaign_id_user_id"),
+        Index("ix_newsletter_recipients_campaign_id_status_id", "campaign_id", "status", "id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    campaign_id = Column(Integer, ForeignKey("newsletter_campaigns.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    email = Column(String(255), nullable=False)
+    
+    status = Column(Enum(NewsletterRecipientStatus), default=NewsletterRecipientStatus.PENDING, nullable=False)
+    error = Column(Text, nullable=True)
+    sent_at = Column(DateTime, nullable=True)
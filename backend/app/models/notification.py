@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -7,6 +7,15 @@ from app.database import Base
 
 class Notification(Base):
     __tablename__ = "notifications"
+    __table_args__ = (
+        # Keyset pages of a user's notifications, newest first
+        Index("ix_notifications_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_notifications_user_id_is_read_created_at_id", "user_id", "is_read", "created_at", "id"),
+        # Notification stream: a user's notifications after the last id sent
+        Index("ix_notifications_user_id_id", "user_id", "id"),
+        # Notification digests: users with notifications not yet emailed
+        Index("ix_notifications_is_email_sent_user_id_created_at", "is_email_sent", "user_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     
@@ -35,3 +44,38 @@ class Notification(Base):
     # Relationships
     user = relationship("User", back_populates="notifications")
 
+
+
+class NotificationCounter(Base):
+    """Number of unread notifications of a user, kept in step with notifications"""
+    __tablename__ = "notification_counters"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    unread = Column(Integer, default=0, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class NotificationArchive(Base):
+    """
+    Read notifications moved out of notifications after
+    NOTIFICATION_RETENTION_DAYS (see notification_archiver), keeping their ids
+    """
+    __tablename__ = "notifications_archive"
+    __table_args__ = (
+        Index("ix_notifications_archive_user_id_created_at", "user_id", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    title = Column(String(255), nullable=False)
+    message = Column(Text, nullable=False)
+    notification_type = Column(String(50), nullable=False)
+    reference_type = Column(String(50), nullable=True)
+    reference_id = Column(Integer, nullable=True)
+    action_url = Column(String(500), nullable=True)
+    data = Column(JSON, nullable=True)
+    is_read = Column(Boolean, default=True)
+    is_email_sent = Column(Boolean, default=False)
+    created_at = Column(DateTime)
+    read_at = Column(DateTime, nullable=True)
+    archived_at = Column(DateTime, default=datetime.utcnow)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Enum, Text, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Float, DateTime, Enum, Text, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -17,6 +17,13 @@ class OfferStatus(str, enum.Enum):
 
 class Offer(Base):
     __tablename__ = "offers"
+    __table_args__ = (
+        Index("ix_offers_application_id_status", "application_id", "status"),
+        Index("ix_offers_application_id_created_at", "application_id", "created_at"),
+        Index("ix_offers_created_at_id", "created_at", "id"),
+        Index("ix_offers_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_offers_financier_id_created_at_id", "financier_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     
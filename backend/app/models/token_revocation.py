@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from datetime import datetime
+
+from app.database import Base
+
+
+class TokenRevocation(Base):
+    """Per-user token version; access tokens with a lower version are revoked"""
+    __tablename__ = "token_revocations"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    token_version = Column(Integer, nullable=False, default=1)
+    reason = Column(String(100), nullable=True)
+    
+    revoked_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
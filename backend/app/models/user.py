@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum, ForeignKey, Index, false
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -14,6 +14,12 @@ class UserRole(str, enum.Enum):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_financier_id_is_active", "financier_id", "is_active"),
+        Index("ix_users_role_is_active", "role", "is_active"),
+        Index("ix_users_role_created_at", "role", "created_at"),
+        Index("ix_users_verification_token", "verification_token"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String(255), unique=True, index=True, nullable=False)
@@ -35,6 +41,7 @@ class User(Base):
     is_verified = Column(Boolean, default=False)
     verification_token = Column(String(255), nullable=True)
     verification_token_expires = Column(DateTime, nullable=True)
+    newsletter_opt_out = Column(Boolean, default=False, server_default=false(), nullable=False)
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
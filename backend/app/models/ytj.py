@@ -0,0 +1,57 @@
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, JSON
+from datetime import datetime
+
+from app.database import Base
+
+
+class YtjCacheEntry(Base):
+    """
+    Cached PRH/YTJ response, keyed "company:<business id>" or
+    "search:<limit>:<normalized query>". data is NULL for a company PRH
+    does not know.
+    """
+    __tablename__ = "ytj_cache"
+
+    key = Column(String(255), primary_key=True)
+    data = Column(JSON, nullable=True)
+    fetched_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+
+
+class YtjCompany(Base):
+    """
+    Company imported from the PRH open-data bulk dumps (import_ytj.py),
+    searched by name without calling PRH (see ytj_index). content_hash
+    covers the stored fields, so a re-import only writes changed companies.
+    """
+    __tablename__ = "ytj_companies"
+
+    # Integer rowid for the SQLite FTS5 index
+    id = Column(Integer, primary_key=True)
+    business_id = Column(String(9), nullable=False, unique=True)
+    name = Column(String(500), nullable=False)
+    # normalize_query(name); "C" collation on PostgreSQL so prefix range
+    # scans can use the index
+    name_normalized = Column(
+        String(500).with_variant(String(500, collation="C"), "postgresql"), nullable=False, index=True
+    )
+    company_form = Column(String(255), nullable=True)
+    is_active = Column(Boolean, nullable=False, default=True)
+    is_liquidated = Column(Boolean, nullable=False, default=False)
+    content_hash = Column(String(40), nullable=False)
+    imported_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class YtjCompanyStatus(Base):
+    """
+    Last known PRH status of a company behind an open application or a
+    signed contract, kept up to date by company_status_refresher.
+    business_id is as written in the application or contract; the status
+    columns are NULL if the id is invalid or PRH does not know it.
+    """
+    __tablename__ = "ytj_company_status"
+
+    business_id = Column(String(50), primary_key=True)
+    is_active = Column(Boolean, nullable=True)
+    is_liquidated = Column(Boolean, nullable=True)
+    checked_at = Column(DateTime, nullable=False, index=True)
+    changed_at = Column(DateTime, nullable=True)
@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.routes import auth, users, financiers, applications, assignments, info_requests, offers, contracts, notifications, files, ytj
+from app.routes import auth, users, financiers, applications, assignments, info_requests, offers, contracts, notifications, files, ytj, metrics, newsletters
 
 api_router = APIRouter()
 
@@ -13,5 +13,7 @@ api_router.include_router(offers.router, prefix="/offers", tags=["Offers"])
 api_router.include_router(contracts.router, prefix="/contracts", tags=["Contracts"])
 api_router.include_router(notifications.router, prefix="/notifications", tags=["Notifications"])
 api_router.include_router(files.router, prefix="/files", tags=["Files"])
+api_router.include_router(newsletters.router, prefix="/newsletters", tags=["Newsletters"])
 api_router.include_router(ytj.router, prefix="/ytj", tags=["YTJ - Company Info"])
+api_router.include_router(metrics.router, prefix="/metrics", tags=["Metrics"])
 
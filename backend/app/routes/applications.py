@@ -1,23 +1,31 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_
-from sqlalchemy.orm import selectinload
-from typing import List, Optional
+from sqlalchemy import select, or_, func
+from sqlalchemy.orm import selectinload, joinedload
+from typing import List, Optional, Literal
 from datetime import datetime
 import random
 import string
 
+from app.config import settings
 from app.database import get_db
 from app.models.user import User, UserRole
 from app.models.application import Application, ApplicationType, ApplicationStatus
 from app.models.assignment import ApplicationAssignment
+from app.models.offer import Offer, OfferStatus
+from app.models.contract import Contract, ContractStatus
+from app.models.info_request import InfoRequest, InfoRequestResponse
 from app.schemas.application import (
     ApplicationCreate, ApplicationUpdate, ApplicationResponse,
-    LeasingApplicationCreate, SaleLeasebackApplicationCreate
+    LeasingApplicationCreate, SaleLeasebackApplicationCreate,
+    ApplicationWorkspaceResponse, ApplicationStats
 )
-from app.utils.auth import get_current_user, require_role
+from app.schemas.user import TokenData
+from app.utils.auth import get_token_data, require_role
+from app.utils.pagination import encode_cursor, decode_cursor, keyset_page
 from app.services.notification_service import notification_service
 from app.services.email_service import email_service
+from app.services.search_service import search_service
 
 
 router = APIRouter()
@@ -31,25 +39,54 @@ def generate_reference_number(app_type: ApplicationType) -> str:
     return f"{prefix}-{year}-{random_part}"
 
 
-@router.get("/", response_model=List[ApplicationResponse])
-async def list_applications(
-    status_filter: Optional[ApplicationStatus] = None,
-    type_filter: Optional[ApplicationType] = None,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
-):
-    """List applications based on user role"""
-    query = select(Application).options(selectinload(Application.files))
-    
+APPLICATION_SORT_COLUMNS = {
+    "created_at": Application.created_at,
+    "equipment_price": Application.equipment_price,
+    "status": Application.status,
+}
+
+
+def scope_applications(query, current_user: TokenData):
+    """Restrict an Application query to what the caller may see"""
     if current_user.role == UserRole.CUSTOMER:
         # Customers see only their own applications
         query = query.where(Application.customer_id == current_user.id)
     elif current_user.role == UserRole.FINANCIER:
         # Financiers see only assigned applications
-        query = query.join(ApplicationAssignment).where(
-            ApplicationAssignment.financier_id == current_user.financier_id
+        query = query.where(
+            Application.id.in_(
+                select(ApplicationAssignment.application_id).where(
+                    ApplicationAssignment.financier_id == current_user.financier_id
+                )
+            )
         )
     # Admins see all applications
+    return query
+
+
+@router.get("/", response_model=List[ApplicationResponse])
+async def list_applications(
+    response: Response,
+    status_filter: Optional[ApplicationStatus] = None,
+    type_filter: Optional[ApplicationType] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    min_term: Optional[int] = None,
+    max_term: Optional[int] = None,
+    sort: Literal["created_at", "equipment_price", "status"] = "created_at",
+    order: Literal["asc", "desc"] = "desc",
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_token_data)
+):
+    """
+    List applications based on user role, one page at a time.
+
+    Pass the X-Next-Cursor response header back as `cursor` to get the next
+    page. X-Total-Count (matching rows) is sent with the first page.
+    """
+    query = scope_applications(select(Application), current_user)
     
     if status_filter:
         query = query.where(Application.status == status_filter)
@@ -57,17 +94,86 @@ async def list_applications(
     if type_filter:
         query = query.where(Application.application_type == type_filter)
     
-    query = query.order_by(Application.created_at.desc())
+    if min_price is not None:
+        query = query.where(Application.equipment_price >= min_price)
+    if max_price is not None:
+        query = query.where(Application.equipment_price <= max_price)
+    if min_term is not None:
+        query = query.where(Application.requested_term_months >= min_term)
+    if max_term is not None:
+        query = query.where(Application.requested_term_months <= max_term)
+    
+    if cursor is None:
+        total = await db.execute(query.with_only_columns(func.count(Application.id)))
+        response.headers["X-Total-Count"] = str(total.scalar_one())
+    
+    sort_column = APPLICATION_SORT_COLUMNS[sort]
+    page_query = keyset_page(
+        query.options(selectinload(Application.files)),
+        sort_column,
+        Application.id,
+        descending=order == "desc",
+        after=decode_cursor(cursor, f"{sort}:{order}") if cursor else None,
+        limit=limit,
+    )
     
+    result = await db.execute(page_query)
+    applications = result.scalars().all()
+    
+    if len(applications) > limit:
+        applications = applications[:limit]
+        last = applications[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(
+            f"{sort}:{order}", getattr(last, sort), last.id
+        )
+    
+    return applications
+
+
+@router.get("/search", response_model=List[ApplicationResponse])
+async def search_applications(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=settings.PAGE_SIZE_MAX),
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_token_data)
+):
+    """
+    Search applications by company name, Y-tunnus, reference number,
+    equipment description and additional info. Terms match as prefixes;
+    best matches first.
+    """
+    query = scope_applications(select(Application), current_user)
+    return await search_service.search(
+        db, query.options(selectinload(Application.files)), q, limit
+    )
+
+
+@router.get("/stats", response_model=ApplicationStats)
+async def application_stats(
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_token_data)
+):
+    """Number and total equipment value of the caller's applications by status"""
+    query = scope_applications(
+        select(Application.status, func.count(Application.id), func.sum(Application.equipment_price)),
+        current_user
+    ).group_by(Application.status)
     result = await db.execute(query)
-    return result.scalars().all()
+    
+    by_status = {}
+    total_value = 0.0
+    for application_status, count, value in result.all():
+        by_status[application_status] = count
+        total_value += value or 0.0
+    
+    return ApplicationStats(total=sum(by_status.values()), total_value=total_value, by_status=by_status)
 
 
 @router.get("/{application_id}", response_model=ApplicationResponse)
 async def get_application(
     application_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_token_data)
 ):
     """Get application by ID"""
     result = await db.execute(
@@ -107,11 +213,83 @@ async def get_application(
     return application
 
 
+def _newest_first(items):
+    return sorted(items, key=lambda item: (item.created_at or datetime.min, item.id), reverse=True)
+
+
+@router.get("/{application_id}/workspace", response_model=ApplicationWorkspaceResponse)
+async def get_application_workspace(
+    application_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_token_data)
+):
+    """
+    Get an application with its offers, contracts, info requests, files and
+    assignments in one call.
+
+    The access check is part of the application query and the related rows
+    are loaded with one batched query per relationship. Visibility follows
+    the individual /offers, /contracts, /info-requests, /files and
+    /assignments routes.
+    """
+    if current_user.role == UserRole.CUSTOMER:
+        # Customer only sees sent offers and contracts
+        offers = Application.offers.and_(
+            Offer.status.not_in([OfferStatus.DRAFT, OfferStatus.PENDING_ADMIN])
+        )
+        contracts = Application.contracts.and_(Contract.status != ContractStatus.DRAFT)
+    elif current_user.role == UserRole.FINANCIER:
+        # Financier sees only own offers and contracts
+        offers = Application.offers.and_(Offer.financier_id == current_user.financier_id)
+        contracts = Application.contracts.and_(Contract.financier_id == current_user.financier_id)
+    else:
+        offers = Application.offers
+        contracts = Application.contracts
+    
+    options = [
+        selectinload(Application.files),
+        selectinload(offers),
+        selectinload(contracts),
+        selectinload(Application.info_requests)
+        .selectinload(InfoRequest.responses)
+        .joinedload(InfoRequestResponse.user),
+    ]
+    is_admin = current_user.role == UserRole.ADMIN
+    if is_admin:
+        options.append(selectinload(Application.assignments))
+    
+    query = select(Application).options(*options).where(Application.id == application_id)
+    result = await db.execute(scope_applications(query, current_user))
+    application = result.scalar_one_or_none()
+    
+    if not application:
+        # Only the failure path needs to tell a missing application from a forbidden one
+        exists = await db.scalar(select(Application.id).where(Application.id == application_id))
+        if exists is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Hakemusta ei löytynyt"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Ei käyttöoikeutta"
+        )
+    
+    return {
+        "application": application,
+        "offers": _newest_first(application.offers),
+        "contracts": _newest_first(application.contracts),
+        "info_requests": _newest_first(application.info_requests),
+        "files": _newest_first(application.files),
+        "assignments": _newest_first(application.assignments) if is_admin else None,
+    }
+
+
 @router.post("/leasing", response_model=ApplicationResponse)
 async def create_leasing_application(
     application_data: LeasingApplicationCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_token_data)
 ):
     """Create a new leasing application"""
     reference_number = generate_reference_number(ApplicationType.LEASING)
@@ -127,19 +305,10 @@ async def create_leasing_application(
     )
     
     db.add(application)
-    await db.commit()
-    await db.refresh(application)
     
-    # Create notification
-    await notification_service.notify_application_submitted(
-        db=db,
-        user_id=current_user.id,
-        application_id=application.id,
-        reference_number=reference_number
-    )
-    
-    # Notify admin
+    # Notify admin (queued in the same transaction)
     await email_service.send_admin_notification(
+        db=db,
         subject=f"Uusi leasing-hakemus: {reference_number}",
         event_type="UUSI HAKEMUS",
         application_ref=reference_number,
@@ -152,6 +321,19 @@ async def create_leasing_application(
         }
     )
     
+    await db.flush()
+    
+    # Create notification (in the same transaction)
+    await notification_service.notify_application_submitted(
+        db=db,
+        user_id=current_user.id,
+        application_id=application.id,
+        reference_number=reference_number
+    )
+    
+    await db.commit()
+    await db.refresh(application)
+    
     return application
 
 
@@ -159,7 +341,7 @@ async def create_leasing_application(
 async def create_sale_leaseback_application(
     application_data: SaleLeasebackApplicationCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_token_data)
 ):
     """Create a new sale-leaseback application"""
     reference_number = generate_reference_number(ApplicationType.SALE_LEASEBACK)
@@ -175,19 +357,10 @@ async def create_sale_leaseback_application(
     )
     
     db.add(application)
-    await db.commit()
-    await db.refresh(application)
     
-    # Create notification
-    await notification_service.notify_application_submitted(
-        db=db,
-        user_id=current_user.id,
-        application_id=application.id,
-        reference_number=reference_number
-    )
-    
-    # Notify admin
+    # Notify admin (queued in the same transaction)
     await email_service.send_admin_notification(
+        db=db,
         subject=f"Uusi takaisinvuokraus-hakemus: {reference_number}",
         event_type="UUSI HAKEMUS",
         application_ref=reference_number,
@@ -196,11 +369,24 @@ async def create_sale_leaseback_application(
             "Yritys": application.company_name,
             "Y-tunnus": application.business_id,
             "Nykyarvo": f"{application.current_value:,.2f} €",
-            "Alkuperäinen hinta": f"{application.original_purchase_price:,.2f} €",
+            "Alkuperäinen hinta": f"{application.original_purchase_price:,.2f} €" if application.original_purchase_price else "-",
             "Yhteyshenkilö": application.contact_email
         }
     )
     
+    await db.flush()
+    
+    # Create notification (in the same transaction)
+    await notification_service.notify_application_submitted(
+        db=db,
+        user_id=current_user.id,
+        application_id=application.id,
+        reference_number=reference_number
+    )
+    
+    await db.commit()
+    await db.refresh(application)
+    
     return application
 
 
@@ -211,7 +397,7 @@ async def create_public_leasing_application(
 ):
     """Create a leasing application without authentication (for landing page)"""
     from app.models.user import User
-    from app.utils.auth import get_password_hash
+    from app.utils.auth import get_password_hash_async
     
     # Check if user exists
     result = await db.execute(select(User).where(User.email == application_data.contact_email))
@@ -228,7 +414,7 @@ async def create_public_leasing_application(
         
         user = User(
             email=application_data.contact_email,
-            password_hash=get_password_hash(password),
+            password_hash=await get_password_hash_async(password),
             role=UserRole.CUSTOMER,
             company_name=application_data.company_name,
             business_id=application_data.business_id,
@@ -241,6 +427,7 @@ async def create_public_leasing_application(
         
         # Send welcome email with login info
         await email_service.send_welcome_email(
+            db=db,
             email=user.email,
             company_name=application_data.company_name,
             password=password if not application_data.password else None
@@ -274,18 +461,10 @@ async def create_public_leasing_application(
     )
     
     db.add(application)
-    await db.commit()
-    
-    # Re-query with files relationship loaded to avoid greenlet error
-    result = await db.execute(
-        select(Application)
-        .options(selectinload(Application.files))
-        .where(Application.id == application.id)
-    )
-    application = result.scalar_one()
     
-    # Notify admin
+    # Notify admin (queued in the same transaction)
     await email_service.send_admin_notification(
+        db=db,
         subject=f"Uusi leasing-hakemus: {reference_number}",
         event_type="UUSI HAKEMUS",
         application_ref=reference_number,
@@ -299,6 +478,16 @@ async def create_public_leasing_application(
         }
     )
     
+    await db.commit()
+    
+    # Re-query with files relationship loaded to avoid greenlet error
+    result = await db.execute(
+        select(Application)
+        .options(selectinload(Application.files))
+        .where(Application.id == application.id)
+    )
+    application = result.scalar_one()
+    
     return application
 
 
@@ -309,7 +498,7 @@ async def create_public_sale_leaseback_application(
 ):
     """Create a sale-leaseback application without authentication (for landing page)"""
     from app.models.user import User
-    from app.utils.auth import get_password_hash
+    from app.utils.auth import get_password_hash_async
     
     # Check if user exists
     result = await db.execute(select(User).where(User.email == application_data.contact_email))
@@ -326,7 +515,7 @@ async def create_public_sale_leaseback_application(
         
         user = User(
             email=application_data.contact_email,
-            password_hash=get_password_hash(password),
+            password_hash=await get_password_hash_async(password),
             role=UserRole.CUSTOMER,
             company_name=application_data.company_name,
             business_id=application_data.business_id,
@@ -339,6 +528,7 @@ async def create_public_sale_leaseback_application(
         
         # Send welcome email with login info
         await email_service.send_welcome_email(
+            db=db,
             email=user.email,
             company_name=application_data.company_name,
             password=password if not application_data.password else None
@@ -374,18 +564,10 @@ async def create_public_sale_leaseback_application(
     )
     
     db.add(application)
-    await db.commit()
-    
-    # Re-query with files relationship loaded to avoid greenlet error
-    result = await db.execute(
-        select(Application)
-        .options(selectinload(Application.files))
-        .where(Application.id == application.id)
-    )
-    application = result.scalar_one()
     
-    # Notify admin
+    # Notify admin (queued in the same transaction)
     await email_service.send_admin_notification(
+        db=db,
         subject=f"Uusi takaisinvuokraus-hakemus: {reference_number}",
         event_type="UUSI HAKEMUS",
         application_ref=reference_number,
@@ -401,6 +583,16 @@ async def create_public_sale_leaseback_application(
         }
     )
     
+    await db.commit()
+    
+    # Re-query with files relationship loaded to avoid greenlet error
+    result = await db.execute(
+        select(Application)
+        .options(selectinload(Application.files))
+        .where(Application.id == application.id)
+    )
+    application = result.scalar_one()
+    
     return application
 
 
@@ -409,7 +601,7 @@ async def update_application(
     application_id: int,
     application_data: ApplicationUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_token_data)
 ):
     """Update application (Customer can update own, Admin can update all)"""
     result = await db.execute(
@@ -9,9 +9,11 @@ from app.models.application import Application, ApplicationStatus
 from app.models.assignment import ApplicationAssignment, AssignmentStatus
 from app.models.financier import Financier
 from app.schemas.assignment import AssignmentCreate, AssignmentResponse
+from app.schemas.user import TokenData
 from app.utils.auth import require_role
 from app.services.notification_service import notification_service
 from app.services.email_service import email_service
+from app.services.notification_digest import digest_roles
 
 
 router = APIRouter()
@@ -21,7 +23,7 @@ router = APIRouter()
 async def assign_to_financier(
     assignment_data: AssignmentCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.ADMIN))
+    current_user: TokenData = Depends(require_role(UserRole.ADMIN))
 ):
     """Assign application to financier (Admin only)"""
     # Get application
@@ -75,20 +77,29 @@ async def assign_to_financier(
     # Update application status
     application.status = ApplicationStatus.SUBMITTED_TO_FINANCIER
     
-    await db.commit()
-    await db.refresh(assignment)
-    
     # Get financier users
     result = await db.execute(
-        select(User).where(
+        select(User.id).where(
             User.financier_id == financier.id,
             User.is_active == True
         )
     )
-    financier_users = result.scalars().all()
-    financier_user_ids = [u.id for u in financier_users]
+    financier_user_ids = result.scalars().all()
+    
+    # Financier users get this in their notification digest; email the
+    # financier directly only if nobody would receive one
+    if not financier_user_ids or UserRole.FINANCIER not in digest_roles():
+        await email_service.send_application_submitted_to_financier(
+            db=db,
+            financier_email=financier.email,
+            financier_name=financier.name,
+            application_ref=application.reference_number,
+            company_name=application.company_name,
+            application_type=application.application_type.value,
+            equipment_price=application.equipment_price
+        )
     
-    # Send notifications
+    # Send notifications (in the same transaction)
     await notification_service.notify_sent_to_financier(
         db=db,
         customer_id=application.customer_id,
@@ -98,15 +109,8 @@ async def assign_to_financier(
         financier_name=financier.name
     )
     
-    # Send email to financier
-    await email_service.send_application_submitted_to_financier(
-        financier_email=financier.email,
-        financier_name=financier.name,
-        application_ref=application.reference_number,
-        company_name=application.company_name,
-        application_type=application.application_type.value,
-        equipment_price=application.equipment_price
-    )
+    await db.commit()
+    await db.refresh(assignment)
     
     return assignment
 
@@ -115,7 +119,7 @@ async def assign_to_financier(
 async def get_application_assignments(
     application_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.ADMIN))
+    current_user: TokenData = Depends(require_role(UserRole.ADMIN))
 ):
     """Get all assignments for an application (Admin only)"""
     result = await db.execute(
@@ -130,7 +134,7 @@ async def get_application_assignments(
 async def remove_assignment(
     assignment_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.ADMIN))
+    current_user: TokenData = Depends(require_role(UserRole.ADMIN))
 ):
     """Remove assignment (Admin only)"""
     result = await db.execute(
@@ -7,13 +7,15 @@ from app.database import get_db
 from app.models.user import User, UserRole
 from app.schemas.user import UserCreate, UserLogin, Token, UserResponse, PasswordReset
 from app.utils.auth import (
-    get_password_hash,
-    verify_password,
-    create_access_token,
+    get_password_hash_async,
+    verify_password_async,
+    create_user_access_token,
     generate_verification_token,
     get_current_user
 )
 from app.services.email_service import email_service
+from app.services.user_cache import user_cache
+from app.services.revocation_service import revocation_service
 
 
 router = APIRouter()
@@ -43,7 +45,7 @@ async def register(
     
     user = User(
         email=user_data.email,
-        password_hash=get_password_hash(user_data.password),
+        password_hash=await get_password_hash_async(user_data.password),
         role=UserRole.CUSTOMER,
         first_name=user_data.first_name,
         last_name=user_data.last_name,
@@ -57,20 +59,21 @@ async def register(
     )
     
     db.add(user)
-    await db.commit()
-    await db.refresh(user)
     
-    # Send verification email
+    # Queue verification email in the same transaction
     await email_service.send_verification_email(
+        db=db,
         email=user.email,
         token=verification_token,
         first_name=user.first_name
     )
     
+    await db.commit()
+    await db.refresh(user)
+    
     # Generate access token
-    access_token = create_access_token(
-        data={"sub": str(user.id), "email": user.email, "role": user.role.value}
-    )
+    token_version = await revocation_service.get_version(db, user.id)
+    access_token = create_user_access_token(user, token_version)
     
     return Token(
         access_token=access_token,
@@ -87,7 +90,7 @@ async def login(
     result = await db.execute(select(User).where(User.email == credentials.email))
     user = result.scalar_one_or_none()
     
-    if not user or not verify_password(credentials.password, user.password_hash):
+    if not user or not await verify_password_async(credentials.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Virheellinen sähköposti tai salasana"
@@ -104,9 +107,8 @@ async def login(
     await db.commit()
     
     # Generate access token
-    access_token = create_access_token(
-        data={"sub": str(user.id), "email": user.email, "role": user.role.value}
-    )
+    token_version = await revocation_service.get_version(db, user.id)
+    access_token = create_user_access_token(user, token_version)
     
     return Token(
         access_token=access_token,
@@ -141,6 +143,7 @@ async def verify_email(
     user.verification_token = None
     user.verification_token_expires = None
     await db.commit()
+    user_cache.invalidate(user.id)
     
     return {"message": "Sähköposti vahvistettu onnistuneesti"}
 
@@ -161,15 +164,18 @@ async def resend_verification(
     verification_token = generate_verification_token()
     current_user.verification_token = verification_token
     current_user.verification_token_expires = datetime.utcnow() + timedelta(hours=24)
-    await db.commit()
     
-    # Send verification email
+    # Queue verification email in the same transaction
     await email_service.send_verification_email(
+        db=db,
         email=current_user.email,
         token=verification_token,
         first_name=current_user.first_name
     )
     
+    await db.commit()
+    user_cache.invalidate(current_user.id)
+    
     return {"message": "Vahvistuslinkki lähetetty"}
 
 
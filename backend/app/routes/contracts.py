@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import List
+from sqlalchemy import select, func
+from typing import List, Optional
 from datetime import datetime
 import os
 import uuid
@@ -18,7 +19,10 @@ from app.models.contract import Contract, ContractStatus
 from app.models.financier import Financier
 from app.models.file import File as FileModel
 from app.schemas.contract import ContractCreate, ContractUpdate, ContractResponse
-from app.utils.auth import get_current_user, require_role
+from app.schemas.user import TokenData
+from app.utils.auth import get_current_user, get_token_data, require_role
+from app.utils.pagination import encode_cursor, decode_cursor, keyset_range, keyset_next_key
+from app.utils.streaming import stream_json_array
 from app.services.notification_service import notification_service
 from app.services.email_service import email_service
 
@@ -36,7 +40,7 @@ def generate_contract_number() -> str:
 async def create_contract(
     contract_data: ContractCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.FINANCIER))
+    current_user: TokenData = Depends(require_role(UserRole.FINANCIER))
 ):
     """Create contract with full details (Financier only)"""
     # Get application
@@ -183,7 +187,7 @@ async def update_contract(
     contract_id: int,
     contract_data: ContractUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.FINANCIER))
+    current_user: TokenData = Depends(require_role(UserRole.FINANCIER))
 ):
     """Update contract details (Financier only, only DRAFT contracts)"""
     result = await db.execute(
@@ -225,7 +229,7 @@ async def upload_contract_logo(
     contract_id: int,
     file: UploadFile = File(...),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.FINANCIER))
+    current_user: TokenData = Depends(require_role(UserRole.FINANCIER))
 ):
     """Upload financier logo for contract (Financier only)"""
     result = await db.execute(
@@ -283,7 +287,7 @@ async def upload_contract_file(
     contract_id: int,
     file: UploadFile = File(...),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.FINANCIER))
+    current_user: TokenData = Depends(require_role(UserRole.FINANCIER))
 ):
     """Upload contract PDF (Financier only)"""
     result = await db.execute(
@@ -339,7 +343,7 @@ async def upload_contract_file(
 async def send_contract(
     contract_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.FINANCIER))
+    current_user: TokenData = Depends(require_role(UserRole.FINANCIER))
 ):
     """Send contract to customer for signing (Financier only)"""
     result = await db.execute(
@@ -380,10 +384,16 @@ async def send_contract(
     # Update application
     application.status = ApplicationStatus.CONTRACT_SENT
     
-    await db.commit()
-    await db.refresh(contract)
+    # Queue email in the same transaction
+    await email_service.send_contract_to_customer(
+        db=db,
+        customer_email=customer.email,
+        customer_name=customer.full_name,
+        application_ref=application.reference_number,
+        message=contract.message_to_customer
+    )
     
-    # Send notification
+    # Send notification (in the same transaction)
     await notification_service.notify_contract_sent(
         db=db,
         customer_id=customer.id,
@@ -391,24 +401,23 @@ async def send_contract(
         reference_number=application.reference_number
     )
     
-    # Send email
-    await email_service.send_contract_to_customer(
-        customer_email=customer.email,
-        customer_name=customer.full_name,
-        application_ref=application.reference_number,
-        message=contract.message_to_customer
-    )
+    await db.commit()
+    await db.refresh(contract)
     
     return contract
 
 
-@router.post("/{contract_id}/sign", response_model=ContractResponse)
+@router.post(
+    "/{contract_id}/sign",
+    response_model=ContractResponse,
+    dependencies=[Depends(require_role(UserRole.CUSTOMER))]
+)
 async def sign_contract(
     contract_id: int,
     signature_place: str = "Finland",
     signer_name: str = None,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.CUSTOMER))
+    current_user: User = Depends(get_current_user)
 ):
     """Sign contract (Customer only) - electronic signature placeholder"""
     result = await db.execute(
@@ -443,54 +452,54 @@ async def sign_contract(
     # Update application
     application.status = ApplicationStatus.SIGNED
     
-    await db.commit()
-    await db.refresh(contract)
-    
     # Get financier info
     result = await db.execute(
         select(Financier).where(Financier.id == contract.financier_id)
     )
     financier = result.scalar_one()
     
+    # Notify admin (queued in the same transaction)
+    await email_service.send_admin_notification(
+        db=db,
+        subject=f"Sopimus allekirjoitettu: {application.reference_number}",
+        event_type="SOPIMUS ALLEKIRJOITETTU",
+        application_ref=application.reference_number,
+        details={
+            "Yritys": application.company_name,
+            "Rahoittaja": financier.name,
+            "Allekirjoittaja": contract.lessee_signer_name,
+            "Päivämäärä": datetime.utcnow().strftime("%d.%m.%Y %H:%M")
+        }
+    )
+    
     result = await db.execute(
-        select(User).where(
+        select(User.id).where(
             User.financier_id == financier.id,
             User.is_active == True
         )
     )
-    financier_users = result.scalars().all()
     
-    # Notify financier
+    # Notify financier (in the same transaction)
     await notification_service.notify_contract_signed(
         db=db,
-        financier_user_ids=[u.id for u in financier_users],
+        financier_user_ids=result.scalars().all(),
         application_id=application.id,
         reference_number=application.reference_number,
         company_name=application.company_name
     )
     
-    # Notify admin
-    await email_service.send_admin_notification(
-        subject=f"Sopimus allekirjoitettu: {application.reference_number}",
-        event_type="SOPIMUS ALLEKIRJOITETTU",
-        application_ref=application.reference_number,
-        details={
-            "Yritys": application.company_name,
-            "Rahoittaja": financier.name,
-            "Allekirjoittaja": contract.lessee_signer_name,
-            "Päivämäärä": datetime.utcnow().strftime("%d.%m.%Y %H:%M")
-        }
-    )
+    await db.commit()
+    await db.refresh(contract)
     
     return contract
 
 
-@router.post("/{contract_id}/upload-signed")
+@router.post("/{contract_id}/upload-signed", dependencies=[Depends(require_role(UserRole.CUSTOMER))])
 async def upload_signed_contract(
     contract_id: int,
     file: UploadFile = File(...),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.CUSTOMER))
+    current_user: User = Depends(get_current_user)
 ):
     """Upload signed contract PDF (Customer only) - alternative to e-signature"""
     result = await db.execute(
@@ -555,42 +564,42 @@ async def upload_signed_contract(
     # Update application
     application.status = ApplicationStatus.SIGNED
     
-    await db.commit()
-    
     # Get financier info
     result = await db.execute(
         select(Financier).where(Financier.id == contract.financier_id)
     )
     financier = result.scalar_one()
     
+    # Notify admin (queued in the same transaction)
+    await email_service.send_admin_notification(
+        db=db,
+        subject=f"Sopimus allekirjoitettu: {application.reference_number}",
+        event_type="SOPIMUS ALLEKIRJOITETTU",
+        application_ref=application.reference_number,
+        details={
+            "Yritys": application.company_name,
+            "Rahoittaja": financier.name,
+            "Päivämäärä": datetime.utcnow().strftime("%d.%m.%Y %H:%M")
+        }
+    )
+    
     result = await db.execute(
-        select(User).where(
+        select(User.id).where(
             User.financier_id == financier.id,
             User.is_active == True
         )
     )
-    financier_users = result.scalars().all()
     
-    # Notify financier
+    # Notify financier (in the same transaction)
     await notification_service.notify_contract_signed(
         db=db,
-        financier_user_ids=[u.id for u in financier_users],
+        financier_user_ids=result.scalars().all(),
         application_id=application.id,
         reference_number=application.reference_number,
         company_name=application.company_name
     )
     
-    # Notify admin
-    await email_service.send_admin_notification(
-        subject=f"Sopimus allekirjoitettu: {application.reference_number}",
-        event_type="SOPIMUS ALLEKIRJOITETTU",
-        application_ref=application.reference_number,
-        details={
-            "Yritys": application.company_name,
-            "Rahoittaja": financier.name,
-            "Päivämäärä": datetime.utcnow().strftime("%d.%m.%Y %H:%M")
-        }
-    )
+    await db.commit()
     
     return {"message": "Allekirjoitettu sopimus ladattu"}
 
@@ -599,7 +608,7 @@ async def upload_signed_contract(
 async def get_application_contracts(
     application_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_token_data)
 ):
     """Get contracts for an application"""
     result = await db.execute(
@@ -646,7 +655,7 @@ async def get_application_contracts(
 async def get_contract(
     contract_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_token_data)
 ):
     """Get contract by ID"""
     result = await db.execute(
@@ -675,60 +684,104 @@ async def get_contract(
     return contract
 
 
+def _admin_contract_dict(row) -> dict:
+    """Contract row from the admin listing query as returned by the API"""
+    return {
+        "id": row["id"],
+        "contract_number": row["contract_number"],
+        "application_id": row["application_id"],
+        "financier_id": row["financier_id"],
+        "offer_id": row["offer_id"],
+        "contract_file_id": row["contract_file_id"],
+        "signed_file_id": row["signed_file_id"],
+        "message_to_customer": row["message_to_customer"],
+        "internal_notes": row["internal_notes"],
+        "lessee_company_name": row["lessee_company_name"],
+        "lessee_business_id": row["lessee_business_id"],
+        "lessor_company_name": row["lessor_company_name"],
+        "monthly_rent": row["monthly_rent"],
+        "lease_period_months": row["lease_period_months"],
+        "status": row["status"],
+        "created_at": row["created_at"],
+        "updated_at": row["updated_at"],
+        "sent_at": row["sent_at"],
+        "signed_at": row["signed_at"],
+        "application": {
+            "id": row["app_id"],
+            "reference_number": row["app_reference_number"],
+            "company_name": row["app_company_name"],
+            "status": row["app_status"]
+        } if row["app_id"] is not None else None,
+        "financier_name": row["financier_name"]
+    }
+
+
 @router.get("/admin/all")
 async def get_all_contracts_admin(
+    status_filter: Optional[ContractStatus] = None,
+    financier_id: Optional[int] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.ADMIN))
+    current_user: TokenData = Depends(require_role(UserRole.ADMIN))
 ):
-    """Get all contracts for admin with application and financier info"""
-    result = await db.execute(
-        select(Contract).order_by(Contract.created_at.desc())
-    )
-    contracts_list = result.scalars().all()
-    
-    # Enrich with application and financier info
-    enriched_contracts = []
-    for contract in contracts_list:
-        # Get application
-        app_result = await db.execute(
-            select(Application).where(Application.id == contract.application_id)
-        )
-        application = app_result.scalar_one_or_none()
-        
-        # Get financier
-        fin_result = await db.execute(
-            select(Financier).where(Financier.id == contract.financier_id)
+    """
+    Get all contracts for admin with application and financier info, newest
+    first. Paginated like the application list (X-Next-Cursor header).
+    """
+    query = select(Contract)
+    if status_filter:
+        query = query.where(Contract.status == status_filter)
+    if financier_id is not None:
+        query = query.where(Contract.financier_id == financier_id)
+    
+    after = decode_cursor(cursor, "contracts") if cursor else None
+    headers = {}
+    
+    if cursor is None:
+        total = await db.execute(query.with_only_columns(func.count(Contract.id)))
+        headers["X-Total-Count"] = str(total.scalar_one())
+    
+    next_key = await keyset_next_key(db, query, Contract.created_at, Contract.id, True, after, limit)
+    if next_key is not None:
+        headers["X-Next-Cursor"] = encode_cursor("contracts", *next_key)
+    
+    # One joined projection query for the whole page, ending exactly at the
+    # row the next cursor points past (the last page runs to the end)
+    page = keyset_range(
+        query.with_only_columns(
+            Contract.id,
+            Contract.contract_number,
+            Contract.application_id,
+            Contract.financier_id,
+            Contract.offer_id,
+            Contract.contract_file_id,
+            Contract.signed_file_id,
+            Contract.message_to_customer,
+            Contract.internal_notes,
+            Contract.lessee_company_name,
+            Contract.lessee_business_id,
+            Contract.lessor_company_name,
+            Contract.monthly_rent,
+            Contract.lease_period_months,
+            Contract.status,
+            Contract.created_at,
+            Contract.updated_at,
+            Contract.sent_at,
+            Contract.signed_at,
+            Application.id.label("app_id"),
+            Application.reference_number.label("app_reference_number"),
+            Application.company_name.label("app_company_name"),
+            Application.status.label("app_status"),
+            Financier.name.label("financier_name"),
         )
-        financier = fin_result.scalar_one_or_none()
-        
-        contract_dict = {
-            "id": contract.id,
-            "contract_number": contract.contract_number,
-            "application_id": contract.application_id,
-            "financier_id": contract.financier_id,
-            "offer_id": contract.offer_id,
-            "contract_file_id": contract.contract_file_id,
-            "signed_file_id": contract.signed_file_id,
-            "message_to_customer": contract.message_to_customer,
-            "internal_notes": contract.internal_notes,
-            "lessee_company_name": contract.lessee_company_name,
-            "lessee_business_id": contract.lessee_business_id,
-            "lessor_company_name": contract.lessor_company_name,
-            "monthly_rent": contract.monthly_rent,
-            "lease_period_months": contract.lease_period_months,
-            "status": contract.status.value,
-            "created_at": contract.created_at.isoformat() if contract.created_at else None,
-            "updated_at": contract.updated_at.isoformat() if contract.updated_at else None,
-            "sent_at": contract.sent_at.isoformat() if contract.sent_at else None,
-            "signed_at": contract.signed_at.isoformat() if contract.signed_at else None,
-            "application": {
-                "id": application.id,
-                "reference_number": application.reference_number,
-                "company_name": application.company_name,
-                "status": application.status.value
-            } if application else None,
-            "financier_name": financier.name if financier else None
-        }
-        enriched_contracts.append(contract_dict)
+        .outerjoin(Application, Application.id == Contract.application_id)
+        .outerjoin(Financier, Financier.id == Contract.financier_id),
+        Contract.created_at, Contract.id, True, after, next_key
+    )
     
-    return enriched_contracts
+    return StreamingResponse(
+        stream_json_array(page, _admin_contract_dict),
+        media_type="application/json",
+        headers=headers
+    )
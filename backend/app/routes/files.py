@@ -8,12 +8,13 @@ import uuid
 
 from app.database import get_db
 from app.config import settings
-from app.models.user import User, UserRole
+from app.models.user import UserRole
 from app.models.application import Application
 from app.models.assignment import ApplicationAssignment
 from app.models.file import File as FileModel
 from app.schemas.application import FileResponse as FileResponseSchema
-from app.utils.auth import get_current_user
+from app.schemas.user import TokenData
+from app.utils.auth import get_token_data
 
 
 router = APIRouter()
@@ -25,7 +26,7 @@ async def upload_file(
     description: Optional[str] = None,
     file: UploadFile = File(...),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_token_data)
 ):
     """Upload a file for an application"""
     # Verify access to application
@@ -96,7 +97,7 @@ async def upload_file(
 async def get_application_files(
     application_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_token_data)
 ):
     """Get files for an application"""
     # Verify access
@@ -133,7 +134,7 @@ async def get_application_files(
 async def download_file(
     file_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_token_data)
 ):
     """Download a file"""
     result = await db.execute(
@@ -178,7 +179,7 @@ async def download_file(
 async def delete_file(
     file_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_token_data)
 ):
     """Delete a file"""
     result = await db.execute(
@@ -6,9 +6,10 @@ from typing import List
 
 from app.database import get_db
 from app.models.financier import Financier
-from app.models.user import User, UserRole
+from app.models.user import UserRole
 from app.schemas.financier import FinancierCreate, FinancierUpdate, FinancierResponse
-from app.utils.auth import require_role, get_current_user
+from app.schemas.user import TokenData
+from app.utils.auth import require_role
 
 
 router = APIRouter()
@@ -18,7 +19,7 @@ router = APIRouter()
 async def list_financiers(
     active_only: bool = False,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.ADMIN))
+    current_user: TokenData = Depends(require_role(UserRole.ADMIN))
 ):
     """List all financiers (Admin only)"""
     query = select(Financier).options(selectinload(Financier.users))
@@ -35,7 +36,7 @@ async def list_financiers(
 @router.get("/active", response_model=List[FinancierResponse])
 async def list_active_financiers(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.ADMIN))
+    current_user: TokenData = Depends(require_role(UserRole.ADMIN))
 ):
     """List active financiers for dropdown"""
     query = select(Financier).options(selectinload(Financier.users)).where(Financier.is_active == True).order_by(Financier.name)
@@ -47,7 +48,7 @@ async def list_active_financiers(
 async def get_financier(
     financier_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.ADMIN))
+    current_user: TokenData = Depends(require_role(UserRole.ADMIN))
 ):
     """Get financier by ID (Admin only)"""
     result = await db.execute(
@@ -70,7 +71,7 @@ async def get_financier(
 async def create_financier(
     financier_data: FinancierCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.ADMIN))
+    current_user: TokenData = Depends(require_role(UserRole.ADMIN))
 ):
     """Create a new financier (Admin only)"""
     financier = Financier(**financier_data.model_dump())
@@ -92,7 +93,7 @@ async def update_financier(
     financier_id: int,
     financier_data: FinancierUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.ADMIN))
+    current_user: TokenData = Depends(require_role(UserRole.ADMIN))
 ):
     """Update financier (Admin only)"""
     result = await db.execute(select(Financier).where(Financier.id == financier_id))
@@ -122,7 +123,7 @@ async def update_financier(
 async def delete_financier(
     financier_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.ADMIN))
+    current_user: TokenData = Depends(require_role(UserRole.ADMIN))
 ):
     """Delete/deactivate financier (Admin only)"""
     result = await db.execute(select(Financier).where(Financier.id == financier_id))
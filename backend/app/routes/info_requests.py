@@ -12,7 +12,8 @@ from app.models.info_request import InfoRequest, InfoRequestStatus, InfoRequestR
 from app.schemas.info_request import (
     InfoRequestCreate, InfoRequestResponse, InfoRequestResponseCreate
 )
-from app.utils.auth import get_current_user, require_role
+from app.schemas.user import TokenData
+from app.utils.auth import get_token_data, require_role
 from app.services.notification_service import notification_service
 from app.services.email_service import email_service
 
@@ -24,7 +25,7 @@ router = APIRouter()
 async def create_info_request(
     request_data: InfoRequestCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.FINANCIER))
+    current_user: TokenData = Depends(require_role(UserRole.FINANCIER))
 ):
     """Create info request (Financier only)"""
     # Get application
@@ -66,14 +67,21 @@ async def create_info_request(
     # Update application status
     application.status = ApplicationStatus.INFO_REQUESTED
     
-    await db.commit()
-    await db.refresh(info_request)
-    
     # Get customer
     result = await db.execute(select(User).where(User.id == application.customer_id))
     customer = result.scalar_one()
     
-    # Send notification
+    # Queue email in the same transaction
+    await email_service.send_info_request_to_customer(
+        db=db,
+        customer_email=customer.email,
+        customer_name=customer.full_name,
+        application_ref=application.reference_number,
+        message=request_data.message,
+        requested_items=request_data.requested_items
+    )
+    
+    # Send notification (in the same transaction)
     await notification_service.notify_info_requested(
         db=db,
         customer_id=customer.id,
@@ -82,14 +90,8 @@ async def create_info_request(
         message=request_data.message
     )
     
-    # Send email
-    await email_service.send_info_request_to_customer(
-        customer_email=customer.email,
-        customer_name=customer.full_name,
-        application_ref=application.reference_number,
-        message=request_data.message,
-        requested_items=request_data.requested_items
-    )
+    await db.commit()
+    await db.refresh(info_request)
     
     return info_request
 
@@ -98,7 +100,7 @@ async def create_info_request(
 async def get_application_info_requests(
     application_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_token_data)
 ):
     """Get info requests for an application"""
     # Verify access
@@ -139,7 +141,7 @@ async def get_application_info_requests(
 async def respond_to_info_request(
     response_data: InfoRequestResponseCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_token_data)
 ):
     """Respond to info request (Customer or Financier)"""
     # Get info request
@@ -179,27 +181,26 @@ async def respond_to_info_request(
     # Update info request status
     info_request.status = InfoRequestStatus.RESPONDED
     
-    await db.commit()
-    await db.refresh(info_request)
-    
-    # Send notifications
+    # Send notifications (in the same transaction)
     if current_user.role == UserRole.CUSTOMER:
         # Notify financier
         result = await db.execute(
-            select(User).where(
+            select(User.id).where(
                 User.financier_id == info_request.financier_id,
                 User.is_active == True
             )
         )
-        financier_users = result.scalars().all()
         
         await notification_service.notify_info_provided(
             db=db,
-            financier_user_ids=[u.id for u in financier_users],
+            financier_user_ids=result.scalars().all(),
             application_id=application.id,
             reference_number=application.reference_number
         )
     
+    await db.commit()
+    await db.refresh(info_request)
+    
     # Re-fetch with responses
     result = await db.execute(
         select(InfoRequest)
@@ -0,0 +1,49 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.models.user import UserRole
+from app.schemas.user import TokenData
+from app.utils.auth import require_role, password_hash_pool
+from app.services.user_cache import user_cache
+from app.services.revocation_service import revocation_service
+from app.services.sql_metrics import sql_metrics
+from app.services.email_worker import email_worker
+from app.services.email_service import email_service
+from app.services.email_templates import email_templates
+from app.services.newsletter_service import newsletter_service
+from app.services.notification_counters import notification_counters
+from app.services.notification_bus import notification_bus
+from app.services.notification_archiver import notification_archiver
+from app.services.notification_digest import notification_digest
+from app.services.ytj_service import ytj_service
+from app.services.ytj_index import ytj_index
+from app.services.company_status_refresher import company_status_refresher
+
+
+router = APIRouter()
+
+
+@router.get("/")
+async def get_metrics(
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(require_role(UserRole.ADMIN))
+):
+    """Get in-process runtime metrics of this worker (Admin only)"""
+    return {
+        "auth_cache": user_cache.stats(),
+        "token_revocations": revocation_service.stats(),
+        "password_hash_pool": password_hash_pool.stats(),
+        "sql": sql_metrics.stats(),
+        "email_outbox": await email_worker.stats(db),
+        "smtp_pool": email_service.smtp_pool.stats(),
+        "email_templates": email_templates.stats(),
+        "newsletters": newsletter_service.stats(),
+        "notification_counters": notification_counters.stats(),
+        "notification_bus": notification_bus.stats(),
+        "notification_archive": notification_archiver.stats(),
+        "notification_digests": notification_digest.stats(),
+        "ytj": ytj_service.stats(),
+        "ytj_index": ytj_index.stats(),
+        "company_status": company_status_refresher.stats(),
+    }
@@ -0,0 +1,139 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import HTMLResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
+from typing import List
+
+from app.database import get_db
+from app.models.user import User, UserRole
+from app.models.newsletter import NewsletterCampaign
+from app.schemas.newsletter import NewsletterCampaignCreate, NewsletterCampaignResponse, NewsletterUnsubscribe
+from app.schemas.user import TokenData
+from app.utils.auth import require_role
+from app.services.newsletter_service import newsletter_service, verify_unsubscribe_token, UNSUBSCRIBE_PLACEHOLDER
+
+
+router = APIRouter()
+
+
+def _to_response(campaign: NewsletterCampaign) -> NewsletterCampaignResponse:
+    response = NewsletterCampaignResponse.model_validate(campaign)
+    response.emails_per_second = newsletter_service.emails_per_second(campaign)
+    return response
+
+
+async def _get_campaign(db: AsyncSession, campaign_id: int) -> NewsletterCampaign:
+    campaign = await db.get(NewsletterCampaign, campaign_id)
+    if not campaign:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Uutiskirjettä ei löydy"
+        )
+    return campaign
+
+
+@router.post("/", response_model=NewsletterCampaignResponse)
+async def create_campaign(
+    data: NewsletterCampaignCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(require_role(UserRole.ADMIN))
+):
+    """Create a newsletter campaign as a draft (Admin only)"""
+    campaign = NewsletterCampaign(**data.model_dump(), created_by_id=current_user.user_id)
+    db.add(campaign)
+    await db.commit()
+    await db.refresh(campaign)
+    return _to_response(campaign)
+
+
+@router.get("/", response_model=List[NewsletterCampaignResponse])
+async def list_campaigns(
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(require_role(UserRole.ADMIN))
+):
+    """List newsletter campaigns (Admin only)"""
+    result = await db.execute(
+        select(NewsletterCampaign).order_by(NewsletterCampaign.created_at.desc(), NewsletterCampaign.id.desc())
+    )
+    return [_to_response(campaign) for campaign in result.scalars().all()]
+
+
+@router.get("/{campaign_id}", response_model=NewsletterCampaignResponse)
+async def get_campaign(
+    campaign_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(require_role(UserRole.ADMIN))
+):
+    """Get a campaign with its sending progress (Admin only)"""
+    return _to_response(await _get_campaign(db, campaign_id))
+
+
+@router.get("/{campaign_id}/preview", response_class=HTMLResponse)
+async def preview_campaign(
+    campaign_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(require_role(UserRole.ADMIN))
+):
+    """Render the campaign's HTML email (Admin only)"""
+    campaign = await _get_campaign(db, campaign_id)
+    html_content, _ = newsletter_service.render(campaign)
+    return html_content.replace(UNSUBSCRIBE_PLACEHOLDER, "#")
+
+
+@router.post("/{campaign_id}/send", response_model=NewsletterCampaignResponse)
+async def send_campaign(
+    campaign_id: int,
+    retry_failed: bool = False,
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(require_role(UserRole.ADMIN))
+):
+    """
+    Start or resume sending a campaign in the background (Admin only).
+    With retry_failed, recipients whose delivery failed are sent again.
+    """
+    await _get_campaign(db, campaign_id)
+    if not await newsletter_service.send(campaign_id, retry_failed=retry_failed):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Uutiskirjettä ei voi lähettää tässä tilassa"
+        )
+    
+    db.expire_all()
+    return _to_response(await _get_campaign(db, campaign_id))
+
+
+@router.post("/{campaign_id}/pause", response_model=NewsletterCampaignResponse)
+async def pause_campaign(
+    campaign_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(require_role(UserRole.ADMIN))
+):
+    """Pause a campaign that is being sent (Admin only)"""
+    await _get_campaign(db, campaign_id)
+    if not await newsletter_service.pause(campaign_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Uutiskirjettä ei lähetetä parhaillaan"
+        )
+    
+    db.expire_all()
+    return _to_response(await _get_campaign(db, campaign_id))
+
+
+@router.post("/unsubscribe")
+async def unsubscribe(
+    data: NewsletterUnsubscribe,
+    db: AsyncSession = Depends(get_db)
+):
+    """Opt out of newsletters with the link from a newsletter"""
+    user_id = verify_unsubscribe_token(data.token)
+    if user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Virheellinen peruutuslinkki"
+        )
+    
+    await db.execute(update(User).where(User.id == user_id).values(newsletter_opt_out=True))
+    await db.commit()
+    
+    return {"message": "Uutiskirjeen tilaus peruutettu"}
@@ -1,12 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 
+from app.config import settings
 from app.database import get_db
-from app.models.user import User
-from app.schemas.notification import NotificationResponse
-from app.utils.auth import get_current_user
+from app.schemas.notification import NotificationResponse, NotificationMarkRead
+from app.schemas.user import TokenData
+from app.utils.auth import get_token_data, get_stream_token_data, create_stream_ticket
+from app.utils.pagination import encode_cursor, decode_cursor
 from app.services.notification_service import notification_service
+from app.services.notification_bus import notification_bus
 
 
 router = APIRouter()
@@ -14,36 +18,79 @@ router = APIRouter()
 
 @router.get("/", response_model=List[NotificationResponse])
 async def get_notifications(
+    response: Response,
     unread_only: bool = False,
-    limit: int = 50,
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_token_data)
 ):
-    """Get current user's notifications"""
+    """
+    Get current user's notifications, newest first, one page at a time.
+    Pass the X-Next-Cursor response header back as `cursor` for the next page.
+    """
+    sort = "notifications:unread" if unread_only else "notifications"
     notifications = await notification_service.get_user_notifications(
         db=db,
         user_id=current_user.id,
         unread_only=unread_only,
-        limit=limit
+        limit=limit,
+        after=decode_cursor(cursor, sort) if cursor else None
     )
+    
+    if len(notifications) > limit:
+        notifications = notifications[:limit]
+        last = notifications[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(sort, last.created_at, last.id)
+    
     return notifications
 
 
 @router.get("/unread-count")
 async def get_unread_count(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_token_data)
 ):
     """Get count of unread notifications"""
     count = await notification_service.get_unread_count(db=db, user_id=current_user.id)
     return {"count": count}
 
 
+@router.post("/stream-ticket")
+async def create_notification_stream_ticket(
+    current_user: TokenData = Depends(get_token_data)
+):
+    """
+    Ticket for opening the notification stream, valid for
+    STREAM_TICKET_EXPIRE_SECONDS. Get a new one for each (re)connect.
+    """
+    return {"ticket": create_stream_ticket(current_user)}
+
+
+@router.get("/stream")
+async def stream_notifications(
+    last_event_id: Optional[int] = None,
+    last_event_id_header: Optional[int] = Header(None, alias="Last-Event-ID"),
+    current_user: TokenData = Depends(get_stream_token_data)
+):
+    """
+    Server-Sent Events stream of new notifications. EventSource cannot send
+    headers, so it authenticates with a `ticket` query parameter from
+    POST /stream-ticket instead of the access token.
+    """
+    cursor = last_event_id_header if last_event_id_header is not None else last_event_id
+    return StreamingResponse(
+        notification_bus.events(current_user, cursor),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.put("/{notification_id}/read")
 async def mark_notification_read(
     notification_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_token_data)
 ):
     """Mark a notification as read"""
     success = await notification_service.mark_as_read(
@@ -58,10 +105,25 @@ async def mark_notification_read(
     return {"message": "Ilmoitus merkitty luetuksi"}
 
 
+@router.put("/read")
+async def mark_notifications_read(
+    body: NotificationMarkRead,
+    db: AsyncSession = Depends(get_db),
+    current_user: TokenData = Depends(get_token_data)
+):
+    """Mark several notifications as read (ids of other users' notifications are ignored)"""
+    count = await notification_service.mark_many_as_read(
+        db=db,
+        notification_ids=body.ids,
+        user_id=current_user.id
+    )
+    return {"message": f"{count} ilmoitusta merkitty luetuksi", "count": count}
+
+
 @router.put("/read-all")
 async def mark_all_read(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_token_data)
 ):
     """Mark all notifications as read"""
     count = await notification_service.mark_all_as_read(db=db, user_id=current_user.id)
@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import List
+from sqlalchemy import select, func
+from typing import List, Optional
 from datetime import datetime
 
+from app.config import settings
 from app.database import get_db
 from app.models.user import User, UserRole
 from app.models.application import Application, ApplicationStatus
@@ -11,7 +13,10 @@ from app.models.assignment import ApplicationAssignment
 from app.models.offer import Offer, OfferStatus
 from app.models.financier import Financier
 from app.schemas.offer import OfferCreate, OfferUpdate, OfferResponse, OfferCustomerResponse
-from app.utils.auth import get_current_user, require_role
+from app.schemas.user import TokenData
+from app.utils.auth import get_current_user, get_token_data, require_role
+from app.utils.pagination import encode_cursor, decode_cursor, keyset_range, keyset_next_key
+from app.utils.streaming import stream_json_array
 from app.services.notification_service import notification_service
 from app.services.email_service import email_service
 
@@ -23,7 +28,7 @@ router = APIRouter()
 async def create_offer(
     offer_data: OfferCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.FINANCIER))
+    current_user: TokenData = Depends(require_role(UserRole.FINANCIER))
 ):
     """Create offer draft (Financier only)"""
     # Verify access to application
@@ -63,7 +68,7 @@ async def update_offer(
     offer_id: int,
     offer_data: OfferUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.FINANCIER))
+    current_user: TokenData = Depends(require_role(UserRole.FINANCIER))
 ):
     """Update offer (Financier only, draft status)"""
     result = await db.execute(
@@ -94,7 +99,7 @@ async def update_offer(
 async def send_offer_to_admin(
     offer_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.FINANCIER))
+    current_user: TokenData = Depends(require_role(UserRole.FINANCIER))
 ):
     """Send offer to admin for approval (Financier only)"""
     result = await db.execute(
@@ -126,11 +131,9 @@ async def send_offer_to_admin(
     # Update offer - send to admin for approval
     offer.status = OfferStatus.PENDING_ADMIN
     
-    await db.commit()
-    await db.refresh(offer)
-    
-    # Notify admin
+    # Notify admin (queued in the same transaction)
     await email_service.send_admin_notification(
+        db=db,
         subject=f"Uusi tarjous odottaa hyväksyntää: {application.reference_number}",
         event_type="TARJOUS ODOTTAA HYVÄKSYNTÄÄ",
         application_ref=application.reference_number,
@@ -143,23 +146,24 @@ async def send_offer_to_admin(
         }
     )
     
-    # Notify all admins
+    # Notify all admins (in the same transaction)
     result = await db.execute(
-        select(User).where(User.role == UserRole.ADMIN, User.is_active == True)
+        select(User.id).where(User.role == UserRole.ADMIN, User.is_active == True)
     )
-    admin_users = result.scalars().all()
-    
-    for admin in admin_users:
-        await notification_service.create_notification(
-            db=db,
-            user_id=admin.id,
-            title="Tarjous odottaa hyväksyntää",
-            message=f"Rahoittaja {financier.name} on lähettänyt tarjouksen hakemukselle {application.reference_number}",
-            notification_type="OFFER_PENDING",
-            reference_type="offer",
-            reference_id=offer.id,
-            action_url=f"/admin/applications/{application.id}"
-        )
+    
+    await notification_service.create_notifications(
+        db=db,
+        user_ids=result.scalars().all(),
+        title="Tarjous odottaa hyväksyntää",
+        message=f"Rahoittaja {financier.name} on lähettänyt tarjouksen hakemukselle {application.reference_number}",
+        notification_type="OFFER_PENDING",
+        reference_type="offer",
+        reference_id=offer.id,
+        action_url=f"/admin/applications/{application.id}"
+    )
+    
+    await db.commit()
+    await db.refresh(offer)
     
     return offer
 
@@ -168,7 +172,7 @@ async def send_offer_to_admin(
 async def approve_and_send_offer(
     offer_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.ADMIN))
+    current_user: TokenData = Depends(require_role(UserRole.ADMIN))
 ):
     """Approve offer and send to customer (Admin only)"""
     result = await db.execute(
@@ -201,10 +205,18 @@ async def approve_and_send_offer(
     # Update application status
     application.status = ApplicationStatus.OFFER_SENT
     
-    await db.commit()
-    await db.refresh(offer)
+    # Queue email to customer in the same transaction
+    await email_service.send_offer_to_customer(
+        db=db,
+        customer_email=customer.email,
+        customer_name=customer.full_name,
+        application_ref=application.reference_number,
+        monthly_payment=offer.monthly_payment,
+        term_months=offer.term_months,
+        notes=offer.notes_to_customer
+    )
     
-    # Send notification to customer
+    # Send notification to customer (in the same transaction)
     await notification_service.notify_offer_sent(
         db=db,
         customer_id=customer.id,
@@ -213,24 +225,17 @@ async def approve_and_send_offer(
         monthly_payment=offer.monthly_payment
     )
     
-    # Send email to customer
-    await email_service.send_offer_to_customer(
-        customer_email=customer.email,
-        customer_name=customer.full_name,
-        application_ref=application.reference_number,
-        monthly_payment=offer.monthly_payment,
-        term_months=offer.term_months,
-        notes=offer.notes_to_customer
-    )
+    await db.commit()
+    await db.refresh(offer)
     
     return offer
 
 
-@router.post("/{offer_id}/accept")
+@router.post("/{offer_id}/accept", dependencies=[Depends(require_role(UserRole.CUSTOMER))])
 async def accept_offer(
     offer_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.CUSTOMER))
+    current_user: User = Depends(get_current_user)
 ):
     """Accept offer (Customer only)"""
     result = await db.execute(
@@ -260,33 +265,15 @@ async def accept_offer(
     # Update application
     application.status = ApplicationStatus.OFFER_ACCEPTED
     
-    await db.commit()
-    
     # Get financier info
     result = await db.execute(
         select(Financier).where(Financier.id == offer.financier_id)
     )
     financier = result.scalar_one()
     
-    result = await db.execute(
-        select(User).where(
-            User.financier_id == financier.id,
-            User.is_active == True
-        )
-    )
-    financier_users = result.scalars().all()
-    
-    # Notify financier
-    await notification_service.notify_offer_accepted(
-        db=db,
-        financier_user_ids=[u.id for u in financier_users],
-        application_id=application.id,
-        reference_number=application.reference_number,
-        company_name=application.company_name
-    )
-    
-    # Send emails
+    # Queue emails in the same transaction
     await email_service.send_offer_accepted_notification(
+        db=db,
         to_email=financier.email,
         recipient_name=financier.name,
         application_ref=application.reference_number,
@@ -297,6 +284,7 @@ async def accept_offer(
     )
     
     await email_service.send_offer_accepted_notification(
+        db=db,
         to_email=current_user.email,
         recipient_name=current_user.full_name,
         application_ref=application.reference_number,
@@ -306,6 +294,24 @@ async def accept_offer(
         is_financier=False
     )
     
+    result = await db.execute(
+        select(User.id).where(
+            User.financier_id == financier.id,
+            User.is_active == True
+        )
+    )
+    
+    # Notify financier (in the same transaction)
+    await notification_service.notify_offer_accepted(
+        db=db,
+        financier_user_ids=result.scalars().all(),
+        application_id=application.id,
+        reference_number=application.reference_number,
+        company_name=application.company_name
+    )
+    
+    await db.commit()
+    
     return {"message": "Tarjous hyväksytty"}
 
 
@@ -313,7 +319,7 @@ async def accept_offer(
 async def reject_offer(
     offer_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.CUSTOMER))
+    current_user: TokenData = Depends(require_role(UserRole.CUSTOMER))
 ):
     """Reject offer (Customer only)"""
     result = await db.execute(
@@ -352,7 +358,7 @@ async def reject_offer(
 async def get_application_offers(
     application_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_token_data)
 ):
     """Get offers for an application"""
     result = await db.execute(
@@ -401,7 +407,7 @@ async def get_application_offers(
 async def get_offer(
     offer_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_token_data)
 ):
     """Get offer by ID"""
     result = await db.execute(
@@ -430,60 +436,102 @@ async def get_offer(
     return offer
 
 
+def _admin_offer_dict(row) -> dict:
+    """Offer row from the admin listing query as returned by the API"""
+    return {
+        "id": row["id"],
+        "application_id": row["application_id"],
+        "financier_id": row["financier_id"],
+        "monthly_payment": row["monthly_payment"],
+        "term_months": row["term_months"],
+        "upfront_payment": row["upfront_payment"],
+        "residual_value": row["residual_value"],
+        "interest_or_margin": row["interest_or_margin"],
+        "included_services": row["included_services"],
+        "notes_to_customer": row["notes_to_customer"],
+        "internal_notes": row["internal_notes"],
+        "status": row["status"],
+        "attachment_file_id": row["attachment_file_id"],
+        "created_at": row["created_at"],
+        "updated_at": row["updated_at"],
+        "sent_at": row["sent_at"],
+        "responded_at": row["responded_at"],
+        "expires_at": row["expires_at"],
+        "application": {
+            "id": row["app_id"],
+            "reference_number": row["app_reference_number"],
+            "company_name": row["app_company_name"],
+            "status": row["app_status"]
+        } if row["app_id"] is not None else None,
+        "financier_name": row["financier_name"]
+    }
+
+
 @router.get("/admin/all")
 async def get_all_offers_admin(
+    status_filter: Optional[OfferStatus] = None,
+    financier_id: Optional[int] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.ADMIN))
+    current_user: TokenData = Depends(require_role(UserRole.ADMIN))
 ):
-    """Get all offers for admin with application and financier info"""
-    result = await db.execute(
-        select(Offer).order_by(Offer.created_at.desc())
-    )
-    offers_list = result.scalars().all()
-    
-    # Enrich with application and financier info
-    enriched_offers = []
-    for offer in offers_list:
-        # Get application
-        app_result = await db.execute(
-            select(Application).where(Application.id == offer.application_id)
-        )
-        application = app_result.scalar_one_or_none()
-        
-        # Get financier
-        fin_result = await db.execute(
-            select(Financier).where(Financier.id == offer.financier_id)
+    """
+    Get all offers for admin with application and financier info, newest
+    first. Paginated like the application list (X-Next-Cursor header).
+    """
+    query = select(Offer)
+    if status_filter:
+        query = query.where(Offer.status == status_filter)
+    if financier_id is not None:
+        query = query.where(Offer.financier_id == financier_id)
+    
+    after = decode_cursor(cursor, "offers") if cursor else None
+    headers = {}
+    
+    if cursor is None:
+        total = await db.execute(query.with_only_columns(func.count(Offer.id)))
+        headers["X-Total-Count"] = str(total.scalar_one())
+    
+    next_key = await keyset_next_key(db, query, Offer.created_at, Offer.id, True, after, limit)
+    if next_key is not None:
+        headers["X-Next-Cursor"] = encode_cursor("offers", *next_key)
+    
+    # One joined projection query for the whole page, ending exactly at the
+    # row the next cursor points past (the last page runs to the end)
+    page = keyset_range(
+        query.with_only_columns(
+            Offer.id,
+            Offer.application_id,
+            Offer.financier_id,
+            Offer.monthly_payment,
+            Offer.term_months,
+            Offer.upfront_payment,
+            Offer.residual_value,
+            Offer.interest_or_margin,
+            Offer.included_services,
+            Offer.notes_to_customer,
+            Offer.internal_notes,
+            Offer.status,
+            Offer.attachment_file_id,
+            Offer.created_at,
+            Offer.updated_at,
+            Offer.sent_at,
+            Offer.responded_at,
+            Offer.expires_at,
+            Application.id.label("app_id"),
+            Application.reference_number.label("app_reference_number"),
+            Application.company_name.label("app_company_name"),
+            Application.status.label("app_status"),
+            Financier.name.label("financier_name"),
         )
-        financier = fin_result.scalar_one_or_none()
-        
-        offer_dict = {
-            "id": offer.id,
-            "application_id": offer.application_id,
-            "financier_id": offer.financier_id,
-            "monthly_payment": offer.monthly_payment,
-            "term_months": offer.term_months,
-            "upfront_payment": offer.upfront_payment,
-            "residual_value": offer.residual_value,
-            "interest_or_margin": offer.interest_or_margin,
-            "included_services": offer.included_services,
-            "notes_to_customer": offer.notes_to_customer,
-            "internal_notes": offer.internal_notes,
-            "status": offer.status.value,
-            "attachment_file_id": offer.attachment_file_id,
-            "created_at": offer.created_at.isoformat() if offer.created_at else None,
-            "updated_at": offer.updated_at.isoformat() if offer.updated_at else None,
-            "sent_at": offer.sent_at.isoformat() if offer.sent_at else None,
-            "responded_at": offer.responded_at.isoformat() if offer.responded_at else None,
-            "expires_at": offer.expires_at.isoformat() if offer.expires_at else None,
-            "application": {
-                "id": application.id,
-                "reference_number": application.reference_number,
-                "company_name": application.company_name,
-                "status": application.status.value
-            } if application else None,
-            "financier_name": financier.name if financier else None
-        }
-        enriched_offers.append(offer_dict)
+        .outerjoin(Application, Application.id == Offer.application_id)
+        .outerjoin(Financier, Financier.id == Offer.financier_id),
+        Offer.created_at, Offer.id, True, after, next_key
+    )
     
-    return enriched_offers
-
+    return StreamingResponse(
+        stream_json_array(page, _admin_offer_dict),
+        media_type="application/json",
+        headers=headers
+    )
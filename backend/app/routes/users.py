@@ -5,8 +5,10 @@ from typing import List
 
 from app.database import get_db
 from app.models.user import User, UserRole
-from app.schemas.user import UserUpdate, UserResponse, FinancierUserCreate
-from app.utils.auth import get_current_user, get_password_hash, require_role
+from app.schemas.user import UserUpdate, UserResponse, FinancierUserCreate, TokenData
+from app.utils.auth import get_current_user, get_password_hash_async, require_role
+from app.services.user_cache import user_cache
+from app.services.revocation_service import revocation_service
 
 
 router = APIRouter()
@@ -16,7 +18,7 @@ router = APIRouter()
 async def list_users(
     role: UserRole = None,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.ADMIN))
+    current_user: TokenData = Depends(require_role(UserRole.ADMIN))
 ):
     """List all users (Admin only)"""
     query = select(User)
@@ -32,7 +34,7 @@ async def list_users(
 async def get_user(
     user_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.ADMIN))
+    current_user: TokenData = Depends(require_role(UserRole.ADMIN))
 ):
     """Get user by ID (Admin only)"""
     result = await db.execute(select(User).where(User.id == user_id))
@@ -58,6 +60,7 @@ async def update_me(
         setattr(current_user, field, value)
     
     await db.commit()
+    user_cache.invalidate(current_user.id)
     await db.refresh(current_user)
     
     return current_user
@@ -67,7 +70,7 @@ async def update_me(
 async def create_financier_user(
     user_data: FinancierUserCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.ADMIN))
+    current_user: TokenData = Depends(require_role(UserRole.ADMIN))
 ):
     """Create a new financier user (Admin only)"""
     # Check if email exists
@@ -81,7 +84,7 @@ async def create_financier_user(
     # Create user
     user = User(
         email=user_data.email,
-        password_hash=get_password_hash(user_data.password),
+        password_hash=await get_password_hash_async(user_data.password),
         role=UserRole.FINANCIER,
         first_name=user_data.first_name,
         last_name=user_data.last_name,
@@ -92,6 +95,7 @@ async def create_financier_user(
     
     db.add(user)
     await db.commit()
+    user_cache.invalidate(user.id)
     await db.refresh(user)
     
     return user
@@ -101,7 +105,7 @@ async def create_financier_user(
 async def activate_user(
     user_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.ADMIN))
+    current_user: TokenData = Depends(require_role(UserRole.ADMIN))
 ):
     """Activate a user (Admin only)"""
     result = await db.execute(select(User).where(User.id == user_id))
@@ -115,6 +119,7 @@ async def activate_user(
     
     user.is_active = True
     await db.commit()
+    user_cache.invalidate(user.id)
     
     return {"message": "Käyttäjä aktivoitu"}
 
@@ -123,7 +128,7 @@ async def activate_user(
 async def deactivate_user(
     user_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role(UserRole.ADMIN))
+    current_user: TokenData = Depends(require_role(UserRole.ADMIN))
 ):
     """Deactivate a user (Admin only)"""
     result = await db.execute(select(User).where(User.id == user_id))
@@ -142,7 +147,9 @@ async def deactivate_user(
         )
     
     user.is_active = False
+    await revocation_service.revoke_user_tokens(db, user.id, reason="deactivated")
     await db.commit()
+    user_cache.invalidate(user.id)
     
     return {"message": "Käyttäjä deaktivoitu"}
 
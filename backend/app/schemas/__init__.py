@@ -5,7 +5,7 @@ from app.schemas.user import (
 from app.schemas.financier import FinancierCreate, FinancierUpdate, FinancierResponse
 from app.schemas.application import (
     ApplicationCreate, ApplicationUpdate, ApplicationResponse,
-    LeasingApplicationCreate, SaleLeasebackApplicationCreate
+    LeasingApplicationCreate, SaleLeasebackApplicationCreate, ApplicationStats
 )
 from app.schemas.assignment import AssignmentCreate, AssignmentResponse
 from app.schemas.info_request import (
@@ -13,18 +13,24 @@ from app.schemas.info_request import (
 )
 from app.schemas.offer import OfferCreate, OfferUpdate, OfferResponse
 from app.schemas.contract import ContractCreate, ContractUpdate, ContractResponse
-from app.schemas.notification import NotificationResponse
+from app.schemas.notification import NotificationResponse, NotificationMarkRead
+from app.schemas.newsletter import (
+    NewsletterCampaignCreate, NewsletterCampaignResponse, NewsletterUnsubscribe
+)
+from app.schemas.ytj import YtjBatchRequest
 
 __all__ = [
     "UserCreate", "UserUpdate", "UserResponse", "UserLogin", "Token", "TokenData",
     "PasswordReset", "PasswordResetConfirm",
     "FinancierCreate", "FinancierUpdate", "FinancierResponse",
     "ApplicationCreate", "ApplicationUpdate", "ApplicationResponse",
-    "LeasingApplicationCreate", "SaleLeasebackApplicationCreate",
+    "LeasingApplicationCreate", "SaleLeasebackApplicationCreate", "ApplicationStats",
     "AssignmentCreate", "AssignmentResponse",
     "InfoRequestCreate", "InfoRequestResponse", "InfoRequestResponseCreate",
     "OfferCreate", "OfferUpdate", "OfferResponse",
     "ContractCreate", "ContractUpdate", "ContractResponse",
-    "NotificationResponse",
+    "NotificationResponse", "NotificationMarkRead",
+    "NewsletterCampaignCreate", "NewsletterCampaignResponse", "NewsletterUnsubscribe",
+    "YtjBatchRequest",
 ]
 
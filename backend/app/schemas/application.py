@@ -1,7 +1,11 @@
 from pydantic import BaseModel, EmailStr
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict
 from datetime import datetime
 from app.models.application import ApplicationType, ApplicationStatus
+from app.schemas.offer import OfferResponse
+from app.schemas.contract import ContractResponse
+from app.schemas.info_request import InfoRequestResponse
+from app.schemas.assignment import AssignmentResponse
 
 
 class ApplicationCreate(BaseModel):
@@ -134,3 +138,19 @@ class ApplicationResponse(BaseModel):
     class Config:
         from_attributes = True
 
+
+class ApplicationStats(BaseModel):
+    """Counts of the applications the caller can see, for the dashboards"""
+    total: int
+    total_value: float
+    by_status: Dict[ApplicationStatus, int]
+
+
+class ApplicationWorkspaceResponse(BaseModel):
+    """Everything the application detail page shows, in one response"""
+    application: ApplicationResponse
+    offers: List[OfferResponse]
+    contracts: List[ContractResponse]
+    info_requests: List[InfoRequestResponse]
+    files: List[FileResponse]
+    assignments: Optional[List[AssignmentResponse]] = None  # Admin only
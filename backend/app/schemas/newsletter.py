@@ -0,0 +1,42 @@
+from pydantic import BaseModel
+from typing import Optional, List
+from datetime import datetime
+from app.models.newsletter import NewsletterSegment, NewsletterCampaignStatus
+
+
+class NewsletterCampaignCreate(BaseModel):
+    subject: str
+    headline: str
+    subheadline: Optional[str] = None
+    content: str
+    cta_text: Optional[str] = None
+    cta_url: Optional[str] = None
+    features: Optional[List[str]] = None
+    segment: NewsletterSegment = NewsletterSegment.ALL
+
+
+class NewsletterCampaignResponse(BaseModel):
+    id: int
+    subject: str
+    headline: str
+    subheadline: Optional[str]
+    content: str
+    cta_text: Optional[str]
+    cta_url: Optional[str]
+    features: Optional[List[str]]
+    segment: NewsletterSegment
+    status: NewsletterCampaignStatus
+    total_recipients: int
+    sent_count: int
+    failed_count: int
+    created_at: datetime
+    started_at: Optional[datetime]
+    completed_at: Optional[datetime]
+    emails_per_second: Optional[float] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class NewsletterUnsubscribe(BaseModel):
+    token: str
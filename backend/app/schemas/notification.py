@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from pydantic import BaseModel, Field
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 
@@ -20,3 +20,6 @@ class NotificationResponse(BaseModel):
     class Config:
         from_attributes = True
 
+
+class NotificationMarkRead(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=500)
@@ -52,9 +52,17 @@ class Token(BaseModel):
 
 
 class TokenData(BaseModel):
-    user_id: Optional[int] = None
+    """Signed access token claims, usable as a principal without a DB lookup"""
+    user_id: int
     email: Optional[str] = None
-    role: Optional[str] = None
+    role: UserRole
+    financier_id: Optional[int] = None
+    is_active: bool = True
+    token_version: int = 0
+    
+    @property
+    def id(self) -> int:
+        return self.user_id
 
 
 class PasswordReset(BaseModel):
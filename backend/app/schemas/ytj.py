@@ -0,0 +1,6 @@
+from pydantic import BaseModel, Field
+from typing import List
+
+
+class YtjBatchRequest(BaseModel):
+    business_ids: List[str] = Field(..., min_length=1, max_length=1000)
@@ -0,0 +1,358 @@
+from fastapi import HTTPException
+from sqlalchemy import select, update, delete, union, or_, func, bindparam
+from sqlalchemy.dialects import postgresql, sqlite
+from typing import Optional, Dict, Any, List, Set, Tuple
+from collections import defaultdict
+from datetime import datetime, timedelta
+import asyncio
+import logging
+import uuid
+
+from app.config import settings
+from app.database import async_session_maker
+from app.models.application import Application, ApplicationStatus
+from app.models.contract import Contract, ContractStatus
+from app.models.job_lease import JobLease
+from app.models.user import User, UserRole
+from app.models.ytj import YtjCompanyStatus
+from app.services.newsletter_service import RateLimiter
+from app.services.notification_service import notification_service
+from app.services.ytj_service import ytj_service, normalize_business_id, valid_business_id
+from app.utils.circuit_breaker import CircuitBreaker
+
+
+logger = logging.getLogger(__name__)
+
+CLOSED_APPLICATION_STATUSES = [ApplicationStatus.CLOSED, ApplicationStatus.CANCELLED]
+
+LEASE_NAME = "company_status_refresh"
+
+# Changes listed by name in one notification message; the rest are counted
+_MAX_LISTED_CHANGES = 5
+
+
+def _describe(is_active: Optional[bool], is_liquidated: Optional[bool]) -> str:
+    if is_liquidated:
+        return "selvitystilassa tai konkurssissa"
+    return "toiminnassa" if is_active else "ei toiminnassa"
+
+
+class CompanyStatusRefresher:
+    """
+    Keeps the PRH status of the companies behind open applications and
+    signed contracts up to date.
+
+    A periodic job picks the business ids whose ytj_company_status row is
+    missing or older than YTJ_STATUS_MAX_AGE_SECONDS and looks them up
+    in PRH through ytj_service (bypassing its cache), YTJ_STATUS_BATCH_SIZE
+    per transaction and at most YTJ_STATUS_RATE_PER_SECOND requests per
+    second. Each batch stores the new status,
+    refreshes the ytj_data snapshot in the open applications'
+    extra_data, and notifies all admins with one notification about the
+    companies whose is_active / is_liquidated changed. The first check of
+    a company compares with the snapshot taken at submission. Lookups that
+    fail (or only return stale cached data) are retried on the next run.
+
+    Every app process schedules the job, but a run only goes ahead in the
+    process holding the job_leases row, so PRH is called (and admins are
+    notified) once per company and the rate limit holds across processes.
+    """
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        # Lease holder id of this process
+        self._holder = uuid.uuid4().hex
+        self.checked = 0
+        self.changed = 0
+        self.failed = 0
+        self.last_run: Optional[datetime] = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="company-status-refresh")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self):
+        while True:
+            # Sleep first: no run (and commits) racing the first requests at startup
+            await asyncio.sleep(settings.YTJ_STATUS_INTERVAL_SECONDS)
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Company status refresh failed: {e}")
+
+    async def refresh(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Re-check every company due; returns counts of checked, changed and failed ids"""
+        now = now or datetime.utcnow()
+        cutoff = now - timedelta(seconds=settings.YTJ_STATUS_MAX_AGE_SECONDS)
+        # burst=1: PRH requests evenly spaced, not in bursts
+        limiter = RateLimiter(settings.YTJ_STATUS_RATE_PER_SECOND, burst=1)
+        counts = {"checked": 0, "changed": 0, "failed": 0}
+        if not await self._acquire_lease():
+            # Running in another process
+            return counts
+
+        # Failed this run; not picked again until the next one
+        failed: Set[str] = set()
+        try:
+            while True:
+                async with async_session_maker() as db:
+                    business_ids = await self._due(db, cutoff, failed)
+                if not business_ids:
+                    break
+                checked, changed, batch_failed = await self._refresh_batch(business_ids, limiter, now)
+                counts["checked"] += checked
+                counts["changed"] += changed
+                counts["failed"] += len(batch_failed)
+                failed.update(batch_failed)
+                if ytj_service.breaker.state == CircuitBreaker.OPEN:
+                    # PRH is down: the rest would only fail
+                    break
+                if not await self._acquire_lease():
+                    logger.warning("Company status refresh lease expired; leaving the rest to its new holder")
+                    break
+        finally:
+            await self._release_lease()
+
+        self.checked += counts["checked"]
+        self.changed += counts["changed"]
+        self.failed += counts["failed"]
+        self.last_run = now
+        return counts
+
+    async def _acquire_lease(self) -> bool:
+        """Take or renew the run lease; False if another process holds it"""
+        now = datetime.utcnow()
+        async with async_session_maker() as db:
+            dialect = db.get_bind().dialect.name
+            upsert = (postgresql if dialect == "postgresql" else sqlite).insert(JobLease)
+            result = await db.execute(
+                upsert.values(
+                    name=LEASE_NAME,
+                    holder=self._holder,
+                    locked_until=now + timedelta(seconds=settings.YTJ_STATUS_LOCK_TIMEOUT_SECONDS)
+                )
+                .on_conflict_do_update(
+                    index_elements=[JobLease.name],
+                    set_={"holder": upsert.excluded.holder, "locked_until": upsert.excluded.locked_until},
+                    where=or_(JobLease.holder == self._holder, JobLease.locked_until < now)
+                )
+                .returning(JobLease.name)
+            )
+            acquired = result.first() is not None
+            await db.commit()
+        return acquired
+
+    async def _release_lease(self):
+        async with async_session_maker() as db:
+            await db.execute(
+                delete(JobLease).where(JobLease.name == LEASE_NAME, JobLease.holder == self._holder)
+            )
+            await db.commit()
+
+    async def _due(self, db, cutoff: datetime, exclude: Set[str]) -> List[str]:
+        """Business ids of open applications and signed contracts not checked since cutoff"""
+        in_use = union(
+            select(Application.business_id.label("business_id"))
+            .where(Application.status.not_in(CLOSED_APPLICATION_STATUSES)),
+            select(func.coalesce(Contract.lessee_business_id, Application.business_id).label("business_id"))
+            .join(Application, Application.id == Contract.application_id)
+            .where(Contract.status == ContractStatus.SIGNED),
+        ).subquery()
+        query = (
+            select(in_use.c.business_id)
+            .outerjoin(YtjCompanyStatus, YtjCompanyStatus.business_id == in_use.c.business_id)
+            .where(
+                in_use.c.business_id.is_not(None),
+                or_(YtjCompanyStatus.business_id.is_(None), YtjCompanyStatus.checked_at < cutoff)
+            )
+            # Never checked first, then the oldest
+            .order_by(YtjCompanyStatus.checked_at.is_not(None), YtjCompanyStatus.checked_at, in_use.c.business_id)
+            .limit(settings.YTJ_STATUS_BATCH_SIZE)
+        )
+        if exclude:
+            query = query.where(in_use.c.business_id.not_in(exclude))
+        result = await db.execute(query)
+        return list(result.scalars().all())
+
+    async def _lookup(self, business_ids: List[str], limiter: RateLimiter) -> Dict[str, Any]:
+        """PRH company (or HTTPException) of each valid normalized id"""
+        lookups = sorted({
+            normalize_business_id(business_id) for business_id in business_ids
+            if valid_business_id(normalize_business_id(business_id))
+        })
+        results = {}
+        # Always from PRH: a cached copy may be up to YTJ_COMPANY_TTL_SECONDS old
+        async for business_id, result in ytj_service.get_companies(lookups, force=True, limiter=limiter):
+            results[business_id] = result
+        return results
+
+    async def _refresh_batch(
+        self,
+        business_ids: List[str],
+        limiter: RateLimiter,
+        now: datetime
+    ) -> Tuple[int, int, Set[str]]:
+        """One batch in one transaction; returns (checked, changed, failed ids)"""
+        results = await self._lookup(business_ids, limiter)
+
+        async with async_session_maker() as db:
+            result = await db.execute(
+                select(YtjCompanyStatus).where(YtjCompanyStatus.business_id.in_(business_ids))
+            )
+            known = {status.business_id: status for status in result.scalars().all()}
+            result = await db.execute(
+                select(
+                    Application.id,
+                    Application.business_id,
+                    Application.reference_number,
+                    Application.company_name,
+                    Application.extra_data,
+                )
+                .where(
+                    Application.business_id.in_(business_ids),
+                    Application.status.not_in(CLOSED_APPLICATION_STATUSES)
+                )
+                .order_by(Application.id)
+            )
+            applications = defaultdict(list)
+            for application in result.all():
+                applications[application.business_id].append(application)
+
+            rows = []
+            snapshots = []
+            changes = []
+            failed = set()
+            for business_id in business_ids:
+                company = results.get(normalize_business_id(business_id))
+                if isinstance(company, HTTPException) and company.status_code != 404:
+                    failed.add(business_id)
+                    continue
+                if isinstance(company, dict) and company.get("stale"):
+                    failed.add(business_id)
+                    continue
+                if not isinstance(company, dict):
+                    # Invalid id or unknown to PRH
+                    company = None
+
+                new = (company["is_active"], company["is_liquidated"]) if company else (None, None)
+                status = known.get(business_id)
+                if status is not None:
+                    previous = (status.is_active, status.is_liquidated)
+                else:
+                    previous = self._submitted_status(applications[business_id])
+                changed = company is not None and previous is not None and previous != (None, None) and previous != new
+                rows.append({
+                    "business_id": business_id,
+                    "is_active": new[0],
+                    "is_liquidated": new[1],
+                    "checked_at": now,
+                    "changed_at": now if changed else (status.changed_at if status is not None else None),
+                })
+                if changed:
+                    changes.append((business_id, company, previous, new, applications[business_id]))
+
+                for application in applications[business_id]:
+                    extra_data = application.extra_data or {}
+                    if company is not None and extra_data.get("ytj_data") != company:
+                        snapshots.append({
+                            "application_id": application.id,
+                            "snapshot": {**extra_data, "ytj_data": company},
+                        })
+
+            if rows:
+                dialect = db.get_bind().dialect.name
+                upsert = (postgresql if dialect == "postgresql" else sqlite).insert(YtjCompanyStatus)
+                await db.execute(upsert.on_conflict_do_update(
+                    index_elements=[YtjCompanyStatus.business_id],
+                    set_={
+                        "is_active": upsert.excluded.is_active,
+                        "is_liquidated": upsert.excluded.is_liquidated,
+                        "checked_at": upsert.excluded.checked_at,
+                        "changed_at": upsert.excluded.changed_at,
+                    }
+                ), rows)
+            if snapshots:
+                table = Application.__table__
+                await db.execute(
+                    update(table)
+                    .where(table.c.id == bindparam("application_id"))
+                    # updated_at kept: a refreshed snapshot is not an edit of the application
+                    .values(
+                        extra_data=bindparam("snapshot", type_=table.c.extra_data.type),
+                        updated_at=table.c.updated_at
+                    ),
+                    snapshots
+                )
+            if changes:
+                await self._notify_admins(db, changes)
+            await db.commit()
+
+        return len(rows), len(changes), failed
+
+    def _submitted_status(self, applications: List[Any]) -> Optional[Tuple[Optional[bool], Optional[bool]]]:
+        """Status in the ytj_data snapshot taken at submission, if any"""
+        for application in applications:
+            ytj_data = (application.extra_data or {}).get("ytj_data")
+            if isinstance(ytj_data, dict) and "is_active" in ytj_data:
+                return ytj_data.get("is_active"), ytj_data.get("is_liquidated")
+        return None
+
+    async def _notify_admins(self, db, changes: List[Tuple[str, Dict[str, Any], Any, Any, List[Any]]]):
+        result = await db.execute(
+            select(User.id).where(User.role == UserRole.ADMIN, User.is_active == True)
+        )
+        admin_ids = result.scalars().all()
+
+        lines = []
+        for business_id, company, previous, new, applications in changes[:_MAX_LISTED_CHANGES]:
+            references = ", ".join(application.reference_number for application in applications)
+            line = f"{company.get('name') or business_id} ({business_id}): {_describe(*previous)} → {_describe(*new)}"
+            lines.append(f"{line} (hakemukset {references})" if references else line)
+        if len(changes) > _MAX_LISTED_CHANGES:
+            lines.append(f"ja {len(changes) - _MAX_LISTED_CHANGES} muuta")
+
+        application_ids = [application.id for *_, applications in changes for application in applications]
+        single = len(application_ids) == 1
+        await notification_service.create_notifications(
+            db=db,
+            user_ids=admin_ids,
+            title="Yrityksen tila muuttunut" if len(changes) == 1 else f"{len(changes)} yrityksen tila muuttunut",
+            message="; ".join(lines),
+            notification_type="COMPANY_STATUS_CHANGED",
+            reference_type="application" if single else None,
+            reference_id=application_ids[0] if single else None,
+            action_url=f"/admin/applications/{application_ids[0]}" if single else "/admin/applications",
+            data={
+                "changes": [
+                    {
+                        "business_id": business_id,
+                        "name": company.get("name"),
+                        "is_active": new[0],
+                        "is_liquidated": new[1],
+                        "was_active": previous[0],
+                        "was_liquidated": previous[1],
+                        "application_ids": [application.id for application in applications],
+                    }
+                    for business_id, company, previous, new, applications in changes
+                ]
+            }
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "checked": self.checked,
+            "changed": self.changed,
+            "failed": self.failed,
+            "last_run": self.last_run.isoformat() if self.last_run else None,
+        }
+
+
+company_status_refresher = CompanyStatusRefresher()
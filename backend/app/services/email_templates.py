@@ -0,0 +1,117 @@
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape, StrictUndefined
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+from pathlib import Path
+import threading
+
+from app.config import settings
+
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+# Email name -> whether rendered output may be cached. Emails carrying
+# one-off secrets (tokens, passwords) are never cached.
+EMAIL_TEMPLATES: Dict[str, bool] = {
+    "verification": False,
+    "application_to_financier": True,
+    "info_request": True,
+    "offer": True,
+    "offer_accepted": True,
+    "contract": True,
+    "admin_notification": True,
+    "welcome": False,
+    "notification_digest": False,
+}
+
+
+def money(value: float) -> str:
+    return f"{value:,.2f}"
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class EmailTemplates:
+    """
+    Registry of the email templates in app/templates/emails.
+
+    Each email is a `<name>.html` / `<name>.txt` pair extending the shared
+    base layouts. All templates are compiled once by load() (at startup);
+    render() returns the HTML and plain-text bodies. Rendered output of
+    cacheable emails is kept in a small LRU keyed by the template context,
+    so repeated sends with the same inputs skip rendering.
+    """
+
+    def __init__(self, template_dir: Path = TEMPLATE_DIR, cache_size: int = settings.EMAIL_TEMPLATE_CACHE_SIZE):
+        self.env = Environment(
+            loader=FileSystemLoader(str(template_dir)),
+            autoescape=select_autoescape(["html"]),
+            undefined=StrictUndefined,
+            trim_blocks=True,
+            lstrip_blocks=True,
+            auto_reload=False,
+        )
+        self.env.filters["money"] = money
+        self.cache_size = cache_size
+        self._templates: Dict[str, Tuple[Template, Template]] = {}
+        self._cache: "OrderedDict[Hashable, Tuple[str, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self):
+        """Compile every registered email (and its layout) once"""
+        self._templates = {
+            name: (
+                self.env.get_template(f"emails/{name}.html"),
+                self.env.get_template(f"emails/{name}.txt"),
+            )
+            for name in EMAIL_TEMPLATES
+        }
+
+    def render(self, name: str, /, **context: Any) -> Tuple[str, str]:
+        """Render an email; returns (html, text)"""
+        if not self._templates:
+            self.load()
+        html_template, text_template = self._templates[name]
+
+        key: Optional[Hashable] = None
+        if EMAIL_TEMPLATES[name] and self.cache_size:
+            try:
+                key = (name, _freeze(sorted(context.items())))
+                hash(key)
+            except TypeError:
+                key = None
+        if key is not None:
+            with self._lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+                    return cached
+
+        rendered = (html_template.render(**context), text_template.render(**context).strip() + "\n")
+
+        if key is not None:
+            with self._lock:
+                self.misses += 1
+                self._cache[key] = rendered
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return rendered
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "templates": len(self._templates),
+            "cached": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+email_templates = EmailTemplates()
@@ -0,0 +1,214 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, func, event
+from typing import Optional, List, Dict, Any
+from datetime import datetime, timedelta
+import asyncio
+import logging
+import random
+
+from app.config import settings
+from app.database import async_session_maker, AppSession
+from app.models.email_outbox import EmailOutbox, EmailOutboxStatus
+from app.services.email_service import email_service, OUTBOX_PENDING_KEY
+
+
+logger = logging.getLogger(__name__)
+
+# Body of an email that is no longer going to be sent
+CLEARED_BODY = {"html_content": "", "text_content": None}
+
+
+class EmailWorker:
+    """
+    Background delivery of the email outbox.
+
+    EMAIL_WORKERS tasks claim due emails in batches, send them over SMTP and
+    record the result. A failed email is retried with exponential backoff
+    (with jitter) and moved to DEAD after EMAIL_MAX_ATTEMPTS. Claims that
+    are not finished within EMAIL_LOCK_TIMEOUT_SECONDS (e.g. the process
+    died) are released back to PENDING. The bodies of SENT and DEAD emails
+    are cleared: they may hold generated passwords or verification links,
+    which must not outlive delivery.
+
+    Workers sleep until EMAIL_OUTBOX_POLL_SECONDS has passed or a session
+    that queued an email commits.
+    """
+
+    def __init__(self):
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.sent = 0
+        self.retried = 0
+        self.dead = 0
+
+    def start(self, workers: int = settings.EMAIL_WORKERS):
+        if self._tasks:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._run(), name=f"email-worker-{i}") for i in range(workers)]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._wakeup = None
+
+    def wake(self):
+        """Wake the workers (callable from any thread)"""
+        if self._wakeup is None or self._loop is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._wakeup.set()
+        else:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def _run(self):
+        while True:
+            try:
+                processed = await self.process_batch()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Email worker failed: {e}")
+                processed = 0
+
+            if processed:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=settings.EMAIL_OUTBOX_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def claim(self, limit: int) -> List[EmailOutbox]:
+        """Mark up to `limit` due emails as SENDING and return them"""
+        now = datetime.utcnow()
+        async with async_session_maker() as db:
+            # Release claims of workers that died mid-delivery
+            await db.execute(
+                update(EmailOutbox)
+                .where(
+                    EmailOutbox.status == EmailOutboxStatus.SENDING,
+                    EmailOutbox.locked_at < now - timedelta(seconds=settings.EMAIL_LOCK_TIMEOUT_SECONDS)
+                )
+                .values(status=EmailOutboxStatus.PENDING, locked_at=None)
+            )
+
+            due = (
+                select(EmailOutbox.id)
+                .where(
+                    EmailOutbox.status == EmailOutboxStatus.PENDING,
+                    EmailOutbox.next_attempt_at <= now
+                )
+                .order_by(EmailOutbox.next_attempt_at, EmailOutbox.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            result = await db.execute(
+                update(EmailOutbox)
+                .where(
+                    EmailOutbox.id.in_(due.scalar_subquery()),
+                    EmailOutbox.status == EmailOutboxStatus.PENDING
+                )
+                .values(
+                    status=EmailOutboxStatus.SENDING,
+                    locked_at=now,
+                    attempts=EmailOutbox.attempts + 1
+                )
+                .returning(EmailOutbox)
+                .execution_options(synchronize_session=False)
+            )
+            emails = list(result.scalars().all())
+            await db.commit()
+            return emails
+
+    def retry_delay(self, attempts: int) -> float:
+        delay = min(settings.EMAIL_RETRY_MAX_SECONDS, settings.EMAIL_RETRY_BASE_SECONDS * 2 ** (attempts - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+    async def _deliver(self, email: EmailOutbox) -> Optional[str]:
+        """Send one email; returns the error message on failure"""
+        try:
+            await email_service.deliver(email)
+            return None
+        except Exception as e:
+            logger.error(f"Failed to send email to {email.to_email} (attempt {email.attempts}): {e}")
+            return str(e)[:1000] or type(e).__name__
+
+    async def process_batch(self) -> int:
+        """Deliver one batch of due emails; returns the number processed"""
+        emails = await self.claim(settings.EMAIL_WORKER_BATCH_SIZE)
+        if not emails:
+            return 0
+
+        # Delivered concurrently; the SMTP pool bounds the open connections
+        errors = await asyncio.gather(*(self._deliver(email) for email in emails))
+
+        now = datetime.utcnow()
+        async with async_session_maker() as db:
+            for email, error in zip(emails, errors):
+                values: Dict[str, Any] = {"locked_at": None, "last_error": error}
+                if error is None:
+                    values.update(status=EmailOutboxStatus.SENT, sent_at=now, **CLEARED_BODY)
+                    self.sent += 1
+                elif email.attempts >= settings.EMAIL_MAX_ATTEMPTS:
+                    values.update(status=EmailOutboxStatus.DEAD, **CLEARED_BODY)
+                    self.dead += 1
+                    logger.error(f"Giving up on email {email.id} to {email.to_email} after {email.attempts} attempts")
+                else:
+                    values.update(
+                        status=EmailOutboxStatus.PENDING,
+                        next_attempt_at=now + timedelta(seconds=self.retry_delay(email.attempts))
+                    )
+                    self.retried += 1
+                await db.execute(
+                    update(EmailOutbox)
+                    .where(EmailOutbox.id == email.id, EmailOutbox.status == EmailOutboxStatus.SENDING)
+                    .values(**values)
+                )
+            await db.commit()
+        return len(emails)
+
+    async def stats(self, db: AsyncSession) -> Dict[str, Any]:
+        result = await db.execute(
+            select(EmailOutbox.status, func.count(), func.min(EmailOutbox.created_at))
+            .group_by(EmailOutbox.status)
+        )
+        depth = {status.value: 0 for status in EmailOutboxStatus}
+        oldest_pending = None
+        for status, count, oldest in result.all():
+            depth[EmailOutboxStatus(status).value] = count
+            if status == EmailOutboxStatus.PENDING:
+                oldest_pending = oldest
+
+        return {
+            "workers": len(self._tasks),
+            "queue": depth,
+            "oldest_pending_age_seconds": (
+                round((datetime.utcnow() - oldest_pending).total_seconds(), 1) if oldest_pending else None
+            ),
+            "sent": self.sent,
+            "retried": self.retried,
+            "dead": self.dead,
+        }
+
+
+email_worker = EmailWorker()
+
+
+@event.listens_for(AppSession, "after_commit")
+def _wake_email_worker(session):
+    if session.info.pop(OUTBOX_PENDING_KEY, False):
+        email_worker.wake()
+
+
+@event.listens_for(AppSession, "after_rollback")
+def _forget_queued_email(session):
+    session.info.pop(OUTBOX_PENDING_KEY, None)
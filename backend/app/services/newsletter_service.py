@@ -0,0 +1,428 @@
+from sqlalchemy import select, update, insert, func, literal, or_
+from jinja2 import Template
+from typing import Optional, List, Dict, Any, Tuple
+from datetime import datetime, timedelta
+import asyncio
+import hashlib
+import hmac
+import logging
+import time
+
+from app.config import settings
+from app.database import async_session_maker
+from app.models.user import User, UserRole
+from app.models.newsletter import (
+    NewsletterCampaign,
+    NewsletterCampaignStatus,
+    NewsletterRecipient,
+    NewsletterRecipientStatus,
+    NewsletterSegment,
+)
+from app.services.email_service import email_service
+from app.services.email_templates import email_templates
+
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_ROLES: Dict[NewsletterSegment, Tuple[UserRole, ...]] = {
+    NewsletterSegment.ALL: (UserRole.CUSTOMER, UserRole.FINANCIER),
+    NewsletterSegment.CUSTOMER: (UserRole.CUSTOMER,),
+    NewsletterSegment.FINANCIER: (UserRole.FINANCIER,),
+}
+
+# Rendered in place of the per-recipient unsubscribe link, which is
+# substituted into the segment's rendered body for each recipient
+UNSUBSCRIBE_PLACEHOLDER = "__NEWSLETTER_UNSUBSCRIBE_URL__"
+
+# How long stop() lets running campaigns finish their current batch
+_STOP_GRACE_SECONDS = 10.0
+
+
+def unsubscribe_token(user_id: int) -> str:
+    signature = hmac.new(
+        settings.SECRET_KEY.encode(), f"newsletter-unsubscribe:{user_id}".encode(), hashlib.sha256
+    ).hexdigest()[:32]
+    return f"{user_id}.{signature}"
+
+
+def verify_unsubscribe_token(token: str) -> Optional[int]:
+    """Return the user id of a valid unsubscribe token"""
+    user_id, _, _ = token.partition(".")
+    if not user_id.isdigit():
+        return None
+    if not hmac.compare_digest(token, unsubscribe_token(int(user_id))):
+        return None
+    return int(user_id)
+
+
+class RateLimiter:
+    """Token bucket allowing `rate` acquisitions per second (no limit if rate <= 0)"""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.burst = burst or max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class NewsletterService:
+    """
+    Sends newsletter campaigns (templates/newsletter.html) in the background.
+
+    Starting a campaign stores a PENDING recipient row for every user of its
+    segment in one INSERT ... SELECT. The sender then streams the pending
+    recipients with a server-side cursor, renders the newsletter once and
+    delivers it through the SMTP pool, NEWSLETTER_CONCURRENCY emails at a
+    time and at most NEWSLETTER_RATE_PER_SECOND per second. Recipient
+    statuses and the campaign counters are written after each batch, so a
+    paused, stopped or crashed campaign resumes with the recipients still
+    PENDING; only a batch that was being sent when the process died can be
+    delivered twice.
+
+    The sending process refreshes the campaign's locked_at after every
+    batch; a SENDING campaign whose heartbeat is older than
+    NEWSLETTER_LOCK_TIMEOUT_SECONDS is picked up by another worker.
+    """
+
+    def __init__(self):
+        self._templates: Optional[Tuple[Template, Template]] = None
+        self._tasks: Dict[int, asyncio.Task] = {}
+        self._progress: Dict[int, Dict[str, float]] = {}
+        self._watchdog: Optional[asyncio.Task] = None
+        self._stopping = False
+        self.sent = 0
+        self.failed = 0
+
+    def start(self):
+        """Resume interrupted campaigns now and whenever their sender goes quiet"""
+        if self._watchdog is None:
+            self._stopping = False
+            self._watchdog = asyncio.create_task(self._watch(), name="newsletter-watchdog")
+
+    async def stop(self):
+        self._stopping = True
+        if self._watchdog is not None:
+            self._watchdog.cancel()
+            await asyncio.gather(self._watchdog, return_exceptions=True)
+            self._watchdog = None
+
+        running = dict(self._tasks)
+        if not running:
+            return
+        # Let the senders record their current batch, then release the
+        # campaigns so the next process resumes them without waiting
+        _, pending = await asyncio.wait(running.values(), timeout=_STOP_GRACE_SECONDS)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*running.values(), return_exceptions=True)
+        async with async_session_maker() as db:
+            await db.execute(
+                update(NewsletterCampaign)
+                .where(
+                    NewsletterCampaign.id.in_(list(running)),
+                    NewsletterCampaign.status == NewsletterCampaignStatus.SENDING
+                )
+                .values(locked_at=None)
+            )
+            await db.commit()
+
+    async def _watch(self):
+        while True:
+            try:
+                await self.resume_stale()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Resuming newsletter campaigns failed: {e}")
+            await asyncio.sleep(settings.NEWSLETTER_LOCK_TIMEOUT_SECONDS / 2)
+
+    def render(self, campaign: NewsletterCampaign) -> Tuple[str, str]:
+        """Render a campaign once; returns (html, text) with UNSUBSCRIBE_PLACEHOLDER"""
+        if self._templates is None:
+            self._templates = (
+                email_templates.env.get_template("newsletter.html"),
+                email_templates.env.get_template("newsletter.txt"),
+            )
+        html_template, text_template = self._templates
+        context = dict(
+            subject=campaign.subject,
+            headline=campaign.headline,
+            subheadline=campaign.subheadline,
+            content=campaign.content,
+            cta_text=campaign.cta_text,
+            cta_url=campaign.cta_url,
+            features=campaign.features or [],
+            unsubscribe_url=UNSUBSCRIBE_PLACEHOLDER,
+        )
+        return html_template.render(**context), text_template.render(**context).strip() + "\n"
+
+    def unsubscribe_url(self, user_id: int) -> str:
+        return f"{settings.FRONTEND_URL}/newsletter/unsubscribe?token={unsubscribe_token(user_id)}"
+
+    async def send(self, campaign_id: int, retry_failed: bool = False) -> bool:
+        """
+        Start or resume sending a DRAFT or PAUSED campaign (or a COMPLETED
+        one with retry_failed). Returns False if the campaign is not in a
+        sendable state.
+        """
+        sendable = [NewsletterCampaignStatus.DRAFT, NewsletterCampaignStatus.PAUSED]
+        if retry_failed:
+            sendable.append(NewsletterCampaignStatus.COMPLETED)
+
+        now = datetime.utcnow()
+        async with async_session_maker() as db:
+            result = await db.execute(
+                update(NewsletterCampaign)
+                .where(NewsletterCampaign.id == campaign_id, NewsletterCampaign.status.in_(sendable))
+                .values(status=NewsletterCampaignStatus.SENDING, locked_at=now, completed_at=None)
+                .returning(NewsletterCampaign)
+                .execution_options(synchronize_session=False)
+            )
+            campaign = result.scalar_one_or_none()
+            if campaign is None:
+                return False
+
+            values: Dict[str, Any] = {}
+            if campaign.started_at is None:
+                values.update(started_at=now, total_recipients=await self._add_recipients(db, campaign))
+            if retry_failed:
+                await db.execute(
+                    update(NewsletterRecipient)
+                    .where(
+                        NewsletterRecipient.campaign_id == campaign_id,
+                        NewsletterRecipient.status == NewsletterRecipientStatus.FAILED
+                    )
+                    .values(status=NewsletterRecipientStatus.PENDING, error=None)
+                )
+                values.update(failed_count=0)
+            if values:
+                await db.execute(
+                    update(NewsletterCampaign).where(NewsletterCampaign.id == campaign_id).values(**values)
+                )
+            await db.commit()
+
+        self._spawn(campaign_id)
+        return True
+
+    async def pause(self, campaign_id: int) -> bool:
+        """Stop a SENDING campaign after its current batch"""
+        async with async_session_maker() as db:
+            result = await db.execute(
+                update(NewsletterCampaign)
+                .where(
+                    NewsletterCampaign.id == campaign_id,
+                    NewsletterCampaign.status == NewsletterCampaignStatus.SENDING
+                )
+                .values(status=NewsletterCampaignStatus.PAUSED, locked_at=None)
+            )
+            await db.commit()
+            return result.rowcount > 0
+
+    async def resume_stale(self) -> List[int]:
+        """Take over SENDING campaigns whose sender stopped reporting progress"""
+        if self._stopping:
+            return []
+        now = datetime.utcnow()
+        stale = [
+            NewsletterCampaign.status == NewsletterCampaignStatus.SENDING,
+            or_(
+                NewsletterCampaign.locked_at.is_(None),
+                NewsletterCampaign.locked_at < now - timedelta(seconds=settings.NEWSLETTER_LOCK_TIMEOUT_SECONDS)
+            ),
+        ]
+        if self._tasks:
+            stale.append(NewsletterCampaign.id.not_in(list(self._tasks)))
+        async with async_session_maker() as db:
+            result = await db.execute(
+                update(NewsletterCampaign)
+                .where(*stale)
+                .values(locked_at=now)
+                .returning(NewsletterCampaign.id)
+            )
+            campaign_ids = list(result.scalars().all())
+            await db.commit()
+
+        for campaign_id in campaign_ids:
+            logger.info(f"Resuming newsletter campaign {campaign_id}")
+            self._spawn(campaign_id)
+        return campaign_ids
+
+    async def _add_recipients(self, db, campaign: NewsletterCampaign) -> int:
+        """Insert a PENDING recipient for every subscribed user of the segment"""
+        users = (
+            select(
+                literal(campaign.id),
+                User.id,
+                User.email,
+                literal(NewsletterRecipientStatus.PENDING, NewsletterRecipient.status.type),
+            )
+            .where(
+                User.role.in_(SEGMENT_ROLES[campaign.segment]),
+                User.is_active == True,
+                User.newsletter_opt_out == False
+            )
+            .order_by(User.id)
+        )
+        await db.execute(
+            insert(NewsletterRecipient).from_select(["campaign_id", "user_id", "email", "status"], users)
+        )
+        return await db.scalar(
+            select(func.count())
+            .select_from(NewsletterRecipient)
+            .where(NewsletterRecipient.campaign_id == campaign.id)
+        )
+
+    def _spawn(self, campaign_id: int):
+        if campaign_id in self._tasks:
+            return
+        task = asyncio.create_task(self._run(campaign_id), name=f"newsletter-{campaign_id}")
+        self._tasks[campaign_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(campaign_id, None))
+
+    async def _run(self, campaign_id: int):
+        try:
+            async with async_session_maker() as db:
+                campaign = await db.get(NewsletterCampaign, campaign_id)
+            html_content, text_content = self.render(campaign)
+
+            rate = settings.NEWSLETTER_RATE_PER_SECOND
+            limiter = RateLimiter(rate)
+            semaphore = asyncio.Semaphore(settings.NEWSLETTER_CONCURRENCY)
+            # Keep each batch well within the lock timeout so the heartbeat stays fresh
+            batch_size = settings.NEWSLETTER_BATCH_SIZE
+            if rate > 0:
+                batch_size = min(batch_size, max(1, int(rate * settings.NEWSLETTER_LOCK_TIMEOUT_SECONDS / 4)))
+
+            progress = {"started": time.monotonic(), "sent": 0, "failed": 0}
+            self._progress[campaign_id] = progress
+
+            async def deliver(recipient) -> Optional[str]:
+                async with semaphore:
+                    await limiter.acquire()
+                    url = self.unsubscribe_url(recipient.user_id)
+                    try:
+                        await email_service.deliver_message(
+                            to_email=recipient.email,
+                            subject=campaign.subject,
+                            html_content=html_content.replace(UNSUBSCRIBE_PLACEHOLDER, url),
+                            text_content=text_content.replace(UNSUBSCRIBE_PLACEHOLDER, url),
+                        )
+                        return None
+                    except Exception as e:
+                        logger.warning(f"Newsletter {campaign_id} to {recipient.email} failed: {e}")
+                        return str(e)[:1000] or type(e).__name__
+
+            async with async_session_maker() as reader:
+                result = await reader.stream(
+                    select(NewsletterRecipient.id, NewsletterRecipient.user_id, NewsletterRecipient.email)
+                    .where(
+                        NewsletterRecipient.campaign_id == campaign_id,
+                        NewsletterRecipient.status == NewsletterRecipientStatus.PENDING
+                    )
+                    .order_by(NewsletterRecipient.id)
+                    .execution_options(yield_per=batch_size)
+                )
+                async for recipients in result.partitions(batch_size):
+                    errors = await asyncio.gather(*(deliver(recipient) for recipient in recipients))
+                    still_sending = await self._record(campaign_id, recipients, errors)
+                    progress["sent"] += errors.count(None)
+                    progress["failed"] += len(errors) - errors.count(None)
+                    if not still_sending or self._stopping:
+                        return
+
+            await self._complete(campaign_id, progress)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Left SENDING; resumed once the heartbeat goes stale
+            logger.error(f"Newsletter campaign {campaign_id} failed: {e}")
+        finally:
+            self._progress.pop(campaign_id, None)
+
+    async def _record(self, campaign_id: int, recipients, errors: List[Optional[str]]) -> bool:
+        """Store the results of one batch; returns False if the campaign was paused"""
+        now = datetime.utcnow()
+        sent_ids = [recipient.id for recipient, error in zip(recipients, errors) if error is None]
+        async with async_session_maker() as db:
+            if sent_ids:
+                await db.execute(
+                    update(NewsletterRecipient)
+                    .where(NewsletterRecipient.id.in_(sent_ids))
+                    .values(status=NewsletterRecipientStatus.SENT, sent_at=now)
+                )
+            for recipient, error in zip(recipients, errors):
+                if error is not None:
+                    await db.execute(
+                        update(NewsletterRecipient)
+                        .where(NewsletterRecipient.id == recipient.id)
+                        .values(status=NewsletterRecipientStatus.FAILED, error=error)
+                    )
+            status = await db.scalar(
+                update(NewsletterCampaign)
+                .where(NewsletterCampaign.id == campaign_id)
+                .values(
+                    sent_count=NewsletterCampaign.sent_count + len(sent_ids),
+                    failed_count=NewsletterCampaign.failed_count + len(recipients) - len(sent_ids),
+                    locked_at=now
+                )
+                .returning(NewsletterCampaign.status)
+            )
+            await db.commit()
+
+        self.sent += len(sent_ids)
+        self.failed += len(recipients) - len(sent_ids)
+        return status == NewsletterCampaignStatus.SENDING
+
+    async def _complete(self, campaign_id: int, progress: Dict[str, float]):
+        async with async_session_maker() as db:
+            await db.execute(
+                update(NewsletterCampaign)
+                .where(
+                    NewsletterCampaign.id == campaign_id,
+                    NewsletterCampaign.status == NewsletterCampaignStatus.SENDING
+                )
+                .values(status=NewsletterCampaignStatus.COMPLETED, completed_at=datetime.utcnow(), locked_at=None)
+            )
+            await db.commit()
+
+        elapsed = time.monotonic() - progress["started"]
+        logger.info(
+            f"Newsletter campaign {campaign_id} completed: {progress['sent']:.0f} sent, "
+            f"{progress['failed']:.0f} failed in {elapsed:.1f} s "
+            f"({(progress['sent'] + progress['failed']) / elapsed if elapsed else 0:.1f} emails/s)"
+        )
+
+    def emails_per_second(self, campaign: NewsletterCampaign) -> Optional[float]:
+        """Throughput of the running send in this worker, or of the whole campaign"""
+        progress = self._progress.get(campaign.id)
+        if progress is not None:
+            elapsed = time.monotonic() - progress["started"]
+            return round((progress["sent"] + progress["failed"]) / elapsed, 1) if elapsed else None
+        if campaign.started_at and campaign.completed_at:
+            elapsed = (campaign.completed_at - campaign.started_at).total_seconds()
+            return round((campaign.sent_count + campaign.failed_count) / elapsed, 1) if elapsed else None
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": sorted(self._tasks),
+            "sent": self.sent,
+            "failed": self.failed,
+        }
+
+
+newsletter_service = NewsletterService()
@@ -0,0 +1,116 @@
+from sqlalchemy import select, insert, delete, literal
+from typing import Optional, Dict, Any, List
+from datetime import datetime, timedelta
+import asyncio
+import logging
+
+from app.config import settings
+from app.database import async_session_maker
+from app.models.notification import Notification, NotificationArchive
+
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationArchiver:
+    """
+    Retention for the notifications table.
+
+    Read notifications created more than NOTIFICATION_RETENTION_DAYS ago
+    are copied to notifications_archive and deleted, one transaction per
+    NOTIFICATION_ARCHIVE_BATCH_SIZE rows, so the hot table only holds
+    unread and recent notifications. Unread notifications are never
+    archived, which keeps the unread counters valid without changes.
+    Runs at startup and every NOTIFICATION_ARCHIVE_INTERVAL_SECONDS.
+    """
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self.archived = 0
+        self.last_run: Optional[datetime] = None
+
+    def start(self):
+        if self._task is None and settings.NOTIFICATION_RETENTION_DAYS > 0:
+            self._task = asyncio.create_task(self._run(), name="notification-archiver")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self.archive()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Notification archiving failed: {e}")
+            await asyncio.sleep(settings.NOTIFICATION_ARCHIVE_INTERVAL_SECONDS)
+
+    async def archive(self, before: Optional[datetime] = None) -> int:
+        """Archive read notifications created before `before`; returns the number moved"""
+        if before is None:
+            before = datetime.utcnow() - timedelta(days=settings.NOTIFICATION_RETENTION_DAYS)
+        total = 0
+        after_id = 0
+        while True:
+            ids = await self._archive_batch(before, after_id)
+            if not ids:
+                break
+            total += len(ids)
+            after_id = ids[-1]
+            if len(ids) < settings.NOTIFICATION_ARCHIVE_BATCH_SIZE:
+                break
+            # Let requests waiting for the writer go first
+            await asyncio.sleep(0)
+
+        self.archived += total
+        self.last_run = datetime.utcnow()
+        if total:
+            logger.info(f"Archived {total} read notifications created before {before:%Y-%m-%d}")
+        return total
+
+    async def _archive_batch(self, before: datetime, after_id: int) -> List[int]:
+        """Move the next batch of read notifications with ids above after_id"""
+        async with async_session_maker() as db:
+            result = await db.execute(
+                select(Notification.id)
+                .where(
+                    Notification.id > after_id,
+                    Notification.is_read == True,
+                    Notification.created_at < before
+                )
+                .order_by(Notification.id)
+                .limit(settings.NOTIFICATION_ARCHIVE_BATCH_SIZE)
+            )
+            ids = list(result.scalars().all())
+            if not ids:
+                return ids
+
+            columns = [column.name for column in Notification.__table__.columns]
+            await db.execute(
+                insert(NotificationArchive).from_select(
+                    columns + ["archived_at"],
+                    select(*Notification.__table__.columns, literal(datetime.utcnow()))
+                    .where(Notification.id.in_(ids), Notification.is_read == True)
+                )
+            )
+            await db.execute(
+                delete(Notification)
+                .where(Notification.id.in_(ids), Notification.is_read == True)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        return ids
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "retention_days": settings.NOTIFICATION_RETENTION_DAYS,
+            "archived": self.archived,
+            "last_run": self.last_run.isoformat() if self.last_run else None,
+        }
+
+
+notification_archiver = NotificationArchiver()
@@ -0,0 +1,299 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, text, event
+from typing import Optional, Dict, Any, Iterable, List, Set, AsyncIterator
+import asyncio
+import logging
+
+from app.config import settings
+from app.database import engine, async_session_maker, AppSession
+from app.models.notification import Notification
+from app.schemas.notification import NotificationResponse
+from app.schemas.user import TokenData
+from app.services.notification_counters import notification_counters
+from app.services.revocation_service import revocation_service
+
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "kantama_notifications"
+
+# Set in session.info to the ids of users who got new notifications; they
+# are published once that session commits
+PUBLISH_PENDING_KEY = "notification_bus_pending"
+
+# pg_notify payloads must stay under 8000 bytes
+_MAX_PAYLOAD_BYTES = 7900
+
+# Notifications sent per query while a stream catches up
+_STREAM_BATCH_SIZE = 100
+
+# Wait before reconnecting a lost LISTEN connection
+_LISTEN_RETRY_SECONDS = 5.0
+
+
+class LocalBackend:
+    """Publishes to the streams of this process when the session commits"""
+
+    name = "local"
+
+    def __init__(self, bus: "NotificationBus"):
+        self.bus = bus
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    async def publish(self, db: AsyncSession, user_ids: Set[int]):
+        db.info.setdefault(PUBLISH_PENDING_KEY, set()).update(user_ids)
+
+    def after_commit(self, user_ids: Set[int]):
+        self.bus.dispatch_threadsafe(user_ids)
+
+
+class PostgresBackend:
+    """
+    Publishes through Postgres NOTIFY, so the streams of every worker are
+    woken. The NOTIFY is sent in the caller's transaction and delivered by
+    Postgres only if it commits.
+    """
+
+    name = "postgres"
+
+    def __init__(self, bus: "NotificationBus"):
+        self.bus = bus
+        self._task: Optional[asyncio.Task] = None
+        self.reconnects = 0
+
+    async def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen(), name="notification-listener")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def publish(self, db: AsyncSession, user_ids: Set[int]):
+        chunk: List[str] = []
+        size = 0
+        for user_id in sorted(user_ids):
+            item = str(user_id)
+            if chunk and size + len(item) + 1 > _MAX_PAYLOAD_BYTES:
+                await self._notify(db, chunk)
+                chunk, size = [], 0
+            chunk.append(item)
+            size += len(item) + 1
+        if chunk:
+            await self._notify(db, chunk)
+
+    async def _notify(self, db: AsyncSession, user_ids: List[str]):
+        await db.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": NOTIFY_CHANNEL, "payload": ",".join(user_ids)}
+        )
+
+    def after_commit(self, user_ids: Set[int]):
+        pass
+
+    def _on_notify(self, connection, pid, channel, payload):
+        self.bus.dispatch({int(user_id) for user_id in payload.split(",") if user_id})
+
+    async def _listen(self):
+        import asyncpg
+
+        dsn = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(dsn)
+                await connection.add_listener(NOTIFY_CHANNEL, self._on_notify)
+                # Anything published while disconnected: let every stream re-check
+                self.bus.dispatch_all()
+                while not connection.is_closed():
+                    await asyncio.sleep(_LISTEN_RETRY_SECONDS)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Notification listener failed: {e}")
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            self.reconnects += 1
+            await asyncio.sleep(_LISTEN_RETRY_SECONDS)
+
+
+class NotificationBus:
+    """
+    Pushes new notifications to their users over Server-Sent Events.
+
+    NotificationService publishes the ids of users who got notifications;
+    the bus wakes those users' open streams, which then read the new rows
+    from the database after the last notification id they sent. A client
+    that reconnects with Last-Event-ID gets everything it missed, and a
+    lost wake-up only delays delivery until the next heartbeat.
+
+    NOTIFICATION_PUBSUB_BACKEND selects how wake-ups travel: "postgres"
+    (LISTEN/NOTIFY, reaches every worker), "local" (this process only;
+    streams on other workers catch up at the heartbeat) or "auto".
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[int, Set[asyncio.Event]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopping = False
+        self.backend = self._create_backend(settings.NOTIFICATION_PUBSUB_BACKEND)
+        self.published = 0
+        self.dispatched = 0
+        self.sent = 0
+
+    def _create_backend(self, name: str):
+        if name == "auto":
+            name = "postgres" if engine.dialect.name == "postgresql" else "local"
+        if name == "postgres":
+            return PostgresBackend(self)
+        if name == "local":
+            return LocalBackend(self)
+        raise ValueError(f"Unknown NOTIFICATION_PUBSUB_BACKEND: {name}")
+
+    async def start(self):
+        self._loop = asyncio.get_running_loop()
+        self._stopping = False
+        await self.backend.start()
+
+    async def stop(self):
+        await self.backend.stop()
+        # Close open streams now instead of at their next heartbeat
+        self._stopping = True
+        self.dispatch_all()
+
+    async def publish(self, db: AsyncSession, user_ids: Iterable[int]):
+        """Wake the streams of `user_ids` once the caller's transaction commits"""
+        user_ids = set(user_ids)
+        if user_ids:
+            await self.backend.publish(db, user_ids)
+            self.published += len(user_ids)
+
+    def subscribe(self, user_id: int) -> asyncio.Event:
+        wakeup = asyncio.Event()
+        self._subscribers.setdefault(user_id, set()).add(wakeup)
+        return wakeup
+
+    def unsubscribe(self, user_id: int, wakeup: asyncio.Event):
+        subscribers = self._subscribers.get(user_id)
+        if subscribers is not None:
+            subscribers.discard(wakeup)
+            if not subscribers:
+                del self._subscribers[user_id]
+
+    def dispatch(self, user_ids: Iterable[int]):
+        for user_id in user_ids:
+            for wakeup in self._subscribers.get(user_id, ()):
+                wakeup.set()
+                self.dispatched += 1
+
+    def dispatch_all(self):
+        self.dispatch(list(self._subscribers))
+
+    def dispatch_threadsafe(self, user_ids: Set[int]):
+        """dispatch() from any thread (session events may run off the loop)"""
+        if self._loop is None or self._loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self.dispatch(user_ids)
+        else:
+            self._loop.call_soon_threadsafe(self.dispatch, user_ids)
+
+    async def events(self, token_data: TokenData, last_event_id: Optional[int] = None) -> AsyncIterator[str]:
+        """
+        SSE stream of a user's notifications. Every connection starts with
+        an `unread` event holding the unread count; reconnects
+        (last_event_id) then resume with the notifications created after
+        that id, so their `unread` counts only the notifications up to it
+        and each replayed unread notification adds one. Ends when the
+        token is revoked or the bus stops.
+        """
+        user_id = token_data.user_id
+        wakeup = self.subscribe(user_id)
+        try:
+            yield f"retry: {settings.NOTIFICATION_STREAM_RETRY_MS}\n\n"
+
+            cursor = last_event_id
+            async with async_session_maker() as db:
+                if cursor is None:
+                    cursor = await db.scalar(
+                        select(func.max(Notification.id)).where(Notification.user_id == user_id)
+                    ) or 0
+                    count = await notification_counters.get(db, user_id)
+                else:
+                    count = await db.scalar(
+                        select(func.count(Notification.id)).where(
+                            Notification.user_id == user_id,
+                            Notification.is_read == False,
+                            Notification.id <= cursor,
+                        )
+                    )
+            yield f"event: unread\ndata: {count}\n\n"
+
+            while not self._stopping:
+                wakeup.clear()
+                async with async_session_maker() as db:
+                    result = await db.execute(
+                        select(Notification)
+                        .where(Notification.user_id == user_id, Notification.id > cursor)
+                        .order_by(Notification.id)
+                        .limit(_STREAM_BATCH_SIZE)
+                    )
+                    notifications = result.scalars().all()
+                for notification in notifications:
+                    cursor = notification.id
+                    data = NotificationResponse.model_validate(notification).model_dump_json()
+                    yield f"id: {notification.id}\nevent: notification\ndata: {data}\n\n"
+                self.sent += len(notifications)
+                if len(notifications) == _STREAM_BATCH_SIZE:
+                    continue
+
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=settings.NOTIFICATION_STREAM_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    # Keeps proxies from closing an idle connection
+                    yield ": ping\n\n"
+                    await revocation_service.refresh()
+                    if revocation_service.is_revoked(user_id, token_data.token_version):
+                        return
+        finally:
+            self.unsubscribe(user_id, wakeup)
+
+    def stats(self) -> Dict[str, Any]:
+        stats = {
+            "backend": self.backend.name,
+            "streams": sum(len(subscribers) for subscribers in self._subscribers.values()),
+            "users": len(self._subscribers),
+            "published": self.published,
+            "dispatched": self.dispatched,
+            "sent": self.sent,
+        }
+        if isinstance(self.backend, PostgresBackend):
+            stats["reconnects"] = self.backend.reconnects
+        return stats
+
+
+notification_bus = NotificationBus()
+
+
+@event.listens_for(AppSession, "after_commit")
+def _publish_notifications(session):
+    user_ids = session.info.pop(PUBLISH_PENDING_KEY, None)
+    if user_ids:
+        notification_bus.backend.after_commit(user_ids)
+
+
+@event.listens_for(AppSession, "after_rollback")
+def _forget_notifications(session):
+    session.info.pop(PUBLISH_PENDING_KEY, None)
@@ -0,0 +1,205 @@
+from collections import OrderedDict
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, insert, func, case, exists, literal, event
+from sqlalchemy.dialects import postgresql, sqlite
+from typing import Optional, Dict, Any, Iterable, List, Tuple
+from datetime import datetime
+import asyncio
+import logging
+import time
+
+from app.config import settings
+from app.database import async_session_maker, AppSession
+from app.models.notification import Notification, NotificationCounter
+
+
+logger = logging.getLogger(__name__)
+
+# Set in session.info to the ids of users whose counter changed; their
+# cache entries are dropped after that session commits
+COUNTERS_CHANGED_KEY = "notification_counters_changed"
+
+
+class NotificationCounters:
+    """
+    Unread notification count of each user (notification_counters table).
+
+    Counters are updated in the caller's transaction together with the
+    notifications they count, relative to their current value, so
+    concurrent changes do not overwrite each other. Reads go through a
+    size-bounded TTL cache in this process; a user's entry is dropped when
+    a session that changed the counter commits, and other workers see the
+    change after at most NOTIFICATION_COUNT_CACHE_TTL_SECONDS.
+
+    repair() recounts the counters from the notifications table and fixes
+    any that drifted; it runs at startup and every
+    NOTIFICATION_COUNTER_REPAIR_SECONDS.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[int, Tuple[float, int]]" = OrderedDict()
+        self._versions: Dict[int, int] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+        self.repaired = 0
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="notification-counter-repair")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self.repair()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Notification counter repair failed: {e}")
+            await asyncio.sleep(settings.NOTIFICATION_COUNTER_REPAIR_SECONDS)
+
+    async def get(self, db: AsyncSession, user_id: int) -> int:
+        """Unread count of a user: a cache hit or one primary key lookup"""
+        entry = self._entries.get(user_id)
+        if entry is not None and entry[0] >= time.monotonic():
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+
+        version = self._versions.get(user_id, 0)
+        count = await db.scalar(
+            select(NotificationCounter.unread).where(NotificationCounter.user_id == user_id)
+        ) or 0
+
+        # Not stored if the counter changed while it was being read
+        if self.max_size > 0 and self._versions.get(user_id, 0) == version:
+            self._entries[user_id] = (time.monotonic() + self.ttl_seconds, count)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return count
+
+    async def increment(self, db: AsyncSession, counts: Dict[int, int]):
+        """Add `counts` (user id -> new unread notifications) in one upsert"""
+        if not counts:
+            return
+        dialect = db.get_bind().dialect.name
+        upsert = (postgresql if dialect == "postgresql" else sqlite).insert(NotificationCounter)
+        upsert = upsert.on_conflict_do_update(
+            index_elements=[NotificationCounter.user_id],
+            set_={
+                "unread": NotificationCounter.unread + upsert.excluded.unread,
+                "updated_at": upsert.excluded.updated_at,
+            }
+        )
+        now = datetime.utcnow()
+        # Sorted so concurrent fan-outs lock the counter rows in the same order
+        await db.execute(upsert, [
+            {"user_id": user_id, "unread": count, "updated_at": now}
+            for user_id, count in sorted(counts.items())
+        ])
+        self._changed(db, counts)
+
+    async def decrement(self, db: AsyncSession, user_id: int, amount: int):
+        """Subtract `amount` read notifications (never below zero)"""
+        if amount <= 0:
+            return
+        await db.execute(
+            update(NotificationCounter)
+            .where(NotificationCounter.user_id == user_id)
+            .values(
+                unread=case(
+                    (NotificationCounter.unread > amount, NotificationCounter.unread - amount),
+                    else_=0
+                ),
+                updated_at=datetime.utcnow()
+            )
+        )
+        self._changed(db, [user_id])
+
+    def _changed(self, db: AsyncSession, user_ids: Iterable[int]):
+        db.info.setdefault(COUNTERS_CHANGED_KEY, set()).update(user_ids)
+
+    def invalidate(self, user_ids: Iterable[int]):
+        for user_id in user_ids:
+            self._versions[user_id] = self._versions.get(user_id, 0) + 1
+            self._entries.pop(user_id, None)
+
+    async def repair(self) -> List[int]:
+        """Recount every counter from notifications; returns the users fixed"""
+        now = datetime.utcnow()
+        async with async_session_maker() as db:
+            actual = (
+                select(func.count())
+                .where(Notification.user_id == NotificationCounter.user_id, Notification.is_read == False)
+                .scalar_subquery()
+            )
+            result = await db.execute(
+                update(NotificationCounter)
+                .where(NotificationCounter.unread != actual)
+                .values(unread=actual, updated_at=now)
+                .returning(NotificationCounter.user_id)
+            )
+            user_ids = list(result.scalars().all())
+
+            # Users with unread notifications but no counter row
+            result = await db.execute(
+                insert(NotificationCounter)
+                .from_select(
+                    ["user_id", "unread", "updated_at"],
+                    select(Notification.user_id, func.count(), literal(now))
+                    .where(
+                        Notification.is_read == False,
+                        ~exists().where(NotificationCounter.user_id == Notification.user_id)
+                    )
+                    .group_by(Notification.user_id)
+                )
+                .returning(NotificationCounter.user_id)
+            )
+            user_ids.extend(result.scalars().all())
+            await db.commit()
+
+        if user_ids:
+            logger.warning(f"Repaired unread notification counters of {len(user_ids)} users")
+            self.invalidate(user_ids)
+            self.repaired += len(user_ids)
+        return user_ids
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "repaired": self.repaired,
+        }
+
+
+notification_counters = NotificationCounters(
+    max_size=settings.NOTIFICATION_COUNT_CACHE_SIZE,
+    ttl_seconds=settings.NOTIFICATION_COUNT_CACHE_TTL_SECONDS,
+)
+
+
+@event.listens_for(AppSession, "after_commit")
+def _invalidate_notification_counts(session):
+    user_ids = session.info.pop(COUNTERS_CHANGED_KEY, None)
+    if user_ids:
+        notification_counters.invalidate(user_ids)
+
+
+@event.listens_for(AppSession, "after_rollback")
+def _forget_notification_counts(session):
+    session.info.pop(COUNTERS_CHANGED_KEY, None)
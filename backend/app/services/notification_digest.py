@@ -0,0 +1,156 @@
+from sqlalchemy import select, update, func
+from typing import Optional, Dict, Any, List, Set
+from collections import defaultdict
+from datetime import datetime, timedelta
+import asyncio
+import logging
+
+from app.config import settings
+from app.database import async_session_maker
+from app.models.notification import Notification
+from app.models.user import User, UserRole
+from app.services.email_service import email_service
+from app.services.email_templates import email_templates
+
+
+logger = logging.getLogger(__name__)
+
+
+def digest_roles() -> Set[UserRole]:
+    return {UserRole(role.strip()) for role in settings.NOTIFICATION_DIGEST_ROLES.split(",") if role.strip()}
+
+
+class NotificationDigest:
+    """
+    Emails each user's new notifications as one digest.
+
+    A periodic job picks users whose oldest unsent notification
+    (is_email_sent = false) is older than NOTIFICATION_DIGEST_WINDOW_SECONDS,
+    claims all their unsent notifications with one UPDATE ... RETURNING and
+    queues one digest email per user in the outbox, in the same
+    transaction. Claimed rows are never emailed twice, even with several
+    workers running the job. Notifications already read in the app are
+    claimed but left out of the email, and users outside
+    NOTIFICATION_DIGEST_ROLES get no email at all.
+    """
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self.digests = 0
+        self.notifications = 0
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="notification-digest")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self.send_due()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Notification digests failed: {e}")
+            await asyncio.sleep(settings.NOTIFICATION_DIGEST_POLL_SECONDS)
+
+    async def send_due(self, now: Optional[datetime] = None) -> int:
+        """Queue the digests that are due; returns the number of emails queued"""
+        cutoff = (now or datetime.utcnow()) - timedelta(seconds=settings.NOTIFICATION_DIGEST_WINDOW_SECONDS)
+        queued = 0
+        while True:
+            users, emails = await self._send_batch(cutoff)
+            queued += emails
+            if users < settings.NOTIFICATION_DIGEST_BATCH_USERS:
+                return queued
+
+    async def _send_batch(self, cutoff: datetime):
+        """One batch of due users in one transaction; returns (users, emails queued)"""
+        async with async_session_maker() as db:
+            result = await db.execute(
+                select(Notification.user_id)
+                .where(Notification.is_email_sent == False)
+                .group_by(Notification.user_id)
+                .having(func.min(Notification.created_at) <= cutoff)
+                .order_by(Notification.user_id)
+                .limit(settings.NOTIFICATION_DIGEST_BATCH_USERS)
+            )
+            user_ids = list(result.scalars().all())
+            if not user_ids:
+                return 0, 0
+
+            # Claim: a concurrent run skips the rows once this commits
+            result = await db.execute(
+                update(Notification)
+                .where(Notification.user_id.in_(user_ids), Notification.is_email_sent == False)
+                .values(is_email_sent=True)
+                .returning(
+                    Notification.id,
+                    Notification.user_id,
+                    Notification.title,
+                    Notification.message,
+                    Notification.action_url,
+                    Notification.is_read,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            pending: Dict[int, List[Any]] = defaultdict(list)
+            for row in result.all():
+                if not row.is_read:
+                    pending[row.user_id].append(row)
+
+            emails = 0
+            if pending:
+                result = await db.execute(
+                    select(User.id, User.email, User.first_name)
+                    .where(User.id.in_(list(pending)), User.is_active == True, User.role.in_(digest_roles()))
+                )
+                for user in result.all():
+                    await self._queue(db, user, sorted(pending[user.id], key=lambda row: row.id))
+                    emails += 1
+                    self.notifications += len(pending[user.id])
+            await db.commit()
+
+        self.digests += emails
+        return len(user_ids), emails
+
+    async def _queue(self, db, user, notifications: List[Any]):
+        listed = notifications[-settings.NOTIFICATION_DIGEST_MAX_ITEMS:]
+        html_content, text_content = email_templates.render(
+            "notification_digest",
+            name=user.first_name or "Kantaman käyttäjä",
+            total=len(notifications),
+            notifications=[
+                {
+                    "title": row.title,
+                    "message": row.message,
+                    "url": f"{settings.FRONTEND_URL}{row.action_url}" if row.action_url else None,
+                }
+                for row in reversed(listed)
+            ],
+            app_url=settings.FRONTEND_URL,
+        )
+        subject = notifications[0].title if len(notifications) == 1 else f"{len(notifications)} uutta ilmoitusta"
+        await email_service.send_email(
+            db=db,
+            to_email=user.email,
+            subject=f"[Kantama] {subject}",
+            html_content=html_content,
+            text_content=text_content
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "roles": sorted(role.value for role in digest_roles()),
+            "window_seconds": settings.NOTIFICATION_DIGEST_WINDOW_SECONDS,
+            "digests": self.digests,
+            "notifications": self.notifications,
+        }
+
+
+notification_digest = NotificationDigest()
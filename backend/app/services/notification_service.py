@@ -1,14 +1,28 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
-from typing import Optional, Dict, Any
+from sqlalchemy import select, update, insert
+from typing import Optional, Dict, Any, Iterable, List, Tuple
+from collections import Counter
 from datetime import datetime
 
 from app.models.notification import Notification
 from app.models.user import User
 from app.services.email_service import email_service
+from app.services.notification_counters import notification_counters
+from app.services.notification_bus import notification_bus
+from app.utils.pagination import keyset_page
 
 
 class NotificationService:
+    """
+    In-app notifications.
+
+    New notifications are added to the caller's transaction and not
+    committed here, so they are stored only together with the change that
+    triggered them; the route commits once. Every change of read state
+    also updates the user's unread counter (see notification_counters), and
+    new notifications are pushed to the users' open streams once the
+    transaction commits (see notification_bus).
+    """
     
     async def create_notification(
         self,
@@ -24,7 +38,7 @@ class NotificationService:
         send_email: bool = False,
         email_content: Optional[Dict] = None
     ) -> Notification:
-        """Create an in-app notification"""
+        """Add an in-app notification to the caller's transaction"""
         notification = Notification(
             user_id=user_id,
             title=title,
@@ -37,25 +51,69 @@ class NotificationService:
         )
         
         db.add(notification)
-        await db.commit()
-        await db.refresh(notification)
-        
+        await notification_counters.increment(db, {user_id: 1})
+        await notification_bus.publish(db, [user_id])
         return notification
     
+    async def create_notifications(
+        self,
+        db: AsyncSession,
+        user_ids: Iterable[int],
+        title: str,
+        message: str,
+        notification_type: str,
+        reference_type: Optional[str] = None,
+        reference_id: Optional[int] = None,
+        action_url: Optional[str] = None,
+        data: Optional[Dict[str, Any]] = None
+    ) -> List[int]:
+        """Add the same notification for many users with one INSERT; returns the new ids"""
+        return await self._insert(db, [
+            dict(
+                user_id=user_id,
+                title=title,
+                message=message,
+                notification_type=notification_type,
+                reference_type=reference_type,
+                reference_id=reference_id,
+                action_url=action_url,
+                data=data
+            )
+            for user_id in user_ids
+        ])
+    
+    async def _insert(self, db: AsyncSession, rows: List[Dict[str, Any]]) -> List[int]:
+        """Insert notification rows in one statement (INSERT ... RETURNING)"""
+        if not rows:
+            return []
+        result = await db.execute(
+            insert(Notification).returning(Notification.id),
+            rows
+        )
+        counts = Counter(row["user_id"] for row in rows)
+        await notification_counters.increment(db, counts)
+        await notification_bus.publish(db, counts)
+        return list(result.scalars().all())
+    
     async def get_user_notifications(
         self,
         db: AsyncSession,
         user_id: int,
         unread_only: bool = False,
-        limit: int = 50
+        limit: int = 50,
+        after: Optional[Tuple[datetime, int]] = None
     ) -> list[Notification]:
-        """Get notifications for a user"""
+        """
+        A page of a user's notifications, newest first, continuing after the
+        decoded cursor `after`. Returns up to limit + 1 rows; the extra row
+        only tells that another page follows.
+        """
         query = select(Notification).where(Notification.user_id == user_id)
         
         if unread_only:
             query = query.where(Notification.is_read == False)
         
-        query = query.order_by(Notification.created_at.desc()).limit(limit)
+        query = keyset_page(query, Notification.created_at, Notification.id, True, after, limit)
         
         result = await db.execute(query)
         return result.scalars().all()
@@ -69,11 +127,44 @@ class NotificationService:
         """Mark a notification as read"""
         result = await db.execute(
             update(Notification)
-            .where(Notification.id == notification_id, Notification.user_id == user_id)
+            .where(
+                Notification.id == notification_id,
+                Notification.user_id == user_id,
+                Notification.is_read == False
+            )
+            .values(is_read=True, read_at=datetime.utcnow())
+        )
+        if not result.rowcount:
+            # Already read, or not this user's notification
+            found = await db.scalar(
+                select(Notification.id)
+                .where(Notification.id == notification_id, Notification.user_id == user_id)
+            )
+            return found is not None
+        
+        await notification_counters.decrement(db, user_id, result.rowcount)
+        await db.commit()
+        return True
+    
+    async def mark_many_as_read(
+        self,
+        db: AsyncSession,
+        notification_ids: Iterable[int],
+        user_id: int
+    ) -> int:
+        """Mark the user's notifications with the given ids as read in one UPDATE"""
+        result = await db.execute(
+            update(Notification)
+            .where(
+                Notification.id.in_(set(notification_ids)),
+                Notification.user_id == user_id,
+                Notification.is_read == False
+            )
             .values(is_read=True, read_at=datetime.utcnow())
         )
+        await notification_counters.decrement(db, user_id, result.rowcount)
         await db.commit()
-        return result.rowcount > 0
+        return result.rowcount
     
     async def mark_all_as_read(
         self,
@@ -86,6 +177,7 @@ class NotificationService:
             .where(Notification.user_id == user_id, Notification.is_read == False)
             .values(is_read=True, read_at=datetime.utcnow())
         )
+        await notification_counters.decrement(db, user_id, result.rowcount)
         await db.commit()
         return result.rowcount
     
@@ -95,11 +187,7 @@ class NotificationService:
         user_id: int
     ) -> int:
         """Get count of unread notifications"""
-        result = await db.execute(
-            select(Notification)
-            .where(Notification.user_id == user_id, Notification.is_read == False)
-        )
-        return len(result.scalars().all())
+        return await notification_counters.get(db, user_id)
     
     # Convenience methods for common notification types
     
@@ -132,9 +220,7 @@ class NotificationService:
         financier_name: str
     ):
         """Notify when application is sent to financier"""
-        # Notify customer
-        await self.create_notification(
-            db=db,
+        customer = dict(
             user_id=customer_id,
             title="Hakemus käsittelyssä",
             message=f"Hakemuksenne {reference_number} on lähetetty rahoittajalle {financier_name} käsittelyyn.",
@@ -143,11 +229,8 @@ class NotificationService:
             reference_id=application_id,
             action_url=f"/dashboard/applications/{application_id}"
         )
-        
-        # Notify financier users
-        for user_id in financier_user_ids:
-            await self.create_notification(
-                db=db,
+        financier_users = [
+            dict(
                 user_id=user_id,
                 title="Uusi hakemus",
                 message=f"Uusi rahoitushakemus {reference_number} odottaa käsittelyä.",
@@ -156,6 +239,9 @@ class NotificationService:
                 reference_id=application_id,
                 action_url=f"/financier/applications/{application_id}"
             )
+            for user_id in financier_user_ids
+        ]
+        await self._insert(db, [customer] + financier_users)
     
     async def notify_info_requested(
         self,
@@ -185,17 +271,16 @@ class NotificationService:
         reference_number: str
     ):
         """Notify financier that customer provided info"""
-        for user_id in financier_user_ids:
-            await self.create_notification(
-                db=db,
-                user_id=user_id,
-                title="Lisätiedot toimitettu",
-                message=f"Asiakas on toimittanut lisätietoja hakemukseen {reference_number}.",
-                notification_type="INFO_PROVIDED",
-                reference_type="application",
-                reference_id=application_id,
-                action_url=f"/financier/applications/{application_id}"
-            )
+        await self.create_notifications(
+            db=db,
+            user_ids=financier_user_ids,
+            title="Lisätiedot toimitettu",
+            message=f"Asiakas on toimittanut lisätietoja hakemukseen {reference_number}.",
+            notification_type="INFO_PROVIDED",
+            reference_type="application",
+            reference_id=application_id,
+            action_url=f"/financier/applications/{application_id}"
+        )
     
     async def notify_offer_sent(
         self,
@@ -226,17 +311,16 @@ class NotificationService:
         company_name: str
     ):
         """Notify financier that offer was accepted"""
-        for user_id in financier_user_ids:
-            await self.create_notification(
-                db=db,
-                user_id=user_id,
-                title="Tarjous hyväksytty",
-                message=f"Asiakas {company_name} on hyväksynyt tarjouksen hakemukseen {reference_number}.",
-                notification_type="OFFER_ACCEPTED",
-                reference_type="application",
-                reference_id=application_id,
-                action_url=f"/financier/applications/{application_id}"
-            )
+        await self.create_notifications(
+            db=db,
+            user_ids=financier_user_ids,
+            title="Tarjous hyväksytty",
+            message=f"Asiakas {company_name} on hyväksynyt tarjouksen hakemukseen {reference_number}.",
+            notification_type="OFFER_ACCEPTED",
+            reference_type="application",
+            reference_id=application_id,
+            action_url=f"/financier/applications/{application_id}"
+        )
     
     async def notify_contract_sent(
         self,
@@ -266,17 +350,16 @@ class NotificationService:
         company_name: str
     ):
         """Notify financier that contract was signed"""
-        for user_id in financier_user_ids:
-            await self.create_notification(
-                db=db,
-                user_id=user_id,
-                title="Sopimus allekirjoitettu",
-                message=f"Asiakas {company_name} on allekirjoittanut sopimuksen {reference_number}.",
-                notification_type="CONTRACT_SIGNED",
-                reference_type="application",
-                reference_id=application_id,
-                action_url=f"/financier/applications/{application_id}"
-            )
+        await self.create_notifications(
+            db=db,
+            user_ids=financier_user_ids,
+            title="Sopimus allekirjoitettu",
+            message=f"Asiakas {company_name} on allekirjoittanut sopimuksen {reference_number}.",
+            notification_type="CONTRACT_SIGNED",
+            reference_type="application",
+            reference_id=application_id,
+            action_url=f"/financier/applications/{application_id}"
+        )
 
 
 notification_service = NotificationService()
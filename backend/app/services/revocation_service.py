@@ -0,0 +1,96 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from typing import Optional, Dict, Any
+from datetime import datetime
+import asyncio
+import time
+
+from app.config import settings
+from app.database import async_session_maker
+from app.models.token_revocation import TokenRevocation
+
+
+class RevocationService:
+    """
+    Token revocation list backed by the token_revocations table.
+
+    Each worker keeps the table in memory as {user_id: token_version} and
+    reloads it every TOKEN_REVOCATION_REFRESH_SECONDS, so a revocation made
+    in one worker reaches the others within seconds. Lookups are O(1).
+    """
+
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self._versions: Dict[int, int] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    def is_revoked(self, user_id: int, token_version: int) -> bool:
+        """Check a token version against the in-memory revocation list"""
+        return token_version < self._versions.get(user_id, 0)
+
+    async def refresh(self, force: bool = False):
+        """Reload the revocation list if it is older than the refresh interval"""
+        if not force and self._loaded_at is not None \
+                and time.monotonic() - self._loaded_at < self.refresh_seconds:
+            return
+
+        async with self._lock:
+            if not force and self._loaded_at is not None \
+                    and time.monotonic() - self._loaded_at < self.refresh_seconds:
+                return
+
+            async with async_session_maker() as db:
+                result = await db.execute(
+                    select(TokenRevocation.user_id, TokenRevocation.token_version)
+                )
+                self._versions = {user_id: version for user_id, version in result.all()}
+            self._loaded_at = time.monotonic()
+
+    async def get_version(self, db: AsyncSession, user_id: int) -> int:
+        """Get the current token version of a user from the database"""
+        result = await db.execute(
+            select(TokenRevocation.token_version).where(TokenRevocation.user_id == user_id)
+        )
+        version = result.scalar_one_or_none() or 0
+        self._versions[user_id] = version
+        return version
+
+    async def revoke_user_tokens(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        reason: Optional[str] = None
+    ) -> int:
+        """
+        Revoke all tokens issued to a user so far.
+
+        The change is added to the caller's transaction; the local list is
+        updated immediately.
+        """
+        result = await db.execute(
+            select(TokenRevocation).where(TokenRevocation.user_id == user_id)
+        )
+        revocation = result.scalar_one_or_none()
+
+        if revocation:
+            revocation.token_version += 1
+            revocation.reason = reason
+            revocation.revoked_at = datetime.utcnow()
+        else:
+            revocation = TokenRevocation(user_id=user_id, token_version=1, reason=reason)
+            db.add(revocation)
+
+        self._versions[user_id] = revocation.token_version
+        return revocation.token_version
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "revoked_users": len(self._versions),
+            "age_seconds": round(time.monotonic() - self._loaded_at, 3) if self._loaded_at else None,
+        }
+
+
+revocation_service = RevocationService(
+    refresh_seconds=settings.TOKEN_REVOCATION_REFRESH_SECONDS
+)
@@ -0,0 +1,126 @@
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncEngine
+from sqlalchemy import text, func, literal_column, Integer, Float
+from sqlalchemy.sql import Select
+from typing import List
+import re
+
+from app.models.application import Application
+
+
+# Columns searched, with their bm25 weights (SQLite) / ranking weights (PostgreSQL)
+SEARCH_COLUMNS = [
+    ("company_name", 10.0, "A"),
+    ("business_id", 8.0, "A"),
+    ("reference_number", 8.0, "A"),
+    ("equipment_description", 2.0, "B"),
+    ("additional_info", 1.0, "C"),
+]
+
+_COLUMN_NAMES = ", ".join(name for name, _, _ in SEARCH_COLUMNS)
+_NEW_VALUES = ", ".join(f"new.{name}" for name, _, _ in SEARCH_COLUMNS)
+_OLD_VALUES = ", ".join(f"old.{name}" for name, _, _ in SEARCH_COLUMNS)
+
+# External-content FTS5 table kept in sync by triggers; only changes to
+# the searched columns touch the index.
+SQLITE_DDL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS applications_fts USING fts5(
+        {_COLUMN_NAMES},
+        content='applications', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS applications_fts_ai AFTER INSERT ON applications BEGIN
+        INSERT INTO applications_fts(rowid, {_COLUMN_NAMES}) VALUES (new.id, {_NEW_VALUES});
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS applications_fts_ad AFTER DELETE ON applications BEGIN
+        INSERT INTO applications_fts(applications_fts, rowid, {_COLUMN_NAMES}) VALUES ('delete', old.id, {_OLD_VALUES});
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS applications_fts_au AFTER UPDATE OF {_COLUMN_NAMES} ON applications BEGIN
+        INSERT INTO applications_fts(applications_fts, rowid, {_COLUMN_NAMES}) VALUES ('delete', old.id, {_OLD_VALUES});
+        INSERT INTO applications_fts(rowid, {_COLUMN_NAMES}) VALUES (new.id, {_NEW_VALUES});
+    END""",
+]
+
+# Hyphens are replaced so Y-tunnus and reference numbers split into plain tokens
+_PG_VECTOR = " || ".join(
+    f"setweight(to_tsvector('simple', replace(coalesce({name}, ''), '-', ' ')), '{weight}')"
+    for name, _, weight in SEARCH_COLUMNS
+)
+
+POSTGRES_DDL = [
+    f"""ALTER TABLE applications ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS ({_PG_VECTOR}) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_applications_search_vector ON applications USING gin (search_vector)",
+]
+
+
+class SearchService:
+    """
+    Full-text search over applications.
+
+    SQLite uses an FTS5 table maintained by triggers, PostgreSQL a generated
+    tsvector column with a GIN index. All terms must match; the last term is
+    also matched as a prefix (search as you type). Results are ranked best
+    first.
+    """
+
+    async def ensure_index(self, engine: AsyncEngine):
+        """Create the search index for databases made by create_all (idempotent)"""
+        async with engine.begin() as conn:
+            if conn.dialect.name == "sqlite":
+                exists = await conn.exec_driver_sql(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'applications_fts'"
+                )
+                is_new = exists.first() is None
+                for statement in SQLITE_DDL:
+                    await conn.exec_driver_sql(statement)
+                if is_new:
+                    await conn.exec_driver_sql(
+                        "INSERT INTO applications_fts(applications_fts) VALUES ('rebuild')"
+                    )
+            elif conn.dialect.name == "postgresql":
+                for statement in POSTGRES_DDL:
+                    await conn.exec_driver_sql(statement)
+
+    def terms(self, q: str) -> List[str]:
+        return re.findall(r"\w+", q.lower())[:8]
+
+    def is_prefix(self, terms: List[str], index: int) -> bool:
+        # One-letter prefixes match most of the index and are not worth ranking
+        return index == len(terms) - 1 and len(terms[index]) >= 2
+
+    def search_query(self, dialect: str, query: Select, q: str) -> Select:
+        """Add the full-text match and rank ordering to an Application query"""
+        terms = self.terms(q)
+
+        if dialect == "sqlite":
+            match = " ".join(
+                f'"{term}"*' if self.is_prefix(terms, i) else f'"{term}"'
+                for i, term in enumerate(terms)
+            )
+            weights = ", ".join(str(weight) for _, weight, _ in SEARCH_COLUMNS)
+            hits = text(
+                f"SELECT rowid AS id, bm25(applications_fts, {weights}) AS rank "
+                "FROM applications_fts WHERE applications_fts MATCH :match"
+            ).bindparams(match=match).columns(id=Integer, rank=Float).subquery("hits")
+            return query.join(hits, hits.c.id == Application.id).order_by(hits.c.rank, Application.id)
+
+        ts_query = func.to_tsquery("simple", " & ".join(
+            f"{term}:*" if self.is_prefix(terms, i) else term
+            for i, term in enumerate(terms)
+        ))
+        search_vector = literal_column("applications.search_vector")
+        return (
+            query
+            .where(search_vector.op("@@")(ts_query))
+            .order_by(func.ts_rank_cd(search_vector, ts_query).desc(), Application.id)
+        )
+
+    async def search(self, db: AsyncSession, query: Select, q: str, limit: int) -> List[Application]:
+        if not self.terms(q):
+            return []
+        dialect = db.get_bind().dialect.name
+        result = await db.execute(self.search_query(dialect, query, q).limit(limit))
+        return list(result.scalars().all())
+
+
+search_service = SearchService()
@@ -0,0 +1,131 @@
+from email.message import Message
+from typing import Optional, List, Dict, Any, Tuple
+import asyncio
+import logging
+import time
+
+import aiosmtplib
+
+
+logger = logging.getLogger(__name__)
+
+# Errors after which the connection is gone and a fresh one may succeed
+_DISCONNECT_ERRORS = (aiosmtplib.SMTPServerDisconnected, ConnectionError)
+
+
+class SmtpPool:
+    """
+    Pool of connected and authenticated SMTP sessions.
+
+    At most `size` connections are open at once. A connection is reused
+    for later messages until it has been idle for `idle_timeout` seconds;
+    if the server dropped a reused connection the message is retried once
+    on a new one. Connections are opened lazily, so an idle worker holds
+    none.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: Optional[str],
+        password: Optional[str],
+        start_tls: bool,
+        timeout: float,
+        size: int,
+        idle_timeout: float,
+    ):
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.start_tls = start_tls
+        self.timeout = timeout
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self._idle: List[Tuple[aiosmtplib.SMTP, float]] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.in_use = 0
+        self.opened = 0
+        self.reconnects = 0
+        self.sent = 0
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        client = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            start_tls=self.start_tls,
+            timeout=self.timeout,
+        )
+        await client.connect()  # EHLO, STARTTLS and AUTH
+        self.opened += 1
+        return client
+
+    async def _discard(self, client: aiosmtplib.SMTP):
+        try:
+            if client.is_connected:
+                await asyncio.wait_for(client.quit(), timeout=2)
+        except Exception:
+            client.close()
+
+    async def _acquire(self) -> Tuple[aiosmtplib.SMTP, bool]:
+        """Take an idle connection (reused=True) or open a new one"""
+        now = time.monotonic()
+        while self._idle:
+            client, released_at = self._idle.pop()
+            if client.is_connected and now - released_at < self.idle_timeout:
+                return client, True
+            await self._discard(client)
+        return await self._connect(), False
+
+    async def send(self, message: Message, recipients: List[str]):
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.size)
+
+        async with self._slots:
+            self.in_use += 1
+            client = None
+            try:
+                client, reused = await self._acquire()
+                try:
+                    await client.send_message(message, recipients=recipients)
+                except _DISCONNECT_ERRORS as e:
+                    await self._discard(client)
+                    client = None
+                    if not reused:
+                        raise
+                    # The server closed a pooled connection (idle limit, restart)
+                    logger.info(f"SMTP connection lost, reconnecting: {e}")
+                    self.reconnects += 1
+                    client = await self._connect()
+                    await client.send_message(message, recipients=recipients)
+                self.sent += 1
+            except Exception:
+                # State of the session is unknown after an error; do not reuse it
+                if client is not None:
+                    await self._discard(client)
+                    client = None
+                raise
+            finally:
+                self.in_use -= 1
+                if client is not None:
+                    self._idle.append((client, time.monotonic()))
+
+    async def close(self):
+        """Close all idle connections"""
+        idle, self._idle = self._idle, []
+        self._slots = None
+        for client, _ in idle:
+            await self._discard(client)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": self.size,
+            "idle": len(self._idle),
+            "in_use": self.in_use,
+            "opened": self.opened,
+            "reconnects": self.reconnects,
+            "sent": self.sent,
+        }
@@ -0,0 +1,172 @@
+from contextvars import ContextVar
+from collections import Counter
+from typing import Optional, Dict, Any
+import logging
+import time
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class RequestSqlStats:
+    """SQL statements run while serving one request"""
+
+    def __init__(self):
+        self.statements = 0
+        self.total_seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement: Optional[str] = None
+        self.shapes: Counter = Counter()
+
+    def record(self, statement: str, seconds: float):
+        self.statements += 1
+        self.total_seconds += seconds
+        self.shapes[statement] += 1
+        if seconds > self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = statement
+
+
+class SqlMetrics:
+    """
+    Per-request SQL instrumentation.
+
+    Engine cursor events add every statement to the stats of the request
+    that is running (held in a contextvar by SqlTimingMiddleware). Finished
+    requests are aggregated per route for the metrics endpoint. When
+    SQL_N_PLUS_ONE_THRESHOLD is set, a request that runs the same statement
+    more than that many times is logged as a likely N+1.
+    """
+
+    def __init__(self, n_plus_one_threshold: int, slow_statement_chars: int = 500):
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.slow_statement_chars = slow_statement_chars
+        self._current: ContextVar[Optional[RequestSqlStats]] = ContextVar("request_sql_stats", default=None)
+        self.routes: Dict[str, Dict[str, Any]] = {}
+        self.n_plus_one: Dict[str, Dict[str, Any]] = {}
+
+    def instrument(self, engine: AsyncEngine):
+        """Attach the cursor timing hooks to an engine"""
+        sync_engine = engine.sync_engine
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            started = conn.info["query_start_time"].pop()
+            stats = self._current.get()
+            if stats is not None:
+                stats.record(statement, time.perf_counter() - started)
+
+    def start_request(self) -> RequestSqlStats:
+        stats = RequestSqlStats()
+        self._current.set(stats)
+        return stats
+
+    def finish_request(self, route: str, stats: RequestSqlStats):
+        """Aggregate a finished request and run the N+1 check"""
+        entry = self.routes.get(route)
+        if entry is None:
+            entry = self.routes[route] = {
+                "requests": 0,
+                "statements": 0,
+                "max_statements": 0,
+                "db_seconds": 0.0,
+                "slowest_ms": 0.0,
+                "slowest_statement": None,
+            }
+
+        entry["requests"] += 1
+        entry["statements"] += stats.statements
+        entry["max_statements"] = max(entry["max_statements"], stats.statements)
+        entry["db_seconds"] += stats.total_seconds
+        if stats.slowest_seconds * 1000 > entry["slowest_ms"]:
+            entry["slowest_ms"] = round(stats.slowest_seconds * 1000, 3)
+            entry["slowest_statement"] = stats.slowest_statement[:self.slow_statement_chars]
+
+        if self.n_plus_one_threshold and stats.shapes:
+            statement, count = stats.shapes.most_common(1)[0]
+            if count > self.n_plus_one_threshold:
+                self.n_plus_one[route] = {
+                    "count": count,
+                    "statement": statement[:self.slow_statement_chars],
+                }
+                logger.warning(
+                    f"[N+1] {route} ran the same statement {count} times: "
+                    f"{' '.join(statement.split())[:200]}"
+                )
+
+    def stats(self) -> Dict[str, Any]:
+        routes = {}
+        for route, entry in sorted(self.routes.items()):
+            requests = entry["requests"]
+            routes[route] = {
+                "requests": requests,
+                "avg_statements": round(entry["statements"] / requests, 2),
+                "max_statements": entry["max_statements"],
+                "avg_db_ms": round(entry["db_seconds"] / requests * 1000, 3),
+                "slowest_ms": entry["slowest_ms"],
+                "slowest_statement": entry["slowest_statement"],
+            }
+        return {
+            "routes": routes,
+            "n_plus_one": self.n_plus_one,
+        }
+
+
+def route_template(scope) -> str:
+    """Request path with path parameter values put back as {name}"""
+    # Unmatched paths (404s) share one entry so the route table stays bounded
+    if "endpoint" not in scope:
+        return "(unmatched)"
+    segments = scope["path"].split("/")
+    names = {str(value): name for name, value in scope.get("path_params", {}).items()}
+    return "/".join(f"{{{names[segment]}}}" if segment in names else segment for segment in segments)
+
+
+class SqlTimingMiddleware:
+    """
+    ASGI middleware that collects SQL stats per request and reports them in
+    a Server-Timing header, e.g. `db;dur=12.4;desc="7 queries"`.
+    """
+
+    def __init__(self, app, metrics: "SqlMetrics"):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = self.metrics.start_request()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((
+                    b"server-timing",
+                    (
+                        f'db;dur={stats.total_seconds * 1000:.2f};desc="{stats.statements} queries", '
+                        f'db-slowest;dur={stats.slowest_seconds * 1000:.2f}'
+                    ).encode("latin-1"),
+                ))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            self.metrics.finish_request(f"{scope['method']} {route_template(scope)}", stats)
+
+
+sql_metrics = SqlMetrics(
+    n_plus_one_threshold=settings.SQL_N_PLUS_ONE_THRESHOLD if settings.DEBUG else 0,
+)
@@ -0,0 +1,91 @@
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
+import time
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.config import settings
+from app.models.user import User
+
+
+class UserCache:
+    """
+    Size-bounded TTL cache of authenticated users, keyed by user id.
+
+    Entries are plain column snapshots, so a cached principal is never shared
+    between sessions. Every user has a version counter that is bumped on
+    invalidation; a snapshot loaded before an invalidation is never stored.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[int, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._versions: Dict[int, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def version(self, user_id: int) -> int:
+        """Current version of a user's cache entry"""
+        return self._versions.get(user_id, 0)
+
+    def get(self, user_id: int) -> Optional[User]:
+        """Return a detached User built from the cached snapshot, or None"""
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[user_id]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+
+        user = User(**entry[1])
+        make_transient_to_detached(user)
+        return user
+
+    def set(self, user: User, version: int) -> None:
+        """Cache a user loaded while the user's version was `version`"""
+        if self.max_size <= 0 or self.version(user.id) != version:
+            return
+
+        snapshot = {
+            attr.key: getattr(user, attr.key)
+            for attr in inspect(User).column_attrs
+        }
+        self._entries[user.id] = (time.monotonic() + self.ttl_seconds, snapshot)
+        self._entries.move_to_end(user.id)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        """Drop a user's entry and bump its version"""
+        self._versions[user_id] = self.version(user_id) + 1
+        self._entries.pop(user_id, None)
+        self.invalidations += 1
+
+    def clear(self) -> None:
+        for user_id in list(self._entries):
+            self.invalidate(user_id)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+user_cache = UserCache(
+    max_size=settings.AUTH_CACHE_MAX_SIZE,
+    ttl_seconds=settings.AUTH_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,320 @@
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy import select, text, func, literal_column, Integer, Float
+from sqlalchemy.sql import Select
+from sqlalchemy.dialects import postgresql, sqlite
+from typing import Optional, Dict, Any, Iterable, Iterator
+from datetime import datetime
+import csv
+import hashlib
+import io
+import json
+import os
+import re
+import zipfile
+
+from app.config import settings
+from app.database import async_session_maker
+from app.models.ytj import YtjCompany
+from app.services.search_service import search_service
+from app.services.ytj_service import normalize_query, company_summary, _status
+
+# Sorts after every other character, so q <= name < q + _PREFIX_END
+# selects the names starting with q
+_PREFIX_END = "\U0010ffff"
+
+_BUSINESS_ID = re.compile(r"^\d{7}-\d$")
+
+# Same tokenizer as applications_fts: "oy" matches "Oy", "kone" "Koneistamo"
+SQLITE_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS ytj_companies_fts USING fts5(
+        name,
+        content='ytj_companies', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS ytj_companies_fts_ai AFTER INSERT ON ytj_companies BEGIN
+        INSERT INTO ytj_companies_fts(rowid, name) VALUES (new.id, new.name);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS ytj_companies_fts_ad AFTER DELETE ON ytj_companies BEGIN
+        INSERT INTO ytj_companies_fts(ytj_companies_fts, rowid, name) VALUES ('delete', old.id, old.name);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS ytj_companies_fts_au AFTER UPDATE OF name ON ytj_companies BEGIN
+        INSERT INTO ytj_companies_fts(ytj_companies_fts, rowid, name) VALUES ('delete', old.id, old.name);
+        INSERT INTO ytj_companies_fts(rowid, name) VALUES (new.id, new.name);
+    END""",
+]
+
+POSTGRES_DDL = [
+    """ALTER TABLE ytj_companies ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (to_tsvector('simple', name)) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_ytj_companies_search_vector ON ytj_companies USING gin (search_vector)",
+]
+
+
+def _flag(value: Any) -> Optional[bool]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("1", "true", "yes", "kyllä")
+
+
+def _csv_record(row: Dict[str, str]) -> Dict[str, Any]:
+    """Flat company fields of a CSV row"""
+    is_active = _flag(row.get("is_active"))
+    is_liquidated = _flag(row.get("is_liquidated")) or False
+    if is_active is None:
+        is_active, _ = _status({
+            "status": row.get("status"),
+            "tradeRegisterStatus": row.get("trade_register_status") or row.get("tradeRegisterStatus"),
+        })
+        is_active = is_active and not is_liquidated
+    return {
+        "business_id": row.get("business_id") or row.get("businessId"),
+        "name": row.get("name"),
+        "company_form": row.get("company_form") or None,
+        "is_active": is_active,
+        "is_liquidated": is_liquidated,
+    }
+
+
+def _read_json(stream) -> Iterator[Dict[str, Any]]:
+    # A JSON array of companies or {"companies": [...]} like the API returns;
+    # streamed with ijson when it is installed, else loaded whole
+    try:
+        import ijson
+    except ImportError:
+        data = json.load(stream)
+        yield from data if isinstance(data, list) else data.get("companies", [])
+        return
+    head = stream.read(64).lstrip()
+    stream.seek(0)
+    yield from ijson.items(stream, "item" if head.startswith("[") else "companies.item")
+
+
+def _read_stream(name: str, stream) -> Iterator[Dict[str, Any]]:
+    extension = os.path.splitext(name)[1].lower()
+    if extension == ".json":
+        yield from _read_json(stream)
+    elif extension in (".jsonl", ".ndjson"):
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+    elif extension == ".csv":
+        for row in csv.DictReader(stream):
+            yield _csv_record(row)
+    else:
+        raise ValueError(f"Unsupported dump file: {name}")
+
+
+def read_dump(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Company records of a PRH bulk dump: .json, .jsonl/.ndjson, .csv, or a
+    .zip of those. Records are PRH API companies or flat rows with
+    business_id, name, company_form, is_active and is_liquidated.
+    """
+    if path.lower().endswith(".zip"):
+        with zipfile.ZipFile(path) as archive:
+            for member in archive.namelist():
+                if member.endswith("/"):
+                    continue
+                with archive.open(member) as raw:
+                    yield from _read_stream(member, io.TextIOWrapper(raw, encoding="utf-8-sig"))
+        return
+    with open(path, encoding="utf-8-sig", newline="") as stream:
+        yield from _read_stream(path, stream)
+
+
+def company_row(record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """ytj_companies values of a dump record, or None if it is unusable"""
+    summary = company_summary(record) if "businessId" in record else record
+    if summary is None:
+        return None
+    business_id = (summary.get("business_id") or "").strip()
+    name = " ".join((summary.get("name") or "").split())
+    if not _BUSINESS_ID.match(business_id) or not name:
+        return None
+    row = {
+        "business_id": business_id,
+        "name": name[:500],
+        "company_form": summary.get("company_form"),
+        "is_active": bool(summary.get("is_active")),
+        "is_liquidated": bool(summary.get("is_liquidated")),
+    }
+    row["content_hash"] = hashlib.sha1(json.dumps(
+        [row["name"], row["company_form"], row["is_active"], row["is_liquidated"]]
+    ).encode()).hexdigest()
+    row["name_normalized"] = normalize_query(row["name"])[:500]
+    return row
+
+
+class YtjIndex:
+    """
+    Local company index for name autocomplete (ytj_companies table).
+
+    Filled from PRH open-data dumps by import_ytj.py. A search returns the
+    companies whose name starts with the query (a range scan on
+    name_normalized), topped up with full-text matches where a word of the
+    name starts with the last term (FTS5 on SQLite, a tsvector on
+    PostgreSQL). The search endpoint calls PRH only when nothing matches.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    async def ensure_index(self, engine: AsyncEngine):
+        """Create the full-text index for databases made by create_all (idempotent)"""
+        async with engine.begin() as conn:
+            if conn.dialect.name == "sqlite":
+                exists = await conn.exec_driver_sql(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'ytj_companies_fts'"
+                )
+                is_new = exists.first() is None
+                for statement in SQLITE_DDL:
+                    await conn.exec_driver_sql(statement)
+                if is_new:
+                    await conn.exec_driver_sql(
+                        "INSERT INTO ytj_companies_fts(ytj_companies_fts) VALUES ('rebuild')"
+                    )
+            elif conn.dialect.name == "postgresql":
+                for statement in POSTGRES_DDL:
+                    await conn.exec_driver_sql(statement)
+
+    def _word_prefix_query(self, dialect: str, query: Select, q: str) -> Optional[Select]:
+        """Add the word-prefix match and rank ordering to a YtjCompany query"""
+        terms = search_service.terms(q)
+        if not terms:
+            return None
+
+        if dialect == "sqlite":
+            match = " ".join(
+                f'"{term}"*' if search_service.is_prefix(terms, i) else f'"{term}"'
+                for i, term in enumerate(terms)
+            )
+            hits = text(
+                "SELECT rowid AS id, bm25(ytj_companies_fts) AS rank "
+                "FROM ytj_companies_fts WHERE ytj_companies_fts MATCH :match"
+            ).bindparams(match=match).columns(id=Integer, rank=Float).subquery("hits")
+            return query.join(hits, hits.c.id == YtjCompany.id).order_by(hits.c.rank, YtjCompany.id)
+
+        ts_query = func.to_tsquery("simple", " & ".join(
+            f"{term}:*" if search_service.is_prefix(terms, i) else term
+            for i, term in enumerate(terms)
+        ))
+        search_vector = literal_column("ytj_companies.search_vector")
+        return (
+            query
+            .where(search_vector.op("@@")(ts_query))
+            .order_by(func.ts_rank_cd(search_vector, ts_query).desc(), YtjCompany.id)
+        )
+
+    async def search(self, name: str, limit: int) -> Dict[str, Any]:
+        """Local matches in the shape of ytj_service.search; empty on a miss"""
+        q = normalize_query(name)
+        columns = (
+            YtjCompany.id,
+            YtjCompany.business_id,
+            YtjCompany.name,
+            YtjCompany.company_form,
+            YtjCompany.is_active,
+            YtjCompany.is_liquidated,
+        )
+        async with async_session_maker() as db:
+            result = await db.execute(
+                select(*columns)
+                .where(YtjCompany.name_normalized >= q, YtjCompany.name_normalized < q + _PREFIX_END)
+                .order_by(YtjCompany.name_normalized)
+                .limit(limit)
+            )
+            rows = list(result.all())
+
+            if len(rows) < limit:
+                query = select(*columns)
+                if rows:
+                    query = query.where(YtjCompany.id.not_in([row.id for row in rows]))
+                query = self._word_prefix_query(db.get_bind().dialect.name, query, q)
+                if query is not None:
+                    result = await db.execute(query.limit(limit - len(rows)))
+                    rows.extend(result.all())
+
+        if rows:
+            self.hits += 1
+        else:
+            self.misses += 1
+        results = [
+            {
+                "business_id": row.business_id,
+                "name": row.name,
+                "company_form": row.company_form,
+                "is_active": row.is_active,
+                "is_liquidated": row.is_liquidated,
+            }
+            for row in rows
+        ]
+        return {"results": results, "total": len(results)}
+
+    async def import_records(self, records: Iterable[Dict[str, Any]], batch_size: Optional[int] = None) -> Dict[str, int]:
+        """
+        Upsert dump records in batches, writing only new companies and ones
+        whose hash changed. Returns counts of inserted, updated, unchanged
+        and skipped records.
+        """
+        batch_size = batch_size or settings.YTJ_IMPORT_BATCH_SIZE
+        counts = {"inserted": 0, "updated": 0, "unchanged": 0, "skipped": 0}
+        batch: Dict[str, Dict[str, Any]] = {}
+        for record in records:
+            row = company_row(record)
+            if row is None:
+                counts["skipped"] += 1
+                continue
+            batch[row["business_id"]] = row
+            if len(batch) >= batch_size:
+                await self._import_batch(batch, counts)
+                batch = {}
+        if batch:
+            await self._import_batch(batch, counts)
+        return counts
+
+    async def _import_batch(self, batch: Dict[str, Dict[str, Any]], counts: Dict[str, int]):
+        async with async_session_maker() as db:
+            result = await db.execute(
+                select(YtjCompany.business_id, YtjCompany.content_hash)
+                .where(YtjCompany.business_id.in_(list(batch)))
+            )
+            existing = dict(result.all())
+
+            now = datetime.utcnow()
+            changed = []
+            for business_id, row in sorted(batch.items()):
+                known = existing.get(business_id)
+                if known == row["content_hash"]:
+                    counts["unchanged"] += 1
+                    continue
+                counts["updated" if known is not None else "inserted"] += 1
+                changed.append({**row, "imported_at": now})
+
+            if changed:
+                dialect = db.get_bind().dialect.name
+                upsert = (postgresql if dialect == "postgresql" else sqlite).insert(YtjCompany)
+                await db.execute(upsert.on_conflict_do_update(
+                    index_elements=[YtjCompany.business_id],
+                    set_={
+                        column: upsert.excluded[column]
+                        for column in (
+                            "name", "name_normalized", "company_form", "is_active",
+                            "is_liquidated", "content_hash", "imported_at",
+                        )
+                    }
+                ), changed)
+                await db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        searches = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / searches, 4) if searches else 0.0,
+        }
+
+
+ytj_index = YtjIndex()
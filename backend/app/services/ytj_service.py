@@ -0,0 +1,718 @@
+from fastapi import HTTPException
+from sqlalchemy import select, delete, or_
+from sqlalchemy.dialects import postgresql, sqlite
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Callable, Awaitable, Tuple, AsyncIterator
+from datetime import datetime, timedelta
+import asyncio
+import logging
+import re
+import time
+
+import httpx
+
+from app.config import settings
+from app.database import async_session_maker
+from app.models.ytj import YtjCacheEntry
+from app.services.newsletter_service import RateLimiter
+from app.utils.circuit_breaker import CircuitBreaker, CircuitBreakerOpen
+
+
+logger = logging.getLogger(__name__)
+
+# How often entries past YTJ_STALE_TTL_SECONDS are deleted from ytj_cache
+_PURGE_INTERVAL_SECONDS = 60 * 60
+
+
+def normalize_business_id(business_id: str) -> str:
+    """Y-tunnus without spaces; old six-digit ids get their leading zero"""
+    business_id = "".join(business_id.split())
+    if re.match(r"^\d{6}-\d$", business_id):
+        business_id = "0" + business_id
+    return business_id
+
+
+def valid_business_id(business_id: str) -> bool:
+    """Y-tunnus format and check digit (weights 7, 9, 10, 5, 8, 4, 2, modulo 11)"""
+    if not re.match(r"^\d{7}-\d$", business_id):
+        return False
+    remainder = sum(int(digit) * weight for digit, weight in zip(business_id[:7], (7, 9, 10, 5, 8, 4, 2))) % 11
+    if remainder == 1:
+        return False
+    return int(business_id[8]) == (11 - remainder if remainder else 0)
+
+
+def normalize_query(name: str) -> str:
+    """Search text as a cache key: trimmed, single-spaced, case-folded"""
+    return " ".join(name.split()).casefold()
+
+
+def _finnish(descriptions) -> Optional[str]:
+    for desc in descriptions or []:
+        if desc.get("languageCode") == "1":
+            return desc.get("description")
+    return None
+
+
+def _status(company: Dict[str, Any]) -> Tuple[bool, bool]:
+    """(is_active, is_liquidated) of a PRH company"""
+    status = company.get("status")
+    trade_register_status = company.get("tradeRegisterStatus")
+    is_active = status in ["1", "2"] and trade_register_status == "1"
+    # Liquidation, bankruptcy etc.
+    is_liquidated = len(company.get("companySituations", [])) > 0
+    return is_active and not is_liquidated, is_liquidated
+
+
+def company_summary(company: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Search result fields of a PRH company, or None if it has no id or name"""
+    # Business ID may be a string or an object with a 'value' property
+    business_id = company.get("businessId")
+    if isinstance(business_id, dict):
+        business_id = business_id.get("value")
+    if not business_id:
+        return None
+
+    names = company.get("names", [])
+    current_name = None
+    for n in names:
+        if n.get("type") == "1" and not n.get("endDate"):
+            current_name = n.get("name")
+            break
+    if not current_name and names:
+        current_name = names[0].get("name")
+    if not current_name:
+        return None
+
+    company_form = None
+    for form in company.get("companyForms", []):
+        if not form.get("endDate"):
+            company_form = _finnish(form.get("descriptions"))
+            break
+
+    is_active, is_liquidated = _status(company)
+    return {
+        "business_id": business_id,
+        "name": current_name,
+        "company_form": company_form,
+        "is_active": is_active,
+        "is_liquidated": is_liquidated
+    }
+
+
+def company_details(company: Dict[str, Any], business_id: str) -> Dict[str, Any]:
+    """Full company information from a PRH company record"""
+    # === NAMES ===
+    names = company.get("names", [])
+    current_name = None
+    all_names = []
+    for name in names:
+        all_names.append({
+            "name": name.get("name"),
+            "type": name.get("type"),
+            "start_date": name.get("startDate"),
+            "end_date": name.get("endDate"),
+        })
+        if name.get("type") == "1" and not name.get("endDate"):
+            current_name = name.get("name")
+    if not current_name and names:
+        current_name = names[0].get("name")
+
+    # === ADDRESSES ===
+    visiting_address = None
+    postal_address = None
+    for addr in company.get("addresses", []):
+        street = addr.get("street", "")
+        if addr.get("buildingNumber"):
+            street += " " + addr.get("buildingNumber", "")
+
+        city = None
+        for po in addr.get("postOffices", []):
+            if po.get("languageCode") == "1":
+                city = po.get("city")
+                break
+
+        addr_obj = {
+            "street": street.strip() if street else None,
+            "postal_code": addr.get("postCode"),
+            "city": city,
+            "country": addr.get("country"),
+        }
+        if addr.get("type") == 1:
+            visiting_address = addr_obj
+        elif addr.get("type") == 2:
+            postal_address = addr_obj
+
+    # === COMPANY FORM ===
+    company_form = None
+    company_form_code = None
+    for form in company.get("companyForms", []):
+        if not form.get("endDate"):
+            company_form_code = form.get("type")
+            company_form = _finnish(form.get("descriptions"))
+            break
+
+    # === BUSINESS LINES ===
+    main_business_line = company.get("mainBusinessLine", {})
+    main_business = None
+    main_business_code = None
+    if main_business_line:
+        main_business_code = main_business_line.get("code")
+        main_business = _finnish(main_business_line.get("descriptions"))
+
+    business_lines = [
+        {
+            "code": bl.get("code"),
+            "description": _finnish(bl.get("descriptions")),
+            "start_date": bl.get("startDate"),
+            "end_date": bl.get("endDate"),
+        }
+        for bl in company.get("businessLines", [])
+    ]
+
+    # === CONTACT INFO ===
+    phone = None
+    website = None
+    email = None
+    for contact in company.get("contactDetails", []):
+        contact_type = contact.get("type")
+        if contact_type == "1" and not phone:  # Phone
+            phone = contact.get("value")
+        elif contact_type == "2" and not website:  # Website
+            website = contact.get("value")
+        elif contact_type == "3" and not email:  # Email
+            email = contact.get("value")
+
+    # === REGISTERED ENTRIES ===
+    register_info = [
+        {
+            "register": entry.get("register"),
+            "status": entry.get("status"),
+            "description": _finnish(entry.get("descriptions")),
+            "date": entry.get("date"),
+        }
+        for entry in company.get("registeredEntries", [])
+    ]
+
+    # === COMPANY SITUATIONS (liquidation, bankruptcy etc.) ===
+    situations = [
+        {
+            "type": sit.get("type"),
+            "description": _finnish(sit.get("descriptions")),
+            "start_date": sit.get("startDate"),
+            "end_date": sit.get("endDate"),
+        }
+        for sit in company.get("companySituations", [])
+    ]
+
+    is_active, is_liquidated = _status(company)
+    address = visiting_address or postal_address
+
+    return {
+        # Basic info
+        "business_id": business_id,
+        "name": current_name,
+        "all_names": all_names,
+
+        # Addresses
+        "visiting_address": visiting_address,
+        "postal_address": postal_address,
+        # Legacy fields for backwards compatibility
+        "street_address": address.get("street") if address else None,
+        "postal_code": address.get("postal_code") if address else None,
+        "city": address.get("city") if address else None,
+
+        # Company form
+        "company_form": company_form,
+        "company_form_code": company_form_code,
+
+        # Business
+        "main_business": main_business,
+        "main_business_code": main_business_code,
+        "business_lines": business_lines,
+
+        # Contact info
+        "phone": phone,
+        "website": website,
+        "email": email,
+
+        # Register info
+        "registered_entries": register_info,
+
+        # Situations
+        "company_situations": situations,
+
+        # Status
+        "status": company.get("status"),
+        "trade_register_status": company.get("tradeRegisterStatus"),
+        "is_active": is_active,
+        "is_liquidated": is_liquidated,
+
+        # Dates
+        "registration_date": company.get("registrationDate"),
+        "end_date": company.get("endDate"),
+    }
+
+
+class YtjService:
+    """
+    Company lookups and name searches against PRH, behind a two-tier cache.
+
+    Results are kept in a per-process LRU of YTJ_CACHE_SIZE entries and in
+    the ytj_cache table, which all workers share and which survives
+    restarts. A fresh entry is returned without calling PRH; an entry past
+    its TTL but younger than YTJ_STALE_TTL_SECONDS is returned as is while
+    one background task per key fetches a new copy. Companies PRH does
+    not know are cached for YTJ_NOT_FOUND_TTL_SECONDS.
+
+    PRH is called through one long-lived httpx client (opened by start())
+    that keeps connections alive and uses HTTP/2 when h2 is installed.
+    Concurrent misses of the same key share a single upstream request.
+
+    Calls go through a circuit breaker (YTJ_BREAKER_*). While PRH fails or
+    is slow the breaker is open and lookups do not wait for it: the last
+    cached record, kept up to YTJ_FALLBACK_TTL_SECONDS, is returned with
+    "stale": true, or 503 if there is none.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[datetime, Optional[Dict[str, Any]]]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._purge_task: Optional[asyncio.Task] = None
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.coalesced = 0
+        self.upstream_calls = 0
+        self.upstream_errors = 0
+        self.fallbacks = 0
+        self.breaker = CircuitBreaker(
+            window_seconds=settings.YTJ_BREAKER_WINDOW_SECONDS,
+            window_calls=settings.YTJ_BREAKER_WINDOW_CALLS,
+            min_calls=settings.YTJ_BREAKER_MIN_CALLS,
+            error_rate=settings.YTJ_BREAKER_ERROR_RATE,
+            slow_call_seconds=settings.YTJ_BREAKER_SLOW_CALL_SECONDS,
+            slow_call_rate=settings.YTJ_BREAKER_SLOW_CALL_RATE,
+            open_seconds=settings.YTJ_BREAKER_OPEN_SECONDS,
+        )
+
+    def start(self):
+        self._open()
+        if self._purge_task is None:
+            self._purge_task = asyncio.create_task(self._purge_loop(), name="ytj-cache-purge")
+
+    async def stop(self):
+        tasks = list(self._inflight.values())
+        if self._purge_task is not None:
+            tasks.append(self._purge_task)
+            self._purge_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _open(self) -> httpx.AsyncClient:
+        if self._client is None:
+            http2 = settings.YTJ_HTTP2
+            if http2:
+                try:
+                    import h2  # noqa: F401
+                except ImportError:
+                    logger.warning("h2 is not installed; calling PRH over HTTP/1.1")
+                    http2 = False
+            self._client = httpx.AsyncClient(
+                http2=http2,
+                timeout=httpx.Timeout(settings.YTJ_TIMEOUT_SECONDS, connect=settings.YTJ_CONNECT_TIMEOUT_SECONDS),
+                limits=httpx.Limits(
+                    max_connections=settings.YTJ_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.YTJ_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=settings.YTJ_KEEPALIVE_SECONDS,
+                ),
+                headers={"Accept": "application/json"},
+            )
+        return self._client
+
+    async def _purge_loop(self):
+        while True:
+            # Sleep first: no purge (and commit) racing the first requests at startup
+            await asyncio.sleep(_PURGE_INTERVAL_SECONDS)
+            try:
+                await self.purge()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Purging the YTJ cache failed: {e}")
+
+    async def purge(self) -> int:
+        """Delete entries too old to be served even as stale or as a fallback"""
+        now = datetime.utcnow()
+        cutoff = now - timedelta(seconds=settings.YTJ_STALE_TTL_SECONDS)
+        fallback_cutoff = now - timedelta(seconds=settings.YTJ_FALLBACK_TTL_SECONDS)
+        async with async_session_maker() as db:
+            result = await db.execute(delete(YtjCacheEntry).where(
+                YtjCacheEntry.fetched_at < cutoff,
+                or_(
+                    YtjCacheEntry.fetched_at < fallback_cutoff,
+                    ~YtjCacheEntry.key.startswith("company:"),
+                )
+            ))
+            await db.commit()
+        return result.rowcount
+
+    async def get_company(self, business_id: str) -> Dict[str, Any]:
+        """Full company information; raises HTTPException 404 if PRH does not know it"""
+        company = await self._cached(
+            f"company:{business_id}",
+            settings.YTJ_COMPANY_TTL_SECONDS,
+            lambda: self._fetch_company(business_id)
+        )
+        if company is None:
+            raise self._not_found()
+        return company
+
+    async def get_companies(
+        self,
+        business_ids: List[str],
+        force: bool = False,
+        limiter: Optional[RateLimiter] = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Full information of many companies as (business id, company or
+        HTTPException), in completion order. Companies fresh in the cache
+        come first; the rest are fetched from PRH YTJ_BATCH_CONCURRENCY at a
+        time, sharing requests with concurrent lookups of the same company.
+
+        force fetches every company from PRH whatever the cache holds (the
+        cached copy is still the fallback while PRH fails); limiter, if
+        given, is acquired before each request actually sent to PRH.
+        """
+        keys = {business_id: f"company:{business_id}" for business_id in business_ids}
+        loaded = await self._load_many([
+            key for key in keys.values() if key not in self._entries and key not in self._inflight
+        ])
+
+        semaphore = asyncio.Semaphore(max(settings.YTJ_BATCH_CONCURRENCY, 1))
+        cached = []
+        pending = []
+        for business_id, key in keys.items():
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if not force and self._fresh(entry, settings.YTJ_COMPANY_TTL_SECONDS):
+                    self.memory_hits += 1
+                    cached.append((business_id, entry[1]))
+                    continue
+            else:
+                entry = loaded.get(key)
+                if not force and entry is not None and self._fresh(entry, settings.YTJ_COMPANY_TTL_SECONDS):
+                    self.db_hits += 1
+                    self._remember(key, entry)
+                    cached.append((business_id, entry[1]))
+                    continue
+            self.misses += 1
+            pending.append(asyncio.create_task(self._fetch_batched(semaphore, limiter, business_id, key, entry)))
+
+        try:
+            for business_id, company in cached:
+                yield business_id, company if company is not None else self._not_found()
+            for next_done in asyncio.as_completed(pending):
+                yield await next_done
+        finally:
+            # The client went away: stop waiting (fetches already sent still
+            # complete and are cached)
+            for task in pending:
+                task.cancel()
+
+    async def _fetch_batched(
+        self,
+        semaphore: asyncio.Semaphore,
+        limiter: Optional[RateLimiter],
+        business_id: str,
+        key: str,
+        entry: Optional[Tuple[datetime, Optional[Dict[str, Any]]]]
+    ) -> Tuple[str, Any]:
+        async with semaphore:
+            task = self._inflight.get(key)
+            if task is None and limiter is not None:
+                await limiter.acquire()
+                task = self._inflight.get(key)
+            if task is None:
+                task = self._fetch(key, lambda: self._fetch_company(business_id))
+            else:
+                self.coalesced += 1
+            try:
+                company = await asyncio.shield(task)
+            except HTTPException as e:
+                return business_id, await self._fallback(key, entry) or e
+            except Exception as e:
+                logger.error(f"Fetching {key} from PRH failed: {e}")
+                return business_id, HTTPException(status_code=502, detail="Virhe haettaessa tietoja PRH:sta")
+        return business_id, company if company is not None else self._not_found()
+
+    def _not_found(self) -> HTTPException:
+        return HTTPException(
+            status_code=404,
+            detail="Yritystä ei löytynyt annetulla Y-tunnuksella"
+        )
+
+    def _fresh(self, entry: Tuple[datetime, Optional[Dict[str, Any]]], ttl: float) -> bool:
+        fetched_at, data = entry
+        age = (datetime.utcnow() - fetched_at).total_seconds()
+        return age < (ttl if data is not None else settings.YTJ_NOT_FOUND_TTL_SECONDS)
+
+    async def search(self, name: str, limit: int) -> Dict[str, Any]:
+        """Companies matching a name: {"results": [...], "total": n}"""
+        query = normalize_query(name)
+        return await self._cached(
+            f"search:{limit}:{query}",
+            settings.YTJ_SEARCH_TTL_SECONDS,
+            lambda: self._fetch_search(name.strip(), limit)
+        )
+
+    async def _cached(
+        self,
+        key: str,
+        ttl: float,
+        fetch: Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+    ) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        in_memory = entry is not None
+        if in_memory:
+            self._entries.move_to_end(key)
+        elif key in self._inflight:
+            self.misses += 1
+            self.coalesced += 1
+            return await self._await_fetch(key, self._inflight[key], None)
+        else:
+            entry = await self._load(key)
+            if entry is None and key in self._entries:
+                # Stored by a concurrent request while this one was loading
+                entry, in_memory = self._entries[key], True
+
+        if entry is not None:
+            fetched_at, data = entry
+            age = (datetime.utcnow() - fetched_at).total_seconds()
+            if data is None:
+                usable = age < settings.YTJ_NOT_FOUND_TTL_SECONDS
+            else:
+                usable = age < settings.YTJ_STALE_TTL_SECONDS
+            if usable:
+                if in_memory:
+                    self.memory_hits += 1
+                else:
+                    self.db_hits += 1
+                    self._remember(key, entry)
+                if data is not None and age >= ttl:
+                    self.stale_hits += 1
+                    if self.breaker.state != CircuitBreaker.OPEN:
+                        self._revalidate(key, fetch)
+                    if self.breaker.state != CircuitBreaker.CLOSED:
+                        # PRH is failing: say the record may be out of date
+                        self.fallbacks += 1
+                        return self._flag_stale(entry)
+                return data
+
+        self.misses += 1
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._fetch(key, fetch)
+        else:
+            self.coalesced += 1
+        return await self._await_fetch(key, task, entry)
+
+    async def _await_fetch(
+        self,
+        key: str,
+        task: asyncio.Task,
+        entry: Optional[Tuple[datetime, Optional[Dict[str, Any]]]]
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            # Shielded: a caller that goes away does not cancel the others' request
+            return await asyncio.shield(task)
+        except HTTPException:
+            stale = await self._fallback(key, entry)
+            if stale is None:
+                raise
+            return stale
+
+    async def _fallback(
+        self,
+        key: str,
+        entry: Optional[Tuple[datetime, Optional[Dict[str, Any]]]]
+    ) -> Optional[Dict[str, Any]]:
+        """The last cached record of a key flagged stale, for when PRH fails"""
+        if entry is None:
+            entry = self._entries.get(key) or await self._load(key)
+        if entry is None or entry[1] is None:
+            return None
+        self.fallbacks += 1
+        return self._flag_stale(entry)
+
+    def _flag_stale(self, entry: Tuple[datetime, Dict[str, Any]]) -> Dict[str, Any]:
+        fetched_at, data = entry
+        return {**data, "stale": True, "fetched_at": fetched_at.isoformat()}
+
+    def _fetch(self, key: str, fetch: Callable[[], Awaitable[Optional[Dict[str, Any]]]]) -> asyncio.Task:
+        """Start the single upstream request for a key; callers await the task"""
+        async def fetch_and_store():
+            data = await fetch()
+            await self._store(key, data)
+            return data
+
+        def done(task: asyncio.Task):
+            self._inflight.pop(key, None)
+            # Retrieved here so a failure nobody awaited is not logged as unhandled
+            if not task.cancelled():
+                task.exception()
+
+        task = asyncio.create_task(fetch_and_store(), name=f"ytj-{key}")
+        self._inflight[key] = task
+        task.add_done_callback(done)
+        return task
+
+    def _revalidate(self, key: str, fetch: Callable[[], Awaitable[Optional[Dict[str, Any]]]]):
+        if key in self._inflight:
+            return
+
+        def done(task: asyncio.Task):
+            if task.cancelled():
+                return
+            error = task.exception()
+            if error is None:
+                self.refreshes += 1
+            elif not (isinstance(error, HTTPException) and error.status_code == 503):
+                detail = error.detail if isinstance(error, HTTPException) else error
+                logger.warning(f"Refreshing {key} from PRH failed: {detail}")
+
+        self._fetch(key, fetch).add_done_callback(done)
+
+    def _remember(self, key: str, entry: Tuple[datetime, Optional[Dict[str, Any]]]):
+        if self.max_size <= 0:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def _load(self, key: str) -> Optional[Tuple[datetime, Optional[Dict[str, Any]]]]:
+        async with async_session_maker() as db:
+            row = (await db.execute(
+                select(YtjCacheEntry.fetched_at, YtjCacheEntry.data).where(YtjCacheEntry.key == key)
+            )).first()
+        return (row.fetched_at, row.data) if row is not None else None
+
+    async def _load_many(self, keys: List[str]) -> Dict[str, Tuple[datetime, Optional[Dict[str, Any]]]]:
+        if not keys:
+            return {}
+        async with async_session_maker() as db:
+            result = await db.execute(
+                select(YtjCacheEntry.key, YtjCacheEntry.fetched_at, YtjCacheEntry.data)
+                .where(YtjCacheEntry.key.in_(keys))
+            )
+        return {row.key: (row.fetched_at, row.data) for row in result.all()}
+
+    async def _store(self, key: str, data: Optional[Dict[str, Any]]):
+        fetched_at = datetime.utcnow()
+        self._remember(key, (fetched_at, data))
+        async with async_session_maker() as db:
+            dialect = db.get_bind().dialect.name
+            upsert = (postgresql if dialect == "postgresql" else sqlite).insert(YtjCacheEntry)
+            await db.execute(
+                upsert.values(key=key, data=data, fetched_at=fetched_at).on_conflict_do_update(
+                    index_elements=[YtjCacheEntry.key],
+                    set_={"data": upsert.excluded.data, "fetched_at": upsert.excluded.fetched_at}
+                )
+            )
+            await db.commit()
+
+    async def _request(self, params: Dict[str, Any]) -> httpx.Response:
+        try:
+            self.breaker.before_call()
+        except CircuitBreakerOpen:
+            raise HTTPException(
+                status_code=503,
+                detail="PRH-palvelu ei ole juuri nyt käytettävissä. Yritä hetken kuluttua uudelleen."
+            )
+        self.upstream_calls += 1
+        started = time.monotonic()
+        try:
+            response = await self._open().get(settings.YTJ_API_URL, params=params)
+        except httpx.TimeoutException:
+            self.upstream_errors += 1
+            self.breaker.record(time.monotonic() - started, failed=True)
+            raise HTTPException(
+                status_code=504,
+                detail="PRH-palvelu ei vastannut ajoissa. Yritä uudelleen."
+            )
+        except httpx.HTTPError as e:
+            self.upstream_errors += 1
+            self.breaker.record(time.monotonic() - started, failed=True)
+            raise HTTPException(
+                status_code=502,
+                detail=f"Virhe haettaessa tietoja PRH:sta: {str(e)}"
+            )
+        except BaseException:
+            self.breaker.cancel()
+            raise
+        # 404 is an unknown company; server errors and rate limiting count as failures
+        failed = response.status_code >= 500 or response.status_code == 429
+        self.breaker.record(time.monotonic() - started, failed=failed)
+        return response
+
+    def _json(self, response: httpx.Response) -> Dict[str, Any]:
+        try:
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            self.upstream_errors += 1
+            raise HTTPException(
+                status_code=502,
+                detail=f"Virhe haettaessa tietoja PRH:sta: {str(e)}"
+            )
+        return response.json()
+
+    async def _fetch_company(self, business_id: str) -> Optional[Dict[str, Any]]:
+        response = await self._request({"businessId": business_id})
+        if response.status_code == 404:
+            return None
+        companies = self._json(response).get("companies")
+        if not companies:
+            return None
+        return company_details(companies[0], business_id)
+
+    async def _fetch_search(self, name: str, limit: int) -> Dict[str, Any]:
+        response = await self._request({"name": name, "maxResults": limit})
+        results = []
+        for company in self._json(response).get("companies", []):
+            summary = company_summary(company)
+            if summary is not None:
+                results.append(summary)
+        return {"results": results, "total": len(results)}
+
+    def stats(self) -> Dict[str, Any]:
+        hits = self.memory_hits + self.db_hits
+        lookups = hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "in_flight": len(self._inflight),
+            "refreshes": self.refreshes,
+            "coalesced": self.coalesced,
+            "upstream_calls": self.upstream_calls,
+            "upstream_errors": self.upstream_errors,
+            "fallbacks": self.fallbacks,
+            "circuit_breaker": self.breaker.stats(),
+        }
+
+
+ytj_service = YtjService(max_size=settings.YTJ_CACHE_SIZE)
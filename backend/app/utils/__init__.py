@@ -1,9 +1,14 @@
 from app.utils.auth import (
     verify_password,
     get_password_hash,
+    verify_password_async,
+    get_password_hash_async,
     create_access_token,
+    create_user_access_token,
     decode_token,
     generate_verification_token,
+    get_token_data,
+    get_stream_token_data,
     get_current_user,
     get_current_active_user,
     require_role,
@@ -12,13 +17,20 @@ from app.utils.auth import (
     get_customer_user,
     get_admin_or_financier_user,
 )
+from app.utils.pagination import encode_cursor, decode_cursor, keyset_page, keyset_next_key
+from app.utils.circuit_breaker import CircuitBreaker, CircuitBreakerOpen
 
 __all__ = [
     "verify_password",
     "get_password_hash",
+    "verify_password_async",
+    "get_password_hash_async",
     "create_access_token",
+    "create_user_access_token",
     "decode_token",
     "generate_verification_token",
+    "get_token_data",
+    "get_stream_token_data",
     "get_current_user",
     "get_current_active_user",
     "require_role",
@@ -26,5 +38,11 @@ __all__ = [
     "get_financier_user",
     "get_customer_user",
     "get_admin_or_financier_user",
+    "encode_cursor",
+    "decode_cursor",
+    "keyset_page",
+    "keyset_next_key",
+    "CircuitBreaker",
+    "CircuitBreakerOpen",
 ]
 
@@ -1,19 +1,30 @@
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Callable, Any, Dict
+from concurrent.futures import ThreadPoolExecutor
 from jose import JWTError, jwt
 import bcrypt
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 import secrets
+import asyncio
+import threading
+import time
 
 from app.config import settings
 from app.database import get_db
 from app.models.user import User, UserRole
+from app.schemas.user import TokenData
+from app.services.user_cache import user_cache
+from app.services.revocation_service import revocation_service
 
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+
+STREAM_TICKET_TYPE = "stream"
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -24,6 +35,88 @@ def get_password_hash(password: str) -> str:
     return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
 
 
+class PasswordHashPool:
+    """
+    Bounded thread pool for bcrypt.
+
+    bcrypt releases the GIL, so hashing on worker threads keeps the event loop
+    free. Calls beyond max_queue waiting jobs are rejected with 503 instead of
+    piling up behind a login burst.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        self.max_queue_depth = 0
+        self.total_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self.queued >= self.max_queue:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Palvelu on ruuhkautunut. Yritä hetken kuluttua uudelleen."
+                )
+            self.queued += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queued)
+
+        submitted_at = time.perf_counter()
+
+        def job():
+            started_at = time.perf_counter()
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+                self.total_wait_seconds += started_at - submitted_at
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.completed += 1
+                    self.total_run_seconds += time.perf_counter() - started_at
+
+        return await asyncio.get_running_loop().run_in_executor(self._executor, job)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "queue_depth": self.queued,
+                "max_queue_depth": self.max_queue_depth,
+                "max_queue": self.max_queue,
+                "running": self.running,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "avg_wait_ms": round(self.total_wait_seconds / self.completed * 1000, 2) if self.completed else 0.0,
+                "avg_run_ms": round(self.total_run_seconds / self.completed * 1000, 2) if self.completed else 0.0,
+            }
+
+
+password_hash_pool = PasswordHashPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password on the bcrypt pool; use this in request handlers"""
+    return await password_hash_pool.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash on the bcrypt pool; use this in request handlers"""
+    return await password_hash_pool.run(get_password_hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     if expires_delta:
@@ -47,31 +140,126 @@ def generate_verification_token() -> str:
     return secrets.token_urlsafe(32)
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db)
-) -> User:
-    credentials_exception = HTTPException(
+def create_user_access_token(user: User, token_version: int) -> str:
+    """Create an access token carrying the claims needed for access checks"""
+    return create_access_token(
+        data={
+            "sub": str(user.id),
+            "email": user.email,
+            "role": user.role.value,
+            "fid": user.financier_id,
+            "act": bool(user.is_active),
+            "ver": token_version,
+        }
+    )
+
+
+def create_stream_ticket(token_data: TokenData) -> str:
+    """
+    Short-lived token that only opens the notification stream. It goes in
+    the stream URL, so it must not be usable as an access token.
+    """
+    return create_access_token(
+        data={
+            "sub": str(token_data.user_id),
+            "email": token_data.email,
+            "role": token_data.role.value,
+            "fid": token_data.financier_id,
+            "act": token_data.is_active,
+            "ver": token_data.token_version,
+            "typ": STREAM_TICKET_TYPE,
+        },
+        expires_delta=timedelta(seconds=settings.STREAM_TICKET_EXPIRE_SECONDS)
+    )
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Ei voitu vahvistaa käyttäjätietoja",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
-    token = credentials.credentials
+
+
+async def _resolve_token(token: str, token_type: Optional[str] = None) -> TokenData:
     payload = decode_token(token)
     
-    if payload is None:
-        raise credentials_exception
+    # Tokens issued before claims were added carry no version; require re-login
+    if payload is None or payload.get("sub") is None or "ver" not in payload:
+        raise _credentials_exception()
+    
+    # Access tokens have no type; a stream ticket is accepted only where asked for
+    if payload.get("typ") != token_type:
+        raise _credentials_exception()
+    
+    try:
+        token_data = TokenData(
+            user_id=int(payload["sub"]),
+            email=payload.get("email"),
+            role=payload.get("role"),
+            financier_id=payload.get("fid"),
+            is_active=payload.get("act", False),
+            token_version=payload["ver"],
+        )
+    except (ValueError, ValidationError):
+        raise _credentials_exception()
     
-    user_id: int = payload.get("sub")
-    if user_id is None:
-        raise credentials_exception
+    await revocation_service.refresh()
+    if revocation_service.is_revoked(token_data.user_id, token_data.token_version):
+        raise _credentials_exception()
     
-    result = await db.execute(select(User).where(User.id == int(user_id)))
-    user = result.scalar_one_or_none()
+    if not token_data.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Käyttäjätili ei ole aktiivinen"
+        )
     
-    if user is None:
-        raise credentials_exception
+    return token_data
+
+
+async def get_token_data(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> TokenData:
+    """Resolve the caller from the signed token claims, without a DB lookup"""
+    return await _resolve_token(credentials.credentials)
+
+
+async def get_stream_token_data(
+    ticket: Optional[str] = Query(None),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)
+) -> TokenData:
+    """
+    Like get_token_data, but also accepts a stream ticket (create_stream_ticket)
+    as the `ticket` query parameter, since browser EventSource cannot send
+    headers. Access tokens are never accepted in the URL.
+    """
+    if credentials is not None:
+        return await _resolve_token(credentials.credentials)
+    if ticket:
+        return await _resolve_token(ticket, STREAM_TICKET_TYPE)
+    raise _credentials_exception()
+
+
+async def get_current_user(
+    token_data: TokenData = Depends(get_token_data),
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """Load the full User row of the caller (cached per worker)"""
+    user_id = token_data.user_id
+    user = user_cache.get(user_id)
+
+    if user is not None:
+        # Attach the cached principal to this request's session without a query
+        db.add(user)
+    else:
+        version = user_cache.version(user_id)
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
+
+        if user is None:
+            raise _credentials_exception()
+
+        user_cache.set(user, version)
     
     if not user.is_active:
         raise HTTPException(
@@ -89,7 +277,7 @@ async def get_current_active_user(current_user: User = Depends(get_current_user)
 
 
 def require_role(*roles: UserRole):
-    async def role_checker(current_user: User = Depends(get_current_user)) -> User:
+    async def role_checker(current_user: TokenData = Depends(get_token_data)) -> TokenData:
         if current_user.role not in roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -0,0 +1,134 @@
+from collections import deque
+from typing import Any, Deque, Dict, Tuple
+import time
+
+
+class CircuitBreakerOpen(Exception):
+    """Raised by CircuitBreaker.before_call() while calls are not allowed"""
+
+
+class CircuitBreaker:
+    """
+    Stops calling a failing upstream service.
+
+    Closed: calls go through and the outcomes of the last window_calls
+    calls within window_seconds are kept. Once the window holds at least
+    min_calls calls and the share of failed calls reaches error_rate, or
+    the share of calls slower than slow_call_seconds reaches
+    slow_call_rate, the breaker opens.
+
+    Open: before_call() raises CircuitBreakerOpen at once. After
+    open_seconds the breaker is half-open and lets one probe call through;
+    a fast success closes it (with an empty window), anything else opens
+    it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        window_seconds: float,
+        window_calls: int,
+        min_calls: int,
+        error_rate: float,
+        slow_call_seconds: float,
+        slow_call_rate: float,
+        open_seconds: float,
+    ):
+        self.window_seconds = window_seconds
+        self.window_calls = window_calls
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.open_seconds = open_seconds
+        self._state = self.CLOSED
+        # (finished at, failed, slow) of the calls in the window
+        self._calls: Deque[Tuple[float, bool, bool]] = deque()
+        self._failed = 0
+        self._slow = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self.opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() >= self._opened_at + self.open_seconds:
+            self._state = self.HALF_OPEN
+        return self._state
+
+    def before_call(self):
+        """Claim a call; raises CircuitBreakerOpen if it must not be made"""
+        state = self.state
+        if state == self.CLOSED:
+            return
+        if state == self.HALF_OPEN and not self._probing:
+            self._probing = True
+            return
+        self.rejected += 1
+        raise CircuitBreakerOpen()
+
+    def record(self, seconds: float, failed: bool):
+        """Outcome of a call claimed with before_call()"""
+        slow = seconds >= self.slow_call_seconds
+        if self._state == self.HALF_OPEN:
+            self._probing = False
+            if failed or slow:
+                self._open()
+            else:
+                self._close()
+            return
+        if self._state == self.OPEN:
+            # Finished after the breaker opened; already accounted for
+            return
+
+        now = time.monotonic()
+        self._calls.append((now, failed, slow))
+        self._failed += failed
+        self._slow += slow
+        self._prune(now)
+        calls = len(self._calls)
+        if calls >= self.min_calls and (
+            self._failed / calls >= self.error_rate or self._slow / calls >= self.slow_call_rate
+        ):
+            self._open()
+
+    def cancel(self):
+        """A claimed call that never finished (e.g. cancelled)"""
+        if self._state == self.HALF_OPEN:
+            self._probing = False
+
+    def _prune(self, now: float):
+        while self._calls and (
+            len(self._calls) > self.window_calls or self._calls[0][0] < now - self.window_seconds
+        ):
+            _, failed, slow = self._calls.popleft()
+            self._failed -= failed
+            self._slow -= slow
+
+    def _open(self):
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._probing = False
+        self.opened += 1
+
+    def _close(self):
+        self._state = self.CLOSED
+        self._calls.clear()
+        self._failed = 0
+        self._slow = 0
+
+    def stats(self) -> Dict[str, Any]:
+        self._prune(time.monotonic())
+        calls = len(self._calls)
+        return {
+            "state": self.state,
+            "window_calls": calls,
+            "window_error_rate": round(self._failed / calls, 4) if calls else 0.0,
+            "window_slow_rate": round(self._slow / calls, 4) if calls else 0.0,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,121 @@
+from typing import Any, Optional, Tuple
+from datetime import datetime
+from decimal import Decimal
+import base64
+import enum
+import json
+
+from fastapi import HTTPException, status
+from sqlalchemy import tuple_, literal
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement, Select
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _python_value(value: Any) -> Any:
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(sort: str, value: Any, row_id: int) -> str:
+    """Opaque cursor pointing just past the row (value, row_id) of a sort order"""
+    raw = json.dumps([sort, _json_value(value), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> Tuple[Any, int]:
+    """Decode a cursor made by encode_cursor for the same sort order"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        if cursor_sort != sort or not isinstance(row_id, int):
+            raise ValueError(cursor_sort)
+        return _python_value(value), row_id
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Virheellinen sivutusavain"
+        )
+
+
+def keyset_range(
+    query: Select,
+    sort_column: ColumnElement,
+    id_column: ColumnElement,
+    descending: bool,
+    after: Optional[Tuple[Any, int]],
+    until: Optional[Tuple[Any, int]],
+) -> Select:
+    """
+    Order by (sort_column, id_column) and keep the rows after a decoded
+    cursor, up to and including the key `until` (to the end if None).
+    """
+    key = tuple_(sort_column, id_column)
+    if after is not None:
+        query = query.where(key < _bind_key(sort_column, id_column, after) if descending
+                            else key > _bind_key(sort_column, id_column, after))
+    if until is not None:
+        query = query.where(key >= _bind_key(sort_column, id_column, until) if descending
+                            else key <= _bind_key(sort_column, id_column, until))
+
+    if descending:
+        return query.order_by(sort_column.desc(), id_column.desc())
+    return query.order_by(sort_column.asc(), id_column.asc())
+
+
+def _bind_key(sort_column: ColumnElement, id_column: ColumnElement, key: Tuple[Any, int]):
+    # Bind with the column types so e.g. native enums compare correctly
+    return tuple_(literal(key[0], sort_column.type), literal(key[1], id_column.type))
+
+
+def keyset_page(
+    query: Select,
+    sort_column: ColumnElement,
+    id_column: ColumnElement,
+    descending: bool,
+    after: Optional[Tuple[Any, int]],
+    limit: int,
+) -> Select:
+    """
+    Order by (sort_column, id_column) and continue after a decoded cursor.
+
+    Fetches limit + 1 rows; the extra row only tells whether a next page
+    exists. Use an index on (sort_column, id_column) to keep pages O(limit).
+    """
+    return keyset_range(query, sort_column, id_column, descending, after, None).limit(limit + 1)
+
+
+async def keyset_next_key(
+    db: AsyncSession,
+    query: Select,
+    sort_column: ColumnElement,
+    id_column: ColumnElement,
+    descending: bool,
+    after: Optional[Tuple[Any, int]],
+    limit: int,
+) -> Optional[Tuple[Any, int]]:
+    """
+    Key (sort value, id) of the last row of a page, if another page follows.
+
+    Reads only the two key columns around the page boundary, so a streamed
+    page can send its next cursor before the rows themselves; stream the
+    page with keyset_range(..., after, key) so it ends exactly at the
+    cursor even if rows are added or removed in between.
+    """
+    keys = keyset_page(
+        query.with_only_columns(sort_column, id_column), sort_column, id_column, descending, after, limit
+    ).offset(limit - 1)
+    rows = (await db.execute(keys)).all()
+    if len(rows) < 2:
+        return None
+    return rows[0][0], rows[0][1]
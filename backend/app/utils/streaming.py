@@ -0,0 +1,41 @@
+from typing import Any, AsyncIterator, Callable, Dict
+from datetime import datetime
+import enum
+import json
+
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.sql import Select
+
+from app.database import async_session_maker
+
+
+def json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+async def stream_json_array(
+    query: Select,
+    to_dict: Callable[[RowMapping], Dict[str, Any]],
+    batch_size: int = 100,
+) -> AsyncIterator[bytes]:
+    """
+    Run a query and yield its rows as a JSON array, batch by batch.
+
+    Uses its own session because the request's session is closed before a
+    StreamingResponse body is sent.
+    """
+    yield b"["
+    first = True
+    async with async_session_maker() as db:
+        result = await db.stream(query)
+        async for rows in result.mappings().partitions(batch_size):
+            chunk = ",".join(json.dumps(to_dict(row), default=json_default) for row in rows)
+            if not first:
+                chunk = "," + chunk
+            first = False
+            yield chunk.encode()
+    yield b"]"
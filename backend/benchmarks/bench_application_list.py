@@ -0,0 +1,133 @@
+"""
+Benchmark: admin GET /api/applications/ on a large table.
+
+Seeds a throwaway SQLite database with --rows applications (bulk insert)
+and times the first page, a walk of --pages pages by cursor, and the
+sorted / filtered variants.
+
+Usage (from backend/):
+    python benchmarks/bench_application_list.py
+    python benchmarks/bench_application_list.py --rows 100000 --limit 50
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{DB_PATH}"
+os.environ.setdefault("DEBUG", "false")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+from sqlalchemy import insert, select  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.database import engine, async_session_maker  # noqa: E402
+from app.models import User, Application, ApplicationStatus, ApplicationType  # noqa: E402
+from app.models.user import UserRole  # noqa: E402
+from app.utils.auth import create_user_access_token  # noqa: E402
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def report(label, latencies):
+    print(
+        f"{label:<40} n={len(latencies):<4} "
+        f"p50={statistics.median(latencies) * 1000:8.2f} ms  "
+        f"p99={percentile(latencies, 99) * 1000:8.2f} ms"
+    )
+
+
+async def seed(rows):
+    rng = random.Random(1)
+    statuses = list(ApplicationStatus)
+    start = datetime(2024, 1, 1)
+    async with engine.begin() as conn:
+        for offset in range(0, rows, 10000):
+            await conn.execute(insert(Application), [
+                {
+                    "reference_number": f"LEA-BENCH-{i:07d}",
+                    "application_type": ApplicationType.LEASING,
+                    "status": rng.choice(statuses),
+                    "customer_id": 1,
+                    "company_name": f"Yritys {i} Oy",
+                    "business_id": f"{i % 9999999:07d}-1",
+                    "contact_email": "bench@example.com",
+                    "equipment_description": "Kaivinkone",
+                    "equipment_price": round(rng.uniform(5000, 500000), 2),
+                    "requested_term_months": rng.choice([12, 24, 36, 48, 60]),
+                    "created_at": start + timedelta(minutes=i),
+                }
+                for i in range(offset, min(rows, offset + 10000))
+            ])
+        await conn.exec_driver_sql("ANALYZE")
+
+
+async def timed_get(client, headers, params):
+    started = time.perf_counter()
+    response = await client.get("/api/applications/", headers=headers, params=params)
+    elapsed = time.perf_counter() - started
+    response.raise_for_status()
+    return elapsed, response
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--pages", type=int, default=50, help="pages to walk by cursor")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    transport = httpx.ASGITransport(app=app)
+
+    async with app.router.lifespan_context(app):
+        async with async_session_maker() as db:
+            admin = (await db.execute(select(User).where(User.role == UserRole.ADMIN))).scalar_one()
+        headers = {"Authorization": f"Bearer {create_user_access_token(admin, 0)}"}
+
+        started = time.perf_counter()
+        await seed(args.rows)
+        print(f"seeded {args.rows} applications in {time.perf_counter() - started:.1f} s")
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            variants = {
+                "first page (created_at desc)": {},
+                "first page (equipment_price asc)": {"sort": "equipment_price", "order": "asc"},
+                "first page (status)": {"sort": "status"},
+                "status filter": {"status_filter": "OFFER_SENT"},
+                "price 10k-50k, term <= 36": {"min_price": 10000, "max_price": 50000, "max_term": 36},
+            }
+            for label, params in variants.items():
+                latencies = []
+                for _ in range(args.repeat):
+                    elapsed, _ = await timed_get(client, headers, {"limit": args.limit, **params})
+                    latencies.append(elapsed)
+                report(label, latencies)
+
+            latencies = []
+            cursor = None
+            for _ in range(args.pages):
+                params = {"limit": args.limit}
+                if cursor:
+                    params["cursor"] = cursor
+                elapsed, response = await timed_get(client, headers, params)
+                latencies.append(elapsed)
+                cursor = response.headers.get("x-next-cursor")
+                if not cursor:
+                    break
+            report(f"cursor walk ({len(latencies)} pages)", latencies)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,125 @@
+"""
+Benchmark: GET /api/applications/search on a large table.
+
+Seeds a throwaway SQLite database with --rows applications (the FTS5 index
+is filled by its triggers during the insert) and times typical admin
+searches: company name prefixes, Y-tunnus, reference numbers and
+equipment words.
+
+Usage (from backend/):
+    python benchmarks/bench_application_search.py
+    python benchmarks/bench_application_search.py --rows 100000
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{DB_PATH}"
+os.environ.setdefault("DEBUG", "false")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+from sqlalchemy import insert, select  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.database import engine, async_session_maker  # noqa: E402
+from app.models import User, Application, ApplicationStatus, ApplicationType  # noqa: E402
+from app.models.user import UserRole  # noqa: E402
+from app.utils.auth import create_user_access_token  # noqa: E402
+
+
+NAMES = ["Mäkinen", "Virtanen", "Korhonen", "Nieminen", "Lehtonen", "Hämäläinen", "Laine", "Heikkinen"]
+TRADES = ["Kaivuu", "Kuljetus", "Rakennus", "Maansiirto", "Metsäkone", "Konepaja", "Logistiikka"]
+FORMS = ["Oy", "Ky", "Tmi", "Oyj"]
+EQUIPMENT = ["kaivinkone", "pyöräkuormaaja", "kuorma-auto", "trukki", "harvesteri", "nosturi", "traktori"]
+BRANDS = ["Volvo", "Caterpillar", "Komatsu", "Scania", "John Deere", "Ponsse", "Liebherr"]
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def report(label, latencies, hits):
+    print(
+        f"{label:<24} hits={hits:<3} "
+        f"p50={statistics.median(latencies) * 1000:8.2f} ms  "
+        f"p99={percentile(latencies, 99) * 1000:8.2f} ms"
+    )
+
+
+async def seed(rows):
+    rng = random.Random(1)
+    start = datetime(2024, 1, 1)
+    async with engine.begin() as conn:
+        for offset in range(0, rows, 10000):
+            await conn.execute(insert(Application), [
+                {
+                    "reference_number": f"LEA-2025-{i:06d}",
+                    "application_type": ApplicationType.LEASING,
+                    "status": ApplicationStatus.SUBMITTED,
+                    "customer_id": 1,
+                    "company_name": f"{rng.choice(TRADES)} {rng.choice(NAMES)} {i} {rng.choice(FORMS)}",
+                    "business_id": f"{1000000 + i}-{i % 10}",
+                    "contact_email": "bench@example.com",
+                    "equipment_description": f"{rng.choice(BRANDS)} {rng.choice(EQUIPMENT)} vm. {rng.randint(2010, 2025)}",
+                    "additional_info": rng.choice([None, "Kiireellinen", "Vaihtokone mukana"]),
+                    "equipment_price": round(rng.uniform(5000, 500000), 2),
+                    "created_at": start + timedelta(minutes=i),
+                }
+                for i in range(offset, min(rows, offset + 10000))
+            ])
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    transport = httpx.ASGITransport(app=app)
+
+    async with app.router.lifespan_context(app):
+        async with async_session_maker() as db:
+            admin = (await db.execute(select(User).where(User.role == UserRole.ADMIN))).scalar_one()
+        headers = {"Authorization": f"Bearer {create_user_access_token(admin, 0)}"}
+
+        started = time.perf_counter()
+        await seed(args.rows)
+        print(f"seeded {args.rows} applications in {time.perf_counter() - started:.1f} s")
+
+        queries = [
+            "Mäkinen 4711",
+            "virt 123",
+            "1004711",
+            "1004711-1",
+            "LEA-2025-04711",
+            "ponsse harvesteri",
+            "kaivuu laine oy",
+            "kiireellinen volvo trukki",
+            "ma",
+        ]
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for q in queries:
+                latencies = []
+                for _ in range(args.repeat):
+                    started = time.perf_counter()
+                    response = await client.get(
+                        "/api/applications/search", headers=headers, params={"q": q, "limit": args.limit}
+                    )
+                    latencies.append(time.perf_counter() - started)
+                    response.raise_for_status()
+                report(q, latencies, len(response.json()))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
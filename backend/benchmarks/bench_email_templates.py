@@ -0,0 +1,101 @@
+"""
+Benchmark: rendering cost of each email template.
+
+Reports the one-off compile time of the registry and, per email, the
+render time of the HTML + plain-text bodies with a fresh context every
+time (cache miss) and with a repeated context (cache hit; only for
+emails that may be cached).
+
+Usage (from backend/):
+    python benchmarks/bench_email_templates.py
+    python benchmarks/bench_email_templates.py --repeat 5000
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.email_templates import EmailTemplates, EMAIL_TEMPLATES  # noqa: E402
+
+
+def sample_context(name, i):
+    """Context for each email; `i` makes it unique"""
+    ref = f"LEA-2025-{i:05d}"
+    return {
+        "verification": dict(name="Matti", verification_url=f"https://kantama.fi/verify?token={i}"),
+        "application_to_financier": dict(
+            financier_name="Rahoittaja Oy", application_ref=ref, company_name="Kaivuu Mäkinen Oy",
+            type_fi="Leasing", equipment_price=85000.0 + i, app_url="https://kantama.fi/financier/applications",
+        ),
+        "info_request": dict(
+            customer_name="Matti Mäkinen", application_ref=ref, message="Toimittakaa tilinpäätös.",
+            requested_items=["Tilinpäätös 2024", "Tase-erittely"], app_url="https://kantama.fi/dashboard/applications",
+        ),
+        "offer": dict(
+            customer_name="Matti Mäkinen", application_ref=ref, monthly_payment=1234.5 + i, term_months=48,
+            notes="Sis. huoltosopimuksen", app_url="https://kantama.fi/dashboard/applications",
+        ),
+        "offer_accepted": dict(
+            recipient_name="Rahoittaja Oy", application_ref=ref, company_name="Kaivuu Mäkinen Oy",
+            monthly_payment=1234.5 + i, term_months=48, is_financier=True,
+            portal_url="https://kantama.fi/financier/applications",
+        ),
+        "contract": dict(
+            customer_name="Matti Mäkinen", application_ref=ref, message="Allekirjoittakaa sopimus.",
+            app_url="https://kantama.fi/dashboard/applications",
+        ),
+        "admin_notification": dict(
+            event_type="UUSI HAKEMUS", application_ref=ref,
+            details={"Tyyppi": "Leasing", "Yritys": "Kaivuu Mäkinen Oy", "Summa": f"{85000 + i:,.2f} €"},
+        ),
+        "welcome": dict(
+            email=f"asiakas{i}@example.com", company_name="Kaivuu Mäkinen Oy", password="Xy7kP2qLm9Tz",
+            login_url="https://kantama.fi/login",
+        ),
+        "notification_digest": dict(
+            name="Riikka", total=12 + i,
+            notifications=[
+                dict(
+                    title="Uusi hakemus", message=f"Hakemus LEA-2025-{i:05d}-{n} on osoitettu teille.",
+                    url=f"https://kantama.fi/financier/applications/{n}",
+                )
+                for n in range(10)
+            ],
+            app_url="https://kantama.fi",
+        ),
+    }[name]
+
+
+def time_renders(templates, name, repeat, same_context):
+    latencies = []
+    for i in range(repeat):
+        context = sample_context(name, 0 if same_context else i)
+        started = time.perf_counter()
+        templates.render(name, **context)
+        latencies.append(time.perf_counter() - started)
+    return statistics.median(latencies) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    templates = EmailTemplates(cache_size=args.repeat * 2)
+    started = time.perf_counter()
+    templates.load()
+    print(f"compiled {len(EMAIL_TEMPLATES)} emails (html + txt) in {(time.perf_counter() - started) * 1000:.1f} ms\n")
+
+    print(f"{'email':<26} {'html KB':>8} {'miss p50':>10} {'hit p50':>10}")
+    for name, cacheable in EMAIL_TEMPLATES.items():
+        html, _ = templates.render(name, **sample_context(name, -1))
+        miss = time_renders(templates, name, args.repeat, same_context=False)
+        hit = f"{time_renders(templates, name, args.repeat, same_context=True):7.1f} us" if cacheable else "-"
+        print(f"{name:<26} {len(html.encode()) / 1024:8.1f} {miss:7.1f} us {hit:>10}")
+
+
+if __name__ == "__main__":
+    main()
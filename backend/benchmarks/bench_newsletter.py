@@ -0,0 +1,151 @@
+"""
+Benchmark: sending a newsletter campaign to a large segment.
+
+Seeds --users active customers, starts a local aiosmtpd server (pip install
+aiosmtpd) that records every recipient, then creates a campaign through
+the API and sends it. Half way through the campaign is paused and resumed
+to check that no recipient gets the newsletter twice. Reports throughput
+in emails per second, SMTP sessions used, the API latency while sending
+and the peak RSS of the process.
+
+Usage (from backend/):
+    python benchmarks/bench_newsletter.py
+    python benchmarks/bench_newsletter.py --users 50000 --rate 0 --concurrency 8
+"""
+import argparse
+import asyncio
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter
+
+from aiosmtpd.controller import Controller
+
+PORT = 8025
+
+parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+parser.add_argument("--users", type=int, default=20000)
+parser.add_argument("--rate", type=float, default=0, help="emails per second, 0 = unlimited")
+parser.add_argument("--concurrency", type=int, default=4)
+parser.add_argument("--batch-size", type=int, default=500)
+args = parser.parse_args()
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{DB_PATH}"
+os.environ["DEBUG"] = "false"
+os.environ["SMTP_HOST"] = "127.0.0.1"
+os.environ["SMTP_PORT"] = str(PORT)
+os.environ["SMTP_START_TLS"] = "false"
+os.environ["SMTP_POOL_SIZE"] = str(args.concurrency)
+os.environ["NEWSLETTER_CONCURRENCY"] = str(args.concurrency)
+os.environ["NEWSLETTER_RATE_PER_SECOND"] = str(args.rate)
+os.environ["NEWSLETTER_BATCH_SIZE"] = str(args.batch_size)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+from sqlalchemy import insert, select  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.database import engine, async_session_maker  # noqa: E402
+from app.models import User  # noqa: E402
+from app.models.user import UserRole  # noqa: E402
+from app.services.newsletter_service import newsletter_service  # noqa: E402
+from app.utils.auth import create_user_access_token  # noqa: E402
+
+
+class RecordingHandler:
+    def __init__(self):
+        self.connections = 0
+        self.recipients = Counter()
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        self.connections += 1
+        session.host_name = hostname
+        return responses
+
+    async def handle_DATA(self, server, session, envelope):
+        self.recipients.update(envelope.rcpt_tos)
+        return "250 OK"
+
+
+async def seed_users(count):
+    async with engine.begin() as conn:
+        for start in range(0, count, 5000):
+            await conn.execute(insert(User), [
+                dict(
+                    email=f"asiakas{i}@example.com", password_hash="x", role=UserRole.CUSTOMER,
+                    first_name="Asiakas", last_name=str(i), is_active=True, is_verified=True,
+                )
+                for i in range(start, min(count, start + 5000))
+            ])
+
+
+async def wait_for(client, headers, campaign_id, done):
+    latencies = []
+    while True:
+        started = time.perf_counter()
+        campaign = (await client.get(f"/api/newsletters/{campaign_id}", headers=headers)).json()
+        latencies.append(time.perf_counter() - started)
+        if done(campaign):
+            return campaign, latencies
+        await asyncio.sleep(0.05)
+
+
+async def main():
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=PORT)
+    controller.start()
+    try:
+        async with app.router.lifespan_context(app):
+            await seed_users(args.users)
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                async with async_session_maker() as db:
+                    admin = await db.scalar(select(User).where(User.role == UserRole.ADMIN))
+                headers = {"Authorization": f"Bearer {create_user_access_token(admin, 0)}"}
+
+                campaign = (await client.post("/api/newsletters/", headers=headers, json={
+                    "subject": "Kantama uutiskirje",
+                    "headline": "Uutta rahoituksessa",
+                    "subheadline": "Ajankohtaista yrittäjille",
+                    "content": "Leasing-rahoitus nyt entistä nopeammin.",
+                    "cta_text": "Lue lisää",
+                    "cta_url": "https://kantama.fi",
+                    "features": ["Nopea päätös", "Kilpailukykyinen hinta"],
+                    "segment": "CUSTOMER",
+                })).json()
+                campaign_id = campaign["id"]
+
+                started = time.perf_counter()
+                await client.post(f"/api/newsletters/{campaign_id}/send", headers=headers)
+                await wait_for(client, headers, campaign_id, lambda c: c["sent_count"] >= args.users // 2)
+                await client.post(f"/api/newsletters/{campaign_id}/pause", headers=headers)
+                paused, _ = await wait_for(
+                    client, headers, campaign_id, lambda c: c["id"] not in newsletter_service.stats()["running"]
+                )
+                await client.post(f"/api/newsletters/{campaign_id}/send", headers=headers)
+                campaign, latencies = await wait_for(
+                    client, headers, campaign_id, lambda c: c["status"] == "COMPLETED"
+                )
+                elapsed = time.perf_counter() - started
+    finally:
+        controller.stop()
+
+    duplicates = sum(1 for count in handler.recipients.values() if count > 1)
+    print(f"recipients         {campaign['total_recipients']}")
+    print(f"sent / failed      {campaign['sent_count']} / {campaign['failed_count']}")
+    print(f"paused at          {paused['sent_count']} sent")
+    print(f"delivered          {sum(handler.recipients.values())} emails to {len(handler.recipients)} addresses "
+          f"({duplicates} duplicates)")
+    print(f"elapsed            {elapsed:.1f} s incl. pause ({campaign['sent_count'] / elapsed:.1f} emails/s)")
+    print(f"campaign rate      {campaign['emails_per_second']} emails/s")
+    print(f"SMTP sessions      {handler.connections}")
+    print(f"API p50 / max      {statistics.median(latencies) * 1000:.1f} / {max(latencies) * 1000:.1f} ms while sending")
+    print(f"peak RSS           {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
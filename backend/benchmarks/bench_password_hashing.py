@@ -0,0 +1,114 @@
+"""
+Benchmark: /health latency while logins run concurrently.
+
+Runs the app in-process against a throwaway SQLite database and probes
+/health while a burst of logins hashes passwords. With --inline bcrypt runs
+directly on the event loop (the old behaviour) for comparison.
+
+Usage (from backend/):
+    python benchmarks/bench_password_hashing.py
+    python benchmarks/bench_password_hashing.py --inline
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{DB_PATH}"
+os.environ.setdefault("DEBUG", "false")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.utils.auth import password_hash_pool  # noqa: E402
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def report(label, latencies):
+    print(
+        f"{label:<28} n={len(latencies):<5} "
+        f"p50={statistics.median(latencies) * 1000:8.2f} ms  "
+        f"p99={percentile(latencies, 99) * 1000:8.2f} ms  "
+        f"max={max(latencies) * 1000:8.2f} ms"
+    )
+
+
+async def probe_health(client, duration, interval=0.01):
+    """
+    Probe /health on a fixed schedule and measure from the scheduled send
+    time, so stalls of the event loop show up as latency.
+    """
+    async def probe(scheduled):
+        response = await client.get("/health")
+        response.raise_for_status()
+        return time.perf_counter() - scheduled
+
+    probes = []
+    start = time.perf_counter()
+    for i in range(int(duration / interval)):
+        scheduled = start + i * interval
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        probes.append(asyncio.create_task(probe(scheduled)))
+    return await asyncio.gather(*probes)
+
+
+async def login_loop(client, email, password, stop):
+    count = 0
+    while not stop.is_set():
+        response = await client.post("/api/auth/login", json={"email": email, "password": password})
+        if response.status_code == 200:
+            count += 1
+    return count
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per phase")
+    parser.add_argument("--logins", type=int, default=8, help="concurrent login loops")
+    parser.add_argument("--inline", action="store_true", help="run bcrypt on the event loop")
+    args = parser.parse_args()
+
+    if args.inline:
+        async def run_inline(fn, *fn_args):
+            return fn(*fn_args)
+        password_hash_pool.run = run_inline
+
+    email, password = "bench@example.com", "bench-password"
+    transport = httpx.ASGITransport(app=app)
+
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            response = await client.post("/api/auth/register", json={"email": email, "password": password})
+            response.raise_for_status()
+
+            mode = "inline" if args.inline else f"pool ({password_hash_pool.max_workers} workers)"
+            print(f"bcrypt mode: {mode}")
+
+            report("/health idle", await probe_health(client, args.duration))
+
+            stop = asyncio.Event()
+            logins = [asyncio.create_task(login_loop(client, email, password, stop)) for _ in range(args.logins)]
+            latencies = await probe_health(client, args.duration)
+            stop.set()
+            completed = sum(await asyncio.gather(*logins))
+
+            report(f"/health + {args.logins} login loops", latencies)
+            print(f"logins completed: {completed} ({completed / args.duration:.1f}/s)")
+            if not args.inline:
+                print(f"pool stats: {password_hash_pool.stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,162 @@
+"""
+Benchmark: SMTP delivery with a new connection per email vs. the pool.
+
+Starts a local aiosmtpd server (pip install aiosmtpd) that counts
+connections and messages, adding --handshake-ms of latency to each EHLO
+to stand in for the round trips of a remote server's handshake, and
+delivers --emails emails:
+
+  per-message   aiosmtplib.send() for every email (the previous behaviour)
+  pooled        SmtpPool.send(), --concurrency senders at a time
+  outbox        emails queued in the outbox and drained by the email workers
+
+Usage (from backend/):
+    python benchmarks/bench_smtp_pool.py
+    python benchmarks/bench_smtp_pool.py --emails 500 --handshake-ms 50
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from email.message import EmailMessage
+
+from aiosmtpd.controller import Controller
+
+PORT = 8025
+DB_PATH = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{DB_PATH}"
+os.environ["DEBUG"] = "false"
+os.environ["SMTP_HOST"] = "127.0.0.1"
+os.environ["SMTP_PORT"] = str(PORT)
+os.environ["SMTP_START_TLS"] = "false"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import aiosmtplib  # noqa: E402
+from sqlalchemy import select, func  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.main import app  # noqa: E402
+from app.database import async_session_maker  # noqa: E402
+from app.models import EmailOutbox, EmailOutboxStatus  # noqa: E402
+from app.services.email_service import email_service  # noqa: E402
+from app.services.smtp_pool import SmtpPool  # noqa: E402
+
+
+class CountingHandler:
+    def __init__(self, handshake_seconds):
+        self.handshake_seconds = handshake_seconds
+        self.connections = 0
+        self.messages = 0
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        self.connections += 1
+        await asyncio.sleep(self.handshake_seconds)
+        session.host_name = hostname
+        return responses
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages += 1
+        return "250 OK"
+
+
+def make_message(i):
+    message = EmailMessage()
+    message["From"] = "noreply@kantama.fi"
+    message["To"] = f"asiakas{i}@example.com"
+    message["Subject"] = f"Rahoitustarjous: LEA-2025-{i:05d}"
+    message.set_content("Hei,\n\nolet saanut uuden rahoitustarjouksen.\n")
+    return message
+
+
+def report(label, handler, elapsed, emails):
+    print(
+        f"{label:<14} {emails} emails in {elapsed * 1000:8.1f} ms  "
+        f"({emails / elapsed:7.1f}/s)  SMTP sessions: {handler.connections}"
+    )
+
+
+async def per_message(handler, emails, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send(i):
+        async with semaphore:
+            await aiosmtplib.send(make_message(i), hostname="127.0.0.1", port=PORT, start_tls=False)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(send(i) for i in range(emails)))
+    return time.perf_counter() - started
+
+
+async def pooled(handler, emails, concurrency):
+    pool = SmtpPool(
+        hostname="127.0.0.1", port=PORT, username=None, password=None,
+        start_tls=False, timeout=30, size=concurrency, idle_timeout=60,
+    )
+    started = time.perf_counter()
+    await asyncio.gather(*(pool.send(make_message(i), [f"asiakas{i}@example.com"]) for i in range(emails)))
+    elapsed = time.perf_counter() - started
+    await pool.close()
+    return elapsed
+
+
+async def outbox(handler, emails):
+    async with app.router.lifespan_context(app):
+        started = time.perf_counter()
+        async with async_session_maker() as db:
+            for i in range(emails):
+                await email_service.send_email(
+                    db=db,
+                    to_email=f"asiakas{i}@example.com",
+                    subject=f"Rahoitustarjous: LEA-2025-{i:05d}",
+                    html_content="<p>Hei, olet saanut uuden rahoitustarjouksen.</p>",
+                )
+            await db.commit()
+
+        while True:
+            async with async_session_maker() as db:
+                pending = await db.scalar(
+                    select(func.count()).select_from(EmailOutbox)
+                    .where(EmailOutbox.status != EmailOutboxStatus.SENT)
+                )
+            if not pending:
+                break
+            await asyncio.sleep(0.01)
+        elapsed = time.perf_counter() - started
+
+        async with async_session_maker() as db:
+            kept = await db.scalar(
+                select(func.count()).select_from(EmailOutbox).where(EmailOutbox.html_content != "")
+            )
+        assert kept == 0, f"{kept} sent emails still hold their body"
+        return elapsed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--emails", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=settings.SMTP_POOL_SIZE)
+    parser.add_argument("--handshake-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    handler = CountingHandler(args.handshake_ms / 1000)
+    controller = Controller(handler, hostname="127.0.0.1", port=PORT)
+    controller.start()
+    try:
+        elapsed = await per_message(handler, args.emails, args.concurrency)
+        report("per-message", handler, elapsed, args.emails)
+
+        handler.connections = 0
+        elapsed = await pooled(handler, args.emails, args.concurrency)
+        report("pooled", handler, elapsed, args.emails)
+
+        handler.connections = 0
+        elapsed = await outbox(handler, args.emails)
+        report("outbox", handler, elapsed, args.emails)
+    finally:
+        controller.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
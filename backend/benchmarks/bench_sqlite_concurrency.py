@@ -0,0 +1,139 @@
+"""
+Benchmark: mixed read/write throughput on SQLite.
+
+Runs the app in-process against a throwaway SQLite file. Concurrent clients
+read their notifications and update their profile (PUT /api/users/me) in a
+fixed ratio. With --untuned the connections skip the pragmas (rollback
+journal, no busy_timeout) for comparison.
+
+Usage (from backend/):
+    python benchmarks/bench_sqlite_concurrency.py
+    python benchmarks/bench_sqlite_concurrency.py --untuned
+    python benchmarks/bench_sqlite_concurrency.py --clients 64 --write-ratio 0.5
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+UNTUNED = "--untuned" in sys.argv
+DB_PATH = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{DB_PATH}"
+os.environ["SQLITE_TUNING"] = "false" if UNTUNED else "true"
+os.environ.setdefault("DEBUG", "false")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.database import async_session_maker  # noqa: E402
+from app.models import User, Notification  # noqa: E402
+from app.models.user import UserRole  # noqa: E402
+from app.utils.auth import create_user_access_token, get_password_hash  # noqa: E402
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def report(label, latencies, duration):
+    if not latencies:
+        print(f"{label:<8} n=0")
+        return
+    print(
+        f"{label:<8} n={len(latencies):<6} {len(latencies) / duration:8.1f}/s  "
+        f"p50={statistics.median(latencies) * 1000:8.2f} ms  "
+        f"p99={percentile(latencies, 99) * 1000:8.2f} ms"
+    )
+
+
+async def seed(users, notifications_per_user):
+    password_hash = get_password_hash("bench-password")
+    async with async_session_maker() as db:
+        created = [
+            User(
+                email=f"bench{i}@example.com",
+                password_hash=password_hash,
+                role=UserRole.CUSTOMER,
+                is_active=True,
+                is_verified=True,
+            )
+            for i in range(users)
+        ]
+        db.add_all(created)
+        await db.flush()
+        db.add_all([
+            Notification(
+                user_id=user.id,
+                title="Ilmoitus",
+                message="Benchmark",
+                notification_type="INFO",
+            )
+            for user in created
+            for _ in range(notifications_per_user)
+        ])
+        await db.commit()
+        return [create_user_access_token(user, 0) for user in created]
+
+
+async def client_loop(client, token, write_ratio, stop, results):
+    headers = {"Authorization": f"Bearer {token}"}
+    rng = random.Random(token)
+    while not stop.is_set():
+        is_write = rng.random() < write_ratio
+        started = time.perf_counter()
+        if is_write:
+            response = await client.put("/api/users/me", headers=headers, json={"first_name": f"n{rng.randint(0, 1 << 30)}"})
+        else:
+            response = await client.get("/api/notifications/", headers=headers)
+        elapsed = time.perf_counter() - started
+
+        if response.status_code != 200:
+            results["errors"] += 1
+        elif is_write:
+            results["writes"].append(elapsed)
+        else:
+            results["reads"].append(elapsed)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to run")
+    parser.add_argument("--clients", type=int, default=32, help="concurrent clients")
+    parser.add_argument("--write-ratio", type=float, default=0.3, help="share of requests that write")
+    parser.add_argument("--untuned", action="store_true", help="connections without the WAL / busy_timeout pragmas")
+    args = parser.parse_args()
+
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+
+    async with app.router.lifespan_context(app):
+        tokens = await seed(args.clients, 20)
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+            print(f"mode: {'untuned' if args.untuned else 'WAL pragmas'}, "
+                  f"{args.clients} clients, write ratio {args.write_ratio}")
+
+            results = {"reads": [], "writes": [], "errors": 0}
+            stop = asyncio.Event()
+            loops = [
+                asyncio.create_task(client_loop(client, token, args.write_ratio, stop, results))
+                for token in tokens
+            ]
+            await asyncio.sleep(args.duration)
+            stop.set()
+            await asyncio.gather(*loops)
+
+            report("reads", results["reads"], args.duration)
+            report("writes", results["writes"], args.duration)
+            total = len(results["reads"]) + len(results["writes"])
+            print(f"total    {total / args.duration:8.1f} req/s, errors: {results['errors']}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
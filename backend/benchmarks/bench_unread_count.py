@@ -0,0 +1,101 @@
+"""
+Benchmark: GET /api/notifications/unread-count for a user with many
+unread notifications.
+
+Seeds --unread unread notifications for one customer and times:
+
+  rows      loading every unread Notification and counting them in Python
+            (the previous implementation)
+  counter   the endpoint with its cache disabled (one notification_counters
+            primary key lookup)
+  cached    the endpoint with the in-process cache
+
+Usage (from backend/):
+    python benchmarks/bench_unread_count.py
+    python benchmarks/bench_unread_count.py --unread 20000 --requests 500
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{DB_PATH}"
+os.environ.setdefault("DEBUG", "false")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+from sqlalchemy import insert, select  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.database import engine, async_session_maker  # noqa: E402
+from app.models import User, Notification  # noqa: E402
+from app.models.user import UserRole  # noqa: E402
+from app.services.notification_counters import notification_counters  # noqa: E402
+from app.services.notification_service import notification_service  # noqa: E402
+from app.utils.auth import create_user_access_token  # noqa: E402
+
+
+async def count_rows(user_id):
+    async with async_session_maker() as db:
+        result = await db.execute(
+            select(Notification).where(Notification.user_id == user_id, Notification.is_read == False)
+        )
+        return len(result.scalars().all())
+
+
+async def timed(call, requests):
+    latencies = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        await call()
+        latencies.append(time.perf_counter() - started)
+    return statistics.median(latencies) * 1000, max(latencies) * 1000
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--unread", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    async with app.router.lifespan_context(app):
+        async with engine.begin() as conn:
+            user_id = (await conn.execute(
+                insert(User).returning(User.id),
+                [dict(email="asiakas@example.com", password_hash="x", role=UserRole.CUSTOMER, is_active=True)]
+            )).scalar_one()
+        async with async_session_maker() as db:
+            for start in range(0, args.unread, 5000):
+                await notification_service.create_notifications(
+                    db, [user_id] * min(5000, args.unread - start), "Uusi tarjous", "Tarjous saatavilla", "OFFER_SENT"
+                )
+            await db.commit()
+            user = await db.get(User, user_id)
+        headers = {"Authorization": f"Bearer {create_user_access_token(user, 0)}"}
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            async def endpoint():
+                response = await client.get("/api/notifications/unread-count", headers=headers)
+                assert response.json()["count"] == args.unread, response.text
+
+            assert await count_rows(user_id) == args.unread
+            results = [("rows", await timed(lambda: count_rows(user_id), max(1, args.requests // 10)))]
+
+            cache_size = notification_counters.max_size
+            notification_counters.max_size = 0
+            results.append(("counter", await timed(endpoint, args.requests)))
+            notification_counters.max_size = cache_size
+            results.append(("cached", await timed(endpoint, args.requests)))
+
+    print(f"{args.unread} unread notifications")
+    for label, (p50, worst) in results:
+        print(f"{label:<8} p50 {p50:8.2f} ms  max {worst:8.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,160 @@
+"""
+Benchmark: POST /api/ytj/batch against N sequential GET /api/ytj/{id}.
+
+Starts a local PRH stand-in (127.0.0.1, v3 /companies shape, --latency ms
+of delay, tracking how many requests it serves at once) and the app under
+uvicorn (the ASGI test transport would buffer the stream), and times, with
+a cold cache each:
+
+  sequential   --ids GET /api/ytj/{business_id} calls one after another
+  batch        one POST /api/ytj/batch with the same number of other ids,
+               plus duplicates and ids with a wrong check digit
+
+then repeats the batch (warm: every company from the cache). Checks that
+every valid id gets exactly one line, invalid ids get status 400, and
+that PRH sees at most YTJ_BATCH_CONCURRENCY requests at once.
+
+Usage (from backend/):
+    python benchmarks/bench_ytj_batch.py
+    python benchmarks/bench_ytj_batch.py --ids 500 --latency 100
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+PORT = 8767
+APP_PORT = 8768
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{DB_PATH}"
+os.environ.setdefault("DEBUG", "false")
+os.environ["EMAIL_WORKERS"] = "0"
+os.environ["YTJ_API_URL"] = f"http://127.0.0.1:{PORT}/companies"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from sqlalchemy import select  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.config import settings  # noqa: E402
+from app.database import async_session_maker  # noqa: E402
+from app.models import User  # noqa: E402
+from app.models.user import UserRole  # noqa: E402
+from app.utils.auth import create_user_access_token  # noqa: E402
+
+
+prh = FastAPI()
+seen = {"requests": 0, "active": 0, "max_active": 0, "latency": 0.0}
+
+
+def business_id(number: int) -> str:
+    digits = f"{number:07d}"
+    remainder = sum(int(d) * w for d, w in zip(digits, (7, 9, 10, 5, 8, 4, 2))) % 11
+    if remainder == 1:
+        return business_id(number + 1)
+    return f"{digits}-{11 - remainder if remainder else 0}"
+
+
+@prh.get("/companies")
+async def companies(businessId: str):
+    seen["requests"] += 1
+    seen["active"] += 1
+    seen["max_active"] = max(seen["max_active"], seen["active"])
+    try:
+        await asyncio.sleep(seen["latency"])
+    finally:
+        seen["active"] -= 1
+    if businessId.startswith("09"):
+        return {"companies": []}
+    return {"companies": [{
+        "businessId": {"value": businessId},
+        "names": [{"name": f"Yritys {businessId} Oy", "type": "1"}],
+        "status": "2",
+        "tradeRegisterStatus": "1",
+        "companySituations": [],
+    }]}
+
+
+def reset():
+    seen["requests"] = 0
+    seen["max_active"] = 0
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ids", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=50.0, help="stand-in response delay in ms")
+    args = parser.parse_args()
+    seen["latency"] = args.latency / 1000
+
+    servers = [
+        uvicorn.Server(uvicorn.Config(prh, host="127.0.0.1", port=PORT, log_level="warning")),
+        uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=APP_PORT, log_level="warning")),
+    ]
+    server_tasks = [asyncio.create_task(server.serve()) for server in servers]
+    while not all(server.started for server in servers):
+        await asyncio.sleep(0.05)
+
+    try:
+        async with async_session_maker() as db:
+            admin = (await db.execute(select(User).where(User.role == UserRole.ADMIN))).scalars().first()
+        headers = {"Authorization": f"Bearer {create_user_access_token(admin, 0)}"}
+
+        sequential_ids = [business_id(1000000 + i * 13) for i in range(args.ids)]
+        batch_ids = [business_id(3000000 + i * 13) for i in range(args.ids - 1)] + [business_id(900001)]
+        invalid = ["1234567-8", "123-4", "FI12345678"]
+        body = {"business_ids": batch_ids + batch_ids[:20] + invalid}
+
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{APP_PORT}", timeout=120) as client:
+            reset()
+            started = time.perf_counter()
+            for business_id_ in sequential_ids:
+                response = await client.get(f"/api/ytj/{business_id_}")
+                assert response.status_code == 200, response.text
+            sequential = (time.perf_counter() - started, seen["requests"], seen["max_active"])
+
+            batches = []
+            for _ in range(2):
+                reset()
+                started = time.perf_counter()
+                first = None
+                lines = []
+                async with client.stream("POST", "/api/ytj/batch", json=body, headers=headers) as response:
+                    assert response.status_code == 200
+                    async for line in response.aiter_lines():
+                        if line:
+                            if first is None:
+                                first = time.perf_counter() - started
+                            lines.append(json.loads(line))
+                total = time.perf_counter() - started
+                statuses = {}
+                for line in lines:
+                    statuses[line["status"]] = statuses.get(line["status"], 0) + 1
+                assert len(lines) == len(set(batch_ids)) + len(invalid), len(lines)
+                assert sorted(line["business_id"] for line in lines) == sorted(set(batch_ids) | set(invalid))
+                assert statuses.get(400) == len(invalid) and statuses.get(404) == 1, statuses
+                assert seen["max_active"] <= settings.YTJ_BATCH_CONCURRENCY
+                batches.append((total, first, seen["requests"], seen["max_active"], statuses))
+    finally:
+        for server in reversed(servers):
+            server.should_exit = True
+        await asyncio.gather(*server_tasks)
+
+    print(f"{args.ids} companies, stand-in latency {args.latency:.0f} ms, concurrency {settings.YTJ_BATCH_CONCURRENCY}")
+    seconds, upstream, active = sequential
+    print(f"sequential GETs  total {seconds:6.2f} s  {upstream} PRH calls, max {active} at once")
+    for label, (seconds, first, upstream, active, statuses) in zip(("batch, cold", "batch, warm"), batches):
+        print(
+            f"{label:<16} total {seconds:6.2f} s  first line {first * 1000:7.1f} ms  "
+            f"{upstream} PRH calls, max {active} at once  statuses {statuses}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,137 @@
+"""
+Benchmark: GET /api/ytj/{business_id} during a PRH outage.
+
+Starts a local PRH stand-in (127.0.0.1, v3 /companies shape) and runs:
+
+  warm      --companies lookups while PRH works; the cache entries are
+            then aged past YTJ_STALE_TTL_SECONDS so every lookup must
+            call PRH again
+  outage    the stand-in hangs; the same lookups plus some never cached
+  recovery  the stand-in answers again; lookups after
+            YTJ_BREAKER_OPEN_SECONDS
+
+and prints latency and breaker state per phase. During the outage the
+first calls wait for the timeout until the breaker opens; after that
+cached companies come back at once flagged "stale" and unknown ones get
+503. YTJ_TIMEOUT_SECONDS and YTJ_BREAKER_OPEN_SECONDS are shortened
+(--timeout, --open) to keep the run short.
+
+Usage (from backend/):
+    python benchmarks/bench_ytj_breaker.py
+    python benchmarks/bench_ytj_breaker.py --companies 100 --timeout 10
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+PORT = 8769
+
+parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+parser.add_argument("--companies", type=int, default=40)
+parser.add_argument("--timeout", type=float, default=2.0, help="YTJ_TIMEOUT_SECONDS")
+parser.add_argument("--open", type=float, default=3.0, help="YTJ_BREAKER_OPEN_SECONDS")
+args = parser.parse_args()
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{DB_PATH}"
+os.environ.setdefault("DEBUG", "false")
+os.environ["EMAIL_WORKERS"] = "0"
+os.environ["YTJ_API_URL"] = f"http://127.0.0.1:{PORT}/companies"
+os.environ["YTJ_TIMEOUT_SECONDS"] = str(args.timeout)
+os.environ["YTJ_BREAKER_OPEN_SECONDS"] = str(args.open)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from sqlalchemy import update  # noqa: E402
+from datetime import datetime, timedelta  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.config import settings  # noqa: E402
+from app.database import async_session_maker  # noqa: E402
+from app.models import YtjCacheEntry  # noqa: E402
+from app.services.ytj_service import ytj_service  # noqa: E402
+
+
+prh = FastAPI()
+state = {"down": False, "up": asyncio.Event()}
+
+
+@prh.get("/companies")
+async def companies(businessId: str):
+    if state["down"]:
+        # Hangs until PRH is back up (the caller has timed out long before)
+        await state["up"].wait()
+    return {"companies": [{
+        "businessId": {"value": businessId},
+        "names": [{"name": f"Yritys {businessId} Oy", "type": "1"}],
+        "status": "2",
+        "tradeRegisterStatus": "1",
+        "companySituations": [],
+    }]}
+
+
+async def lookups(client, business_ids):
+    latencies = []
+    outcomes = {}
+    for business_id in business_ids:
+        started = time.perf_counter()
+        response = await client.get(f"/api/ytj/{business_id}")
+        latencies.append(time.perf_counter() - started)
+        if response.status_code == 200:
+            outcome = "200 stale" if response.json().get("stale") else "200"
+        else:
+            outcome = str(response.status_code)
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+    return latencies, outcomes
+
+
+async def main():
+    server = uvicorn.Server(uvicorn.Config(prh, host="127.0.0.1", port=PORT, log_level="warning"))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    known = [f"{2000000 + i}-0" for i in range(args.companies)]
+    unknown = [f"{3000000 + i}-0" for i in range(10)]
+    phases = []
+    try:
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+                phases.append(("warm", *await lookups(client, known), ytj_service.breaker.state))
+
+                aged = datetime.utcnow() - timedelta(seconds=settings.YTJ_STALE_TTL_SECONDS + 60)
+                async with async_session_maker() as db:
+                    await db.execute(update(YtjCacheEntry).values(fetched_at=aged))
+                    await db.commit()
+                ytj_service._entries.clear()
+
+                state["down"] = True
+                phases.append(("outage", *await lookups(client, known + unknown), ytj_service.breaker.state))
+
+                state["down"] = False
+                state["up"].set()
+                await asyncio.sleep(args.open)
+                phases.append(("recovery", *await lookups(client, known), ytj_service.breaker.state))
+    finally:
+        server.should_exit = True
+        await server_task
+
+    print(f"{args.companies} cached companies, timeout {args.timeout:.1f} s, breaker open {args.open:.1f} s")
+    for label, latencies, outcomes, breaker in phases:
+        ordered = sorted(latencies)
+        print(
+            f"{label:<9} p50 {statistics.median(ordered) * 1000:8.2f} ms  max {ordered[-1] * 1000:8.2f} ms  "
+            f"total {sum(ordered):6.2f} s  {outcomes}  breaker {breaker}"
+        )
+    print(ytj_service.breaker.stats())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
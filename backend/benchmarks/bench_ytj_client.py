@@ -0,0 +1,152 @@
+"""
+Benchmark: PRH/YTJ calls through the shared client, and single-flight.
+
+Starts a local PRH stand-in (a small FastAPI app on 127.0.0.1 serving the
+v3 /companies shape with --latency ms of delay) and compares:
+
+  per-request   a new httpx.AsyncClient for every lookup (the previous code)
+  shared        ytj_service's long-lived pooled client
+
+over --lookups sequential lookups of distinct Y-tunnus, counting the TCP
+connections the stand-in saw. Then fires --concurrency simultaneous API
+requests for one Y-tunnus and for one name search with a cold cache and
+reports how many reached the stand-in (single-flight: 1 each).
+
+The stand-in speaks plain HTTP/1.1, so this measures connection reuse and
+coalescing; against PRH the shared client also saves the TLS handshakes
+and uses HTTP/2 when h2 is installed.
+
+Usage (from backend/):
+    python benchmarks/bench_ytj_client.py
+    python benchmarks/bench_ytj_client.py --lookups 500 --latency 20
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+PORT = 8766
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{DB_PATH}"
+os.environ.setdefault("DEBUG", "false")
+os.environ["EMAIL_WORKERS"] = "0"
+os.environ["YTJ_API_URL"] = f"http://127.0.0.1:{PORT}/companies"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.config import settings  # noqa: E402
+from app.services.ytj_service import ytj_service  # noqa: E402
+
+
+prh = FastAPI()
+seen = {"requests": 0, "connections": set(), "latency": 0.0}
+
+
+def prh_company(business_id, name):
+    return {
+        "businessId": {"value": business_id},
+        "names": [{"name": name, "type": "1"}],
+        "status": "2",
+        "tradeRegisterStatus": "1",
+        "companyForms": [{"type": "16", "descriptions": [{"languageCode": "1", "description": "Osakeyhtiö"}]}],
+        "addresses": [{
+            "type": 1, "street": "Mannerheimintie", "buildingNumber": "1", "postCode": "00100",
+            "postOffices": [{"languageCode": "1", "city": "HELSINKI"}],
+        }],
+        "companySituations": [],
+    }
+
+
+@prh.get("/companies")
+async def companies(request: Request):
+    seen["requests"] += 1
+    seen["connections"].add(request.scope["client"][1])
+    await asyncio.sleep(seen["latency"])
+    business_id = request.query_params.get("businessId")
+    if business_id:
+        return {"companies": [prh_company(business_id, f"Yritys {business_id} Oy")]}
+    name = request.query_params["name"]
+    limit = int(request.query_params.get("maxResults", 10))
+    return {"companies": [prh_company(f"{1000000 + i}-{i % 10}", f"{name} {i} Oy") for i in range(limit)]}
+
+
+def reset():
+    seen["requests"] = 0
+    seen["connections"] = set()
+
+
+async def timed(lookup, business_ids):
+    latencies = []
+    for business_id in business_ids:
+        started = time.perf_counter()
+        await lookup(business_id)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lookups", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=5.0, help="stand-in response delay in ms")
+    args = parser.parse_args()
+    seen["latency"] = args.latency / 1000
+
+    server = uvicorn.Server(uvicorn.Config(prh, host="127.0.0.1", port=PORT, log_level="warning"))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    results = []
+    try:
+        async with app.router.lifespan_context(app):
+            async def per_request(business_id):
+                async with httpx.AsyncClient(timeout=10.0) as client:
+                    (await client.get(settings.YTJ_API_URL, params={"businessId": business_id})).raise_for_status()
+
+            async def shared(business_id):
+                await ytj_service._request({"businessId": business_id})
+
+            for label, lookup, offset in (("per-request", per_request, 0), ("shared", shared, args.lookups)):
+                reset()
+                ids = [f"{2000000 + offset + i}-0" for i in range(args.lookups)]
+                latencies = await timed(lookup, ids)
+                results.append((label, latencies, len(seen["connections"])))
+
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                coalesced = []
+                for label, path, params in (
+                    ("same Y-tunnus", "/api/ytj/3000000-0", None),
+                    ("same name search", "/api/ytj/search/by-name", {"name": "Kone", "limit": 10}),
+                ):
+                    reset()
+                    responses = await asyncio.gather(*(
+                        client.get(path, params=params) for _ in range(args.concurrency)
+                    ))
+                    assert all(response.status_code == 200 for response in responses)
+                    coalesced.append((label, seen["requests"]))
+    finally:
+        server.should_exit = True
+        await server_task
+
+    print(f"{args.lookups} sequential lookups, stand-in latency {args.latency:.0f} ms")
+    for label, latencies, connections in results:
+        print(
+            f"{label:<12} p50 {statistics.median(latencies) * 1000:6.2f} ms  "
+            f"total {sum(latencies):6.2f} s  {connections} TCP connections"
+        )
+    for label, upstream in coalesced:
+        print(f"{args.concurrency} concurrent requests, {label}: {upstream} upstream call(s)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
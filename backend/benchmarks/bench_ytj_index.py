@@ -0,0 +1,126 @@
+"""
+Benchmark: company name autocomplete from the local YTJ index.
+
+Writes a synthetic PRH dump of --companies companies (JSONL, PRH API
+record shape), imports it with the import_ytj.py code path, imports it
+again unchanged and once more with --changed companies renamed, then
+times GET /api/ytj/search/by-name for --requests keystroke-style queries
+("ko", "kon", "kone", ...) and checks that:
+
+  - the unchanged re-import writes nothing and the second one only the
+    renamed companies
+  - every query that matches locally is answered without calling PRH
+  - a query with no local match falls back to PRH (YTJ_API_URL points to
+    a closed port here, so the fallback is counted as an upstream call)
+
+Usage (from backend/):
+    python benchmarks/bench_ytj_index.py
+    python benchmarks/bench_ytj_index.py --companies 500000 --requests 1000
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+TMP = tempfile.mkdtemp()
+DB_PATH = os.path.join(TMP, "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{DB_PATH}"
+os.environ.setdefault("DEBUG", "false")
+os.environ["EMAIL_WORKERS"] = "0"
+os.environ["YTJ_API_URL"] = "http://127.0.0.1:9/companies"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.services.ytj_index import ytj_index, read_dump  # noqa: E402
+from app.services.ytj_service import ytj_service  # noqa: E402
+
+WORDS = [
+    "Kone", "Rakennus", "Kuljetus", "Metalli", "Puu", "Sähkö", "Lvi", "Maansiirto",
+    "Konepaja", "Nosturi", "Hitsaus", "Logistiikka", "Teknologia", "Palvelu", "Huolto",
+    "Järvi", "Pohjolan", "Suomen", "Itä", "Länsi", "Keski", "Savon", "Lapin", "Vaasan",
+]
+FORMS = ["Oy", "Ky", "Tmi", "Ab", "Oyj"]
+
+
+def company(index: int, suffix: str = "") -> dict:
+    rng = random.Random(index)
+    name = f"{rng.choice(WORDS)} {rng.choice(WORDS)}{suffix} {index} {rng.choice(FORMS)}"
+    return {
+        "businessId": {"value": f"{index:07d}-{index % 10}"},
+        "names": [{"name": name, "type": "1"}],
+        "companyForms": [{"type": "16", "descriptions": [{"languageCode": "1", "description": "Osakeyhtiö"}]}],
+        "status": "2",
+        "tradeRegisterStatus": "1",
+    }
+
+
+def write_dump(path: str, companies: int, renamed: int = 0):
+    with open(path, "w", encoding="utf-8") as f:
+        for index in range(1, companies + 1):
+            f.write(json.dumps(company(index, " Uusi" if index <= renamed else "")) + "\n")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--companies", type=int, default=200000)
+    parser.add_argument("--changed", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    dump = os.path.join(TMP, "companies.jsonl")
+    changed_dump = os.path.join(TMP, "companies_changed.jsonl")
+    write_dump(dump, args.companies)
+    write_dump(changed_dump, args.companies, args.changed)
+
+    async with app.router.lifespan_context(app):
+        imports = []
+        for path in (dump, dump, changed_dump):
+            started = time.perf_counter()
+            counts = await ytj_index.import_records(read_dump(path))
+            imports.append((time.perf_counter() - started, counts))
+        assert imports[0][1]["inserted"] == args.companies, imports[0]
+        assert imports[1][1]["unchanged"] == args.companies, imports[1]
+        assert imports[2][1]["updated"] == args.changed, imports[2]
+
+        queries = []
+        for word in WORDS:
+            typed = word.lower()
+            queries.extend(typed[:n] for n in range(2, len(typed) + 1))
+        queries.extend(["kone kuljetus", "suomen sähkö", "uusi"])
+
+        transport = httpx.ASGITransport(app=app)
+        latencies = []
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for i in range(args.requests):
+                q = queries[i % len(queries)]
+                started = time.perf_counter()
+                response = await client.get("/api/ytj/search/by-name", params={"name": q, "limit": 10})
+                latencies.append(time.perf_counter() - started)
+                assert response.status_code == 200 and response.json()["results"], (q, response.text)
+            upstream = ytj_service.upstream_calls
+
+            response = await client.get("/api/ytj/search/by-name", params={"name": "xyzzy plugh"})
+            fallback_calls = ytj_service.upstream_calls - upstream
+
+    labels = ("import", "re-import, unchanged", f"re-import, {args.changed} renamed")
+    for label, (seconds, counts) in zip(labels, imports):
+        print(f"{label:<28} {seconds:6.1f} s  {counts}")
+    latencies.sort()
+    print(
+        f"{args.requests} searches over {args.companies} companies: "
+        f"p50 {statistics.median(latencies) * 1000:.2f} ms  "
+        f"p95 {latencies[int(len(latencies) * 0.95)] * 1000:.2f} ms  "
+        f"max {latencies[-1] * 1000:.2f} ms"
+    )
+    print(f"PRH calls for local hits: {upstream}; for a local miss: {fallback_calls} (status {response.status_code})")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
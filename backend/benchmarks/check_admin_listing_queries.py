@@ -0,0 +1,162 @@
+"""
+Check: the admin offer / contract listings run a constant number of SQL
+statements, whatever the page size.
+
+Seeds a throwaway SQLite database, calls each listing with a small and a
+large table and compares the statement counts recorded by sql_metrics
+(which include the statements of the streamed body). Exits non-zero if a
+count grows with the number of rows, if the JSON shape changes, or if a
+page does not end at its X-Next-Cursor (rows skipped or repeated).
+
+Usage (from backend/):
+    python benchmarks/check_admin_listing_queries.py
+"""
+import asyncio
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), "check.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{DB_PATH}"
+os.environ.setdefault("DEBUG", "false")
+# Keep the periodic revocation list reload out of the counted statements
+os.environ["TOKEN_REVOCATION_REFRESH_SECONDS"] = "3600"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+from sqlalchemy import insert, select  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.database import engine, async_session_maker  # noqa: E402
+from app.models import (  # noqa: E402
+    User, Financier, Application, ApplicationStatus, ApplicationType,
+    Offer, OfferStatus, Contract, ContractStatus,
+)
+from app.models.user import UserRole  # noqa: E402
+from app.services.sql_metrics import sql_metrics  # noqa: E402
+from app.utils.auth import create_user_access_token  # noqa: E402
+
+
+OFFER_KEYS = {
+    "id", "application_id", "financier_id", "monthly_payment", "term_months", "upfront_payment",
+    "residual_value", "interest_or_margin", "included_services", "notes_to_customer",
+    "internal_notes", "status", "attachment_file_id", "created_at", "updated_at", "sent_at",
+    "responded_at", "expires_at", "application", "financier_name",
+}
+CONTRACT_KEYS = {
+    "id", "contract_number", "application_id", "financier_id", "offer_id", "contract_file_id",
+    "signed_file_id", "message_to_customer", "internal_notes", "lessee_company_name",
+    "lessee_business_id", "lessor_company_name", "monthly_rent", "lease_period_months", "status",
+    "created_at", "updated_at", "sent_at", "signed_at", "application", "financier_name",
+}
+
+
+async def seed(count, start_id):
+    now = datetime.utcnow()
+    async with engine.begin() as conn:
+        if start_id == 0:
+            await conn.execute(insert(Financier), [{"name": "Rahoittaja Oy", "email": "r@example.com"}])
+        await conn.execute(insert(Application), [
+            {
+                "id": start_id + i + 1,
+                "reference_number": f"LEA-CHECK-{start_id + i:05d}",
+                "application_type": ApplicationType.LEASING,
+                "status": ApplicationStatus.OFFER_SENT,
+                "customer_id": 1,
+                "company_name": f"Yritys {i} Oy",
+                "business_id": "1234567-8",
+                "contact_email": "check@example.com",
+                "equipment_description": "Trukki",
+                "equipment_price": 10000.0,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(count)
+        ])
+        await conn.execute(insert(Offer), [
+            {
+                "application_id": start_id + i + 1,
+                "financier_id": 1,
+                "monthly_payment": 100.0,
+                "term_months": 36,
+                "status": OfferStatus.SENT,
+                "created_at": now - timedelta(seconds=start_id + i),
+                "updated_at": now,
+            }
+            for i in range(count)
+        ])
+        await conn.execute(insert(Contract), [
+            {
+                "application_id": start_id + i + 1,
+                "financier_id": 1,
+                "status": ContractStatus.SENT,
+                "created_at": now - timedelta(seconds=start_id + i),
+                "updated_at": now,
+            }
+            for i in range(count)
+        ])
+
+
+async def statements_for(client, headers, path, params, expected_keys):
+    route = f"GET /api{path}"
+    before = sql_metrics.routes.get(route, {}).get("statements", 0)
+    response = await client.get(f"/api{path}", headers=headers, params=params)
+    response.raise_for_status()
+    rows = response.json()
+    if rows and set(rows[0]) != expected_keys:
+        raise SystemExit(f"{path}: unexpected keys {sorted(set(rows[0]) ^ expected_keys)}")
+    return sql_metrics.routes[route]["statements"] - before, rows, response.headers
+
+
+async def main():
+    transport = httpx.ASGITransport(app=app)
+    failed = False
+
+    async with app.router.lifespan_context(app):
+        async with async_session_maker() as db:
+            admin = (await db.execute(select(User).where(User.role == UserRole.ADMIN))).scalar_one()
+        headers = {"Authorization": f"Bearer {create_user_access_token(admin, 0)}"}
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://check") as client:
+            (await client.get("/api/metrics/", headers=headers)).raise_for_status()
+
+            listings = [
+                ("/offers/admin/all", OFFER_KEYS),
+                ("/contracts/admin/all", CONTRACT_KEYS),
+            ]
+            counts = {}
+            for rows, start_id in ((3, 0), (150, 3)):
+                await seed(rows, start_id)
+                for path, keys in listings:
+                    for params in ({"limit": 200}, {"limit": 200, "status_filter": "SENT", "financier_id": 1}):
+                        statements, returned, _ = await statements_for(client, headers, path, params, keys)
+                        counts.setdefault((path, str(params)), []).append((len(returned), statements))
+
+            # Following a cursor must not add statements either, and the two
+            # pages must together list every row exactly once
+            for path, keys in listings:
+                _, first, first_headers = await statements_for(client, headers, path, {"limit": 100}, keys)
+                statements, returned, _ = await statements_for(
+                    client, headers, path, {"limit": 100, "cursor": first_headers["x-next-cursor"]}, keys
+                )
+                counts[(path, "next page")] = [(len(returned), statements)]
+                ids = [row["id"] for row in first + returned]
+                ok = len(first) == 100 and len(ids) == len(set(ids)) == int(first_headers["x-total-count"])
+                failed |= not ok
+                print(f"{'ok  ' if ok else 'FAIL'} {path} pages of 100: {len(first)} + {len(returned)} rows, "
+                      f"{len(set(ids))} distinct of {first_headers['x-total-count']}")
+
+            for (path, params), results in counts.items():
+                statement_counts = {statements for _, statements in results}
+                ok = len(statement_counts) == 1
+                failed |= not ok
+                detail = ", ".join(f"{returned} rows: {statements} statements" for returned, statements in results)
+                print(f"{'ok  ' if ok else 'FAIL'} {path} {params}: {detail}")
+
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
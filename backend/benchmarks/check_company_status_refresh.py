@@ -0,0 +1,249 @@
+"""
+Check: the scheduled company status refresh.
+
+Starts a local PRH stand-in (127.0.0.1, v3 /companies shape) and seeds a
+throwaway SQLite database with --applications open applications (their
+ytj_data snapshot says the company is active), a few closed ones and a
+signed contract whose lessee business id differs from its application's.
+Then runs company_status_refresher.refresh():
+
+  first     every open company is checked once; nothing changed yet
+  again     right after: nothing is due, PRH is not called
+  a day on  --liquidated companies now have companySituations in PRH; the
+            run after YTJ_STATUS_MAX_AGE_SECONDS, started by --processes
+            refreshers at once (as each app worker would), must check every
+            company once in PRH (the YTJ cache still holds the first run's
+            copies), find exactly the liquidated ones, update their
+            applications' ytj_data (updated_at untouched) and notify each
+            admin once per batch
+
+PRH requests must be paced at --rate per second, not sent in bursts.
+
+Closed applications must never be looked up. Exits non-zero otherwise.
+
+Usage (from backend/):
+    python benchmarks/check_company_status_refresh.py
+    python benchmarks/check_company_status_refresh.py --applications 500 --liquidated 30
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+PORT = 8770
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), "check.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{DB_PATH}"
+os.environ.setdefault("DEBUG", "false")
+os.environ["EMAIL_WORKERS"] = "0"
+os.environ["YTJ_API_URL"] = f"http://127.0.0.1:{PORT}/companies"
+# Runs are started by hand below
+os.environ["YTJ_STATUS_INTERVAL_SECONDS"] = "3600"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import uvicorn  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from sqlalchemy import insert, select, func  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.config import settings  # noqa: E402
+from app.database import engine, async_session_maker  # noqa: E402
+from app.models import (  # noqa: E402
+    User, Financier, Application, ApplicationStatus, ApplicationType, Contract, ContractStatus,
+    Notification,
+)
+from app.models.user import UserRole  # noqa: E402
+from app.services.company_status_refresher import company_status_refresher, CompanyStatusRefresher  # noqa: E402
+
+
+prh = FastAPI()
+seen = {"requests": [], "times": [], "liquidated": set()}
+
+
+def business_id(number: int) -> str:
+    digits = f"{number:07d}"
+    remainder = sum(int(d) * w for d, w in zip(digits, (7, 9, 10, 5, 8, 4, 2))) % 11
+    if remainder == 1:
+        return business_id(number + 1)
+    return f"{digits}-{11 - remainder if remainder else 0}"
+
+
+@prh.get("/companies")
+async def companies(businessId: str):
+    seen["requests"].append(businessId)
+    seen["times"].append(time.perf_counter())
+    situations = [{"type": "SANE", "registrationDate": "2026-01-01"}] if businessId in seen["liquidated"] else []
+    return {"companies": [{
+        "businessId": {"value": businessId},
+        "names": [{"name": f"Yritys {businessId} Oy", "type": "1"}],
+        "status": "2",
+        "tradeRegisterStatus": "1",
+        "companySituations": situations,
+    }]}
+
+
+def application(customer_id, reference_number, business_id_, status=ApplicationStatus.SUBMITTED):
+    return dict(
+        reference_number=reference_number, application_type=ApplicationType.LEASING,
+        status=status, customer_id=customer_id, company_name=f"Yritys {business_id_} Oy",
+        business_id=business_id_, contact_email="asiakas@example.com", equipment_description="Trukki",
+        equipment_price=10000.0,
+        extra_data={"ytj_data": {"business_id": business_id_, "is_active": True, "is_liquidated": False}},
+    )
+
+
+async def seed(open_ids, closed_ids, lessee_id):
+    updated_at = datetime(2026, 1, 1)
+    async with engine.begin() as conn:
+        customer_id = (await conn.execute(
+            insert(User).returning(User.id),
+            [dict(email="asiakas@example.com", password_hash="x", role=UserRole.CUSTOMER, is_active=True)]
+        )).scalar_one()
+        rows = [application(customer_id, f"LEA-CHECK-{i:05d}", b) for i, b in enumerate(open_ids)]
+        # Two applications of the same company
+        rows.append(application(customer_id, "LEA-CHECK-TWIN", open_ids[0]))
+        rows += [
+            application(customer_id, f"LEA-CLOSED-{i:05d}", b, ApplicationStatus.CLOSED)
+            for i, b in enumerate(closed_ids)
+        ]
+        signed = application(customer_id, "LEA-SIGNED", closed_ids[0], ApplicationStatus.CANCELLED)
+        rows.append(signed)
+        application_ids = (await conn.execute(
+            insert(Application).returning(Application.id, sort_by_parameter_order=True),
+            [{**row, "updated_at": updated_at} for row in rows]
+        )).scalars().all()
+        financier_id = (await conn.execute(
+            insert(Financier).returning(Financier.id),
+            [dict(name="Rahoittaja Oy", email="rahoittaja@example.com", is_active=True)]
+        )).scalar_one()
+        await conn.execute(insert(Contract), [dict(
+            application_id=application_ids[-1], financier_id=financier_id,
+            status=ContractStatus.SIGNED, lessee_business_id=lessee_id,
+        )])
+    return updated_at
+
+
+async def notifications():
+    async with async_session_maker() as db:
+        result = await db.execute(
+            select(Notification.user_id, Notification.data)
+            .where(Notification.notification_type == "COMPANY_STATUS_CHANGED")
+        )
+        return result.all()
+
+
+async def run(now=None, processes=1):
+    """One refresh started by `processes` refreshers at once; returns the summed counts"""
+    seen["requests"].clear()
+    seen["times"].clear()
+    refreshers = [company_status_refresher] + [CompanyStatusRefresher() for _ in range(processes - 1)]
+    started = time.perf_counter()
+    results = await asyncio.gather(*(refresher.refresh(now) for refresher in refreshers))
+    counts = {key: sum(result[key] for result in results) for key in results[0]}
+    return counts, time.perf_counter() - started, list(seen["requests"])
+
+
+def busiest_window(times, seconds):
+    """Most requests that arrived within any `seconds` long window"""
+    busiest = 0
+    start = 0
+    for end, arrived in enumerate(times):
+        while arrived - times[start] > seconds:
+            start += 1
+        busiest = max(busiest, end - start + 1)
+    return busiest
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--applications", type=int, default=120)
+    parser.add_argument("--liquidated", type=int, default=7)
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--rate", type=float, default=100.0)
+    args = parser.parse_args()
+    settings.YTJ_STATUS_RATE_PER_SECOND = args.rate
+
+    open_ids = [business_id(1000000 + i * 17) for i in range(args.applications)]
+    closed_ids = [business_id(5000000 + i * 17) for i in range(5)]
+    lessee_id = business_id(7000001)
+    liquidated = set(open_ids[:args.liquidated]) | {lessee_id}
+    # Every company is due at once on the later run, so batches go in business id order
+    due = sorted(open_ids + [lessee_id])
+    batch_size = settings.YTJ_STATUS_BATCH_SIZE
+    batches = len({due.index(b) // batch_size for b in liquidated})
+
+    server = uvicorn.Server(uvicorn.Config(prh, host="127.0.0.1", port=PORT, log_level="warning"))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    try:
+        async with app.router.lifespan_context(app):
+            await company_status_refresher.stop()
+            updated_at = await seed(open_ids, closed_ids, lessee_id)
+            async with async_session_maker() as db:
+                admins = (await db.execute(
+                    select(func.count()).select_from(User).where(User.role == UserRole.ADMIN)
+                )).scalar_one()
+
+            first, first_seconds, first_requests = await run()
+            again, _, again_requests = await run()
+
+            seen["liquidated"] = liquidated
+            later = datetime.utcnow() + timedelta(seconds=settings.YTJ_STATUS_MAX_AGE_SECONDS + 60)
+            day_on, day_on_seconds, day_on_requests = await run(later, args.processes)
+            # Paced requests stay near rate * window (plus a little arrival jitter); a
+            # burst of YTJ_BATCH_CONCURRENCY shows up as that many within a few ms
+            window = 0.05
+            busiest = busiest_window(list(seen["times"]), window)
+
+            sent = await notifications()
+            async with async_session_maker() as db:
+                result = await db.execute(
+                    select(Application.business_id, Application.extra_data, Application.updated_at)
+                    .where(Application.business_id.in_(open_ids))
+                )
+                applications = result.all()
+    finally:
+        server.should_exit = True
+        await server_task
+
+    changed_ids = {change["business_id"] for _, data in sent for change in data["changes"]}
+    snapshots_ok = all(
+        row.extra_data["ytj_data"]["is_liquidated"] == (row.business_id in liquidated)
+        and row.extra_data["ytj_data"].get("name") == f"Yritys {row.business_id} Oy"
+        for row in applications
+    )
+    checks = [
+        (
+            f"first run checks each open company once ({first} in {first_seconds * 1000:.0f} ms)",
+            first["checked"] == len(open_ids) + 1 and sorted(first_requests) == sorted(open_ids + [lessee_id]),
+        ),
+        ("first run finds no change against the submitted snapshot", first["changed"] == 0 and first["failed"] == 0),
+        ("closed applications never looked up", not set(closed_ids) & set(first_requests + day_on_requests)),
+        ("nothing due right after", again["checked"] == 0 and not again_requests),
+        (
+            f"a day later, with {args.processes} refreshers, every company re-checked once "
+            f"({day_on} in {day_on_seconds * 1000:.0f} ms)",
+            day_on["checked"] == len(open_ids) + 1 and sorted(day_on_requests) == sorted(open_ids + [lessee_id]),
+        ),
+        (
+            f"PRH requests paced (at most {busiest} within {window * 1000:.0f} ms at {args.rate:.0f}/s)",
+            busiest <= args.rate * window + 2,
+        ),
+        ("exactly the liquidated companies changed", changed_ids == liquidated and day_on["changed"] == len(liquidated)),
+        (f"one notification per admin and batch ({len(sent)})", len(sent) == admins * batches and admins > 0),
+        ("ytj_data snapshots refreshed", snapshots_ok),
+        ("updated_at untouched", all(row.updated_at == updated_at for row in applications)),
+    ]
+    for label, ok in checks:
+        print(f"{'ok  ' if ok else 'FAIL'} {label}")
+    if not all(ok for _, ok in checks):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,126 @@
+"""
+Check: a financier user with many new notifications gets one digest email.
+
+Seeds a throwaway SQLite database with a financier that has --users active
+users, assigns --assignments applications to it (POST /api/assignments/)
+and runs the digest job once the window has passed. Every financier user
+must get exactly one queued email, the financier's own address none, and
+a second run must queue nothing. Exits non-zero otherwise.
+
+Usage (from backend/):
+    python benchmarks/check_notification_digest.py
+    python benchmarks/check_notification_digest.py --assignments 200 --users 5
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), "check.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{DB_PATH}"
+os.environ.setdefault("DEBUG", "false")
+# Queued emails stay in the outbox so they can be counted
+os.environ["EMAIL_WORKERS"] = "0"
+os.environ["NOTIFICATION_DIGEST_POLL_SECONDS"] = "3600"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+from sqlalchemy import insert, select, func  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.config import settings  # noqa: E402
+from app.database import engine, async_session_maker  # noqa: E402
+from app.models import User, Financier, Application, ApplicationStatus, ApplicationType, EmailOutbox  # noqa: E402
+from app.models.user import UserRole  # noqa: E402
+from app.services.notification_digest import notification_digest  # noqa: E402
+from app.utils.auth import create_user_access_token  # noqa: E402
+
+
+async def seed(assignments, users):
+    async with engine.begin() as conn:
+        customer_id = (await conn.execute(
+            insert(User).returning(User.id),
+            [dict(email="asiakas@example.com", password_hash="x", role=UserRole.CUSTOMER, is_active=True)]
+        )).scalar_one()
+        application_ids = (await conn.execute(
+            insert(Application).returning(Application.id, sort_by_parameter_order=True),
+            [
+                dict(
+                    reference_number=f"LEA-CHECK-{i:05d}", application_type=ApplicationType.LEASING,
+                    status=ApplicationStatus.SUBMITTED, customer_id=customer_id, company_name="Yritys Oy",
+                    business_id="1234567-8", contact_email="asiakas@example.com", equipment_description="Trukki",
+                    equipment_price=10000.0,
+                )
+                for i in range(assignments)
+            ]
+        )).scalars().all()
+        financier_id = (await conn.execute(
+            insert(Financier).returning(Financier.id),
+            [dict(name="Rahoittaja Oy", email="rahoittaja@example.com", is_active=True)]
+        )).scalar_one()
+        await conn.execute(insert(User), [
+            dict(
+                email=f"r{i}@example.com", password_hash="x", role=UserRole.FINANCIER,
+                financier_id=financier_id, is_active=True,
+            )
+            for i in range(users)
+        ])
+    return application_ids, financier_id
+
+
+async def outbox():
+    async with async_session_maker() as db:
+        result = await db.execute(
+            select(EmailOutbox.to_email, func.count()).group_by(EmailOutbox.to_email)
+        )
+        return dict(result.all())
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--assignments", type=int, default=40)
+    parser.add_argument("--users", type=int, default=3)
+    args = parser.parse_args()
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        application_ids, financier_id = await seed(args.assignments, args.users)
+        async with async_session_maker() as db:
+            admin = (await db.execute(select(User).where(User.role == UserRole.ADMIN))).scalar_one()
+        headers = {"Authorization": f"Bearer {create_user_access_token(admin, 0)}"}
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://check") as client:
+            for application_id in application_ids:
+                response = await client.post(
+                    "/api/assignments/", headers=headers,
+                    json={"application_id": application_id, "financier_id": financier_id}
+                )
+                response.raise_for_status()
+
+        before_window = await notification_digest.send_due()
+        due = datetime.utcnow() + timedelta(seconds=settings.NOTIFICATION_DIGEST_WINDOW_SECONDS)
+        started = time.perf_counter()
+        first = await notification_digest.send_due(due)
+        elapsed = time.perf_counter() - started
+        second = await notification_digest.send_due(due)
+        queued = await outbox()
+
+    checks = [
+        ("no digest before the window", before_window == 0),
+        (f"one digest per financier user ({first} queued in {elapsed * 1000:.1f} ms)", first == args.users),
+        ("no per-assignment email to the financier", "rahoittaja@example.com" not in queued),
+        ("each user emailed once", all(queued.get(f"r{i}@example.com") == 1 for i in range(args.users))),
+        ("nothing queued twice", second == 0),
+    ]
+    for label, ok in checks:
+        print(f"{'ok  ' if ok else 'FAIL'} {label}")
+    print(f"{args.assignments} assignments -> {sum(queued.values())} emails in the outbox")
+    if not all(ok for _, ok in checks):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,148 @@
+"""
+Check: notifying every user of a financier costs a constant number of SQL
+statements and one commit, whatever the number of users.
+
+Seeds a throwaway SQLite database with financiers of 1, 10 and --users
+active users, assigns an application to each (POST /api/assignments/,
+which notifies the customer and all the financier's users) and compares
+the statement counts recorded by sql_metrics and the COMMITs issued.
+Exits non-zero if either grows with the number of users, or if a
+notification is missing.
+
+Usage (from backend/):
+    python benchmarks/check_notification_fanout.py
+    python benchmarks/check_notification_fanout.py --users 200
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), "check.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{DB_PATH}"
+os.environ.setdefault("DEBUG", "false")
+# Keep the periodic revocation list reload out of the counted statements
+os.environ["TOKEN_REVOCATION_REFRESH_SECONDS"] = "3600"
+# No email delivery: only the route's own commits are counted
+os.environ["EMAIL_WORKERS"] = "0"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+from sqlalchemy import event, insert, select, func  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.database import engine, async_session_maker  # noqa: E402
+from app.models import User, Financier, Application, ApplicationStatus, ApplicationType, Notification  # noqa: E402
+from app.models.user import UserRole  # noqa: E402
+from app.services.sql_metrics import sql_metrics  # noqa: E402
+from app.utils.auth import create_user_access_token  # noqa: E402
+
+
+ROUTE = "POST /api/assignments/"
+
+
+async def seed(sizes):
+    async with engine.begin() as conn:
+        customer_id = (await conn.execute(
+            insert(User).returning(User.id),
+            [dict(email="asiakas@example.com", password_hash="x", role=UserRole.CUSTOMER, is_active=True)]
+        )).scalar_one()
+        application_ids = (await conn.execute(
+            insert(Application).returning(Application.id, sort_by_parameter_order=True),
+            [
+                dict(
+                    reference_number=f"LEA-CHECK-{size:05d}", application_type=ApplicationType.LEASING,
+                    status=ApplicationStatus.SUBMITTED, customer_id=customer_id, company_name="Yritys Oy",
+                    business_id="1234567-8", contact_email="asiakas@example.com", equipment_description="Trukki",
+                    equipment_price=10000.0,
+                )
+                for size in sizes
+            ]
+        )).scalars().all()
+        financier_ids = []
+        for size in sizes:
+            financier_id = (await conn.execute(
+                insert(Financier).returning(Financier.id),
+                [dict(name=f"Rahoittaja {size} Oy", email=f"r{size}@example.com", is_active=True)]
+            )).scalar_one()
+            await conn.execute(insert(User), [
+                dict(
+                    email=f"r{size}-{i}@example.com", password_hash="x", role=UserRole.FINANCIER,
+                    financier_id=financier_id, is_active=True,
+                )
+                for i in range(size)
+            ])
+            financier_ids.append(financier_id)
+    return application_ids, financier_ids
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=50)
+    args = parser.parse_args()
+
+    sizes = [1, 10, args.users]
+    commits = 0
+    # The ASGI transport runs the app in this task; commits of the background
+    # jobs started with the app (in their own tasks) are not the route's
+    check_task = asyncio.current_task()
+
+    @event.listens_for(engine.sync_engine, "commit")
+    def count_commit(conn):
+        nonlocal commits
+        if asyncio.current_task() is check_task:
+            commits += 1
+
+    transport = httpx.ASGITransport(app=app)
+    failed = False
+
+    async with app.router.lifespan_context(app):
+        application_ids, financier_ids = await seed(sizes)
+        async with async_session_maker() as db:
+            admin = (await db.execute(select(User).where(User.role == UserRole.ADMIN))).scalar_one()
+        headers = {"Authorization": f"Bearer {create_user_access_token(admin, 0)}"}
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://check") as client:
+            (await client.get("/api/metrics/", headers=headers)).raise_for_status()
+
+            results = []
+            for size, application_id, financier_id in zip(sizes, application_ids, financier_ids):
+                before = sql_metrics.routes.get(ROUTE, {}).get("statements", 0)
+                commits_before = commits
+                started = time.perf_counter()
+                response = await client.post(
+                    "/api/assignments/", headers=headers,
+                    json={"application_id": application_id, "financier_id": financier_id}
+                )
+                elapsed = time.perf_counter() - started
+                response.raise_for_status()
+
+                async with async_session_maker() as db:
+                    notified = await db.scalar(
+                        select(func.count()).select_from(Notification)
+                        .join(User, User.id == Notification.user_id)
+                        .where(User.financier_id == financier_id)
+                    )
+                statements = sql_metrics.routes[ROUTE]["statements"] - before
+                results.append((size, statements, commits - commits_before, notified, elapsed))
+
+    for size, statements, route_commits, notified, elapsed in results:
+        ok = notified == size
+        failed |= not ok
+        print(
+            f"{'ok  ' if ok else 'FAIL'} {size:>4} financier users: {statements} statements, "
+            f"{route_commits} commit(s), {notified} notified, {elapsed * 1000:.1f} ms"
+        )
+    for label, index in (("statements", 1), ("commits", 2)):
+        ok = len({result[index] for result in results}) == 1
+        failed |= not ok
+        print(f"{'ok  ' if ok else 'FAIL'} {label} independent of the number of users")
+
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,280 @@
+"""
+Print the query plan of every query issued by the API routes.
+
+Uses DATABASE_URL like the app does, so the same script covers SQLite
+(EXPLAIN QUERY PLAN) and PostgreSQL (EXPLAIN). Run `alembic upgrade head`
+first so the indexes from the migrations are in place.
+
+Usage (from backend/):
+    python explain_queries.py
+    python explain_queries.py --analyze          # PostgreSQL: EXPLAIN ANALYZE
+    python explain_queries.py --filter offers
+    DATABASE_URL=postgresql+asyncpg://... python explain_queries.py
+"""
+import argparse
+import asyncio
+from datetime import datetime
+
+from sqlalchemy import select, update, func
+
+from app.database import engine
+from app.utils.pagination import keyset_page
+from app.models.user import UserRole
+from app.models import (
+    User, Financier, Application, ApplicationStatus,
+    ApplicationAssignment, InfoRequest, InfoRequestResponse, Offer, OfferStatus,
+    Contract, ContractStatus, Notification, NotificationCounter, File, TokenRevocation,
+    EmailOutbox, EmailOutboxStatus,
+)
+
+
+# Sample parameter values; plans do not depend on the rows existing
+ID = 1
+EMAIL = "asiakas@example.com"
+
+
+def route_queries():
+    """(name, statement) for each WHERE / ORDER BY shape used in app/routes"""
+    return [
+        # auth
+        ("auth.login: user by email",
+         select(User).where(User.email == EMAIL)),
+        ("auth.verify_email: user by verification token",
+         select(User).where(User.verification_token == "token")),
+        ("auth.login: token version",
+         select(TokenRevocation.token_version).where(TokenRevocation.user_id == ID)),
+
+        # users
+        ("users.list_users: by role, newest first",
+         select(User).where(User.role == UserRole.CUSTOMER).order_by(User.created_at.desc())),
+        ("users.list_users: all, newest first",
+         select(User).order_by(User.created_at.desc())),
+        ("financier users to notify",
+         select(User.id).where(User.financier_id == ID, User.is_active == True)),
+        ("active admins to notify",
+         select(User.id).where(User.role == UserRole.ADMIN, User.is_active == True)),
+
+        # financiers
+        ("financiers.list_financiers: active by name",
+         select(Financier).where(Financier.is_active == True).order_by(Financier.name)),
+        ("financiers: users of financiers (selectinload)",
+         select(User).where(User.financier_id.in_([ID, ID + 1]))),
+
+        # applications
+        ("applications.list: customer",
+         keyset_page(
+             select(Application).where(Application.customer_id == ID),
+             Application.created_at, Application.id, True, None, 50)),
+        ("applications.list: financier",
+         keyset_page(
+             select(Application).where(Application.id.in_(
+                 select(ApplicationAssignment.application_id)
+                 .where(ApplicationAssignment.financier_id == ID)
+             )),
+             Application.created_at, Application.id, True, None, 50)),
+        ("applications.list: admin, first page",
+         keyset_page(select(Application), Application.created_at, Application.id, True, None, 50)),
+        ("applications.list: admin, next page",
+         keyset_page(select(Application), Application.created_at, Application.id, True,
+                     (datetime(2025, 1, 1), ID), 50)),
+        ("applications.list: admin by price, next page",
+         keyset_page(select(Application), Application.equipment_price, Application.id, False,
+                     (10000.0, ID), 50)),
+        ("applications.list: admin by status, next page",
+         keyset_page(select(Application), Application.status, Application.id, False,
+                     (ApplicationStatus.SUBMITTED, ID), 50)),
+        ("applications.list: admin, status filter",
+         keyset_page(
+             select(Application).where(Application.status == ApplicationStatus.SUBMITTED),
+             Application.created_at, Application.id, True, None, 50)),
+        ("applications.list: admin, price range sorted by price",
+         keyset_page(
+             select(Application).where(
+                 Application.equipment_price >= 10000, Application.equipment_price <= 50000
+             ),
+             Application.equipment_price, Application.id, True, None, 50)),
+        ("applications.list: admin, total",
+         select(func.count(Application.id)).where(Application.status == ApplicationStatus.SUBMITTED)),
+        ("applications: files of applications (selectinload)",
+         select(File).where(File.application_id.in_([ID, ID + 1]))),
+
+        # assignments (access checks in most routes)
+        ("assignment access check",
+         select(ApplicationAssignment).where(
+             ApplicationAssignment.application_id == ID,
+             ApplicationAssignment.financier_id == ID,
+         )),
+        ("assignments.get_application_assignments",
+         select(ApplicationAssignment)
+         .where(ApplicationAssignment.application_id == ID)
+         .order_by(ApplicationAssignment.created_at.desc())),
+
+        # info requests
+        ("info_requests.get_application_info_requests",
+         select(InfoRequest)
+         .where(InfoRequest.application_id == ID)
+         .order_by(InfoRequest.created_at.desc())),
+        ("info_requests: responses (selectinload)",
+         select(InfoRequestResponse).where(InfoRequestResponse.info_request_id.in_([ID, ID + 1]))),
+
+        # offers
+        ("offers.get_application_offers: customer",
+         select(Offer)
+         .where(
+             Offer.application_id == ID,
+             Offer.status.not_in([OfferStatus.DRAFT, OfferStatus.PENDING_ADMIN]),
+         )
+         .order_by(Offer.created_at.desc())),
+        ("offers.get_application_offers: financier",
+         select(Offer)
+         .where(Offer.application_id == ID, Offer.financier_id == ID)
+         .order_by(Offer.created_at.desc())),
+        ("offers.get_application_offers: admin",
+         select(Offer)
+         .where(Offer.application_id == ID)
+         .order_by(Offer.created_at.desc())),
+        ("contracts.create_contract: accepted offer",
+         select(Offer).where(Offer.application_id == ID, Offer.status == OfferStatus.ACCEPTED)),
+        ("offers.get_all_offers_admin: page",
+         keyset_page(
+             select(Offer.id, Application.company_name, Financier.name)
+             .outerjoin(Application, Application.id == Offer.application_id)
+             .outerjoin(Financier, Financier.id == Offer.financier_id),
+             Offer.created_at, Offer.id, True, (datetime(2025, 1, 1), ID), 50)),
+        ("offers.get_all_offers_admin: by status",
+         keyset_page(select(Offer).where(Offer.status == OfferStatus.SENT),
+                     Offer.created_at, Offer.id, True, None, 50)),
+        ("offers.get_all_offers_admin: by financier",
+         keyset_page(select(Offer).where(Offer.financier_id == ID),
+                     Offer.created_at, Offer.id, True, None, 50)),
+
+        # contracts
+        ("contracts.get_application_contracts: customer",
+         select(Contract)
+         .where(Contract.application_id == ID, Contract.status != ContractStatus.DRAFT)
+         .order_by(Contract.created_at.desc())),
+        ("contracts.get_application_contracts: financier",
+         select(Contract)
+         .where(Contract.application_id == ID, Contract.financier_id == ID)
+         .order_by(Contract.created_at.desc())),
+        ("contracts.get_application_contracts: admin",
+         select(Contract)
+         .where(Contract.application_id == ID)
+         .order_by(Contract.created_at.desc())),
+        ("contracts.get_all_contracts_admin: page",
+         keyset_page(
+             select(Contract.id, Application.company_name, Financier.name)
+             .outerjoin(Application, Application.id == Contract.application_id)
+             .outerjoin(Financier, Financier.id == Contract.financier_id),
+             Contract.created_at, Contract.id, True, (datetime(2025, 1, 1), ID), 50)),
+        ("contracts.get_all_contracts_admin: by status",
+         keyset_page(select(Contract).where(Contract.status == ContractStatus.SENT),
+                     Contract.created_at, Contract.id, True, None, 50)),
+
+        # files
+        ("files.get_application_files",
+         select(File)
+         .where(File.application_id == ID)
+         .order_by(File.created_at.desc())),
+
+        # notifications
+        ("notifications.get_notifications",
+         keyset_page(select(Notification).where(Notification.user_id == ID),
+                     Notification.created_at, Notification.id, True, (datetime(2025, 1, 1), ID), 50)),
+        ("notifications.get_notifications: unread only",
+         keyset_page(select(Notification).where(Notification.user_id == ID, Notification.is_read == False),
+                     Notification.created_at, Notification.id, True, (datetime(2025, 1, 1), ID), 50)),
+        ("notifications.get_unread_count: counter",
+         select(NotificationCounter.unread).where(NotificationCounter.user_id == ID)),
+        ("notification_counters.repair: recount",
+         update(NotificationCounter)
+         .where(NotificationCounter.unread != (
+             select(func.count())
+             .where(Notification.user_id == NotificationCounter.user_id, Notification.is_read == False)
+             .scalar_subquery()
+         ))
+         .values(unread=0)),
+        ("notifications.mark_all_as_read",
+         update(Notification)
+         .where(Notification.user_id == ID, Notification.is_read == False)
+         .values(is_read=True)),
+        ("notifications.mark_many_as_read",
+         update(Notification)
+         .where(Notification.id.in_([ID, ID + 1]), Notification.user_id == ID, Notification.is_read == False)
+         .values(is_read=True)),
+        ("notification_digest: due users",
+         select(Notification.user_id)
+         .where(Notification.is_email_sent == False)
+         .group_by(Notification.user_id)
+         .having(func.min(Notification.created_at) <= datetime(2025, 1, 1))
+         .order_by(Notification.user_id)
+         .limit(200)),
+        ("notification_digest: claim",
+         update(Notification)
+         .where(Notification.user_id.in_([ID, ID + 1]), Notification.is_email_sent == False)
+         .values(is_email_sent=True)),
+        ("notification_archiver: next batch",
+         select(Notification.id)
+         .where(Notification.id > ID, Notification.is_read == True, Notification.created_at < datetime(2025, 1, 1))
+         .order_by(Notification.id)
+         .limit(1000)),
+
+        # email outbox workers
+        ("email_worker.claim: due emails",
+         select(EmailOutbox.id)
+         .where(EmailOutbox.status == EmailOutboxStatus.PENDING, EmailOutbox.next_attempt_at <= datetime(2025, 1, 1))
+         .order_by(EmailOutbox.next_attempt_at, EmailOutbox.id)
+         .limit(10)),
+        ("email_worker.claim: stale claims",
+         update(EmailOutbox)
+         .where(EmailOutbox.status == EmailOutboxStatus.SENDING, EmailOutbox.locked_at < datetime(2025, 1, 1))
+         .values(status=EmailOutboxStatus.PENDING)),
+    ]
+
+
+async def explain_all(analyze: bool, name_filter: str):
+    async with engine.connect() as conn:
+        dialect = conn.dialect
+
+        if dialect.name == "sqlite":
+            prefix = "EXPLAIN QUERY PLAN"
+        elif dialect.name == "postgresql":
+            prefix = "EXPLAIN (ANALYZE, BUFFERS)" if analyze else "EXPLAIN"
+        else:
+            raise SystemExit(f"Unsupported database: {dialect.name}")
+
+        print(f"# {dialect.name}: {engine.url.render_as_string(hide_password=True)}\n")
+
+        for name, statement in route_queries():
+            if name_filter and name_filter not in name:
+                continue
+
+            sql = str(statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+            # EXPLAIN ANALYZE executes the statement; never let it change data
+            trans = await conn.begin()
+            try:
+                result = await conn.exec_driver_sql(f"{prefix} {sql}")
+                rows = result.all()
+            finally:
+                await trans.rollback()
+
+            print(f"== {name}")
+            if dialect.name == "sqlite":
+                # (id, parent, notused, detail)
+                for row in rows:
+                    print(f"   {row[-1]}")
+            else:
+                for row in rows:
+                    print(f"   {row[0]}")
+            print()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--analyze", action="store_true", help="PostgreSQL: run EXPLAIN ANALYZE")
+    parser.add_argument("--filter", default="", help="only queries whose name contains this text")
+    args = parser.parse_args()
+
+    asyncio.run(explain_all(args.analyze, args.filter))
@@ -0,0 +1,41 @@
+"""
+Load PRH open-data company dumps into the local company index
+(ytj_companies), which serves name autocomplete without calling PRH.
+
+Accepts .json (a company array, or {"companies": [...]} as the API
+returns), .jsonl/.ndjson, .csv and .zip files of those. Re-running with a
+newer dump writes only the companies that are new or changed. Install
+ijson to stream large JSON files instead of loading them whole.
+
+Usage (from backend/):
+    python import_ytj.py all_companies.zip
+    python import_ytj.py companies.csv more_companies.jsonl --batch-size 5000
+"""
+import argparse
+import asyncio
+import time
+
+from app.database import engine
+from app.services.ytj_index import ytj_index, read_dump
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="+", help="dump files")
+    parser.add_argument("--batch-size", type=int, default=None, help="companies per transaction")
+    args = parser.parse_args()
+
+    await ytj_index.ensure_index(engine)
+    for path in args.paths:
+        started = time.perf_counter()
+        counts = await ytj_index.import_records(read_dump(path), args.batch_size)
+        print(
+            f"{path}: {counts['inserted']} inserted, {counts['updated']} updated, "
+            f"{counts['unchanged']} unchanged, {counts['skipped']} skipped "
+            f"({time.perf_counter() - started:.1f} s)"
+        )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
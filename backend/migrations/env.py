@@ -0,0 +1,81 @@
+"""
+Alembic environment.
+
+Usage (from backend/):
+    alembic upgrade head
+    alembic revision --autogenerate -m "describe change"
+
+Databases created by init_db before migrations existed already contain the
+baseline schema; mark them with `alembic stamp 0001` and upgrade.
+"""
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config import settings
+from app.database import Base
+import app.models  # noqa: F401  (registers all tables on Base.metadata)
+
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+# Search index objects are managed by raw DDL (see app/services/search_service.py
+# and app/services/ytj_index.py)
+UNMANAGED_PREFIXES = ("applications_fts", "ytj_companies_fts")
+UNMANAGED_NAMES = {"search_vector", "ix_applications_search_vector", "ix_ytj_companies_search_vector"}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if name in UNMANAGED_NAMES or (name or "").startswith(UNMANAGED_PREFIXES):
+        return False
+    return True
+
+
+def run_migrations_offline() -> None:
+    """Emit SQL to stdout instead of running against a database"""
+    context.configure(
+        url=settings.DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=settings.DATABASE_URL.startswith("sqlite"),
+        include_object=include_object,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=connection.dialect.name == "sqlite",
+        include_object=include_object,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_migrations_online() -> None:
+    engine = create_async_engine(settings.DATABASE_URL)
+
+    async with engine.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+
+    await engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    asyncio.run(run_migrations_online())
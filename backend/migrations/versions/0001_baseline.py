@@ -0,0 +1,317 @@
+"""baseline schema
+
+Schema as created by Base.metadata.create_all before migrations were
+introduced. Existing databases already match it: `alembic stamp 0001`.
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-16 12:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('financiers',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('email', sa.String(length=255), nullable=False),
+    sa.Column('phone', sa.String(length=50), nullable=True),
+    sa.Column('address', sa.String(length=500), nullable=True),
+    sa.Column('business_id', sa.String(length=50), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_financiers_id'), 'financiers', ['id'], unique=False)
+
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('email', sa.String(length=255), nullable=False),
+    sa.Column('password_hash', sa.String(length=255), nullable=False),
+    sa.Column('role', sa.Enum('CUSTOMER', 'ADMIN', 'FINANCIER', name='userrole'), nullable=False),
+    sa.Column('first_name', sa.String(length=100), nullable=True),
+    sa.Column('last_name', sa.String(length=100), nullable=True),
+    sa.Column('phone', sa.String(length=50), nullable=True),
+    sa.Column('company_name', sa.String(length=255), nullable=True),
+    sa.Column('business_id', sa.String(length=50), nullable=True),
+    sa.Column('financier_id', sa.Integer(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('is_verified', sa.Boolean(), nullable=True),
+    sa.Column('verification_token', sa.String(length=255), nullable=True),
+    sa.Column('verification_token_expires', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('last_login', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['financier_id'], ['financiers.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
+
+    op.create_table('applications',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('reference_number', sa.String(length=50), nullable=True),
+    sa.Column('application_type', sa.Enum('LEASING', 'SALE_LEASEBACK', name='applicationtype'), nullable=False),
+    sa.Column('status', sa.Enum('DRAFT', 'SUBMITTED', 'SUBMITTED_TO_FINANCIER', 'INFO_REQUESTED', 'OFFER_SENT', 'OFFER_ACCEPTED', 'OFFER_REJECTED', 'CONTRACT_SENT', 'SIGNED', 'CLOSED', 'CANCELLED', name='applicationstatus'), nullable=True),
+    sa.Column('customer_id', sa.Integer(), nullable=False),
+    sa.Column('company_name', sa.String(length=255), nullable=False),
+    sa.Column('business_id', sa.String(length=50), nullable=False),
+    sa.Column('contact_person', sa.String(length=200), nullable=True),
+    sa.Column('contact_email', sa.String(length=255), nullable=False),
+    sa.Column('contact_phone', sa.String(length=50), nullable=True),
+    sa.Column('street_address', sa.String(length=255), nullable=True),
+    sa.Column('postal_code', sa.String(length=20), nullable=True),
+    sa.Column('city', sa.String(length=100), nullable=True),
+    sa.Column('equipment_description', sa.Text(), nullable=False),
+    sa.Column('equipment_supplier', sa.String(length=255), nullable=True),
+    sa.Column('equipment_price', sa.Float(), nullable=False),
+    sa.Column('equipment_age_months', sa.Integer(), nullable=True),
+    sa.Column('equipment_serial_number', sa.String(length=255), nullable=True),
+    sa.Column('original_purchase_price', sa.Float(), nullable=True),
+    sa.Column('current_value', sa.Float(), nullable=True),
+    sa.Column('requested_term_months', sa.Integer(), nullable=True),
+    sa.Column('requested_residual_value', sa.Float(), nullable=True),
+    sa.Column('additional_info', sa.Text(), nullable=True),
+    sa.Column('extra_data', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('submitted_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['customer_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_applications_id'), 'applications', ['id'], unique=False)
+    op.create_index(op.f('ix_applications_reference_number'), 'applications', ['reference_number'], unique=True)
+
+    op.create_table('notifications',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('message', sa.Text(), nullable=False),
+    sa.Column('notification_type', sa.String(length=50), nullable=False),
+    sa.Column('reference_type', sa.String(length=50), nullable=True),
+    sa.Column('reference_id', sa.Integer(), nullable=True),
+    sa.Column('action_url', sa.String(length=500), nullable=True),
+    sa.Column('data', sa.JSON(), nullable=True),
+    sa.Column('is_read', sa.Boolean(), nullable=True),
+    sa.Column('is_email_sent', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('read_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_notifications_id'), 'notifications', ['id'], unique=False)
+
+    op.create_table('token_revocations',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('token_version', sa.Integer(), nullable=False),
+    sa.Column('reason', sa.String(length=100), nullable=True),
+    sa.Column('revoked_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    op.create_table('application_assignments',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('application_id', sa.Integer(), nullable=False),
+    sa.Column('financier_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.Enum('PENDING', 'ACCEPTED', 'REJECTED', 'IN_PROGRESS', 'COMPLETED', name='assignmentstatus'), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('assigned_by_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['application_id'], ['applications.id'], ),
+    sa.ForeignKeyConstraint(['assigned_by_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['financier_id'], ['financiers.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_application_assignments_id'), 'application_assignments', ['id'], unique=False)
+
+    op.create_table('files',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('filename', sa.String(length=255), nullable=False),
+    sa.Column('original_filename', sa.String(length=255), nullable=False),
+    sa.Column('file_path', sa.String(length=500), nullable=False),
+    sa.Column('file_type', sa.String(length=100), nullable=True),
+    sa.Column('file_size', sa.Integer(), nullable=True),
+    sa.Column('application_id', sa.Integer(), nullable=True),
+    sa.Column('uploaded_by_id', sa.Integer(), nullable=False),
+    sa.Column('description', sa.String(length=500), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['application_id'], ['applications.id'], ),
+    sa.ForeignKeyConstraint(['uploaded_by_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_files_id'), 'files', ['id'], unique=False)
+
+    op.create_table('info_requests',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('application_id', sa.Integer(), nullable=False),
+    sa.Column('financier_id', sa.Integer(), nullable=False),
+    sa.Column('message', sa.Text(), nullable=False),
+    sa.Column('requested_items', sa.JSON(), nullable=True),
+    sa.Column('status', sa.Enum('PENDING', 'RESPONDED', 'CLOSED', name='inforequeststatus'), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['application_id'], ['applications.id'], ),
+    sa.ForeignKeyConstraint(['financier_id'], ['financiers.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_info_requests_id'), 'info_requests', ['id'], unique=False)
+
+    op.create_table('info_request_responses',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('info_request_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('message', sa.Text(), nullable=False),
+    sa.Column('attachments', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['info_request_id'], ['info_requests.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_info_request_responses_id'), 'info_request_responses', ['id'], unique=False)
+
+    op.create_table('offers',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('application_id', sa.Integer(), nullable=False),
+    sa.Column('financier_id', sa.Integer(), nullable=False),
+    sa.Column('monthly_payment', sa.Float(), nullable=False),
+    sa.Column('term_months', sa.Integer(), nullable=False),
+    sa.Column('upfront_payment', sa.Float(), nullable=True),
+    sa.Column('residual_value', sa.Float(), nullable=True),
+    sa.Column('interest_or_margin', sa.Float(), nullable=True),
+    sa.Column('included_services', sa.Text(), nullable=True),
+    sa.Column('notes_to_customer', sa.Text(), nullable=True),
+    sa.Column('internal_notes', sa.Text(), nullable=True),
+    sa.Column('terms_json', sa.JSON(), nullable=True),
+    sa.Column('status', sa.Enum('DRAFT', 'PENDING_ADMIN', 'SENT', 'ACCEPTED', 'REJECTED', 'EXPIRED', name='offerstatus'), nullable=True),
+    sa.Column('attachment_file_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('sent_at', sa.DateTime(), nullable=True),
+    sa.Column('responded_at', sa.DateTime(), nullable=True),
+    sa.Column('expires_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['application_id'], ['applications.id'], ),
+    sa.ForeignKeyConstraint(['attachment_file_id'], ['files.id'], ),
+    sa.ForeignKeyConstraint(['financier_id'], ['financiers.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_offers_id'), 'offers', ['id'], unique=False)
+
+    op.create_table('contracts',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('contract_number', sa.String(length=50), nullable=True),
+    sa.Column('application_id', sa.Integer(), nullable=False),
+    sa.Column('financier_id', sa.Integer(), nullable=False),
+    sa.Column('offer_id', sa.Integer(), nullable=True),
+    sa.Column('lessee_company_name', sa.String(length=255), nullable=True),
+    sa.Column('lessee_business_id', sa.String(length=20), nullable=True),
+    sa.Column('lessee_street_address', sa.String(length=255), nullable=True),
+    sa.Column('lessee_postal_code', sa.String(length=20), nullable=True),
+    sa.Column('lessee_city', sa.String(length=100), nullable=True),
+    sa.Column('lessee_country', sa.String(length=100), nullable=True),
+    sa.Column('lessee_contact_person', sa.String(length=255), nullable=True),
+    sa.Column('lessee_phone', sa.String(length=50), nullable=True),
+    sa.Column('lessee_email', sa.String(length=255), nullable=True),
+    sa.Column('lessee_tax_country', sa.String(length=100), nullable=True),
+    sa.Column('lessor_company_name', sa.String(length=255), nullable=True),
+    sa.Column('lessor_business_id', sa.String(length=20), nullable=True),
+    sa.Column('lessor_street_address', sa.String(length=255), nullable=True),
+    sa.Column('lessor_postal_code', sa.String(length=20), nullable=True),
+    sa.Column('lessor_city', sa.String(length=100), nullable=True),
+    sa.Column('seller_company_name', sa.String(length=255), nullable=True),
+    sa.Column('seller_business_id', sa.String(length=20), nullable=True),
+    sa.Column('seller_street_address', sa.String(length=255), nullable=True),
+    sa.Column('seller_postal_code', sa.String(length=20), nullable=True),
+    sa.Column('seller_city', sa.String(length=100), nullable=True),
+    sa.Column('seller_contact_person', sa.String(length=255), nullable=True),
+    sa.Column('seller_phone', sa.String(length=50), nullable=True),
+    sa.Column('seller_email', sa.String(length=255), nullable=True),
+    sa.Column('seller_tax_country', sa.String(length=100), nullable=True),
+    sa.Column('lease_objects', sa.JSON(), nullable=True),
+    sa.Column('usage_location', sa.String(length=255), nullable=True),
+    sa.Column('delivery_method', sa.String(length=100), nullable=True),
+    sa.Column('estimated_delivery_date', sa.DateTime(), nullable=True),
+    sa.Column('other_delivery_terms', sa.Text(), nullable=True),
+    sa.Column('advance_payment', sa.Float(), nullable=True),
+    sa.Column('monthly_rent', sa.Float(), nullable=True),
+    sa.Column('rent_installments_count', sa.Integer(), nullable=True),
+    sa.Column('rent_installments_start', sa.Integer(), nullable=True),
+    sa.Column('rent_installments_end', sa.Integer(), nullable=True),
+    sa.Column('residual_value', sa.Float(), nullable=True),
+    sa.Column('processing_fee', sa.Float(), nullable=True),
+    sa.Column('arrangement_fee', sa.Float(), nullable=True),
+    sa.Column('invoicing_method', sa.String(length=50), nullable=True),
+    sa.Column('lease_period_months', sa.Integer(), nullable=True),
+    sa.Column('lease_start_date', sa.DateTime(), nullable=True),
+    sa.Column('insurance_type', sa.String(length=100), nullable=True),
+    sa.Column('insurance_provider', sa.String(length=255), nullable=True),
+    sa.Column('insurance_policy_number', sa.String(length=100), nullable=True),
+    sa.Column('bank_name', sa.String(length=255), nullable=True),
+    sa.Column('bank_iban', sa.String(length=50), nullable=True),
+    sa.Column('bank_bic', sa.String(length=20), nullable=True),
+    sa.Column('guarantees', sa.Text(), nullable=True),
+    sa.Column('guarantee_type', sa.String(length=100), nullable=True),
+    sa.Column('special_conditions', sa.Text(), nullable=True),
+    sa.Column('logo_file_id', sa.Integer(), nullable=True),
+    sa.Column('message_to_customer', sa.Text(), nullable=True),
+    sa.Column('internal_notes', sa.Text(), nullable=True),
+    sa.Column('contract_file_id', sa.Integer(), nullable=True),
+    sa.Column('signed_file_id', sa.Integer(), nullable=True),
+    sa.Column('lessee_signature_date', sa.DateTime(), nullable=True),
+    sa.Column('lessee_signature_place', sa.String(length=100), nullable=True),
+    sa.Column('lessee_signer_name', sa.String(length=255), nullable=True),
+    sa.Column('lessor_signature_date', sa.DateTime(), nullable=True),
+    sa.Column('lessor_signature_place', sa.String(length=100), nullable=True),
+    sa.Column('lessor_signer_name', sa.String(length=255), nullable=True),
+    sa.Column('status', sa.Enum('DRAFT', 'PENDING_ADMIN', 'SENT', 'SIGNED', 'REJECTED', 'EXPIRED', name='contractstatus'), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('sent_at', sa.DateTime(), nullable=True),
+    sa.Column('signed_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['application_id'], ['applications.id'], ),
+    sa.ForeignKeyConstraint(['contract_file_id'], ['files.id'], ),
+    sa.ForeignKeyConstraint(['financier_id'], ['financiers.id'], ),
+    sa.ForeignKeyConstraint(['logo_file_id'], ['files.id'], ),
+    sa.ForeignKeyConstraint(['offer_id'], ['offers.id'], ),
+    sa.ForeignKeyConstraint(['signed_file_id'], ['files.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('contract_number')
+    )
+    op.create_index(op.f('ix_contracts_id'), 'contracts', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_contracts_id'), table_name='contracts')
+    op.drop_table('contracts')
+    op.drop_index(op.f('ix_offers_id'), table_name='offers')
+    op.drop_table('offers')
+    op.drop_index(op.f('ix_info_request_responses_id'), table_name='info_request_responses')
+    op.drop_table('info_request_responses')
+    op.drop_index(op.f('ix_info_requests_id'), table_name='info_requests')
+    op.drop_table('info_requests')
+    op.drop_index(op.f('ix_files_id'), table_name='files')
+    op.drop_table('files')
+    op.drop_index(op.f('ix_application_assignments_id'), table_name='application_assignments')
+    op.drop_table('application_assignments')
+    op.drop_table('token_revocations')
+    op.drop_index(op.f('ix_notifications_id'), table_name='notifications')
+    op.drop_table('notifications')
+    op.drop_index(op.f('ix_applications_reference_number'), table_name='applications')
+    op.drop_index(op.f('ix_applications_id'), table_name='applications')
+    op.drop_table('applications')
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
+    op.drop_index(op.f('ix_financiers_id'), table_name='financiers')
+    op.drop_table('financiers')
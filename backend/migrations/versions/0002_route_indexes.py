@@ -0,0 +1,67 @@
+"""route indexes
+
+Composite indexes for the WHERE / ORDER BY clauses used by app/routes and
+notification_service. See explain_queries.py for the plans they serve.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 12:30:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_application_assignments_application_id_financier_id', 'application_assignments', ['application_id', 'financier_id'], unique=False)
+    op.create_index('ix_application_assignments_financier_id_application_id', 'application_assignments', ['financier_id', 'application_id'], unique=False)
+    op.create_index('ix_applications_created_at', 'applications', ['created_at'], unique=False)
+    op.create_index('ix_applications_customer_id_created_at', 'applications', ['customer_id', 'created_at'], unique=False)
+    op.create_index('ix_applications_status_created_at', 'applications', ['status', 'created_at'], unique=False)
+    op.create_index('ix_contracts_application_id_created_at', 'contracts', ['application_id', 'created_at'], unique=False)
+    op.create_index('ix_contracts_application_id_status', 'contracts', ['application_id', 'status'], unique=False)
+    op.create_index('ix_contracts_created_at', 'contracts', ['created_at'], unique=False)
+    op.create_index('ix_files_application_id_created_at', 'files', ['application_id', 'created_at'], unique=False)
+    op.create_index('ix_financiers_is_active_name', 'financiers', ['is_active', 'name'], unique=False)
+    op.create_index('ix_info_request_responses_info_request_id', 'info_request_responses', ['info_request_id'], unique=False)
+    op.create_index('ix_info_requests_application_id_created_at', 'info_requests', ['application_id', 'created_at'], unique=False)
+    op.create_index('ix_notifications_user_id_created_at', 'notifications', ['user_id', 'created_at'], unique=False)
+    op.create_index('ix_notifications_user_id_is_read_created_at', 'notifications', ['user_id', 'is_read', 'created_at'], unique=False)
+    op.create_index('ix_offers_application_id_created_at', 'offers', ['application_id', 'created_at'], unique=False)
+    op.create_index('ix_offers_application_id_status', 'offers', ['application_id', 'status'], unique=False)
+    op.create_index('ix_offers_created_at', 'offers', ['created_at'], unique=False)
+    op.create_index('ix_users_financier_id_is_active', 'users', ['financier_id', 'is_active'], unique=False)
+    op.create_index('ix_users_role_created_at', 'users', ['role', 'created_at'], unique=False)
+    op.create_index('ix_users_role_is_active', 'users', ['role', 'is_active'], unique=False)
+    op.create_index('ix_users_verification_token', 'users', ['verification_token'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_verification_token', table_name='users')
+    op.drop_index('ix_users_role_is_active', table_name='users')
+    op.drop_index('ix_users_role_created_at', table_name='users')
+    op.drop_index('ix_users_financier_id_is_active', table_name='users')
+    op.drop_index('ix_offers_created_at', table_name='offers')
+    op.drop_index('ix_offers_application_id_status', table_name='offers')
+    op.drop_index('ix_offers_application_id_created_at', table_name='offers')
+    op.drop_index('ix_notifications_user_id_is_read_created_at', table_name='notifications')
+    op.drop_index('ix_notifications_user_id_created_at', table_name='notifications')
+    op.drop_index('ix_info_requests_application_id_created_at', table_name='info_requests')
+    op.drop_index('ix_info_request_responses_info_request_id', table_name='info_request_responses')
+    op.drop_index('ix_financiers_is_active_name', table_name='financiers')
+    op.drop_index('ix_files_application_id_created_at', table_name='files')
+    op.drop_index('ix_contracts_created_at', table_name='contracts')
+    op.drop_index('ix_contracts_application_id_status', table_name='contracts')
+    op.drop_index('ix_contracts_application_id_created_at', table_name='contracts')
+    op.drop_index('ix_applications_status_created_at', table_name='applications')
+    op.drop_index('ix_applications_customer_id_created_at', table_name='applications')
+    op.drop_index('ix_applications_created_at', table_name='applications')
+    op.drop_index('ix_application_assignments_financier_id_application_id', table_name='application_assignments')
+    op.drop_index('ix_application_assignments_application_id_financier_id', table_name='application_assignments')
@@ -0,0 +1,32 @@
+"""application keyset indexes
+
+(sort column, id) indexes for keyset pagination of GET /api/applications/.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16 13:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_applications_created_at', table_name='applications')
+    op.create_index('ix_applications_created_at_id', 'applications', ['created_at', 'id'], unique=False)
+    op.create_index('ix_applications_equipment_price_id', 'applications', ['equipment_price', 'id'], unique=False)
+    op.create_index('ix_applications_status_id', 'applications', ['status', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_applications_status_id', table_name='applications')
+    op.drop_index('ix_applications_equipment_price_id', table_name='applications')
+    op.drop_index('ix_applications_created_at_id', table_name='applications')
+    op.create_index('ix_applications_created_at', 'applications', ['created_at'], unique=False)
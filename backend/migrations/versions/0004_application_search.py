@@ -0,0 +1,83 @@
+"""application full-text search
+
+SQLite: external-content FTS5 table applications_fts kept in sync by
+triggers. PostgreSQL: generated tsvector column with a GIN index.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16 13:30:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COLUMNS = "company_name, business_id, reference_number, equipment_description, additional_info"
+NEW_VALUES = "new.company_name, new.business_id, new.reference_number, new.equipment_description, new.additional_info"
+OLD_VALUES = "old.company_name, old.business_id, old.reference_number, old.equipment_description, old.additional_info"
+
+
+def pg_vector(column: str, weight: str) -> str:
+    return f"setweight(to_tsvector('simple', replace(coalesce({column}, ''), '-', ' ')), '{weight}')"
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'sqlite':
+        op.execute(f"""
+            CREATE VIRTUAL TABLE applications_fts USING fts5(
+                {COLUMNS},
+                content='applications', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+            )
+        """)
+        op.execute(f"""
+            CREATE TRIGGER applications_fts_ai AFTER INSERT ON applications BEGIN
+                INSERT INTO applications_fts(rowid, {COLUMNS}) VALUES (new.id, {NEW_VALUES});
+            END
+        """)
+        op.execute(f"""
+            CREATE TRIGGER applications_fts_ad AFTER DELETE ON applications BEGIN
+                INSERT INTO applications_fts(applications_fts, rowid, {COLUMNS}) VALUES ('delete', old.id, {OLD_VALUES});
+            END
+        """)
+        op.execute(f"""
+            CREATE TRIGGER applications_fts_au AFTER UPDATE OF {COLUMNS} ON applications BEGIN
+                INSERT INTO applications_fts(applications_fts, rowid, {COLUMNS}) VALUES ('delete', old.id, {OLD_VALUES});
+                INSERT INTO applications_fts(rowid, {COLUMNS}) VALUES (new.id, {NEW_VALUES});
+            END
+        """)
+        op.execute("INSERT INTO applications_fts(applications_fts) VALUES ('rebuild')")
+
+    elif dialect == 'postgresql':
+        vector = " || ".join([
+            pg_vector('company_name', 'A'),
+            pg_vector('business_id', 'A'),
+            pg_vector('reference_number', 'A'),
+            pg_vector('equipment_description', 'B'),
+            pg_vector('additional_info', 'C'),
+        ])
+        op.execute(f"ALTER TABLE applications ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({vector}) STORED")
+        op.execute("CREATE INDEX ix_applications_search_vector ON applications USING gin (search_vector)")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS applications_fts_au")
+        op.execute("DROP TRIGGER IF EXISTS applications_fts_ad")
+        op.execute("DROP TRIGGER IF EXISTS applications_fts_ai")
+        op.execute("DROP TABLE IF EXISTS applications_fts")
+
+    elif dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_applications_search_vector")
+        op.execute("ALTER TABLE applications DROP COLUMN IF EXISTS search_vector")
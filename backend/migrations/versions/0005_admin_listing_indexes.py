@@ -0,0 +1,35 @@
+"""admin listing indexes
+
+Keyset indexes for the admin offer and contract listings, with and
+without the status / financier filters.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16 14:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for table in ('offers', 'contracts'):
+        op.drop_index(f'ix_{table}_created_at', table_name=table)
+        op.create_index(f'ix_{table}_created_at_id', table, ['created_at', 'id'], unique=False)
+        op.create_index(f'ix_{table}_status_created_at_id', table, ['status', 'created_at', 'id'], unique=False)
+        op.create_index(f'ix_{table}_financier_id_created_at_id', table, ['financier_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    for table in ('offers', 'contracts'):
+        op.drop_index(f'ix_{table}_financier_id_created_at_id', table_name=table)
+        op.drop_index(f'ix_{table}_status_created_at_id', table_name=table)
+        op.drop_index(f'ix_{table}_created_at_id', table_name=table)
+        op.create_index(f'ix_{table}_created_at', table, ['created_at'], unique=False)
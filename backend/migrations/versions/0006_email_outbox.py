@@ -0,0 +1,48 @@
+"""email outbox
+
+Table for emails queued in the same transaction as the business change and
+delivered by the background email workers.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-16 15:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'email_outbox',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('to_email', sa.String(length=255), nullable=False),
+        sa.Column('cc', sa.JSON(), nullable=True),
+        sa.Column('subject', sa.String(length=500), nullable=False),
+        sa.Column('html_content', sa.Text(), nullable=False),
+        sa.Column('text_content', sa.Text(), nullable=True),
+        sa.Column('status', sa.Enum('PENDING', 'SENDING', 'SENT', 'DEAD', name='emailoutboxstatus'), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('next_attempt_at', sa.DateTime(), nullable=False),
+        sa.Column('locked_at', sa.DateTime(), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('sent_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_email_outbox_id', 'email_outbox', ['id'], unique=False)
+    op.create_index('ix_email_outbox_status_next_attempt_at', 'email_outbox', ['status', 'next_attempt_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_email_outbox_status_next_attempt_at', table_name='email_outbox')
+    op.drop_index('ix_email_outbox_id', table_name='email_outbox')
+    op.drop_table('email_outbox')
+    sa.Enum(name='emailoutboxstatus').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,85 @@
+"""newsletters
+
+Newsletter campaigns, their per-recipient delivery status, and the users'
+newsletter opt-out flag.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-16 16:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'users',
+        sa.Column('newsletter_opt_out', sa.Boolean(), server_default=sa.false(), nullable=False),
+    )
+
+    op.create_table(
+        'newsletter_campaigns',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('subject', sa.String(length=500), nullable=False),
+        sa.Column('headline', sa.String(length=500), nullable=False),
+        sa.Column('subheadline', sa.String(length=500), nullable=True),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('cta_text', sa.String(length=255), nullable=True),
+        sa.Column('cta_url', sa.String(length=1000), nullable=True),
+        sa.Column('features', sa.JSON(), nullable=True),
+        sa.Column('segment', sa.Enum('ALL', 'CUSTOMER', 'FINANCIER', name='newslettersegment'), nullable=False),
+        sa.Column('status', sa.Enum('DRAFT', 'SENDING', 'PAUSED', 'COMPLETED', name='newslettercampaignstatus'), nullable=False),
+        sa.Column('total_recipients', sa.Integer(), nullable=False),
+        sa.Column('sent_count', sa.Integer(), nullable=False),
+        sa.Column('failed_count', sa.Integer(), nullable=False),
+        sa.Column('locked_at', sa.DateTime(), nullable=True),
+        sa.Column('created_by_id', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['created_by_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_newsletter_campaigns_id', 'newsletter_campaigns', ['id'], unique=False)
+
+    op.create_table(
+        'newsletter_recipients',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('campaign_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('email', sa.String(length=255), nullable=False),
+        sa.Column('status', sa.Enum('PENDING', 'SENT', 'FAILED', name='newsletterrecipientstatus'), nullable=False),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('sent_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['campaign_id'], ['newsletter_campaigns.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('campaign_id', 'user_id', name='uq_newsletter_recipients_campaign_id_user_id'),
+    )
+    op.create_index('ix_newsletter_recipients_id', 'newsletter_recipients', ['id'], unique=False)
+    op.create_index(
+        'ix_newsletter_recipients_campaign_id_status_id', 'newsletter_recipients',
+        ['campaign_id', 'status', 'id'], unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_newsletter_recipients_campaign_id_status_id', table_name='newsletter_recipients')
+    op.drop_index('ix_newsletter_recipients_id', table_name='newsletter_recipients')
+    op.drop_table('newsletter_recipients')
+    op.drop_index('ix_newsletter_campaigns_id', table_name='newsletter_campaigns')
+    op.drop_table('newsletter_campaigns')
+    sa.Enum(name='newsletterrecipientstatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='newslettercampaignstatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='newslettersegment').drop(op.get_bind(), checkfirst=True)
+
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('newsletter_opt_out')
@@ -0,0 +1,39 @@
+"""notification counters
+
+Per-user unread notification counter, filled from the current
+notifications.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-16 17:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0008'
+down_revision: Union[str, None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'notification_counters',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('unread', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id'),
+    )
+    op.execute(
+        "INSERT INTO notification_counters (user_id, unread, updated_at) "
+        "SELECT user_id, COUNT(*), CURRENT_TIMESTAMP FROM notifications "
+        "WHERE is_read = false GROUP BY user_id"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('notification_counters')
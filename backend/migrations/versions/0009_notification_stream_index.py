@@ -0,0 +1,27 @@
+"""notification stream index
+
+Index for the notification stream, which reads a user's notifications
+after the last id it sent.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-16 20:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0009'
+down_revision: Union[str, None] = '0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_notifications_user_id_id', 'notifications', ['user_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_user_id_id', table_name='notifications')
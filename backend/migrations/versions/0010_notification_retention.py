@@ -0,0 +1,67 @@
+"""notification retention
+
+Archive table for read notifications past the retention period, and
+keyset indexes (with id as tie-breaker) for paging a user's
+notifications.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-16 21:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0010'
+down_revision: Union[str, None] = '0009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_notifications_user_id_created_at', table_name='notifications')
+    op.drop_index('ix_notifications_user_id_is_read_created_at', table_name='notifications')
+    op.create_index('ix_notifications_user_id_created_at_id', 'notifications', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index(
+        'ix_notifications_user_id_is_read_created_at_id', 'notifications',
+        ['user_id', 'is_read', 'created_at', 'id'], unique=False
+    )
+
+    op.create_table(
+        'notifications_archive',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('message', sa.Text(), nullable=False),
+        sa.Column('notification_type', sa.String(length=50), nullable=False),
+        sa.Column('reference_type', sa.String(length=50), nullable=True),
+        sa.Column('reference_id', sa.Integer(), nullable=True),
+        sa.Column('action_url', sa.String(length=500), nullable=True),
+        sa.Column('data', sa.JSON(), nullable=True),
+        sa.Column('is_read', sa.Boolean(), nullable=True),
+        sa.Column('is_email_sent', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('read_at', sa.DateTime(), nullable=True),
+        sa.Column('archived_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_notifications_archive_user_id_created_at', 'notifications_archive',
+        ['user_id', 'created_at'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_archive_user_id_created_at', table_name='notifications_archive')
+    op.drop_table('notifications_archive')
+
+    op.drop_index('ix_notifications_user_id_is_read_created_at_id', table_name='notifications')
+    op.drop_index('ix_notifications_user_id_created_at_id', table_name='notifications')
+    op.create_index(
+        'ix_notifications_user_id_is_read_created_at', 'notifications',
+        ['user_id', 'is_read', 'created_at'], unique=False
+    )
+    op.create_index('ix_notifications_user_id_created_at', 'notifications', ['user_id', 'created_at'], unique=False)
@@ -0,0 +1,32 @@
+"""notification digests
+
+Index for finding users with notifications not yet emailed. Existing
+notifications are marked as emailed so the first digest run does not
+send the whole history.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-16 22:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0011'
+down_revision: Union[str, None] = '0010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("UPDATE notifications SET is_email_sent = true WHERE is_email_sent = false OR is_email_sent IS NULL")
+    op.create_index(
+        'ix_notifications_is_email_sent_user_id_created_at', 'notifications',
+        ['is_email_sent', 'user_id', 'created_at'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_is_email_sent_user_id_created_at', table_name='notifications')
@@ -0,0 +1,34 @@
+"""ytj cache
+
+Persistent cache of PRH/YTJ company lookups and name searches.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-16 23:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0012'
+down_revision: Union[str, None] = '0011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'ytj_cache',
+        sa.Column('key', sa.String(length=255), nullable=False),
+        sa.Column('data', sa.JSON(), nullable=True),
+        sa.Column('fetched_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('key'),
+    )
+    op.create_index('ix_ytj_cache_fetched_at', 'ytj_cache', ['fetched_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ytj_cache_fetched_at', table_name='ytj_cache')
+    op.drop_table('ytj_cache')
@@ -0,0 +1,92 @@
+"""ytj companies
+
+Local company index for name autocomplete, filled from PRH open-data
+dumps. SQLite: external-content FTS5 table ytj_companies_fts kept in sync
+by triggers. PostgreSQL: generated tsvector column with a GIN index.
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-17 09:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0013'
+down_revision: Union[str, None] = '0012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'ytj_companies',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('business_id', sa.String(length=9), nullable=False),
+        sa.Column('name', sa.String(length=500), nullable=False),
+        sa.Column(
+            'name_normalized',
+            sa.String(length=500).with_variant(sa.String(length=500, collation='C'), 'postgresql'),
+            nullable=False
+        ),
+        sa.Column('company_form', sa.String(length=255), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=False),
+        sa.Column('is_liquidated', sa.Boolean(), nullable=False),
+        sa.Column('content_hash', sa.String(length=40), nullable=False),
+        sa.Column('imported_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('business_id'),
+    )
+    op.create_index('ix_ytj_companies_name_normalized', 'ytj_companies', ['name_normalized'], unique=False)
+
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'sqlite':
+        op.execute("""
+            CREATE VIRTUAL TABLE ytj_companies_fts USING fts5(
+                name,
+                content='ytj_companies', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+            )
+        """)
+        op.execute("""
+            CREATE TRIGGER ytj_companies_fts_ai AFTER INSERT ON ytj_companies BEGIN
+                INSERT INTO ytj_companies_fts(rowid, name) VALUES (new.id, new.name);
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER ytj_companies_fts_ad AFTER DELETE ON ytj_companies BEGIN
+                INSERT INTO ytj_companies_fts(ytj_companies_fts, rowid, name) VALUES ('delete', old.id, old.name);
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER ytj_companies_fts_au AFTER UPDATE OF name ON ytj_companies BEGIN
+                INSERT INTO ytj_companies_fts(ytj_companies_fts, rowid, name) VALUES ('delete', old.id, old.name);
+                INSERT INTO ytj_companies_fts(rowid, name) VALUES (new.id, new.name);
+            END
+        """)
+
+    elif dialect == 'postgresql':
+        op.execute(
+            "ALTER TABLE ytj_companies ADD COLUMN search_vector tsvector "
+            "GENERATED ALWAYS AS (to_tsvector('simple', name)) STORED"
+        )
+        op.execute("CREATE INDEX ix_ytj_companies_search_vector ON ytj_companies USING gin (search_vector)")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS ytj_companies_fts_au")
+        op.execute("DROP TRIGGER IF EXISTS ytj_companies_fts_ad")
+        op.execute("DROP TRIGGER IF EXISTS ytj_companies_fts_ai")
+        op.execute("DROP TABLE IF EXISTS ytj_companies_fts")
+
+    elif dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_ytj_companies_search_vector")
+
+    op.drop_index('ix_ytj_companies_name_normalized', table_name='ytj_companies')
+    op.drop_table('ytj_companies')
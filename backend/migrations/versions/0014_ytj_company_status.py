@@ -0,0 +1,37 @@
+"""ytj company status
+
+Last known PRH status of the companies behind open applications and
+signed contracts, for the periodic status refresh.
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-17 11:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0014'
+down_revision: Union[str, None] = '0013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'ytj_company_status',
+        sa.Column('business_id', sa.String(length=50), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('is_liquidated', sa.Boolean(), nullable=True),
+        sa.Column('checked_at', sa.DateTime(), nullable=False),
+        sa.Column('changed_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('business_id'),
+    )
+    op.create_index('ix_ytj_company_status_checked_at', 'ytj_company_status', ['checked_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ytj_company_status_checked_at', table_name='ytj_company_status')
+    op.drop_table('ytj_company_status')
@@ -0,0 +1,30 @@
+"""email outbox clear bodies
+
+Clear the bodies of emails already SENT or DEAD; the worker now does
+this when an email reaches either state.
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-17 14:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = '0015'
+down_revision: Union[str, None] = '0014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "UPDATE email_outbox SET html_content = '', text_content = NULL "
+        "WHERE status IN ('SENT', 'DEAD')"
+    )
+
+
+def downgrade() -> None:
+    # The bodies are gone for good
+    pass
@@ -0,0 +1,33 @@
+"""job leases
+
+Lease rows for periodic background jobs that must run in one app process
+at a time (the company status refresh).
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-17 15:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0016'
+down_revision: Union[str, None] = '0015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'job_leases',
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('holder', sa.String(length=64), nullable=False),
+        sa.Column('locked_until', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('name'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('job_leases')
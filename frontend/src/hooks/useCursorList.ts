@@ -0,0 +1,70 @@
+import { useCallback, useEffect, useRef, useState } from 'react';
+import type { Page } from '../lib/api';
+
+// A paginated list loaded one page at a time: the first page when deps
+// change, the next one on loadMore(). Responses of requests started before
+// the latest reload are dropped.
+export function useCursorList<T>(
+  fetchPage: (cursor?: string) => Promise<Page<T>>,
+  deps: unknown[],
+  onError?: () => void
+) {
+  const [items, setItems] = useState<T[]>([]);
+  const [total, setTotal] = useState<number | null>(null);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [isLoading, setIsLoading] = useState(true);
+  const [hasLoaded, setHasLoaded] = useState(false);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
+  const generation = useRef(0);
+
+  // eslint-disable-next-line react-hooks/exhaustive-deps
+  const reload = useCallback(async () => {
+    const current = ++generation.current;
+    setIsLoading(true);
+    try {
+      const page = await fetchPage();
+      if (current !== generation.current) return;
+      setItems(page.items);
+      setTotal(page.total);
+      setNextCursor(page.nextCursor);
+    } catch (error) {
+      if (current === generation.current) onError?.();
+    } finally {
+      if (current === generation.current) {
+        setIsLoading(false);
+        setHasLoaded(true);
+      }
+    }
+  }, deps);
+
+  useEffect(() => {
+    reload();
+  }, [reload]);
+
+  const loadMore = async () => {
+    if (!nextCursor || isLoadingMore) return;
+    const current = generation.current;
+    setIsLoadingMore(true);
+    try {
+      const page = await fetchPage(nextCursor);
+      if (current !== generation.current) return;
+      setItems((previous) => [...previous, ...page.items]);
+      setNextCursor(page.nextCursor);
+    } catch (error) {
+      onError?.();
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
+
+  return {
+    items,
+    total,
+    hasMore: nextCursor !== null,
+    isLoading,
+    hasLoaded,
+    isLoadingMore,
+    loadMore,
+    reload,
+  };
+}
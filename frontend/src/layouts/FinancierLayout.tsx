@@ -38,8 +38,24 @@ export default function FinancierLayout() {
       }
     };
     fetchNotifications();
-    const interval = setInterval(fetchNotifications, 30000);
-    return () => clearInterval(interval);
+    // New notifications are pushed; poll only if the stream cannot be kept open
+    let interval: ReturnType<typeof setInterval> | undefined;
+    const source = notificationsApi.stream({
+      onUnread: setUnreadCount,
+      onNotification: (notification) => {
+        setNotificationsList(prev =>
+          [notification, ...prev.filter(n => n.id !== notification.id)].slice(0, 10)
+        );
+        if (!notification.is_read) setUnreadCount(prev => prev + 1);
+      },
+      onClosed: () => {
+        if (!interval) interval = setInterval(fetchNotifications, 30000);
+      },
+    });
+    return () => {
+      source.close();
+      clearInterval(interval);
+    };
   }, []);
 
   const handleMarkAsRead = async (id: number) => {
@@ -1,6 +1,6 @@
 import axios from 'axios';
 import type {
-  User, Financier, Application, Offer, InfoRequest,
+  User, Financier, Application, ApplicationStats, Offer, InfoRequest,
   Notification, AuthResponse, LeasingFormData, SaleLeasebackFormData
 } from '../types';
 import type { Contract, ContractCreateData } from '../types/contract';
@@ -39,6 +39,36 @@ api.interceptors.response.use(
   }
 );
 
+// Paginated lists return one page per call: X-Next-Cursor is the cursor of
+// the next page (absent on the last one) and X-Total-Count, sent with the
+// first page, the number of matching rows
+export interface Page<T> {
+  items: T[];
+  nextCursor: string | null;
+  total: number | null;
+}
+
+export interface PageParams {
+  cursor?: string;
+  limit?: number;
+}
+
+export async function getPage<T>(url: string, params?: object): Promise<Page<T>> {
+  const response = await api.get<T[]>(url, { params });
+  const total = response.headers['x-total-count'];
+  return {
+    items: response.data,
+    nextCursor: response.headers['x-next-cursor'] || null,
+    total: total !== undefined ? Number(total) : null,
+  };
+}
+
+// Number of matching rows, from the X-Total-Count of a one-row page
+export async function getCount(url: string, params?: object) {
+  const page = await getPage(url, { ...params, limit: 1 });
+  return page.total ?? 0;
+}
+
 // Auth - routes defined as /login, /register, /me, etc. (no trailing slash)
 export const auth = {
   login: (email: string, password: string) =>
@@ -104,8 +134,31 @@ export const financiers = {
 
 // Applications
 export const applications = {
-  list: (params?: { status_filter?: string; type_filter?: string }) =>
-    api.get<Application[]>('/applications/', { params }),
+  list: (params?: PageParams & { status_filter?: string; type_filter?: string }) =>
+    getPage<Application>('/applications/', params),
+  
+  stats: () => api.get<ApplicationStats>('/applications/stats'),
+  
+  search: (q: string, limit = 100) =>
+    api.get<Application[]>('/applications/search', { params: { q, limit } }),
+  
+  // One page of the list, or with a search term the best search matches
+  // (a single page) narrowed to the filters
+  find: async (
+    filters: { q?: string; status_filter?: string; type_filter?: string },
+    cursor?: string
+  ): Promise<Page<Application>> => {
+    const status_filter = filters.status_filter || undefined;
+    const type_filter = filters.type_filter || undefined;
+    if (!filters.q) {
+      return getPage<Application>('/applications/', { status_filter, type_filter, cursor });
+    }
+    const response = await applications.search(filters.q);
+    const items = response.data.filter(app =>
+      (!status_filter || app.status === status_filter) && (!type_filter || app.application_type === type_filter)
+    );
+    return { items, nextCursor: null, total: items.length };
+  },
   
   get: (id: number) => api.get<Application>(`/applications/${id}`),
   
@@ -168,6 +221,11 @@ export const offers = {
     api.get<Offer[]>(`/offers/application/${applicationId}`),
   
   get: (id: number) => api.get<Offer>(`/offers/${id}`),
+  
+  listAdmin: <T = any>(params?: PageParams & { status_filter?: string; financier_id?: number }) =>
+    getPage<T>('/offers/admin/all', params),
+  
+  countAdmin: (status_filter?: string) => getCount('/offers/admin/all', { status_filter }),
 };
 
 // Contracts
@@ -214,7 +272,10 @@ export const contracts = {
   
   get: (id: number) => api.get<Contract>(`/contracts/${id}`),
   
-  getAllAdmin: () => api.get('/contracts/admin/all'),
+  listAdmin: <T = any>(params?: PageParams & { status_filter?: string; financier_id?: number }) =>
+    getPage<T>('/contracts/admin/all', params),
+  
+  countAdmin: (status_filter?: string) => getCount('/contracts/admin/all', { status_filter }),
 };
 
 // Notifications
@@ -227,7 +288,69 @@ export const notifications = {
   
   markAsRead: (id: number) => api.put(`/notifications/${id}/read`),
   
+  markManyAsRead: (ids: number[]) => api.put('/notifications/read', { ids }),
+  
   markAllAsRead: () => api.put('/notifications/read-all'),
+  
+  // Server-Sent Events: the unread count on (re)connect, then each new
+  // notification. EventSource reconnects by itself and resumes from the
+  // last notification it got; the unread count it gets then leaves out the
+  // replayed notifications. The stream URL carries a short-lived ticket,
+  // not the access token: once the ticket has expired a reconnect is
+  // refused, and the stream is reopened with a new ticket. onClosed is
+  // called if that keeps failing.
+  stream: (handlers: {
+    onUnread: (count: number) => void;
+    onNotification: (notification: Notification) => void;
+    onClosed: () => void;
+  }) => {
+    let source: EventSource | null = null;
+    let lastEventId = '';
+    let failures = 0;
+    let closed = false;
+    
+    const open = async () => {
+      let ticket: string;
+      try {
+        ticket = (await api.post<{ ticket: string }>('/notifications/stream-ticket')).data.ticket;
+      } catch (error) {
+        if (!closed) handlers.onClosed();
+        return;
+      }
+      if (closed) return;
+      const params = new URLSearchParams({ ticket });
+      if (lastEventId) params.set('last_event_id', lastEventId);
+      const current = new EventSource(`${API_URL}/notifications/stream?${params}`);
+      source = current;
+      current.onopen = () => {
+        failures = 0;
+      };
+      current.addEventListener('unread', (event) =>
+        handlers.onUnread(Number((event as MessageEvent).data)));
+      current.addEventListener('notification', (event) => {
+        lastEventId = (event as MessageEvent).lastEventId || lastEventId;
+        handlers.onNotification(JSON.parse((event as MessageEvent).data));
+      });
+      current.onerror = () => {
+        if (closed || current.readyState !== EventSource.CLOSED) return;
+        if (++failures > 3) handlers.onClosed();
+        else open();
+      };
+    };
+    
+    open();
+    return {
+      close: () => {
+        closed = true;
+        source?.close();
+      },
+    };
+  },
+};
+
+// Newsletters
+export const newsletters = {
+  unsubscribe: (token: string) => api.post('/newsletters/unsubscribe', { token }),
 };
 
 // Files
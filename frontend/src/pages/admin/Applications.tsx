@@ -19,67 +19,49 @@ import {
   getApplicationTypeLabel
 } from '../../lib/utils';
 import LoadingSpinner from '../../components/LoadingSpinner';
-import type { Application, ApplicationStatus, ApplicationType } from '../../types';
+import { useCursorList } from '../../hooks/useCursorList';
+import { useDebouncedValue } from '../../hooks/useDebouncedValue';
+import type { Application, ApplicationStats, ApplicationStatus, ApplicationType } from '../../types';
 
 export default function AdminApplications() {
   const [searchParams, setSearchParams] = useSearchParams();
-  const [appList, setAppList] = useState<Application[]>([]);
-  const [filteredApps, setFilteredApps] = useState<Application[]>([]);
-  const [isLoading, setIsLoading] = useState(true);
+  const [stats, setStats] = useState<ApplicationStats | null>(null);
   const [searchTerm, setSearchTerm] = useState('');
   const [statusFilter, setStatusFilter] = useState<ApplicationStatus | ''>(
     searchParams.get('status') as ApplicationStatus || ''
   );
   const [typeFilter, setTypeFilter] = useState<ApplicationType | ''>('');
+  const debouncedSearch = useDebouncedValue(searchTerm.trim());
 
-  useEffect(() => {
-    const fetchApps = async () => {
-      try {
-        const response = await applications.list();
-        setAppList(response.data);
-        setFilteredApps(response.data);
-      } catch (error) {
-        console.error('Failed to fetch applications');
-      } finally {
-        setIsLoading(false);
-      }
-    };
-    fetchApps();
-  }, []);
+  const {
+    items: appList, total, hasMore, hasLoaded, isLoadingMore, loadMore
+  } = useCursorList<Application>(
+    (cursor) => applications.find(
+      { q: debouncedSearch, status_filter: statusFilter, type_filter: typeFilter }, cursor
+    ),
+    [debouncedSearch, statusFilter, typeFilter],
+    () => console.error('Failed to fetch applications')
+  );
+  const hasFilters = Boolean(debouncedSearch || statusFilter || typeFilter);
 
   useEffect(() => {
-    let filtered = appList;
-
-    if (searchTerm) {
-      filtered = filtered.filter(app =>
-        app.reference_number.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        app.company_name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        app.business_id.includes(searchTerm) ||
-        app.equipment_description.toLowerCase().includes(searchTerm.toLowerCase())
-      );
-    }
-
-    if (statusFilter) {
-      filtered = filtered.filter(app => app.status === statusFilter);
-    }
-
-    if (typeFilter) {
-      filtered = filtered.filter(app => app.application_type === typeFilter);
-    }
-
-    setFilteredApps(filtered);
-  }, [searchTerm, statusFilter, typeFilter, appList]);
+    applications.stats()
+      .then((response) => setStats(response.data))
+      .catch(() => console.error('Failed to fetch application stats'));
+  }, []);
 
   // Statistics
-  const stats = {
-    total: appList.length,
-    submitted: appList.filter(a => a.status === 'SUBMITTED').length,
-    inProgress: appList.filter(a => ['SUBMITTED_TO_FINANCIER', 'INFO_REQUESTED'].includes(a.status)).length,
-    offersSent: appList.filter(a => ['OFFER_SENT', 'OFFER_ACCEPTED'].includes(a.status)).length,
-    contracts: appList.filter(a => ['CONTRACT_SENT', 'SIGNED'].includes(a.status)).length,
+  const count = (...statuses: ApplicationStatus[]) =>
+    statuses.reduce((sum, status) => sum + (stats?.by_status[status] ?? 0), 0);
+  const statCards = {
+    total: stats?.total ?? 0,
+    submitted: count('SUBMITTED'),
+    inProgress: count('SUBMITTED_TO_FINANCIER', 'INFO_REQUESTED'),
+    offersSent: count('OFFER_SENT', 'OFFER_ACCEPTED'),
+    contracts: count('CONTRACT_SENT', 'SIGNED'),
   };
 
-  if (isLoading) {
+  if (!hasLoaded) {
     return (
       <div className="flex items-center justify-center h-64">
         <LoadingSpinner size="lg" />
@@ -103,11 +85,11 @@ export default function AdminApplications() {
       {/* Quick stats */}
       <div className="grid grid-cols-2 md:grid-cols-5 gap-4">
         {[
-          { label: 'Yhteensä', value: stats.total, onClick: () => setStatusFilter('') },
-          { label: 'Uudet', value: stats.submitted, onClick: () => setStatusFilter('SUBMITTED') },
-          { label: 'Käsittelyssä', value: stats.inProgress, onClick: () => setStatusFilter('SUBMITTED_TO_FINANCIER') },
-          { label: 'Tarjottu', value: stats.offersSent, onClick: () => setStatusFilter('OFFER_SENT') },
-          { label: 'Sopimukset', value: stats.contracts, onClick: () => setStatusFilter('CONTRACT_SENT') },
+          { label: 'Yhteensä', value: statCards.total, onClick: () => setStatusFilter('') },
+          { label: 'Uudet', value: statCards.submitted, onClick: () => setStatusFilter('SUBMITTED') },
+          { label: 'Käsittelyssä', value: statCards.inProgress, onClick: () => setStatusFilter('SUBMITTED_TO_FINANCIER') },
+          { label: 'Tarjottu', value: statCards.offersSent, onClick: () => setStatusFilter('OFFER_SENT') },
+          { label: 'Sopimukset', value: statCards.contracts, onClick: () => setStatusFilter('CONTRACT_SENT') },
         ].map((stat) => (
           <button
             key={stat.label}
@@ -174,14 +156,14 @@ export default function AdminApplications() {
       </div>
 
       {/* Applications table */}
-      {filteredApps.length === 0 ? (
+      {appList.length === 0 ? (
         <div className="card text-center py-12">
           <FileText className="w-16 h-16 text-slate-300 mx-auto mb-4" />
           <h3 className="text-lg font-medium text-midnight-900 mb-2">
-            {appList.length === 0 ? 'Ei hakemuksia' : 'Ei hakemuksia valituilla suodattimilla'}
+            {!hasFilters ? 'Ei hakemuksia' : 'Ei hakemuksia valituilla suodattimilla'}
           </h3>
           <p className="text-slate-500">
-            {appList.length === 0
+            {!hasFilters
               ? 'Hakemukset näkyvät täällä kun asiakkaat lähettävät niitä'
               : 'Kokeile muuttaa hakuehtoja'}
           </p>
@@ -203,12 +185,12 @@ export default function AdminApplications() {
                 </tr>
               </thead>
               <tbody>
-                {filteredApps.map((app, index) => (
+                {appList.map((app, index) => (
                   <motion.tr
                     key={app.id}
                     initial={{ opacity: 0, y: 10 }}
                     animate={{ opacity: 1, y: 0 }}
-                    transition={{ delay: index * 0.02 }}
+                    transition={{ delay: (index % 50) * 0.02 }}
                     className="border-t border-slate-100 hover:bg-slate-50"
                   >
                     <td className="py-4 px-6">
@@ -258,8 +240,16 @@ export default function AdminApplications() {
         </div>
       )}
 
+      {hasMore && (
+        <div className="text-center">
+          <button onClick={loadMore} disabled={isLoadingMore} className="btn-secondary">
+            {isLoadingMore ? 'Ladataan...' : 'Lataa lisää'}
+          </button>
+        </div>
+      )}
+
       <div className="text-sm text-slate-500 text-center">
-        Näytetään {filteredApps.length} / {appList.length} hakemusta
+        Näytetään {appList.length} / {total ?? appList.length} hakemusta
       </div>
     </div>
   );
@@ -12,13 +12,14 @@ import {
   Download,
   CheckCircle
 } from 'lucide-react';
-import api from '../../lib/api';
+import { contracts } from '../../lib/api';
 import {
   formatCurrency,
   formatDateTime,
   getContractStatusLabel
 } from '../../lib/utils';
 import LoadingSpinner from '../../components/LoadingSpinner';
+import { useCursorList } from '../../hooks/useCursorList';
 import type { Contract, Application } from '../../types';
 
 interface ContractWithApplication extends Contract {
@@ -27,38 +28,40 @@ interface ContractWithApplication extends Contract {
 }
 
 export default function AdminContracts() {
-  const [contractList, setContractList] = useState<ContractWithApplication[]>([]);
-  const [isLoading, setIsLoading] = useState(true);
   const [statusFilter, setStatusFilter] = useState<string>('all');
   const [searchTerm, setSearchTerm] = useState('');
+  const [pendingCount, setPendingCount] = useState(0);
+  const [signedCount, setSignedCount] = useState(0);
+
+  const {
+    items: contractList, hasMore, hasLoaded, isLoadingMore, loadMore
+  } = useCursorList<ContractWithApplication>(
+    (cursor) => contracts.listAdmin<ContractWithApplication>({
+      status_filter: statusFilter === 'all' ? undefined : statusFilter,
+      cursor,
+    }),
+    [statusFilter],
+    () => toast.error('Virhe sopimusten latauksessa')
+  );
 
   useEffect(() => {
-    const fetchContracts = async () => {
-      try {
-        const response = await api.get<ContractWithApplication[]>('/contracts/admin/all');
-        setContractList(response.data);
-      } catch (error) {
-        toast.error('Virhe sopimusten latauksessa');
-      } finally {
-        setIsLoading(false);
-      }
-    };
-    fetchContracts();
+    Promise.all([contracts.countAdmin('SENT'), contracts.countAdmin('SIGNED')])
+      .then(([sent, signed]) => {
+        setPendingCount(sent);
+        setSignedCount(signed);
+      })
+      .catch(() => console.error('Failed to count contracts'));
   }, []);
 
-  const filteredContracts = contractList.filter(contract => {
-    const matchesStatus = statusFilter === 'all' || contract.status === statusFilter;
-    const matchesSearch = searchTerm === '' || 
-      contract.application?.reference_number?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-      contract.application?.company_name?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-      contract.financier_name?.toLowerCase().includes(searchTerm.toLowerCase());
-    return matchesStatus && matchesSearch;
-  });
-
-  const pendingCount = contractList.filter(c => c.status === 'SENT').length;
-  const signedCount = contractList.filter(c => c.status === 'SIGNED').length;
+  // The search narrows the contracts loaded so far
+  const filteredContracts = contractList.filter(contract =>
+    searchTerm === '' ||
+    contract.application?.reference_number?.toLowerCase().includes(searchTerm.toLowerCase()) ||
+    contract.application?.company_name?.toLowerCase().includes(searchTerm.toLowerCase()) ||
+    contract.financier_name?.toLowerCase().includes(searchTerm.toLowerCase())
+  );
 
-  if (isLoading) {
+  if (!hasLoaded) {
     return (
       <div className="flex items-center justify-center h-64">
         <LoadingSpinner size="lg" />
@@ -134,7 +137,7 @@ export default function AdminContracts() {
               key={contract.id}
               initial={{ opacity: 0, y: 20 }}
               animate={{ opacity: 1, y: 0 }}
-              transition={{ delay: index * 0.05 }}
+              transition={{ delay: (index % 50) * 0.05 }}
               className={`card ${contract.status === 'SIGNED' ? 'border-2 border-green-300 bg-green-50' : ''}`}
             >
               <div className="flex flex-col md:flex-row md:items-center justify-between gap-4">
@@ -201,6 +204,14 @@ export default function AdminContracts() {
           ))}
         </div>
       )}
+
+      {hasMore && (
+        <div className="text-center">
+          <button onClick={loadMore} disabled={isLoadingMore} className="btn-secondary">
+            {isLoadingMore ? 'Ladataan...' : 'Lataa lisää'}
+          </button>
+        </div>
+      )}
     </div>
   );
 }
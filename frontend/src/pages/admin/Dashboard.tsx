@@ -15,35 +15,47 @@ import {
   FileCheck,
   Send
 } from 'lucide-react';
-import api from '../../lib/api';
-import { applications, financiers, users } from '../../lib/api';
+import { applications, financiers, users, offers, contracts } from '../../lib/api';
 import { formatCurrency, formatDate, getStatusLabel, getStatusColor } from '../../lib/utils';
 import LoadingSpinner from '../../components/LoadingSpinner';
-import type { Application, Financier, User, Offer, Contract } from '../../types';
+import type { Application, ApplicationStats, ApplicationStatus, Financier, User } from '../../types';
 
 export default function AdminDashboard() {
-  const [appList, setAppList] = useState<Application[]>([]);
+  const [appStats, setAppStats] = useState<ApplicationStats | null>(null);
+  const [recentApplications, setRecentApplications] = useState<Application[]>([]);
   const [financierList, setFinancierList] = useState<Financier[]>([]);
   const [userList, setUserList] = useState<User[]>([]);
-  const [offerList, setOfferList] = useState<any[]>([]);
-  const [contractList, setContractList] = useState<any[]>([]);
+  const [offerCounts, setOfferCounts] = useState({ pending: 0, sent: 0, accepted: 0 });
+  const [contractCounts, setContractCounts] = useState({ total: 0, sent: 0, signed: 0 });
   const [isLoading, setIsLoading] = useState(true);
 
   useEffect(() => {
     const fetchData = async () => {
       try {
-        const [appsRes, financiersRes, usersRes, offersRes, contractsRes] = await Promise.all([
-          applications.list(),
+        const [statsRes, recentRes, financiersRes, usersRes, offerCountsRes, contractCountsRes] = await Promise.all([
+          applications.stats(),
+          applications.list({ limit: 5 }),
           financiers.list(),
           users.list(),
-          api.get('/offers/admin/all'),
-          api.get('/contracts/admin/all')
+          Promise.all([
+            offers.countAdmin('PENDING_ADMIN'),
+            offers.countAdmin('SENT'),
+            offers.countAdmin('ACCEPTED')
+          ]),
+          Promise.all([
+            contracts.countAdmin(),
+            contracts.countAdmin('SENT'),
+            contracts.countAdmin('SIGNED')
+          ])
         ]);
-        setAppList(appsRes.data);
+        setAppStats(statsRes.data);
+        setRecentApplications(recentRes.items);
         setFinancierList(financiersRes.data);
         setUserList(usersRes.data);
-        setOfferList(offersRes.data);
-        setContractList(contractsRes.data);
+        const [pendingOffers, sentOffers, acceptedOffers] = offerCountsRes;
+        setOfferCounts({ pending: pendingOffers, sent: sentOffers, accepted: acceptedOffers });
+        const [totalContracts, sentContracts, signedContracts] = contractCountsRes;
+        setContractCounts({ total: totalContracts, sent: sentContracts, signed: signedContracts });
       } catch (error) {
         console.error('Failed to fetch data');
       } finally {
@@ -54,28 +66,26 @@ export default function AdminDashboard() {
   }, []);
 
   // Calculate stats
-  const newApplications = appList.filter(a => a.status === 'SUBMITTED').length;
-  const inProgress = appList.filter(a => 
-    ['SUBMITTED_TO_FINANCIER', 'INFO_REQUESTED', 'OFFER_SENT', 'OFFER_ACCEPTED', 'CONTRACT_SENT'].includes(a.status)
-  ).length;
-  const completed = appList.filter(a => ['SIGNED', 'CLOSED'].includes(a.status)).length;
-  const totalValue = appList.reduce((sum, app) => sum + app.equipment_price, 0);
+  const countApplications = (...statuses: ApplicationStatus[]) =>
+    statuses.reduce((sum, status) => sum + (appStats?.by_status[status] ?? 0), 0);
+  const newApplications = countApplications('SUBMITTED');
+  const inProgress = countApplications(
+    'SUBMITTED_TO_FINANCIER', 'INFO_REQUESTED', 'OFFER_SENT', 'OFFER_ACCEPTED', 'CONTRACT_SENT'
+  );
+  const completed = countApplications('SIGNED', 'CLOSED');
+  const totalValue = appStats?.total_value ?? 0;
 
   const activeFinanciers = financierList.filter(f => f.is_active).length;
   const totalCustomers = userList.filter(u => u.role === 'CUSTOMER').length;
 
   // Offer stats
-  const pendingOffers = offerList.filter(o => o.status === 'PENDING_ADMIN').length;
-  const sentOffers = offerList.filter(o => o.status === 'SENT').length;
-  const acceptedOffers = offerList.filter(o => o.status === 'ACCEPTED').length;
+  const pendingOffers = offerCounts.pending;
+  const sentOffers = offerCounts.sent;
+  const acceptedOffers = offerCounts.accepted;
 
   // Contract stats
-  const pendingContracts = contractList.filter(c => c.status === 'SENT').length;
-  const signedContracts = contractList.filter(c => c.status === 'SIGNED').length;
-
-  const recentApplications = appList
-    .sort((a, b) => new Date(b.created_at).getTime() - new Date(a.created_at).getTime())
-    .slice(0, 5);
+  const pendingContracts = contractCounts.sent;
+  const signedContracts = contractCounts.signed;
 
   if (isLoading) {
     return (
@@ -174,7 +184,7 @@ export default function AdminDashboard() {
           </div>
           <div className="grid grid-cols-3 gap-4">
             <div className="text-center p-3 rounded-xl bg-slate-50">
-              <p className="text-2xl font-bold text-slate-600">{contractList.length}</p>
+              <p className="text-2xl font-bold text-slate-600">{contractCounts.total}</p>
               <p className="text-xs text-slate-600">Yhteensä</p>
             </div>
             <Link to="/admin/contracts?status=SENT" className="text-center p-3 rounded-xl bg-purple-50 hover:bg-purple-100 transition-colors">
@@ -222,7 +232,7 @@ export default function AdminDashboard() {
             </div>
             <div>
               <p className="text-slate-500 text-sm">Hakemuksia yhteensä</p>
-              <p className="text-xl font-bold text-midnight-900">{appList.length}</p>
+              <p className="text-xl font-bold text-midnight-900">{appStats?.total ?? 0}</p>
             </div>
           </div>
         </Link>
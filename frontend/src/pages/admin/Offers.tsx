@@ -12,7 +12,6 @@ import {
   Building2,
   FileText
 } from 'lucide-react';
-import api from '../../lib/api';
 import { offers } from '../../lib/api';
 import {
   formatCurrency,
@@ -21,6 +20,7 @@ import {
   getOfferStatusLabel
 } from '../../lib/utils';
 import LoadingSpinner from '../../components/LoadingSpinner';
+import { useCursorList } from '../../hooks/useCursorList';
 import type { Offer, Application } from '../../types';
 
 interface OfferWithApplication extends Offer {
@@ -29,23 +29,29 @@ interface OfferWithApplication extends Offer {
 }
 
 export default function AdminOffers() {
-  const [offerList, setOfferList] = useState<OfferWithApplication[]>([]);
-  const [isLoading, setIsLoading] = useState(true);
   const [statusFilter, setStatusFilter] = useState<string>('all');
   const [searchTerm, setSearchTerm] = useState('');
+  const [pendingCount, setPendingCount] = useState(0);
+
+  const {
+    items: offerList, hasMore, hasLoaded, isLoadingMore, loadMore, reload
+  } = useCursorList<OfferWithApplication>(
+    (cursor) => offers.listAdmin<OfferWithApplication>({
+      status_filter: statusFilter === 'all' ? undefined : statusFilter,
+      cursor,
+    }),
+    [statusFilter],
+    () => toast.error('Virhe tarjousten latauksessa')
+  );
+
+  const fetchPendingCount = () => {
+    offers.countAdmin('PENDING_ADMIN')
+      .then(setPendingCount)
+      .catch(() => console.error('Failed to count pending offers'));
+  };
 
   useEffect(() => {
-    const fetchOffers = async () => {
-      try {
-        const response = await api.get<OfferWithApplication[]>('/offers/admin/all');
-        setOfferList(response.data);
-      } catch (error) {
-        toast.error('Virhe tarjousten latauksessa');
-      } finally {
-        setIsLoading(false);
-      }
-    };
-    fetchOffers();
+    fetchPendingCount();
   }, []);
 
   const handleApprove = async (offerId: number) => {
@@ -53,25 +59,22 @@ export default function AdminOffers() {
       await offers.approve(offerId);
       toast.success('Tarjous hyväksytty ja lähetetty asiakkaalle!');
       // Refresh list
-      const response = await api.get<OfferWithApplication[]>('/offers/admin/all');
-      setOfferList(response.data);
+      reload();
+      fetchPendingCount();
     } catch (error: any) {
       toast.error(error.response?.data?.detail || 'Virhe tarjouksen hyväksymisessä');
     }
   };
 
-  const filteredOffers = offerList.filter(offer => {
-    const matchesStatus = statusFilter === 'all' || offer.status === statusFilter;
-    const matchesSearch = searchTerm === '' || 
-      offer.application?.reference_number?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-      offer.application?.company_name?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-      offer.financier_name?.toLowerCase().includes(searchTerm.toLowerCase());
-    return matchesStatus && matchesSearch;
-  });
-
-  const pendingCount = offerList.filter(o => o.status === 'PENDING_ADMIN').length;
+  // The search narrows the offers loaded so far
+  const filteredOffers = offerList.filter(offer =>
+    searchTerm === '' ||
+    offer.application?.reference_number?.toLowerCase().includes(searchTerm.toLowerCase()) ||
+    offer.application?.company_name?.toLowerCase().includes(searchTerm.toLowerCase()) ||
+    offer.financier_name?.toLowerCase().includes(searchTerm.toLowerCase())
+  );
 
-  if (isLoading) {
+  if (!hasLoaded) {
     return (
       <div className="flex items-center justify-center h-64">
         <LoadingSpinner size="lg" />
@@ -141,7 +144,7 @@ export default function AdminOffers() {
               key={offer.id}
               initial={{ opacity: 0, y: 20 }}
               animate={{ opacity: 1, y: 0 }}
-              transition={{ delay: index * 0.05 }}
+              transition={{ delay: (index % 50) * 0.05 }}
               className={`card ${offer.status === 'PENDING_ADMIN' ? 'border-2 border-orange-300 bg-orange-50' : ''}`}
             >
               <div className="flex flex-col md:flex-row md:items-center justify-between gap-4">
@@ -212,6 +215,14 @@ export default function AdminOffers() {
           ))}
         </div>
       )}
+
+      {hasMore && (
+        <div className="text-center">
+          <button onClick={loadMore} disabled={isLoadingMore} className="btn-secondary">
+            {isLoadingMore ? 'Ladataan...' : 'Lataa lisää'}
+          </button>
+        </div>
+      )}
     </div>
   );
 }
@@ -1,4 +1,4 @@
-import { useEffect, useState } from 'react';
+import { useState } from 'react';
 import { Link } from 'react-router-dom';
 import { motion } from 'framer-motion';
 import {
@@ -18,53 +18,26 @@ import {
   getApplicationTypeLabel
 } from '../../lib/utils';
 import LoadingSpinner from '../../components/LoadingSpinner';
+import { useCursorList } from '../../hooks/useCursorList';
+import { useDebouncedValue } from '../../hooks/useDebouncedValue';
 import type { Application, ApplicationStatus, ApplicationType } from '../../types';
 
 export default function CustomerApplications() {
-  const [appList, setAppList] = useState<Application[]>([]);
-  const [filteredApps, setFilteredApps] = useState<Application[]>([]);
-  const [isLoading, setIsLoading] = useState(true);
   const [searchTerm, setSearchTerm] = useState('');
   const [statusFilter, setStatusFilter] = useState<ApplicationStatus | ''>('');
   const [typeFilter, setTypeFilter] = useState<ApplicationType | ''>('');
+  const debouncedSearch = useDebouncedValue(searchTerm.trim());
+
+  const { items: appList, hasMore, hasLoaded, isLoadingMore, loadMore } = useCursorList<Application>(
+    (cursor) => applications.find(
+      { q: debouncedSearch, status_filter: statusFilter, type_filter: typeFilter }, cursor
+    ),
+    [debouncedSearch, statusFilter, typeFilter],
+    () => console.error('Failed to fetch applications')
+  );
+  const hasFilters = Boolean(debouncedSearch || statusFilter || typeFilter);
 
-  useEffect(() => {
-    const fetchApps = async () => {
-      try {
-        const response = await applications.list();
-        setAppList(response.data);
-        setFilteredApps(response.data);
-      } catch (error) {
-        console.error('Failed to fetch applications');
-      } finally {
-        setIsLoading(false);
-      }
-    };
-    fetchApps();
-  }, []);
-
-  useEffect(() => {
-    let filtered = appList;
-
-    if (searchTerm) {
-      filtered = filtered.filter(app =>
-        app.reference_number.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        app.equipment_description.toLowerCase().includes(searchTerm.toLowerCase())
-      );
-    }
-
-    if (statusFilter) {
-      filtered = filtered.filter(app => app.status === statusFilter);
-    }
-
-    if (typeFilter) {
-      filtered = filtered.filter(app => app.application_type === typeFilter);
-    }
-
-    setFilteredApps(filtered);
-  }, [searchTerm, statusFilter, typeFilter, appList]);
-
-  if (isLoading) {
+  if (!hasLoaded) {
     return (
       <div className="flex items-center justify-center h-64">
         <LoadingSpinner size="lg" />
@@ -127,18 +100,18 @@ export default function CustomerApplications() {
       </div>
 
       {/* Applications list */}
-      {filteredApps.length === 0 ? (
+      {appList.length === 0 ? (
         <div className="card text-center py-12">
           <FileText className="w-16 h-16 text-slate-300 mx-auto mb-4" />
           <h3 className="text-lg font-medium text-midnight-900 mb-2">
-            {appList.length === 0 ? 'Ei hakemuksia' : 'Ei hakemuksia valituilla suodattimilla'}
+            {!hasFilters ? 'Ei hakemuksia' : 'Ei hakemuksia valituilla suodattimilla'}
           </h3>
           <p className="text-slate-500 mb-6">
-            {appList.length === 0
+            {!hasFilters
               ? 'Aloita hakemalla rahoitusta'
               : 'Kokeile muuttaa hakuehtoja'}
           </p>
-          {appList.length === 0 && (
+          {!hasFilters && (
             <Link to="/" className="btn-primary">
               Hae rahoitusta
             </Link>
@@ -146,12 +119,12 @@ export default function CustomerApplications() {
         </div>
       ) : (
         <div className="space-y-4">
-          {filteredApps.map((app, index) => (
+          {appList.map((app, index) => (
             <motion.div
               key={app.id}
               initial={{ opacity: 0, y: 20 }}
               animate={{ opacity: 1, y: 0 }}
-              transition={{ delay: index * 0.05 }}
+              transition={{ delay: (index % 50) * 0.05 }}
             >
               <Link
                 to={`/dashboard/applications/${app.id}`}
@@ -196,6 +169,14 @@ export default function CustomerApplications() {
           ))}
         </div>
       )}
+
+      {hasMore && (
+        <div className="text-center">
+          <button onClick={loadMore} disabled={isLoadingMore} className="btn-secondary">
+            {isLoadingMore ? 'Ladataan...' : 'Lataa lisää'}
+          </button>
+        </div>
+      )}
     </div>
   );
 }
@@ -15,22 +15,25 @@ import { applications, notifications as notificationsApi } from '../../lib/api';
 import { useAuthStore } from '../../store/authStore';
 import { formatCurrency, formatDate, getStatusLabel, getStatusColor } from '../../lib/utils';
 import LoadingSpinner from '../../components/LoadingSpinner';
-import type { Application, Notification } from '../../types';
+import type { Application, ApplicationStats, ApplicationStatus, Notification } from '../../types';
 
 export default function CustomerDashboard() {
   const { user } = useAuthStore();
-  const [appList, setAppList] = useState<Application[]>([]);
+  const [appStats, setAppStats] = useState<ApplicationStats | null>(null);
+  const [recentApplications, setRecentApplications] = useState<Application[]>([]);
   const [notificationList, setNotificationList] = useState<Notification[]>([]);
   const [isLoading, setIsLoading] = useState(true);
 
   useEffect(() => {
     const fetchData = async () => {
       try {
-        const [appsRes, notifsRes] = await Promise.all([
-          applications.list(),
+        const [statsRes, recentRes, notifsRes] = await Promise.all([
+          applications.stats(),
+          applications.list({ limit: 3 }),
           notificationsApi.list()
         ]);
-        setAppList(appsRes.data);
+        setAppStats(statsRes.data);
+        setRecentApplications(recentRes.items);
         setNotificationList(notifsRes.data.slice(0, 5));
       } catch (error) {
         console.error('Failed to fetch data');
@@ -42,14 +45,12 @@ export default function CustomerDashboard() {
   }, []);
 
   // Calculate stats
-  const totalApplications = appList.length;
-  const pendingApplications = appList.filter(a => 
-    ['SUBMITTED', 'SUBMITTED_TO_FINANCIER', 'INFO_REQUESTED'].includes(a.status)
-  ).length;
-  const offersAvailable = appList.filter(a => a.status === 'OFFER_SENT').length;
-  const completed = appList.filter(a => ['SIGNED', 'CLOSED'].includes(a.status)).length;
-
-  const recentApplications = appList.slice(0, 3);
+  const countApplications = (...statuses: ApplicationStatus[]) =>
+    statuses.reduce((sum, status) => sum + (appStats?.by_status[status] ?? 0), 0);
+  const totalApplications = appStats?.total ?? 0;
+  const pendingApplications = countApplications('SUBMITTED', 'SUBMITTED_TO_FINANCIER', 'INFO_REQUESTED');
+  const offersAvailable = countApplications('OFFER_SENT');
+  const completed = countApplications('SIGNED', 'CLOSED');
 
   if (isLoading) {
     return (
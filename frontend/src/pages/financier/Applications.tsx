@@ -19,67 +19,49 @@ import {
   getApplicationTypeLabel
 } from '../../lib/utils';
 import LoadingSpinner from '../../components/LoadingSpinner';
-import type { Application, ApplicationStatus, ApplicationType } from '../../types';
+import { useCursorList } from '../../hooks/useCursorList';
+import { useDebouncedValue } from '../../hooks/useDebouncedValue';
+import type { Application, ApplicationStats, ApplicationStatus, ApplicationType } from '../../types';
 
 export default function FinancierApplications() {
   const [searchParams, setSearchParams] = useSearchParams();
-  const [appList, setAppList] = useState<Application[]>([]);
-  const [filteredApps, setFilteredApps] = useState<Application[]>([]);
-  const [isLoading, setIsLoading] = useState(true);
+  const [stats, setStats] = useState<ApplicationStats | null>(null);
   const [searchTerm, setSearchTerm] = useState('');
   const [statusFilter, setStatusFilter] = useState<ApplicationStatus | ''>(
     searchParams.get('status') as ApplicationStatus || ''
   );
   const [typeFilter, setTypeFilter] = useState<ApplicationType | ''>('');
+  const debouncedSearch = useDebouncedValue(searchTerm.trim());
 
-  useEffect(() => {
-    const fetchApps = async () => {
-      try {
-        const response = await applications.list();
-        setAppList(response.data);
-        setFilteredApps(response.data);
-      } catch (error) {
-        console.error('Failed to fetch applications');
-      } finally {
-        setIsLoading(false);
-      }
-    };
-    fetchApps();
-  }, []);
+  const {
+    items: appList, total, hasMore, hasLoaded, isLoadingMore, loadMore
+  } = useCursorList<Application>(
+    (cursor) => applications.find(
+      { q: debouncedSearch, status_filter: statusFilter, type_filter: typeFilter }, cursor
+    ),
+    [debouncedSearch, statusFilter, typeFilter],
+    () => console.error('Failed to fetch applications')
+  );
+  const hasFilters = Boolean(debouncedSearch || statusFilter || typeFilter);
 
   useEffect(() => {
-    let filtered = appList;
-
-    if (searchTerm) {
-      filtered = filtered.filter(app =>
-        app.reference_number.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        app.company_name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        app.business_id.includes(searchTerm)
-      );
-    }
-
-    if (statusFilter) {
-      filtered = filtered.filter(app => app.status === statusFilter);
-    }
-
-    if (typeFilter) {
-      filtered = filtered.filter(app => app.application_type === typeFilter);
-    }
-
-    setFilteredApps(filtered);
-  }, [searchTerm, statusFilter, typeFilter, appList]);
+    applications.stats()
+      .then((response) => setStats(response.data))
+      .catch(() => console.error('Failed to fetch application stats'));
+  }, []);
 
   // Stats
-  const stats = {
-    new: appList.filter(a => a.status === 'SUBMITTED_TO_FINANCIER').length,
-    infoRequested: appList.filter(a => a.status === 'INFO_REQUESTED').length,
-    offerSent: appList.filter(a => a.status === 'OFFER_SENT').length,
-    accepted: appList.filter(a => a.status === 'OFFER_ACCEPTED').length,
-    contract: appList.filter(a => a.status === 'CONTRACT_SENT').length,
-    done: appList.filter(a => a.status === 'SIGNED').length,
+  const count = (status: ApplicationStatus) => stats?.by_status[status] ?? 0;
+  const statCards = {
+    new: count('SUBMITTED_TO_FINANCIER'),
+    infoRequested: count('INFO_REQUESTED'),
+    offerSent: count('OFFER_SENT'),
+    accepted: count('OFFER_ACCEPTED'),
+    contract: count('CONTRACT_SENT'),
+    done: count('SIGNED'),
   };
 
-  if (isLoading) {
+  if (!hasLoaded) {
     return (
       <div className="flex items-center justify-center h-64">
         <LoadingSpinner size="lg" />
@@ -97,12 +79,12 @@ export default function FinancierApplications() {
       {/* Quick stats */}
       <div className="grid grid-cols-3 md:grid-cols-6 gap-2">
         {[
-          { label: 'Uudet', value: stats.new, status: 'SUBMITTED_TO_FINANCIER', color: 'border-orange-300 bg-orange-50' },
-          { label: 'Lisätiedot', value: stats.infoRequested, status: 'INFO_REQUESTED', color: 'border-yellow-300 bg-yellow-50' },
-          { label: 'Tarjottu', value: stats.offerSent, status: 'OFFER_SENT', color: 'border-blue-300 bg-blue-50' },
-          { label: 'Hyväksytty', value: stats.accepted, status: 'OFFER_ACCEPTED', color: 'border-purple-300 bg-purple-50' },
-          { label: 'Sopimus', value: stats.contract, status: 'CONTRACT_SENT', color: 'border-indigo-300 bg-indigo-50' },
-          { label: 'Valmis', value: stats.done, status: 'SIGNED', color: 'border-green-300 bg-green-50' },
+          { label: 'Uudet', value: statCards.new, status: 'SUBMITTED_TO_FINANCIER', color: 'border-orange-300 bg-orange-50' },
+          { label: 'Lisätiedot', value: statCards.infoRequested, status: 'INFO_REQUESTED', color: 'border-yellow-300 bg-yellow-50' },
+          { label: 'Tarjottu', value: statCards.offerSent, status: 'OFFER_SENT', color: 'border-blue-300 bg-blue-50' },
+          { label: 'Hyväksytty', value: statCards.accepted, status: 'OFFER_ACCEPTED', color: 'border-purple-300 bg-purple-50' },
+          { label: 'Sopimus', value: statCards.contract, status: 'CONTRACT_SENT', color: 'border-indigo-300 bg-indigo-50' },
+          { label: 'Valmis', value: statCards.done, status: 'SIGNED', color: 'border-green-300 bg-green-50' },
         ].map((stat) => (
           <button
             key={stat.label}
@@ -183,7 +165,7 @@ export default function FinancierApplications() {
       </div>
 
       {/* Urgent actions banner */}
-      {stats.new > 0 && (
+      {statCards.new > 0 && (
         <motion.div
           initial={{ opacity: 0, y: -10 }}
           animate={{ opacity: 1, y: 0 }}
@@ -192,7 +174,7 @@ export default function FinancierApplications() {
           <div className="flex items-center space-x-3">
             <AlertCircle className="w-5 h-5 text-orange-600" />
             <span className="text-orange-900">
-              <strong>{stats.new}</strong> uutta hakemusta odottaa käsittelyä
+              <strong>{statCards.new}</strong> uutta hakemusta odottaa käsittelyä
             </span>
           </div>
           <button
@@ -208,26 +190,26 @@ export default function FinancierApplications() {
       )}
 
       {/* Applications list */}
-      {filteredApps.length === 0 ? (
+      {appList.length === 0 ? (
         <div className="card text-center py-12">
           <FileText className="w-16 h-16 text-slate-300 mx-auto mb-4" />
           <h3 className="text-lg font-medium text-midnight-900 mb-2">
-            {appList.length === 0 ? 'Ei hakemuksia' : 'Ei hakemuksia valituilla suodattimilla'}
+            {!hasFilters ? 'Ei hakemuksia' : 'Ei hakemuksia valituilla suodattimilla'}
           </h3>
           <p className="text-slate-500">
-            {appList.length === 0
+            {!hasFilters
               ? 'Hakemukset näkyvät täällä kun admin lähettää niitä käsittelyyn'
               : 'Kokeile muuttaa hakuehtoja'}
           </p>
         </div>
       ) : (
         <div className="space-y-3">
-          {filteredApps.map((app, index) => (
+          {appList.map((app, index) => (
             <motion.div
               key={app.id}
               initial={{ opacity: 0, y: 20 }}
               animate={{ opacity: 1, y: 0 }}
-              transition={{ delay: index * 0.03 }}
+              transition={{ delay: (index % 50) * 0.03 }}
             >
               <Link
                 to={`/financier/applications/${app.id}`}
@@ -279,8 +261,16 @@ export default function FinancierApplications() {
         </div>
       )}
 
+      {hasMore && (
+        <div className="text-center">
+          <button onClick={loadMore} disabled={isLoadingMore} className="btn-secondary">
+            {isLoadingMore ? 'Ladataan...' : 'Lataa lisää'}
+          </button>
+        </div>
+      )}
+
       <div className="text-sm text-slate-500 text-center">
-        Näytetään {filteredApps.length} / {appList.length} hakemusta
+        Näytetään {appList.length} / {total ?? appList.length} hakemusta
       </div>
     </div>
   );
@@ -17,22 +17,25 @@ import { applications, notifications as notificationsApi } from '../../lib/api';
 import { useAuthStore } from '../../store/authStore';
 import { formatCurrency, formatDate, getStatusLabel, getStatusColor } from '../../lib/utils';
 import LoadingSpinner from '../../components/LoadingSpinner';
-import type { Application, Notification } from '../../types';
+import type { Application, ApplicationStats, ApplicationStatus, Notification } from '../../types';
 
 export default function FinancierDashboard() {
   const { user } = useAuthStore();
-  const [appList, setAppList] = useState<Application[]>([]);
+  const [appStats, setAppStats] = useState<ApplicationStats | null>(null);
+  const [recentApplications, setRecentApplications] = useState<Application[]>([]);
   const [notificationList, setNotificationList] = useState<Notification[]>([]);
   const [isLoading, setIsLoading] = useState(true);
 
   useEffect(() => {
     const fetchData = async () => {
       try {
-        const [appsRes, notifsRes] = await Promise.all([
-          applications.list(),
+        const [statsRes, recentRes, notifsRes] = await Promise.all([
+          applications.stats(),
+          applications.list({ limit: 5 }),
           notificationsApi.list()
         ]);
-        setAppList(appsRes.data);
+        setAppStats(statsRes.data);
+        setRecentApplications(recentRes.items);
         setNotificationList(notifsRes.data.slice(0, 5));
       } catch (error) {
         console.error('Failed to fetch data');
@@ -44,15 +47,15 @@ export default function FinancierDashboard() {
   }, []);
 
   // Calculate stats
-  const newApplications = appList.filter(a => a.status === 'SUBMITTED_TO_FINANCIER').length;
-  const infoRequested = appList.filter(a => a.status === 'INFO_REQUESTED').length;
-  const offersSent = appList.filter(a => a.status === 'OFFER_SENT').length;
-  const offersAccepted = appList.filter(a => a.status === 'OFFER_ACCEPTED').length;
-  const contractsSent = appList.filter(a => a.status === 'CONTRACT_SENT').length;
-  const completed = appList.filter(a => ['SIGNED', 'CLOSED'].includes(a.status)).length;
-  const totalValue = appList.reduce((sum, app) => sum + app.equipment_price, 0);
-
-  const recentApplications = appList.slice(0, 5);
+  const countApplications = (...statuses: ApplicationStatus[]) =>
+    statuses.reduce((sum, status) => sum + (appStats?.by_status[status] ?? 0), 0);
+  const newApplications = countApplications('SUBMITTED_TO_FINANCIER');
+  const infoRequested = countApplications('INFO_REQUESTED');
+  const offersSent = countApplications('OFFER_SENT');
+  const offersAccepted = countApplications('OFFER_ACCEPTED');
+  const contractsSent = countApplications('CONTRACT_SENT');
+  const completed = countApplications('SIGNED', 'CLOSED');
+  const totalValue = appStats?.total_value ?? 0;
 
   // Pending actions
   const pendingActions = [
@@ -98,6 +98,12 @@ export interface Application {
   files?: FileInfo[];
 }
 
+export interface ApplicationStats {
+  total: number;
+  total_value: number;
+  by_status: Partial<Record<ApplicationStatus, number>>;
+}
+
 export interface Offer {
   id: number;
   application_id: number;